@@ -0,0 +1 @@
+# Mediciones de rendimiento de la capa de datos (se ejecutan a mano, no en los tests)
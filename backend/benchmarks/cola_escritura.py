@@ -0,0 +1,130 @@
+"""Mide latencia y throughput de un pico de reservas según cómo se escribe.
+
+Simula el pico del viernes a la tarde: muchas reservas concurrentes (cada
+una con su turno, algunas repetidas para que haya conflictos) registradas con
+ReservaService.registrar_reserva_completa, de tres formas:
+
+- threads: cada request en su thread con su conexión, compitiendo por el lock
+  de escritura de SQLite (como con el pool de conexiones),
+- fila sin agrupar: el thread escritor de data/write_queue.py con max_batch=1
+  (un COMMIT por reserva),
+- group commit: el mismo escritor agrupando hasta --lote reservas por COMMIT.
+
+Uso (desde backend/):
+    python -m benchmarks.cola_escritura
+    python -m benchmarks.cola_escritura --reservas 5000 --concurrencia 200 --perfil api
+"""
+import argparse
+import asyncio
+import datetime
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+from data.connection_pool import ConnectionPool
+from data.datos_ejemplo_db import insert_sample_data
+from data.db_executor import DatabaseExecutor
+from data.init_db import init_database
+from data.write_queue import percentile
+from schemas.reserva_transaccion_schema import ReservaItemSchema, ReservaTransaccionSchema
+from services.async_service import AsyncService
+from services.reserva_service import ReservaService
+
+
+def crear_base(directorio: str, nombre: str) -> str:
+    db_path = os.path.join(directorio, f"{nombre}.db")
+    init_database(db_path)
+    insert_sample_data(db_path)
+    return db_path
+
+
+def armar_reservas(cantidad: int) -> List[ReservaTransaccionSchema]:
+    """Una reserva por turno (3 canchas x 9 horarios por día); una de cada 20 repite la anterior."""
+    reservas = []
+    inicio = datetime.date(2030, 1, 1)
+    for i in range(cantidad):
+        slot = i - 1 if i % 20 == 19 else i
+        item = ReservaItemSchema(
+            id_cancha=slot % 3 + 1,
+            id_horario=slot // 3 % 9 + 1,
+            fecha=inicio + datetime.timedelta(days=slot // 27),
+        )
+        reservas.append(ReservaTransaccionSchema(id_cliente=1, id_metodo_pago=1, items=[item]))
+    return reservas
+
+
+def registrar_con_threads(db_path: str, reservas, concurrencia: int, perfil: str) -> Tuple[List[float], int]:
+    pool = ConnectionPool(db_path, size=concurrencia, timeout=60, profile=perfil)
+
+    def registrar(reserva):
+        inicio = time.perf_counter()
+        try:
+            with pool.connection() as conn:
+                ReservaService(connection=conn).registrar_reserva_completa(reserva)
+            ok = True
+        except ValueError:
+            ok = False
+        return time.perf_counter() - inicio, ok
+
+    with ThreadPoolExecutor(max_workers=concurrencia) as executor:
+        resultados = list(executor.map(registrar, reservas))
+    pool.close()
+    return [r[0] for r in resultados], sum(1 for r in resultados if r[1])
+
+
+def registrar_con_fila(db_path: str, reservas, concurrencia: int, perfil: str, lote: int) -> Tuple[List[float], int]:
+    executor = DatabaseExecutor(db_path, readers=1, profile=perfil, max_batch=lote)
+    service = AsyncService(ReservaService, executor)
+    limite = asyncio.Semaphore(concurrencia)
+
+    async def registrar(reserva):
+        async with limite:
+            inicio = time.perf_counter()
+            try:
+                await service.registrar_reserva_completa(reserva)
+                ok = True
+            except ValueError:
+                ok = False
+            return time.perf_counter() - inicio, ok
+
+    async def todas():
+        return await asyncio.gather(*(registrar(r) for r in reservas))
+
+    resultados = asyncio.run(todas())
+    executor.close()
+    return [r[0] for r in resultados], sum(1 for r in resultados if r[1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Latencia y throughput de reservas concurrentes")
+    parser.add_argument("--reservas", type=int, default=2000, help="Reservas a registrar")
+    parser.add_argument("--concurrencia", type=int, default=64, help="Requests en vuelo a la vez")
+    parser.add_argument("--lote", type=int, default=64, help="Escrituras máximas por group commit")
+    parser.add_argument("--perfil", default="api", help="Perfil de PRAGMA (api usa synchronous=NORMAL)")
+    args = parser.parse_args(argv)
+
+    reservas = armar_reservas(args.reservas)
+    formas = [
+        ("threads", lambda db: registrar_con_threads(db, reservas, args.concurrencia, args.perfil)),
+        ("fila sin agrupar", lambda db: registrar_con_fila(db, reservas, args.concurrencia, args.perfil, 1)),
+        (f"group commit ({args.lote})", lambda db: registrar_con_fila(db, reservas, args.concurrencia, args.perfil, args.lote)),
+    ]
+
+    print(f"{args.reservas} reservas, {args.concurrencia} concurrentes, perfil {args.perfil}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for i, (nombre, registrar) in enumerate(formas):
+            db_path = crear_base(tmp, f"forma{i}")
+            inicio = time.perf_counter()
+            latencias, exitosas = registrar(db_path)
+            total = time.perf_counter() - inicio
+            print(
+                f"  {nombre:<20} {len(latencias) / total:8.0f} reservas/s   "
+                f"p50 {percentile(latencias, 50) * 1000:7.1f} ms   p99 {percentile(latencias, 99) * 1000:7.1f} ms   "
+                f"({exitosas} confirmadas)"
+            )
+
+
+if __name__ == "__main__":
+    main()
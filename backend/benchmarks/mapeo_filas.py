@@ -0,0 +1,111 @@
+"""Mide el armado de entidades desde las filas de la base.
+
+Compara el mapeo anterior (sqlite3.Row -> dict -> from_dict, con búsquedas por
+nombre y un fromisoformat por fila) contra el actual de BaseRepository (tuplas +
+función compilada por posición de columna, estados compartidos y fechas
+memoizadas), ambos leyendo la tabla Turno completa.
+
+Uso (desde backend/):
+    python -m benchmarks.mapeo_filas                 # 1.000.000 de turnos en una base temporal
+    python -m benchmarks.mapeo_filas --filas 200000 --repeticiones 5
+    python -m benchmarks.mapeo_filas --db data/donbalon.db
+"""
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+
+from classes.turno import from_dict as turno_from_dict
+from data.init_db import init_database
+from repositories.turno_repository import TurnoRepository
+
+CANCHAS = 3
+HORARIOS = 9
+
+
+def crear_base(db_path: str, filas: int) -> None:
+    """Crea una base con el esquema completo y `filas` turnos (uno por cancha, horario y día)."""
+    init_database(db_path)
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("INSERT INTO TipoCancha (descripcion, precio_hora) VALUES ('Futbol', 500)")
+        conn.executemany(
+            "INSERT INTO Cancha (id_tipo, nombre) VALUES (1, ?)",
+            [(f"Cancha {i}",) for i in range(1, CANCHAS + 1)],
+        )
+        conn.executemany(
+            "INSERT INTO Horario (hora_inicio, hora_fin) VALUES (?, ?)",
+            [(f"{8 + i:02d}:00:00", f"{9 + i:02d}:00:00") for i in range(HORARIOS)],
+        )
+        # Generado en SQL: n recorre 0..filas-1 y se reparte en cancha, horario y día
+        conn.execute(
+            """
+            WITH RECURSIVE n(i) AS (SELECT 0 UNION ALL SELECT i + 1 FROM n WHERE i + 1 < ?)
+            INSERT INTO Turno (id_cancha, id_horario, fecha, estado_turno)
+            SELECT i % ? + 1, i / ? % ? + 1, date('2000-01-01', '+' || (i / ?) || ' days'),
+                   CASE WHEN i % 3 = 0 THEN 'No Disponible' ELSE 'Disponible' END
+            FROM n
+            """,
+            (filas, CANCHAS, CANCHAS, HORARIOS, CANCHAS * HORARIOS),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def get_all_anterior(repo: TurnoRepository):
+    """TurnoRepository.get_all() antes del mapeo compilado."""
+    rows = repo.query_all(f"SELECT * FROM {repo.TABLE}")
+    return [turno_from_dict(dict(row)) for row in rows]
+
+
+def get_all_actual(repo: TurnoRepository):
+    return repo.get_all()
+
+
+def medir(func, repo, repeticiones):
+    """Mejor tiempo de `repeticiones` ejecuciones, y el resultado de la última."""
+    mejor = None
+    resultado = None
+    for _ in range(repeticiones):
+        resultado = None  # liberar la lista anterior antes de medir
+        inicio = time.perf_counter()
+        resultado = func(repo)
+        transcurrido = time.perf_counter() - inicio
+        mejor = transcurrido if mejor is None else min(mejor, transcurrido)
+    return mejor, resultado
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Medir el mapeo fila -> entidad de TurnoRepository.get_all()")
+    parser.add_argument("--db", default=None, help="Base existente a leer (default: base temporal generada)")
+    parser.add_argument("--filas", type=int, default=1_000_000, help="Turnos a generar en la base temporal")
+    parser.add_argument("--repeticiones", type=int, default=3, help="Repeticiones por versión (se toma la mejor)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = args.db
+        if db_path is None:
+            db_path = os.path.join(tmp, "mapeo_filas.db")
+            inicio = time.perf_counter()
+            crear_base(db_path, args.filas)
+            print(f"Base temporal con {args.filas} turnos creada en {time.perf_counter() - inicio:.1f}s")
+
+        repo = TurnoRepository(db_path, profile="reporting")
+        try:
+            t_anterior, anterior = medir(get_all_anterior, repo, args.repeticiones)
+            t_actual, actual = medir(get_all_actual, repo, args.repeticiones)
+            if [t.to_dict() for t in anterior] != [t.to_dict() for t in actual]:
+                print("ADVERTENCIA: las dos versiones devuelven datos distintos")
+            print(
+                f"Turno.get_all(): {len(actual)} filas | anterior {t_anterior:.2f} s "
+                f"({t_anterior / max(len(actual), 1) * 1e6:.2f} us/fila) | actual {t_actual:.2f} s "
+                f"({t_actual / max(len(actual), 1) * 1e6:.2f} us/fila) | {t_anterior / t_actual:.1f}x"
+            )
+        finally:
+            repo.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Mide la memoria de listar la tabla Turno completa con cada modelo.
+
+Compara con tracemalloc la memoria retenida por la lista resultante y el pico
+durante la consulta de:
+
+- el listado anterior (fetchall de sqlite3.Row -> dict -> from_dict),
+- TurnoRepository.get_all() (Turno, dataclass con __dict__ por instancia),
+- TurnoRepository.get_all_lectura() (TurnoLectura, NamedTuple de solo lectura).
+
+En Python 3.11+ los __dict__ de instancia ya son compactos, así que la
+diferencia entre Turno y TurnoLectura es menor que en versiones anteriores.
+
+Uso (desde backend/):
+    python -m benchmarks.memoria_modelos                 # 1.000.000 de turnos en una base temporal
+    python -m benchmarks.memoria_modelos --filas 200000
+    python -m benchmarks.memoria_modelos --db data/donbalon.db
+"""
+import argparse
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.mapeo_filas import crear_base, get_all_anterior
+from repositories.turno_repository import TurnoRepository
+
+
+def medir_memoria(listar):
+    """
+    Ejecuta `listar()` bajo tracemalloc
+
+    Returns:
+        Tupla (cantidad de objetos, bytes retenidos por el resultado, pico en bytes)
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        antes = tracemalloc.get_traced_memory()[0]
+        resultado = listar()
+        retenido, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return len(resultado), retenido - antes, pico - antes
+
+
+def mb(cantidad: int) -> str:
+    return f"{cantidad / 1024 / 1024:.1f} MB"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Medir la memoria de Turno contra TurnoLectura")
+    parser.add_argument("--db", default=None, help="Base existente a leer (default: base temporal generada)")
+    parser.add_argument("--filas", type=int, default=1_000_000, help="Turnos a generar en la base temporal")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = args.db
+        if db_path is None:
+            db_path = os.path.join(tmp, "memoria_modelos.db")
+            inicio = time.perf_counter()
+            crear_base(db_path, args.filas)
+            print(f"Base temporal con {args.filas} turnos creada en {time.perf_counter() - inicio:.1f}s")
+
+        repo = TurnoRepository(db_path, profile="reporting")
+        try:
+            # Una lectura previa para que las fechas memoizadas y las funciones
+            # compiladas no se cuenten en ninguna de las dos mediciones
+            repo.get_all_lectura()
+            _, retenido_anterior, pico_anterior = medir_memoria(lambda: get_all_anterior(repo))
+            filas, retenido_turno, pico_turno = medir_memoria(repo.get_all)
+            _, retenido_lectura, pico_lectura = medir_memoria(repo.get_all_lectura)
+        finally:
+            repo.close()
+
+    por_fila = max(filas, 1)
+    print(f"Turno.get_all() sobre {filas} filas:")
+    print(f"  anterior      retenido {mb(retenido_anterior)} ({retenido_anterior / por_fila:.0f} B/fila) | pico {mb(pico_anterior)}")
+    print(f"  Turno         retenido {mb(retenido_turno)} ({retenido_turno / por_fila:.0f} B/fila) | pico {mb(pico_turno)}")
+    print(f"  TurnoLectura  retenido {mb(retenido_lectura)} ({retenido_lectura / por_fila:.0f} B/fila) | pico {mb(pico_lectura)}")
+    if retenido_lectura:
+        print(
+            f"  TurnoLectura contra Turno: {retenido_turno / retenido_lectura:.2f}x retenido; "
+            f"contra el anterior: {retenido_anterior / retenido_lectura:.2f}x retenido, "
+            f"{pico_anterior / max(pico_lectura, 1):.2f}x pico"
+        )
+
+
+if __name__ == "__main__":
+    main()
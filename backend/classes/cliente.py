@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, NamedTuple
 
 @dataclass
 class Cliente:
@@ -23,6 +23,26 @@ class Cliente:
         }
 
 
+class ClienteLectura(NamedTuple):
+    """Variante compacta y de solo lectura de Cliente, para listados masivos
+
+    Es una tupla: sin __dict__ por instancia. Tiene los mismos atributos y el
+    mismo to_dict() que Cliente; to_entity() devuelve el Cliente modificable.
+    """
+    id_cliente: Optional[int] = None
+    nombre: str = ""
+    apellido: str = ""
+    telefono: str = ""
+    mail: str = ""
+    password: str = ""
+    admin: bool = False
+
+    to_dict = Cliente.to_dict
+
+    def to_entity(self) -> Cliente:
+        return Cliente(*self)
+
+
 def from_dict(data: Dict[str, Any]) -> "Cliente":
     """Crear una instancia de Cliente a partir de un dict.
 
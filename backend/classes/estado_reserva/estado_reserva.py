@@ -1,11 +1,31 @@
 from abc import ABC, abstractmethod
 
+
 class EstadoReserva(ABC):
     """
     Interfaz para todos los estados concretos de Reserva.
     Define las acciones que pueden ocurrir.
+
+    Los estados no guardan datos: cada clase tiene una única instancia
+    (ReservaPagada() siempre devuelve el mismo objeto) y su nombre se calcula
+    una sola vez al definir la clase.
     """
-    
+
+    __slots__ = ()
+
+    # Nombre serializable ('Pendiente', 'Pagada', ...), fijado por __init_subclass__
+    nombre = ""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.nombre = cls.__name__.replace("Reserva", "")
+        cls._instancia = None
+
+    def __new__(cls):
+        if cls._instancia is None:
+            cls._instancia = super().__new__(cls)
+        return cls._instancia
+
     @abstractmethod
     def confirmar_pago(self, reserva):
         pass
@@ -20,4 +40,7 @@ class EstadoReserva(ABC):
         
     def __str__(self):
         # Permite imprimir el nombre del estado
-        return self.__class__.__name__.replace("Reserva", "")
\ No newline at end of file
+        return self.nombre
+
+    def __repr__(self):
+        return f"<{type(self).__name__}>"
@@ -1,11 +1,19 @@
+import logging
+
 from .estado_reserva import EstadoReserva
 
+logger = logging.getLogger(__name__)
+
+
 class ReservaCancelada(EstadoReserva):
+
+    __slots__ = ()
+
     def confirmar_pago(self, reserva):
-        print(f"[{reserva.id}] Error: No se puede pagar una reserva cancelada.")
+        logger.error("[%s] No se puede pagar una reserva cancelada.", reserva.id_reserva)
 
     def cancelar(self, reserva):
-        print(f"[{reserva.id}] Error: La reserva ya está cancelada.")
+        logger.error("[%s] La reserva ya está cancelada.", reserva.id_reserva)
 
     def finalizar_turno(self, reserva):
-        print(f"[{reserva.id}] La reserva cancelada no necesita finalizarse.")
\ No newline at end of file
+        logger.info("[%s] La reserva cancelada no necesita finalizarse.", reserva.id_reserva)
@@ -1,11 +1,19 @@
+import logging
+
 from .estado_reserva import EstadoReserva
 
+logger = logging.getLogger(__name__)
+
+
 class ReservaFinalizada(EstadoReserva):
+
+    __slots__ = ()
+
     def confirmar_pago(self, reserva):
-        print(f"[{reserva.id}] Error: La reserva ya ha finalizado.")
+        logger.error("[%s] La reserva ya ha finalizado.", reserva.id_reserva)
 
     def cancelar(self, reserva):
-        print(f"[{reserva.id}] Error: Una reserva finalizada no puede ser cancelada.")
+        logger.error("[%s] Una reserva finalizada no puede ser cancelada.", reserva.id_reserva)
 
     def finalizar_turno(self, reserva):
-        print(f"[{reserva.id}] Error: La reserva ya ha finalizado.")
\ No newline at end of file
+        logger.error("[%s] La reserva ya ha finalizado.", reserva.id_reserva)
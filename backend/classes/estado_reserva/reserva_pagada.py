@@ -1,23 +1,25 @@
+import logging
+
 from .estado_reserva import EstadoReserva
 from .reserva_cancelada import ReservaCancelada
 from .reserva_finalizada import ReservaFinalizada
 
+logger = logging.getLogger(__name__)
+
 
 class ReservaPagada(EstadoReserva):
-    
-    def __str__(self):
-        # Permite imprimir el nombre del estado (Pagada)
-        return self.__class__.__name__.replace("Reserva", "") 
+
+    __slots__ = ()
 
     def confirmar_pago(self, reserva):
-        print(f"[{reserva.id_reserva}] Advertencia: La reserva ya se encuentra pagada.")
+        logger.warning("[%s] La reserva ya se encuentra pagada.", reserva.id_reserva)
 
     def cancelar(self, reserva):
-        print(f"[{reserva.id_reserva}] Cancelando reserva pagada. Se procesará un reembolso.")
+        logger.info("[%s] Cancelando reserva pagada. Se procesará un reembolso.", reserva.id_reserva)
         # Cambia a Cancelada (donde se gestiona el reembolso)
         reserva.cambiar_estado(ReservaCancelada())
         
     def finalizar_turno(self, reserva):
-        print(f"[{reserva.id_reserva}] Turno finalizado. Marcando reserva como Finalizada.")
+        logger.debug("[%s] Turno finalizado. Marcando reserva como Finalizada.", reserva.id_reserva)
         # Cambia a Finalizada
-        reserva.cambiar_estado(ReservaFinalizada())
\ No newline at end of file
+        reserva.cambiar_estado(ReservaFinalizada())
@@ -1,23 +1,25 @@
+import logging
+
 from .estado_reserva import EstadoReserva
 from .reserva_pagada import ReservaPagada
 from .reserva_cancelada import ReservaCancelada
 
+logger = logging.getLogger(__name__)
+
+
 class ReservaPendiente(EstadoReserva):
+
+    __slots__ = ()
+
     def confirmar_pago(self, reserva):
-        print(f"[{reserva.id}] Pago recibido. Confirmando reserva...")
+        logger.debug("[%s] Pago recibido. Confirmando reserva...", reserva.id_reserva)
         reserva.cambiar_estado(ReservaPagada())
         
     def cancelar(self, reserva):
-        print(f"[{reserva.id}] Cancelando reserva pendiente.")
+        logger.debug("[%s] Cancelando reserva pendiente.", reserva.id_reserva)
         reserva.cambiar_estado(ReservaCancelada())
         
     def finalizar_turno(self, reserva):
-        print(f"[{reserva.id}] Advertencia: El turno pasó y la reserva sigue pendiente.")
+        logger.warning("[%s] El turno pasó y la reserva sigue pendiente.", reserva.id_reserva)
         # Una reserva pendiente vencida se cancela automáticamente
         reserva.cambiar_estado(ReservaCancelada())
-
-
-
-
-
-
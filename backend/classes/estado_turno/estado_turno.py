@@ -1,8 +1,33 @@
+import re
 from abc import ABC, abstractmethod
 
+
 class EstadoTurno(ABC):
-    """Interfaz para los objetos de estado de un Turno."""
-    
+    """Interfaz para los objetos de estado de un Turno.
+
+    Los estados no guardan datos: cada clase tiene una única instancia
+    (TurnoDisponible() siempre devuelve el mismo objeto) y su nombre se calcula
+    una sola vez al definir la clase.
+    """
+
+    __slots__ = ()
+
+    # Nombre serializable ('Disponible', 'No Disponible'), fijado por __init_subclass__
+    nombre = ""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Convierte 'TurnoDisponible' -> 'Disponible' y 'TurnoNoDisponible' -> 'No Disponible'
+        name = cls.__name__.replace("Turno", "")
+        # Agregar espacio antes de mayúsculas: 'NoDisponible' -> 'No Disponible'
+        cls.nombre = re.sub(r'(?<!^)(?=[A-Z])', ' ', name)
+        cls._instancia = None
+
+    def __new__(cls):
+        if cls._instancia is None:
+            cls._instancia = super().__new__(cls)
+        return cls._instancia
+
     @abstractmethod
     def reservar(self, turno):
         """Intenta cambiar el estado a No Disponible (reservado)."""
@@ -15,9 +40,7 @@ class EstadoTurno(ABC):
 
     def __str__(self):
         """Devuelve la representación serializable del estado."""
-        # Convierte 'TurnoDisponible' -> 'Disponible' y 'TurnoNoDisponible' -> 'No Disponible'
-        name = self.__class__.__name__.replace("Turno", "")
-        # Agregar espacio antes de mayúsculas: 'NoDisponible' -> 'No Disponible'
-        import re
-        name = re.sub(r'(?<!^)(?=[A-Z])', ' ', name)
-        return name
\ No newline at end of file
+        return self.nombre
+
+    def __repr__(self):
+        return f"<{type(self).__name__}>"
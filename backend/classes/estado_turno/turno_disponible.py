@@ -1,14 +1,24 @@
+import logging
+
 from .estado_turno import EstadoTurno
 
+logger = logging.getLogger(__name__)
+
+
 class TurnoDisponible(EstadoTurno):
-    
+
+    __slots__ = ()
+
     def reservar(self, turno):
         """Permite la transición a No Disponible."""
-        from .turno_no_disponible import TurnoNoDisponible
-        print(f"[Turno {turno.id_turno}] Marcado como No Disponible (Reservado).")
+        logger.debug("[Turno %s] Marcado como No Disponible (Reservado).", turno.id_turno)
         turno.cambiar_estado(TurnoNoDisponible())
 
     def liberar(self, turno):
         """Ya está disponible, no hay cambio."""
-        print(f"[Turno {turno.id_turno}] Advertencia: El turno ya está Disponible.")
-        pass
\ No newline at end of file
+        logger.warning("[Turno %s] El turno ya está Disponible.", turno.id_turno)
+
+
+# Al final del módulo por la referencia circular entre los dos estados (importar
+# dentro del método costaba más que toda la transición)
+from .turno_no_disponible import TurnoNoDisponible  # noqa: E402
@@ -1,16 +1,23 @@
+import logging
+
 from .estado_turno import EstadoTurno
-# Las importaciones circulares se evitan importando dentro de los métodos
+
+logger = logging.getLogger(__name__)
 
 
 class TurnoNoDisponible(EstadoTurno):
-    
+
+    __slots__ = ()
+
     def reservar(self, turno):
         """Ya está reservado, no hay cambio."""
-        print(f"[Turno {turno.id_turno}] Advertencia: El turno ya está No Disponible.")
-        pass
+        logger.warning("[Turno %s] El turno ya está No Disponible.", turno.id_turno)
 
     def liberar(self, turno):
         """Permite la transición a Disponible."""
-        from .turno_disponible import TurnoDisponible
-        print(f"[Turno {turno.id_turno}] Marcado como Disponible (Liberado).")
-        turno.cambiar_estado(TurnoDisponible())
\ No newline at end of file
+        logger.debug("[Turno %s] Marcado como Disponible (Liberado).", turno.id_turno)
+        turno.cambiar_estado(TurnoDisponible())
+
+
+# Al final del módulo por la referencia circular entre los dos estados
+from .turno_disponible import TurnoDisponible  # noqa: E402
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, NamedTuple
 from decimal import Decimal
 import datetime
 
@@ -21,6 +21,24 @@ class Pago:
         }
 
 
+class PagoLectura(NamedTuple):
+    """Variante compacta y de solo lectura de Pago, para listados masivos
+
+    Es una tupla: sin __dict__ por instancia. Tiene los mismos atributos y el
+    mismo to_dict() que Pago; to_entity() devuelve el Pago modificable.
+    """
+    id_pago: Optional[int] = None
+    id_reserva: Optional[int] = None
+    id_metodo_pago: Optional[int] = None
+    fecha_pago: Optional[datetime.date] = None
+    monto: Decimal = Decimal("0.00")
+
+    to_dict = Pago.to_dict
+
+    def to_entity(self) -> Pago:
+        return Pago(*self)
+
+
 def from_dict(data: Dict[str, Any]) -> "Pago":
     fecha = data.get("fecha_pago")
     if isinstance(fecha, str):
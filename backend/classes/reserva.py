@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, NamedTuple
 from decimal import Decimal
+from functools import lru_cache
 import datetime
 from .estado_reserva.estado_reserva import EstadoReserva
 from .estado_reserva.reserva_pendiente import ReservaPendiente
@@ -15,6 +16,15 @@ ESTADOS_MAP = {
     "pagada": ReservaPagada,
 }
 
+
+@lru_cache(maxsize=None)
+def estado_reserva_desde_nombre(nombre: Optional[str]) -> EstadoReserva:
+    """Objeto State (único por clase) para el estado guardado en la base,
+    memoizado por el texto tal como viene de la base."""
+    estado_class = ESTADOS_MAP.get((nombre or "pendiente").lower(), ReservaPendiente)
+    return estado_class()
+
+
 @dataclass
 class Reserva:
     id_reserva: Optional[int] = None
@@ -37,7 +47,7 @@ class Reserva:
 
     @property
     def estado_nombre(self) -> str:
-        return str(self.estado)
+        return self.estado.nombre
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -50,10 +60,26 @@ class Reserva:
         }
 
 
+class ReservaLectura(NamedTuple):
+    """Variante compacta y de solo lectura de Reserva, para listados masivos
+
+    Es una tupla: sin __dict__ por instancia. Tiene los mismos atributos y el
+    mismo to_dict() que Reserva; to_entity() devuelve el Reserva modificable.
+    """
+    id_reserva: Optional[int] = None
+    id_cliente: Optional[int] = None
+    monto_total: Decimal = Decimal("0.00")
+    fecha_reserva: Optional[datetime.date] = None
+    estado: EstadoReserva = ReservaPendiente()
+
+    estado_nombre = Reserva.estado_nombre
+    to_dict = Reserva.to_dict
+
+    def to_entity(self) -> Reserva:
+        return Reserva(*self)
+
+
 def from_dict(data: Dict[str, Any]) -> "Reserva":
-    estado_str = (data.get("estado_reserva") or "pendiente").lower()
-    estado_class = ESTADOS_MAP.get(estado_str, ReservaPendiente)
-    
     fecha = data.get("fecha_reserva")
     if isinstance(fecha, str):
         fecha = datetime.date.fromisoformat(fecha)
@@ -63,5 +89,5 @@ def from_dict(data: Dict[str, Any]) -> "Reserva":
         id_cliente=data.get("id_cliente"),
         monto_total=Decimal(str(data.get("monto_total", "0.00"))),
         fecha_reserva=fecha,
-        estado=estado_class(),  # instancia el objeto real del State
+        estado=estado_reserva_desde_nombre(data.get("estado_reserva")),
     )
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, NamedTuple
 from decimal import Decimal
 
 @dataclass
@@ -18,6 +18,23 @@ class ReservaDetalle:
         }
 
 
+class ReservaDetalleLectura(NamedTuple):
+    """Variante compacta y de solo lectura de ReservaDetalle, para listados masivos
+
+    Es una tupla: sin __dict__ por instancia. Tiene los mismos atributos y el
+    mismo to_dict() que ReservaDetalle; to_entity() devuelve el ReservaDetalle modificable.
+    """
+    id_detalle: Optional[int] = None
+    id_reserva: Optional[int] = None
+    id_turno: Optional[int] = None
+    precio_total_item: Decimal = Decimal("0.00")
+
+    to_dict = ReservaDetalle.to_dict
+
+    def to_entity(self) -> ReservaDetalle:
+        return ReservaDetalle(*self)
+
+
 def from_dict(data: Dict[str, Any]) -> "ReservaDetalle":
     def to_dec(v):
         return Decimal(str(v)) if v is not None else Decimal("0.00")
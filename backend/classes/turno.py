@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, NamedTuple
+from functools import lru_cache
 import datetime
 
 # Importar las clases de estado (asumo que estas rutas son correctas)
@@ -14,6 +15,18 @@ ESTADOS_TURNO_MAP = {
     "nodisponible": TurnoNoDisponible, 
 }
 
+
+@lru_cache(maxsize=None)
+def estado_turno_desde_nombre(nombre: Optional[str]) -> EstadoTurno:
+    """Objeto State (único por clase) para el estado guardado en la base.
+
+    Memoizada por el texto tal como viene de la base, para no normalizarlo en
+    cada fila.
+    """
+    estado_class = ESTADOS_TURNO_MAP.get((nombre or "disponible").lower(), TurnoDisponible)
+    return estado_class()
+
+
 @dataclass
 class Turno:
     id_turno: Optional[int] = None
@@ -41,8 +54,8 @@ class Turno:
     
     @property
     def estado_nombre(self) -> str:
-        """Devuelve el string serializable llamando a __str__ del objeto State."""
-        return str(self.estado)
+        """Devuelve el nombre serializable del objeto State (precalculado)."""
+        return self.estado.nombre
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -54,10 +67,27 @@ class Turno:
             "estado_turno": self.estado_nombre, 
         }
 
+
+class TurnoLectura(NamedTuple):
+    """Variante compacta y de solo lectura de Turno, para listados masivos
+
+    Es una tupla: sin __dict__ por instancia. Tiene los mismos atributos y el
+    mismo to_dict() que Turno; to_entity() devuelve el Turno modificable.
+    """
+    id_turno: Optional[int] = None
+    id_cancha: Optional[int] = None
+    id_horario: Optional[int] = None
+    fecha: Optional[datetime.date] = None
+    estado: EstadoTurno = TurnoDisponible()
+
+    estado_nombre = Turno.estado_nombre
+    to_dict = Turno.to_dict
+
+    def to_entity(self) -> Turno:
+        return Turno(*self)
+
+
 def from_dict(data: Dict[str, Any]) -> "Turno":
-    estado_str = (data.get("estado_turno") or "disponible").lower()
-    estado_class = ESTADOS_TURNO_MAP.get(estado_str, TurnoDisponible)
-    
     fecha = data.get("fecha")
     if isinstance(fecha, str):
         fecha = datetime.date.fromisoformat(fecha)
@@ -67,5 +97,5 @@ def from_dict(data: Dict[str, Any]) -> "Turno":
         id_cancha=data.get("id_cancha"),
         id_horario=data.get("id_horario"),
         fecha=fecha,
-        estado=estado_class(), 
+        estado=estado_turno_desde_nombre(data.get("estado_turno")),
     )
\ No newline at end of file
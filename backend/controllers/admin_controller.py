@@ -0,0 +1,44 @@
+from fastapi import APIRouter, Query, status
+from data.query_budget import query_budget
+from data.query_stats import query_stats
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+
+@router.get("/queries")
+def get_query_stats(limit: int = Query(50, ge=1, le=1000, description="Cantidad máxima de sentencias")):
+    """
+    Sentencias SQL agrupadas por forma (ordenadas por tiempo total), con su
+    histograma de latencia y filas; sentencias por request; y log de
+    sentencias lentas con su EXPLAIN QUERY PLAN
+    """
+    return query_stats.snapshot(limit)
+
+
+@router.delete("/queries", status_code=status.HTTP_204_NO_CONTENT)
+def reset_query_stats():
+    """Reiniciar las estadísticas de sentencias (p. ej. antes de medir un cambio)"""
+    query_stats.reset()
+    return None
+
+
+@router.get("/n-plus-one")
+def get_n_plus_one():
+    """
+    Últimos requests que superaron el presupuesto de sentencias o repitieron una
+    sentencia con parámetros distintos (N+1), con los lugares del código que la
+    ejecutaron. Vacío si el detector está apagado (DONBALON_QUERY_BUDGET sin definir)
+    """
+    return {
+        "enabled": query_budget.enabled,
+        "budget": query_budget.budget,
+        "min_repeats": query_budget.min_repeats,
+        "requests": query_budget.flagged(),
+    }
+
+
+@router.delete("/n-plus-one", status_code=status.HTTP_204_NO_CONTENT)
+def reset_n_plus_one():
+    """Descartar los requests marcados por el detector de N+1"""
+    query_budget.reset()
+    return None
@@ -1,30 +1,44 @@
-from fastapi import APIRouter, HTTPException, status, Depends
-from typing import List
+from fastapi import APIRouter, Body, HTTPException, status, Depends, Query, Response
+from typing import List, Optional
 from schemas.cancha_schema import CanchaCreate, CanchaUpdate, CanchaResponse
+from services.async_service import AsyncService
 from services.cancha_service import CanchaService
 from classes.cancha import Cancha
-from data.database_connection import DatabaseConnection
+from data.db_executor import DatabaseExecutor, get_db_executor
+from controllers.pagination import LIMIT_DESCRIPTION, MAX_LIMIT, AFTER_DESCRIPTION, set_next_cursor
 
 router = APIRouter(prefix="/canchas", tags=["Canchas"])
 
 
-def get_cancha_service():
-    """Dependency para obtener instancia de CanchaService"""
-    db_conn = DatabaseConnection()
-    return CanchaService(connection=db_conn.get_connection())
+def get_cancha_service(executor: DatabaseExecutor = Depends(get_db_executor)) -> AsyncService[CanchaService]:
+    """Dependency para obtener CanchaService sobre el executor de base de datos"""
+    return AsyncService(CanchaService, executor)
 
 
 @router.get("/", response_model=List[CanchaResponse])
-def list_canchas(service: CanchaService = Depends(get_cancha_service)):
-    """Listar todas las canchas"""
-    canchas = service.list_all()
+async def list_canchas(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_LIMIT, description=LIMIT_DESCRIPTION),
+    after: Optional[str] = Query(None, description=AFTER_DESCRIPTION),
+    id_tipo: Optional[int] = None,
+    service: AsyncService[CanchaService] = Depends(get_cancha_service),
+):
+    """Listar las canchas paginadas por id (filtros opcionales: tipo de cancha)"""
+    try:
+        canchas, next_cursor = await service.list_page(limit, after, id_tipo=id_tipo)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    set_next_cursor(response, next_cursor)
     return [CanchaResponse(**cancha.to_dict()) for cancha in canchas]
 
 
 @router.get("/{id_cancha}", response_model=CanchaResponse)
-def get_cancha(id_cancha: int, service: CanchaService = Depends(get_cancha_service)):
+async def get_cancha(id_cancha: int, service: AsyncService[CanchaService] = Depends(get_cancha_service)):
     """Obtener una cancha por ID"""
-    cancha = service.get_by_id(id_cancha)
+    cancha = await service.get_by_id(id_cancha)
     if not cancha:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -34,7 +48,7 @@ def get_cancha(id_cancha: int, service: CanchaService = Depends(get_cancha_servi
 
 
 @router.post("/", response_model=CanchaResponse, status_code=status.HTTP_201_CREATED)
-def create_cancha(cancha_data: CanchaCreate, service: CanchaService = Depends(get_cancha_service)):
+async def create_cancha(cancha_data: CanchaCreate, service: AsyncService[CanchaService] = Depends(get_cancha_service)):
     """Crear una nueva cancha"""
     # Conversión manual de Schema a Clase de Dominio
     cancha = Cancha(
@@ -43,7 +57,7 @@ def create_cancha(cancha_data: CanchaCreate, service: CanchaService = Depends(ge
     )
     
     try:
-        created_cancha = service.insert(cancha)
+        created_cancha = await service.insert(cancha)
         return CanchaResponse(**created_cancha.to_dict())
     except ValueError as e:
         raise HTTPException(
@@ -52,11 +66,28 @@ def create_cancha(cancha_data: CanchaCreate, service: CanchaService = Depends(ge
         )
 
 
+@router.post("/bulk", response_model=List[CanchaResponse], status_code=status.HTTP_201_CREATED)
+async def create_canchas_bulk(
+    canchas_data: List[CanchaCreate] = Body(..., min_length=1, max_length=MAX_LIMIT),
+    service: AsyncService[CanchaService] = Depends(get_cancha_service),
+):
+    """Crear varias canchas en una sola transacción (todas o ninguna)"""
+    canchas = [Cancha(nombre=data.nombre, id_tipo=data.id_tipo) for data in canchas_data]
+    try:
+        created = await service.insert_many(canchas)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    return [CanchaResponse(**cancha.to_dict()) for cancha in created]
+
+
 @router.put("/{id_cancha}", response_model=CanchaResponse)
-def update_cancha(id_cancha: int, cancha_data: CanchaUpdate, service: CanchaService = Depends(get_cancha_service)):
+async def update_cancha(id_cancha: int, cancha_data: CanchaUpdate, service: AsyncService[CanchaService] = Depends(get_cancha_service)):
     """Actualizar una cancha existente (Maneja parciales correctamente)"""
     # 1. Verificar y obtener datos ACTUALES de la BD
-    cancha_actual = service.get_by_id(id_cancha)
+    cancha_actual = await service.get_by_id(id_cancha)
     if not cancha_actual:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -75,7 +106,7 @@ def update_cancha(id_cancha: int, cancha_data: CanchaUpdate, service: CanchaServ
     )
     
     try:
-        service.update(cancha_a_guardar)
+        await service.update(cancha_a_guardar)
         # Devolvemos la versión actualizada
         return CanchaResponse(**cancha_a_guardar.to_dict())
     except ValueError as e:
@@ -86,15 +117,15 @@ def update_cancha(id_cancha: int, cancha_data: CanchaUpdate, service: CanchaServ
 
 
 @router.delete("/{id_cancha}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_cancha(id_cancha: int, service: CanchaService = Depends(get_cancha_service)):
+async def delete_cancha(id_cancha: int, service: AsyncService[CanchaService] = Depends(get_cancha_service)):
     """Eliminar una cancha"""
     # Verificar que existe
-    existing = service.get_by_id(id_cancha)
+    existing = await service.get_by_id(id_cancha)
     if not existing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Cancha con ID {id_cancha} no encontrada"
         )
     
-    service.delete(id_cancha)
+    await service.delete(id_cancha)
     return None
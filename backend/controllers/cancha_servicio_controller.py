@@ -1,36 +1,51 @@
-from fastapi import APIRouter, HTTPException, status, Depends
-from typing import List
+from fastapi import APIRouter, Body, HTTPException, status, Depends, Query, Response
+from typing import List, Optional
 from schemas.cancha_servicio_schema import CanchaServicioCreate, CanchaServicioResponse
+from services.async_service import AsyncService
 from services.cancha_servicio_service import CanchaServicioService
 from classes.cancha_servicio import CanchaServicio
-from data.database_connection import DatabaseConnection
+from data.db_executor import DatabaseExecutor, get_db_executor
+from services.exceptions import ConflictoError
+from controllers.pagination import LIMIT_DESCRIPTION, MAX_LIMIT, AFTER_DESCRIPTION, set_next_cursor
 
 router = APIRouter(prefix="/canchas-servicios", tags=["Canchas-Servicios"])
 
 
-def get_cancha_servicio_service():
-    """Dependency para obtener instancia de CanchaServicioService"""
-    db_conn = DatabaseConnection()
-    return CanchaServicioService(connection=db_conn.get_connection())
+def get_cancha_servicio_service(executor: DatabaseExecutor = Depends(get_db_executor)) -> AsyncService[CanchaServicioService]:
+    """Dependency para obtener CanchaServicioService sobre el executor de base de datos"""
+    return AsyncService(CanchaServicioService, executor)
 
 
 @router.get("/", response_model=List[CanchaServicioResponse])
-def list_canchas_servicios(service: CanchaServicioService = Depends(get_cancha_servicio_service)):
-    """Listar todas las relaciones cancha-servicio"""
-    items = service.list_all()
+async def list_canchas_servicios(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_LIMIT, description=LIMIT_DESCRIPTION),
+    after: Optional[str] = Query(None, description=AFTER_DESCRIPTION),
+    id_cancha: Optional[int] = None,
+    id_servicio: Optional[int] = None,
+    service: AsyncService[CanchaServicioService] = Depends(get_cancha_servicio_service),
+):
+    """Listar las relaciones cancha-servicio paginadas por id (filtros opcionales: cancha, servicio)"""
+    try:
+        items, next_cursor = await service.list_page(limit, after, id_cancha=id_cancha, id_servicio=id_servicio)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    set_next_cursor(response, next_cursor)
     return [CanchaServicioResponse(**item.to_dict()) for item in items]
 
 
 @router.get("/cancha/{id_cancha}", response_model=List[CanchaServicioResponse])
-def get_by_cancha(id_cancha: int, service: CanchaServicioService = Depends(get_cancha_servicio_service)):
+async def get_by_cancha(id_cancha: int, service: AsyncService[CanchaServicioService] = Depends(get_cancha_servicio_service)):
     """Obtener servicios por ID de cancha"""
-    items = service.list_all()
-    filtered = [item for item in items if item.id_cancha == id_cancha]
-    return [CanchaServicioResponse(**item.to_dict()) for item in filtered]
+    items = await service.get_by_cancha(id_cancha)
+    return [CanchaServicioResponse(**item.to_dict()) for item in items]
 
 
 @router.post("/", response_model=CanchaServicioResponse, status_code=status.HTTP_201_CREATED)
-def create_cancha_servicio(data: CanchaServicioCreate, service: CanchaServicioService = Depends(get_cancha_servicio_service)):
+async def create_cancha_servicio(data: CanchaServicioCreate, service: AsyncService[CanchaServicioService] = Depends(get_cancha_servicio_service)):
     """Crear una nueva relación cancha-servicio"""
     # Conversión manual de Schema a Clase de Dominio
     cancha_servicio = CanchaServicio(
@@ -39,7 +54,7 @@ def create_cancha_servicio(data: CanchaServicioCreate, service: CanchaServicioSe
     )
     
     try:
-        created = service.insert(cancha_servicio)
+        created = await service.insert(cancha_servicio)
         return CanchaServicioResponse(**created.to_dict())
     except ValueError as e:
         raise HTTPException(
@@ -48,22 +63,38 @@ def create_cancha_servicio(data: CanchaServicioCreate, service: CanchaServicioSe
         )
 
 
+@router.post("/bulk", response_model=List[CanchaServicioResponse], status_code=status.HTTP_201_CREATED)
+async def create_canchas_servicios_bulk(
+    items_data: List[CanchaServicioCreate] = Body(..., min_length=1, max_length=MAX_LIMIT),
+    service: AsyncService[CanchaServicioService] = Depends(get_cancha_servicio_service),
+):
+    """Crear varias relaciones cancha-servicio en una sola transacción (todas o ninguna)"""
+    items = [CanchaServicio(id_cancha=data.id_cancha, id_servicio=data.id_servicio) for data in items_data]
+    try:
+        created = await service.insert_many(items)
+    except ConflictoError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    return [CanchaServicioResponse(**item.to_dict()) for item in created]
+
+
 @router.delete("/cancha/{id_cancha}/servicio/{id_servicio}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_cancha_servicio(id_cancha: int, id_servicio: int, service: CanchaServicioService = Depends(get_cancha_servicio_service)):
+async def delete_cancha_servicio(id_cancha: int, id_servicio: int, service: AsyncService[CanchaServicioService] = Depends(get_cancha_servicio_service)):
     """Eliminar una relación cancha-servicio"""
-    # Buscar la relación
-    items = service.list_all()
-    found = None
-    for item in items:
-        if item.id_cancha == id_cancha and item.id_servicio == id_servicio:
-            found = item
-            break
-    
+    # Buscar la relación por su clave
+    found = await service.get_by_ids(id_cancha, id_servicio)
     if not found:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Relación cancha-servicio no encontrada"
         )
     
-    service.delete(id_cancha, id_servicio)
+    await service.delete(id_cancha, id_servicio)
     return None
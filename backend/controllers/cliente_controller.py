@@ -1,10 +1,12 @@
-from fastapi import APIRouter, HTTPException, status, Depends
-from typing import List
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Response
+from typing import List, Optional
 from pydantic import BaseModel
 from schemas.cliente_schema import ClienteCreate, ClienteUpdate, ClienteResponse
+from services.async_service import AsyncService
 from services.cliente_service import ClienteService
 from classes.cliente import Cliente
-from data.database_connection import DatabaseConnection
+from data.db_executor import DatabaseExecutor, get_db_executor
+from controllers.pagination import LIMIT_DESCRIPTION, MAX_LIMIT, AFTER_DESCRIPTION, set_next_cursor
 
 router = APIRouter(prefix="/clientes", tags=["Clientes"])
 
@@ -14,23 +16,35 @@ class LoginRequest(BaseModel):
     password: str
 
 
-def get_cliente_service():
-    """Dependency para obtener instancia de ClienteService"""
-    db_conn = DatabaseConnection()
-    return ClienteService(connection=db_conn.get_connection())
+def get_cliente_service(executor: DatabaseExecutor = Depends(get_db_executor)) -> AsyncService[ClienteService]:
+    """Dependency para obtener ClienteService sobre el executor de base de datos"""
+    return AsyncService(ClienteService, executor)
 
 
 @router.get("/", response_model=List[ClienteResponse])
-def list_clientes(service: ClienteService = Depends(get_cliente_service)):
-    """Listar todos los clientes"""
-    clientes = service.list_all()
+async def list_clientes(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_LIMIT, description=LIMIT_DESCRIPTION),
+    after: Optional[str] = Query(None, description=AFTER_DESCRIPTION),
+    mail: Optional[str] = None,
+    service: AsyncService[ClienteService] = Depends(get_cliente_service),
+):
+    """Listar los clientes paginados por id (filtros opcionales: mail)"""
+    try:
+        clientes, next_cursor = await service.list_page(limit, after, mail=mail)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    set_next_cursor(response, next_cursor)
     return [ClienteResponse(**cliente.to_dict()) for cliente in clientes]
 
 
 @router.get("/{id_cliente}", response_model=ClienteResponse)
-def get_cliente(id_cliente: int, service: ClienteService = Depends(get_cliente_service)):
+async def get_cliente(id_cliente: int, service: AsyncService[ClienteService] = Depends(get_cliente_service)):
     """Obtener un cliente por ID"""
-    cliente = service.get_by_id(id_cliente)
+    cliente = await service.get_by_id(id_cliente)
     if not cliente:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -40,7 +54,7 @@ def get_cliente(id_cliente: int, service: ClienteService = Depends(get_cliente_s
 
 
 @router.post("/", response_model=ClienteResponse, status_code=status.HTTP_201_CREATED)
-def create_cliente(cliente_data: ClienteCreate, service: ClienteService = Depends(get_cliente_service)):
+async def create_cliente(cliente_data: ClienteCreate, service: AsyncService[ClienteService] = Depends(get_cliente_service)):
     """Crear un nuevo cliente"""
     # Conversión manual de Schema a Clase de Dominio
     cliente = Cliente(
@@ -53,7 +67,7 @@ def create_cliente(cliente_data: ClienteCreate, service: ClienteService = Depend
     )
     
     try:
-        created_cliente = service.insert(cliente)
+        created_cliente = await service.insert(cliente)
         return ClienteResponse(**created_cliente.to_dict())
     except ValueError as e:
         raise HTTPException(
@@ -63,10 +77,10 @@ def create_cliente(cliente_data: ClienteCreate, service: ClienteService = Depend
 
 
 @router.put("/{id_cliente}", response_model=ClienteResponse)
-def update_cliente(id_cliente: int, cliente_data: ClienteUpdate, service: ClienteService = Depends(get_cliente_service)):
+async def update_cliente(id_cliente: int, cliente_data: ClienteUpdate, service: AsyncService[ClienteService] = Depends(get_cliente_service)):
     """Actualizar un cliente existente (Maneja parciales correctamente)"""
     # 1. Verificar y obtener datos ACTUALES de la BD
-    cliente_actual = service.get_by_id(id_cliente)
+    cliente_actual = await service.get_by_id(id_cliente)
     if not cliente_actual:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -93,7 +107,7 @@ def update_cliente(id_cliente: int, cliente_data: ClienteUpdate, service: Client
     )
     
     try:
-        service.update(cliente_a_guardar)
+        await service.update(cliente_a_guardar)
         return ClienteResponse(**cliente_a_guardar.to_dict())
     except ValueError as e:
         raise HTTPException(
@@ -103,27 +117,27 @@ def update_cliente(id_cliente: int, cliente_data: ClienteUpdate, service: Client
 
 
 @router.delete("/{id_cliente}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_cliente(id_cliente: int, service: ClienteService = Depends(get_cliente_service)):
+async def delete_cliente(id_cliente: int, service: AsyncService[ClienteService] = Depends(get_cliente_service)):
     """Eliminar un cliente"""
-    existing = service.get_by_id(id_cliente)
+    existing = await service.get_by_id(id_cliente)
     if not existing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Cliente con ID {id_cliente} no encontrado"
         )
     
-    service.delete(id_cliente)
+    await service.delete(id_cliente)
     return None
 
 
 @router.post("/login", response_model=ClienteResponse)
-def login(login_data: LoginRequest, service: ClienteService = Depends(get_cliente_service)):
+async def login(login_data: LoginRequest, service: AsyncService[ClienteService] = Depends(get_cliente_service)):
     """
     Endpoint de login - valida correo y contraseña
     """
     try:
         # Buscar cliente por mail
-        cliente = service.repository.get_by_mail(login_data.mail)
+        cliente = await service.get_by_mail(login_data.mail)
         
         if not cliente:
             raise HTTPException(
@@ -1,30 +1,44 @@
-from fastapi import APIRouter, HTTPException, status, Depends
-from typing import List
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Response
+from typing import List, Optional
 from schemas.equipo_schema import EquipoCreate, EquipoUpdate, EquipoResponse
+from services.async_service import AsyncService
 from services.equipo_service import EquipoService
 from classes.equipo import Equipo
-from data.database_connection import DatabaseConnection
+from data.db_executor import DatabaseExecutor, get_db_executor
+from controllers.pagination import LIMIT_DESCRIPTION, MAX_LIMIT, AFTER_DESCRIPTION, set_next_cursor
 
 router = APIRouter(prefix="/equipos", tags=["Equipos"])
 
 
-def get_equipo_service():
-    """Dependency para obtener instancia de EquipoService"""
-    db_conn = DatabaseConnection()
-    return EquipoService(connection=db_conn.get_connection())
+def get_equipo_service(executor: DatabaseExecutor = Depends(get_db_executor)) -> AsyncService[EquipoService]:
+    """Dependency para obtener EquipoService sobre el executor de base de datos"""
+    return AsyncService(EquipoService, executor)
 
 
 @router.get("/", response_model=List[EquipoResponse])
-def list_equipos(service: EquipoService = Depends(get_equipo_service)):
-    """Listar todos los equipos"""
-    equipos = service.list_all()
+async def list_equipos(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_LIMIT, description=LIMIT_DESCRIPTION),
+    after: Optional[str] = Query(None, description=AFTER_DESCRIPTION),
+    id_torneo: Optional[int] = None,
+    service: AsyncService[EquipoService] = Depends(get_equipo_service),
+):
+    """Listar los equipos paginados por id (filtros opcionales: torneo)"""
+    try:
+        equipos, next_cursor = await service.list_page(limit, after, id_torneo=id_torneo)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    set_next_cursor(response, next_cursor)
     return [EquipoResponse(**equipo.to_dict()) for equipo in equipos]
 
 
 @router.get("/{id_equipo}", response_model=EquipoResponse)
-def get_equipo(id_equipo: int, service: EquipoService = Depends(get_equipo_service)):
+async def get_equipo(id_equipo: int, service: AsyncService[EquipoService] = Depends(get_equipo_service)):
     """Obtener un equipo por ID"""
-    equipo = service.get_by_id(id_equipo)
+    equipo = await service.get_by_id(id_equipo)
     if not equipo:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -34,7 +48,7 @@ def get_equipo(id_equipo: int, service: EquipoService = Depends(get_equipo_servi
 
 
 @router.post("/", response_model=EquipoResponse, status_code=status.HTTP_201_CREATED)
-def create_equipo(equipo_data: EquipoCreate, service: EquipoService = Depends(get_equipo_service)):
+async def create_equipo(equipo_data: EquipoCreate, service: AsyncService[EquipoService] = Depends(get_equipo_service)):
     """Crear un nuevo equipo"""
     # Conversión manual de Schema a Clase de Dominio
     equipo = Equipo(
@@ -44,7 +58,7 @@ def create_equipo(equipo_data: EquipoCreate, service: EquipoService = Depends(ge
     )
     
     try:
-        created_equipo = service.insert(equipo)
+        created_equipo = await service.insert(equipo)
         return EquipoResponse(**created_equipo.to_dict())
     except ValueError as e:
         raise HTTPException(
@@ -54,10 +68,10 @@ def create_equipo(equipo_data: EquipoCreate, service: EquipoService = Depends(ge
 
 
 @router.put("/{id_equipo}", response_model=EquipoResponse)
-def update_equipo(id_equipo: int, equipo_data: EquipoUpdate, service: EquipoService = Depends(get_equipo_service)):
+async def update_equipo(id_equipo: int, equipo_data: EquipoUpdate, service: AsyncService[EquipoService] = Depends(get_equipo_service)):
     """Actualizar un equipo existente (Maneja parciales correctamente)"""
     # 1. Verificar y obtener datos ACTUALES de la BD
-    equipo_actual = service.get_by_id(id_equipo)
+    equipo_actual = await service.get_by_id(id_equipo)
     if not equipo_actual:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -78,7 +92,7 @@ def update_equipo(id_equipo: int, equipo_data: EquipoUpdate, service: EquipoServ
     )
     
     try:
-        service.update(equipo_a_guardar)
+        await service.update(equipo_a_guardar)
         return EquipoResponse(**equipo_a_guardar.to_dict())
     except ValueError as e:
         raise HTTPException(
@@ -88,14 +102,14 @@ def update_equipo(id_equipo: int, equipo_data: EquipoUpdate, service: EquipoServ
 
 
 @router.delete("/{id_equipo}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_equipo(id_equipo: int, service: EquipoService = Depends(get_equipo_service)):
+async def delete_equipo(id_equipo: int, service: AsyncService[EquipoService] = Depends(get_equipo_service)):
     """Eliminar un equipo"""
-    existing = service.get_by_id(id_equipo)
+    existing = await service.get_by_id(id_equipo)
     if not existing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Equipo con ID {id_equipo} no encontrado"
         )
     
-    service.delete(id_equipo)
+    await service.delete(id_equipo)
     return None
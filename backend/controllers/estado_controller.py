@@ -1,30 +1,44 @@
-from fastapi import APIRouter, HTTPException, status, Depends
-from typing import List
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Response
+from typing import List, Optional
 from schemas.estado_schema import EstadoCreate, EstadoUpdate, EstadoResponse
+from services.async_service import AsyncService
 from services.estado_service import EstadoService
 from classes.estado import Estado
-from data.database_connection import DatabaseConnection
+from data.db_executor import DatabaseExecutor, get_db_executor
+from controllers.pagination import LIMIT_DESCRIPTION, MAX_LIMIT, AFTER_DESCRIPTION, set_next_cursor
 
 router = APIRouter(prefix="/estados", tags=["Estados"])
 
 
-def get_estado_service():
-    """Dependency para obtener instancia de EstadoService"""
-    db_conn = DatabaseConnection()
-    return EstadoService(connection=db_conn.get_connection())
+def get_estado_service(executor: DatabaseExecutor = Depends(get_db_executor)) -> AsyncService[EstadoService]:
+    """Dependency para obtener EstadoService sobre el executor de base de datos"""
+    return AsyncService(EstadoService, executor)
 
 
 @router.get("/", response_model=List[EstadoResponse])
-def list_estados(service: EstadoService = Depends(get_estado_service)):
-    """Listar todos los estados"""
-    estados = service.list_all()
+async def list_estados(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_LIMIT, description=LIMIT_DESCRIPTION),
+    after: Optional[str] = Query(None, description=AFTER_DESCRIPTION),
+    ambito: Optional[str] = None,
+    service: AsyncService[EstadoService] = Depends(get_estado_service),
+):
+    """Listar los estados paginados por id (filtros opcionales: ámbito)"""
+    try:
+        estados, next_cursor = await service.list_page(limit, after, ambito=ambito)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    set_next_cursor(response, next_cursor)
     return [EstadoResponse(**estado.to_dict()) for estado in estados]
 
 
 @router.get("/{id_estado}", response_model=EstadoResponse)
-def get_estado(id_estado: int, service: EstadoService = Depends(get_estado_service)):
+async def get_estado(id_estado: int, service: AsyncService[EstadoService] = Depends(get_estado_service)):
     """Obtener un estado por ID"""
-    estado = service.get_by_id(id_estado)
+    estado = await service.get_by_id(id_estado)
     if not estado:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -34,7 +48,7 @@ def get_estado(id_estado: int, service: EstadoService = Depends(get_estado_servi
 
 
 @router.post("/", response_model=EstadoResponse, status_code=status.HTTP_201_CREATED)
-def create_estado(estado_data: EstadoCreate, service: EstadoService = Depends(get_estado_service)):
+async def create_estado(estado_data: EstadoCreate, service: AsyncService[EstadoService] = Depends(get_estado_service)):
     """Crear un nuevo estado"""
     # Conversión manual de Schema a Clase de Dominio
     estado = Estado(
@@ -43,7 +57,7 @@ def create_estado(estado_data: EstadoCreate, service: EstadoService = Depends(ge
     )
     
     try:
-        created_estado = service.insert(estado)
+        created_estado = await service.insert(estado)
         return EstadoResponse(**created_estado.to_dict())
     except ValueError as e:
         raise HTTPException(
@@ -53,10 +67,10 @@ def create_estado(estado_data: EstadoCreate, service: EstadoService = Depends(ge
 
 
 @router.put("/{id_estado}", response_model=EstadoResponse)
-def update_estado(id_estado: int, estado_data: EstadoUpdate, service: EstadoService = Depends(get_estado_service)):
+async def update_estado(id_estado: int, estado_data: EstadoUpdate, service: AsyncService[EstadoService] = Depends(get_estado_service)):
     """Actualizar un estado existente (Maneja parciales correctamente)"""
     # 1. Verificar y obtener datos ACTUALES de la BD
-    estado_actual = service.get_by_id(id_estado)
+    estado_actual = await service.get_by_id(id_estado)
     if not estado_actual:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -75,7 +89,7 @@ def update_estado(id_estado: int, estado_data: EstadoUpdate, service: EstadoServ
     )
     
     try:
-        service.update(estado_a_guardar)
+        await service.update(estado_a_guardar)
         return EstadoResponse(**estado_a_guardar.to_dict())
     except ValueError as e:
         raise HTTPException(
@@ -85,14 +99,14 @@ def update_estado(id_estado: int, estado_data: EstadoUpdate, service: EstadoServ
 
 
 @router.delete("/{id_estado}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_estado(id_estado: int, service: EstadoService = Depends(get_estado_service)):
+async def delete_estado(id_estado: int, service: AsyncService[EstadoService] = Depends(get_estado_service)):
     """Eliminar un estado"""
-    existing = service.get_by_id(id_estado)
+    existing = await service.get_by_id(id_estado)
     if not existing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Estado con ID {id_estado} no encontrado"
         )
     
-    service.delete(id_estado)
+    await service.delete(id_estado)
     return None
@@ -0,0 +1,44 @@
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from services.export_service import ExportService, FORMATOS
+from repositories.export_repository import EXPORTABLES
+from data.connection_pool import get_pool
+
+router = APIRouter(prefix="/export", tags=["Exportación"])
+
+
+@router.get("/{entidad}")
+def exportar(
+    entidad: str,
+    formato: str = Query("ndjson", description="ndjson o csv"),
+    desde: Optional[date] = Query(None, description="Fecha mínima inclusive (YYYY-MM-DD)"),
+    hasta: Optional[date] = Query(None, description="Fecha máxima inclusive (YYYY-MM-DD)"),
+):
+    """Exportar reservas, turnos o pagos en streaming (NDJSON o CSV), filtrando por fecha"""
+    if entidad not in EXPORTABLES:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No se puede exportar '{entidad}'. Opciones: {', '.join(EXPORTABLES)}"
+        )
+    try:
+        ExportService.validate(entidad, formato, desde, hasta)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    def contenido():
+        # La conexión se toma dentro del generador: una dependency con yield
+        # se cerraría antes de que termine de enviarse la respuesta
+        with get_pool().connection() as connection:
+            yield from ExportService(connection=connection).exportar(entidad, formato, desde, hasta)
+
+    extension = "csv" if formato == "csv" else "ndjson"
+    return StreamingResponse(
+        contenido(),
+        media_type=FORMATOS[formato],
+        headers={"Content-Disposition": f'attachment; filename="{entidad}.{extension}"'},
+    )
@@ -1,30 +1,43 @@
-from fastapi import APIRouter, HTTPException, status, Depends
-from typing import List
+from fastapi import APIRouter, Body, HTTPException, status, Depends, Query, Response
+from typing import List, Optional
 from schemas.horario_schema import HorarioCreate, HorarioUpdate, HorarioResponse
+from services.async_service import AsyncService
 from services.horario_service import HorarioService
 from classes.horario import Horario
-from data.database_connection import DatabaseConnection
+from data.db_executor import DatabaseExecutor, get_db_executor
+from controllers.pagination import LIMIT_DESCRIPTION, MAX_LIMIT, AFTER_DESCRIPTION, set_next_cursor
 
 router = APIRouter(prefix="/horarios", tags=["Horarios"])
 
 
-def get_horario_service():
-    """Dependency para obtener instancia de HorarioService"""
-    db_conn = DatabaseConnection()
-    return HorarioService(connection=db_conn.get_connection())
+def get_horario_service(executor: DatabaseExecutor = Depends(get_db_executor)) -> AsyncService[HorarioService]:
+    """Dependency para obtener HorarioService sobre el executor de base de datos"""
+    return AsyncService(HorarioService, executor)
 
 
 @router.get("/", response_model=List[HorarioResponse])
-def list_horarios(service: HorarioService = Depends(get_horario_service)):
-    """Listar todos los horarios"""
-    horarios = service.list_all()
+async def list_horarios(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_LIMIT, description=LIMIT_DESCRIPTION),
+    after: Optional[str] = Query(None, description=AFTER_DESCRIPTION),
+    service: AsyncService[HorarioService] = Depends(get_horario_service),
+):
+    """Listar los horarios paginados por id"""
+    try:
+        horarios, next_cursor = await service.list_page(limit, after)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    set_next_cursor(response, next_cursor)
     return [HorarioResponse(**horario.to_dict()) for horario in horarios]
 
 
 @router.get("/{id_horario}", response_model=HorarioResponse)
-def get_horario(id_horario: int, service: HorarioService = Depends(get_horario_service)):
+async def get_horario(id_horario: int, service: AsyncService[HorarioService] = Depends(get_horario_service)):
     """Obtener un horario por ID"""
-    horario = service.get_by_id(id_horario)
+    horario = await service.get_by_id(id_horario)
     if not horario:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -34,7 +47,7 @@ def get_horario(id_horario: int, service: HorarioService = Depends(get_horario_s
 
 
 @router.post("/", response_model=HorarioResponse, status_code=status.HTTP_201_CREATED)
-def create_horario(horario_data: HorarioCreate, service: HorarioService = Depends(get_horario_service)):
+async def create_horario(horario_data: HorarioCreate, service: AsyncService[HorarioService] = Depends(get_horario_service)):
     """Crear un nuevo horario"""
     # Conversión manual de Schema a Clase de Dominio
     horario = Horario(
@@ -43,7 +56,7 @@ def create_horario(horario_data: HorarioCreate, service: HorarioService = Depend
     )
     
     try:
-        created_horario = service.insert(horario)
+        created_horario = await service.insert(horario)
         return HorarioResponse(**created_horario.to_dict())
     except ValueError as e:
         raise HTTPException(
@@ -52,11 +65,28 @@ def create_horario(horario_data: HorarioCreate, service: HorarioService = Depend
         )
 
 
+@router.post("/bulk", response_model=List[HorarioResponse], status_code=status.HTTP_201_CREATED)
+async def create_horarios_bulk(
+    horarios_data: List[HorarioCreate] = Body(..., min_length=1, max_length=MAX_LIMIT),
+    service: AsyncService[HorarioService] = Depends(get_horario_service),
+):
+    """Crear varios horarios en una sola transacción (todos o ninguno)"""
+    horarios = [Horario(hora_inicio=data.hora_inicio, hora_fin=data.hora_fin) for data in horarios_data]
+    try:
+        created = await service.insert_many(horarios)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    return [HorarioResponse(**horario.to_dict()) for horario in created]
+
+
 @router.put("/{id_horario}", response_model=HorarioResponse)
-def update_horario(id_horario: int, horario_data: HorarioUpdate, service: HorarioService = Depends(get_horario_service)):
+async def update_horario(id_horario: int, horario_data: HorarioUpdate, service: AsyncService[HorarioService] = Depends(get_horario_service)):
     """Actualizar un horario existente (Maneja parciales correctamente)"""
     # 1. Verificar y obtener datos ACTUALES de la BD
-    horario_actual = service.get_by_id(id_horario)
+    horario_actual = await service.get_by_id(id_horario)
     if not horario_actual:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -75,7 +105,7 @@ def update_horario(id_horario: int, horario_data: HorarioUpdate, service: Horari
     )
     
     try:
-        service.update(horario_a_guardar)
+        await service.update(horario_a_guardar)
         return HorarioResponse(**horario_a_guardar.to_dict())
     except ValueError as e:
         raise HTTPException(
@@ -85,14 +115,14 @@ def update_horario(id_horario: int, horario_data: HorarioUpdate, service: Horari
 
 
 @router.delete("/{id_horario}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_horario(id_horario: int, service: HorarioService = Depends(get_horario_service)):
+async def delete_horario(id_horario: int, service: AsyncService[HorarioService] = Depends(get_horario_service)):
     """Eliminar un horario"""
-    existing = service.get_by_id(id_horario)
+    existing = await service.get_by_id(id_horario)
     if not existing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Horario con ID {id_horario} no encontrado"
         )
     
-    service.delete(id_horario)
+    await service.delete(id_horario)
     return None
@@ -1,30 +1,43 @@
-from fastapi import APIRouter, HTTPException, status, Depends
-from typing import List
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Response
+from typing import List, Optional
 from schemas.metodo_pago_schema import MetodoPagoCreate, MetodoPagoUpdate, MetodoPagoResponse
+from services.async_service import AsyncService
 from services.metodo_pago_service import MetodoPagoService
 from classes.metodo_pago import MetodoPago
-from data.database_connection import DatabaseConnection
+from data.db_executor import DatabaseExecutor, get_db_executor
+from controllers.pagination import LIMIT_DESCRIPTION, MAX_LIMIT, AFTER_DESCRIPTION, set_next_cursor
 
 router = APIRouter(prefix="/metodos-pago", tags=["Métodos de Pago"])
 
 
-def get_metodo_pago_service():
-    """Dependency para obtener instancia de MetodoPagoService"""
-    db_conn = DatabaseConnection()
-    return MetodoPagoService(connection=db_conn.get_connection())
+def get_metodo_pago_service(executor: DatabaseExecutor = Depends(get_db_executor)) -> AsyncService[MetodoPagoService]:
+    """Dependency para obtener MetodoPagoService sobre el executor de base de datos"""
+    return AsyncService(MetodoPagoService, executor)
 
 
 @router.get("/", response_model=List[MetodoPagoResponse])
-def list_metodos_pago(service: MetodoPagoService = Depends(get_metodo_pago_service)):
-    """Listar todos los métodos de pago"""
-    metodos = service.list_all()
+async def list_metodos_pago(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_LIMIT, description=LIMIT_DESCRIPTION),
+    after: Optional[str] = Query(None, description=AFTER_DESCRIPTION),
+    service: AsyncService[MetodoPagoService] = Depends(get_metodo_pago_service),
+):
+    """Listar los métodos de pago paginados por id"""
+    try:
+        metodos, next_cursor = await service.list_page(limit, after)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    set_next_cursor(response, next_cursor)
     return [MetodoPagoResponse(**metodo.to_dict()) for metodo in metodos]
 
 
 @router.get("/{id_metodo_pago}", response_model=MetodoPagoResponse)
-def get_metodo_pago(id_metodo_pago: int, service: MetodoPagoService = Depends(get_metodo_pago_service)):
+async def get_metodo_pago(id_metodo_pago: int, service: AsyncService[MetodoPagoService] = Depends(get_metodo_pago_service)):
     """Obtener un método de pago por ID"""
-    metodo = service.get_by_id(id_metodo_pago)
+    metodo = await service.get_by_id(id_metodo_pago)
     if not metodo:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -34,7 +47,7 @@ def get_metodo_pago(id_metodo_pago: int, service: MetodoPagoService = Depends(ge
 
 
 @router.post("/", response_model=MetodoPagoResponse, status_code=status.HTTP_201_CREATED)
-def create_metodo_pago(metodo_data: MetodoPagoCreate, service: MetodoPagoService = Depends(get_metodo_pago_service)):
+async def create_metodo_pago(metodo_data: MetodoPagoCreate, service: AsyncService[MetodoPagoService] = Depends(get_metodo_pago_service)):
     """Crear un nuevo método de pago"""
     # Conversión manual de Schema a Clase de Dominio
     metodo = MetodoPago(
@@ -42,7 +55,7 @@ def create_metodo_pago(metodo_data: MetodoPagoCreate, service: MetodoPagoService
     )
     
     try:
-        created_metodo = service.insert(metodo)
+        created_metodo = await service.insert(metodo)
         return MetodoPagoResponse(**created_metodo.to_dict())
     except ValueError as e:
         raise HTTPException(
@@ -52,10 +65,10 @@ def create_metodo_pago(metodo_data: MetodoPagoCreate, service: MetodoPagoService
 
 
 @router.put("/{id_metodo_pago}", response_model=MetodoPagoResponse)
-def update_metodo_pago(id_metodo_pago: int, metodo_data: MetodoPagoUpdate, service: MetodoPagoService = Depends(get_metodo_pago_service)):
+async def update_metodo_pago(id_metodo_pago: int, metodo_data: MetodoPagoUpdate, service: AsyncService[MetodoPagoService] = Depends(get_metodo_pago_service)):
     """Actualizar un método de pago existente (Maneja parciales correctamente)"""
     # 1. Verificar y obtener datos ACTUALES de la BD
-    metodo_actual = service.get_by_id(id_metodo_pago)
+    metodo_actual = await service.get_by_id(id_metodo_pago)
     if not metodo_actual:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -72,7 +85,7 @@ def update_metodo_pago(id_metodo_pago: int, metodo_data: MetodoPagoUpdate, servi
     )
     
     try:
-        service.update(metodo_a_guardar)
+        await service.update(metodo_a_guardar)
         return MetodoPagoResponse(**metodo_a_guardar.to_dict())
     except ValueError as e:
         raise HTTPException(
@@ -82,14 +95,14 @@ def update_metodo_pago(id_metodo_pago: int, metodo_data: MetodoPagoUpdate, servi
 
 
 @router.delete("/{id_metodo_pago}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_metodo_pago(id_metodo_pago: int, service: MetodoPagoService = Depends(get_metodo_pago_service)):
+async def delete_metodo_pago(id_metodo_pago: int, service: AsyncService[MetodoPagoService] = Depends(get_metodo_pago_service)):
     """Eliminar un método de pago"""
-    existing = service.get_by_id(id_metodo_pago)
+    existing = await service.get_by_id(id_metodo_pago)
     if not existing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Método de pago con ID {id_metodo_pago} no encontrado"
         )
     
-    service.delete(id_metodo_pago)
+    await service.delete(id_metodo_pago)
     return None
@@ -0,0 +1,98 @@
+from typing import List
+
+from fastapi import APIRouter, Response
+
+from data.connection_pool import get_pool
+from data.db_executor import get_db_executor
+from data.metrics import CONTENT_TYPE, family, metrics
+from repositories.catalog_cache import catalog_cache
+
+router = APIRouter(tags=["Métricas"])
+
+
+def _db_connection_collector() -> List[str]:
+    """Espera por conexión y ocupación del executor de base de datos y del pool."""
+    executor = get_db_executor().stats()
+    lanes = {"writer": executor["writer"], "readers": executor["readers"]}
+    writer = executor["writer"]
+    pool = get_pool().stats()
+
+    lines = []
+    lines += family(
+        "donbalon_db_executor_pending", "gauge", "Tareas en fila o en curso en el executor de base de datos.",
+        (({"lane": lane}, stats["pending"]) for lane, stats in lanes.items()),
+    )
+    lines += family(
+        "donbalon_db_executor_completed_total", "counter", "Tareas terminadas en el executor de base de datos.",
+        (({"lane": lane}, stats["completed"]) for lane, stats in lanes.items()),
+    )
+    lines += family(
+        "donbalon_db_executor_wait_seconds_total", "counter", "Espera acumulada hasta que un thread del executor toma la tarea.",
+        (({"lane": lane}, stats["total_wait_seconds"]) for lane, stats in lanes.items()),
+    )
+    lines += family(
+        "donbalon_db_executor_max_wait_seconds", "gauge", "Espera máxima hasta que un thread del executor toma la tarea.",
+        (({"lane": lane}, stats["max_wait_seconds"]) for lane, stats in lanes.items()),
+    )
+    lines += family(
+        "donbalon_db_write_batches_total", "counter", "Lotes confirmados por la fila de escritura (group commit).",
+        [({}, writer["batches"])],
+    )
+    lines += family(
+        "donbalon_db_write_failed_total", "counter", "Escrituras de la fila que terminaron con error.",
+        [({}, writer["failed"])],
+    )
+    lines += family(
+        "donbalon_db_write_latency_seconds", "gauge", "Percentiles de latencia de las últimas escrituras de la fila.",
+        [({"quantile": "0.5"}, writer["latency_p50_seconds"]), ({"quantile": "0.99"}, writer["latency_p99_seconds"])],
+    )
+    lines += family(
+        "donbalon_db_pool_connections", "gauge", "Conexiones del pool por estado.",
+        [({"state": "in_use"}, pool["in_use"]), ({"state": "idle"}, pool["idle"]), ({"state": "max"}, pool["size"])],
+    )
+    lines += family(
+        "donbalon_db_pool_waits_total", "counter", "Pedidos de conexión que tuvieron que esperar.",
+        [({}, pool["waits"])],
+    )
+    lines += family(
+        "donbalon_db_pool_timeouts_total", "counter", "Pedidos de conexión que vencieron esperando.",
+        [({}, pool["timeouts"])],
+    )
+    lines += family(
+        "donbalon_db_pool_wait_seconds_total", "counter", "Espera acumulada por una conexión del pool.",
+        [({}, pool["total_wait_seconds"])],
+    )
+    lines += family(
+        "donbalon_db_pool_max_wait_seconds", "gauge", "Espera máxima por una conexión del pool.",
+        [({}, pool["max_wait_seconds"])],
+    )
+    return lines
+
+
+def _catalog_cache_collector() -> List[str]:
+    """Hits, misses, invalidaciones y tamaño del caché de catálogo por tabla."""
+    tables = sorted(catalog_cache.stats().items())
+    lines = []
+    lines += family(
+        "donbalon_catalog_cache_lookups_total", "counter", "Lecturas del caché de catálogo por resultado.",
+        [({"table": table, "result": result}, stats[key]) for table, stats in tables for result, key in (("hit", "hits"), ("miss", "misses"))],
+    )
+    lines += family(
+        "donbalon_catalog_cache_invalidations_total", "counter", "Invalidaciones del caché de catálogo.",
+        [({"table": table}, stats["invalidations"]) for table, stats in tables],
+    )
+    lines += family(
+        "donbalon_catalog_cache_entries", "gauge", "Filas en el caché de catálogo.",
+        [({"table": table}, stats["size"]) for table, stats in tables if "size" in stats],
+    )
+    return lines
+
+
+metrics.register_collector(_db_connection_collector)
+metrics.register_collector(_catalog_cache_collector)
+
+
+@router.get("/metrics", include_in_schema=False)
+def get_metrics():
+    """Métricas del proceso en el formato de texto de Prometheus (ver data/metrics.py)"""
+    return Response(content=metrics.render(), media_type=CONTENT_TYPE)
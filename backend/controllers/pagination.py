@@ -0,0 +1,20 @@
+"""Parámetros comunes de la paginación por cursor (keyset) de los listados.
+
+Los listados devuelven una lista JSON, como siempre. Sin `limit` devuelven
+todas las filas (como antes de paginar, para los clientes existentes); con
+`limit`, si hay más resultados, el cursor de la página siguiente viaja en el
+header X-Next-Cursor y se pasa como `after` en el próximo pedido.
+"""
+from typing import Optional
+from fastapi import Response
+
+MAX_LIMIT = 1000
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+LIMIT_DESCRIPTION = f"Cantidad máxima de filas (sin limit: todas; con limit se pagina con {NEXT_CURSOR_HEADER})"
+AFTER_DESCRIPTION = f"Cursor de la página siguiente (header {NEXT_CURSOR_HEADER} de la respuesta anterior)"
+
+
+def set_next_cursor(response: Response, next_cursor: Optional[str]) -> None:
+    """Agrega el header X-Next-Cursor si hay una página siguiente."""
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
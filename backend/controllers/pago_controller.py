@@ -1,30 +1,53 @@
-from fastapi import APIRouter, HTTPException, status, Depends
-from typing import List
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Response
+from datetime import date
+from typing import List, Optional
 from schemas.pago_schema import PagoCreate, PagoUpdate, PagoResponse
+from services.async_service import AsyncService
 from services.pago_service import PagoService
 from classes.pago import Pago
-from data.database_connection import DatabaseConnection
+from data.db_executor import DatabaseExecutor, get_db_executor
+from controllers.pagination import LIMIT_DESCRIPTION, MAX_LIMIT, AFTER_DESCRIPTION, set_next_cursor
 
 router = APIRouter(prefix="/pagos", tags=["Pagos"])
 
 
-def get_pago_service():
-    """Dependency para obtener instancia de PagoService"""
-    db_conn = DatabaseConnection()
-    return PagoService(connection=db_conn.get_connection())
+def get_pago_service(executor: DatabaseExecutor = Depends(get_db_executor)) -> AsyncService[PagoService]:
+    """Dependency para obtener PagoService sobre el executor de base de datos"""
+    return AsyncService(PagoService, executor)
 
 
 @router.get("/", response_model=List[PagoResponse])
-def list_pagos(service: PagoService = Depends(get_pago_service)):
-    """Listar todos los pagos"""
-    pagos = service.list_all()
+async def list_pagos(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_LIMIT, description=LIMIT_DESCRIPTION),
+    after: Optional[str] = Query(None, description=AFTER_DESCRIPTION),
+    id_reserva: Optional[int] = None,
+    desde: Optional[date] = None,
+    hasta: Optional[date] = None,
+    service: AsyncService[PagoService] = Depends(get_pago_service),
+):
+    """Listar los pagos paginados por id (filtros opcionales: reserva, rango de fechas)"""
+    try:
+        pagos, next_cursor = await service.list_page(
+            limit,
+            after,
+            id_reserva=id_reserva,
+            fecha_desde=desde,
+            fecha_hasta=hasta,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    set_next_cursor(response, next_cursor)
     return [PagoResponse(**pago.to_dict()) for pago in pagos]
 
 
 @router.get("/{id_pago}", response_model=PagoResponse)
-def get_pago(id_pago: int, service: PagoService = Depends(get_pago_service)):
+async def get_pago(id_pago: int, service: AsyncService[PagoService] = Depends(get_pago_service)):
     """Obtener un pago por ID"""
-    pago = service.get_by_id(id_pago)
+    pago = await service.get_by_id(id_pago)
     if not pago:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -34,7 +57,7 @@ def get_pago(id_pago: int, service: PagoService = Depends(get_pago_service)):
 
 
 @router.post("/", response_model=PagoResponse, status_code=status.HTTP_201_CREATED)
-def create_pago(pago_data: PagoCreate, service: PagoService = Depends(get_pago_service)):
+async def create_pago(pago_data: PagoCreate, service: AsyncService[PagoService] = Depends(get_pago_service)):
     """Crear un nuevo pago"""
     # Conversión manual de Schema a Clase de Dominio
     pago = Pago(
@@ -45,7 +68,7 @@ def create_pago(pago_data: PagoCreate, service: PagoService = Depends(get_pago_s
     )
     
     try:
-        created_pago = service.insert(pago)
+        created_pago = await service.insert(pago)
         return PagoResponse(**created_pago.to_dict())
     except ValueError as e:
         raise HTTPException(
@@ -55,10 +78,10 @@ def create_pago(pago_data: PagoCreate, service: PagoService = Depends(get_pago_s
 
 
 @router.put("/{id_pago}", response_model=PagoResponse)
-def update_pago(id_pago: int, pago_data: PagoUpdate, service: PagoService = Depends(get_pago_service)):
+async def update_pago(id_pago: int, pago_data: PagoUpdate, service: AsyncService[PagoService] = Depends(get_pago_service)):
     """Actualizar un pago existente (Maneja parciales correctamente)"""
     # 1. Verificar y obtener datos ACTUALES de la BD
-    pago_actual = service.get_by_id(id_pago)
+    pago_actual = await service.get_by_id(id_pago)
     if not pago_actual:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -81,7 +104,7 @@ def update_pago(id_pago: int, pago_data: PagoUpdate, service: PagoService = Depe
     )
     
     try:
-        service.update(pago_a_guardar)
+        await service.update(pago_a_guardar)
         return PagoResponse(**pago_a_guardar.to_dict())
     except ValueError as e:
         raise HTTPException(
@@ -91,14 +114,14 @@ def update_pago(id_pago: int, pago_data: PagoUpdate, service: PagoService = Depe
 
 
 @router.delete("/{id_pago}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_pago(id_pago: int, service: PagoService = Depends(get_pago_service)):
+async def delete_pago(id_pago: int, service: AsyncService[PagoService] = Depends(get_pago_service)):
     """Eliminar un pago"""
-    existing = service.get_by_id(id_pago)
+    existing = await service.get_by_id(id_pago)
     if not existing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Pago con ID {id_pago} no encontrado"
         )
     
-    service.delete(id_pago)
+    await service.delete(id_pago)
     return None
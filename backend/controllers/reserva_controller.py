@@ -1,30 +1,58 @@
-from fastapi import APIRouter, HTTPException, status, Depends
-from typing import List
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Response
+import time
+from datetime import date
+from typing import List, Optional
 from schemas.reserva_schema import ReservaCreate, ReservaUpdate, ReservaResponse
+from services.async_service import AsyncService
 from services.reserva_service import ReservaService
 from classes.reserva import Reserva
-from data.database_connection import DatabaseConnection
+from data.db_executor import DatabaseExecutor, get_db_executor
+from data.metrics import record_booking
+from services.exceptions import ConflictoError
+from controllers.pagination import LIMIT_DESCRIPTION, MAX_LIMIT, AFTER_DESCRIPTION, set_next_cursor
 
 router = APIRouter(prefix="/reservas", tags=["Reservas"])
 
 
-def get_reserva_service():
-    """Dependency para obtener instancia de ReservaService"""
-    db_conn = DatabaseConnection()
-    return ReservaService(connection=db_conn.get_connection())
+def get_reserva_service(executor: DatabaseExecutor = Depends(get_db_executor)) -> AsyncService[ReservaService]:
+    """Dependency para obtener ReservaService sobre el executor de base de datos"""
+    return AsyncService(ReservaService, executor)
 
 
 @router.get("/", response_model=List[ReservaResponse])
-def list_reservas(service: ReservaService = Depends(get_reserva_service)):
-    """Listar todas las reservas"""
-    reservas = service.list_all()
+async def list_reservas(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_LIMIT, description=LIMIT_DESCRIPTION),
+    after: Optional[str] = Query(None, description=AFTER_DESCRIPTION),
+    id_cliente: Optional[int] = None,
+    estado: Optional[str] = None,
+    desde: Optional[date] = None,
+    hasta: Optional[date] = None,
+    service: AsyncService[ReservaService] = Depends(get_reserva_service),
+):
+    """Listar las reservas paginadas por id (filtros opcionales: cliente, estado, rango de fechas)"""
+    try:
+        reservas, next_cursor = await service.list_page(
+            limit,
+            after,
+            id_cliente=id_cliente,
+            estado=estado,
+            fecha_desde=desde,
+            fecha_hasta=hasta,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    set_next_cursor(response, next_cursor)
     return [ReservaResponse(**reserva.to_dict()) for reserva in reservas]
 
 
 @router.get("/{id_reserva}", response_model=ReservaResponse)
-def get_reserva(id_reserva: int, service: ReservaService = Depends(get_reserva_service)):
+async def get_reserva(id_reserva: int, service: AsyncService[ReservaService] = Depends(get_reserva_service)):
     """Obtener una reserva por ID"""
-    reserva = service.get_by_id(id_reserva)
+    reserva = await service.get_by_id(id_reserva)
     if not reserva:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -36,15 +64,26 @@ def get_reserva(id_reserva: int, service: ReservaService = Depends(get_reserva_s
 from schemas.reserva_transaccion_schema import ReservaTransaccionSchema
 
 @router.post("/", response_model=ReservaResponse, status_code=status.HTTP_201_CREATED)
-def create_reserva(reserva_data: ReservaTransaccionSchema, service: ReservaService = Depends(get_reserva_service)):
+async def create_reserva(reserva_data: ReservaTransaccionSchema, service: AsyncService[ReservaService] = Depends(get_reserva_service)):
     """
     Crear una nueva reserva transaccional.
     Recibe cliente, método de pago y lista de items (cancha/horario/fecha).
     """
+    # Resultado y latencia del alta para las métricas (donbalon_bookings_total)
+    inicio = time.perf_counter()
+    resultado = "error"
     try:
-        created_reserva = service.registrar_reserva_completa(reserva_data)
+        created_reserva = await service.registrar_reserva_completa(reserva_data)
+        resultado = "success"
         return ReservaResponse(**created_reserva.to_dict())
+    except ConflictoError as e:
+        resultado = "conflict"
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
     except ValueError as e:
+        resultado = "invalid"
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
@@ -54,13 +93,15 @@ def create_reserva(reserva_data: ReservaTransaccionSchema, service: ReservaServi
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error interno al procesar la reserva: {str(e)}"
         )
+    finally:
+        record_booking(resultado, time.perf_counter() - inicio)
 
 
 @router.put("/{id_reserva}", response_model=ReservaResponse)
-def update_reserva(id_reserva: int, reserva_data: ReservaUpdate, service: ReservaService = Depends(get_reserva_service)):
+async def update_reserva(id_reserva: int, reserva_data: ReservaUpdate, service: AsyncService[ReservaService] = Depends(get_reserva_service)):
     """Actualizar una reserva existente (Maneja parciales correctamente)"""
     # 1. Verificar y obtener datos ACTUALES de la BD
-    reserva_actual = service.get_by_id(id_reserva)
+    reserva_actual = await service.get_by_id(id_reserva)
     if not reserva_actual:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -89,7 +130,7 @@ def update_reserva(id_reserva: int, reserva_data: ReservaUpdate, service: Reserv
     )
     
     try:
-        service.update(reserva_a_guardar)
+        await service.update(reserva_a_guardar)
         return ReservaResponse(**reserva_a_guardar.to_dict())
     except ValueError as e:
         raise HTTPException(
@@ -99,14 +140,14 @@ def update_reserva(id_reserva: int, reserva_data: ReservaUpdate, service: Reserv
 
 
 @router.delete("/{id_reserva}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_reserva(id_reserva: int, service: ReservaService = Depends(get_reserva_service)):
+async def delete_reserva(id_reserva: int, service: AsyncService[ReservaService] = Depends(get_reserva_service)):
     """Eliminar una reserva"""
-    existing = service.get_by_id(id_reserva)
+    existing = await service.get_by_id(id_reserva)
     if not existing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Reserva con ID {id_reserva} no encontrada"
         )
     
-    service.delete(id_reserva)
+    await service.delete(id_reserva)
     return None
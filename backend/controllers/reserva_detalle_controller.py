@@ -1,30 +1,45 @@
-from fastapi import APIRouter, HTTPException, status, Depends
-from typing import List
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Response
+from typing import List, Optional
 from schemas.reserva_detalle_schema import ReservaDetalleCreate, ReservaDetalleUpdate, ReservaDetalleResponse
+from services.async_service import AsyncService
 from services.reserva_detalle_service import ReservaDetalleService
 from classes.reserva_detalle import ReservaDetalle
-from data.database_connection import DatabaseConnection
+from data.db_executor import DatabaseExecutor, get_db_executor
+from controllers.pagination import LIMIT_DESCRIPTION, MAX_LIMIT, AFTER_DESCRIPTION, set_next_cursor
 
 router = APIRouter(prefix="/reservas-detalles", tags=["Reservas Detalles"])
 
 
-def get_reserva_detalle_service():
-    """Dependency para obtener instancia de ReservaDetalleService"""
-    db_conn = DatabaseConnection()
-    return ReservaDetalleService(connection=db_conn.get_connection())
+def get_reserva_detalle_service(executor: DatabaseExecutor = Depends(get_db_executor)) -> AsyncService[ReservaDetalleService]:
+    """Dependency para obtener ReservaDetalleService sobre el executor de base de datos"""
+    return AsyncService(ReservaDetalleService, executor)
 
 
 @router.get("/", response_model=List[ReservaDetalleResponse])
-def list_reservas_detalles(service: ReservaDetalleService = Depends(get_reserva_detalle_service)):
-    """Listar todos los detalles de reservas"""
-    detalles = service.list_all()
+async def list_reservas_detalles(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_LIMIT, description=LIMIT_DESCRIPTION),
+    after: Optional[str] = Query(None, description=AFTER_DESCRIPTION),
+    id_reserva: Optional[int] = None,
+    id_turno: Optional[int] = None,
+    service: AsyncService[ReservaDetalleService] = Depends(get_reserva_detalle_service),
+):
+    """Listar los detalles de reservas paginados por id (filtros opcionales: reserva, turno)"""
+    try:
+        detalles, next_cursor = await service.list_page(limit, after, id_reserva=id_reserva, id_turno=id_turno)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    set_next_cursor(response, next_cursor)
     return [ReservaDetalleResponse(**detalle.to_dict()) for detalle in detalles]
 
 
 @router.get("/{id_detalle}", response_model=ReservaDetalleResponse)
-def get_reserva_detalle(id_detalle: int, service: ReservaDetalleService = Depends(get_reserva_detalle_service)):
+async def get_reserva_detalle(id_detalle: int, service: AsyncService[ReservaDetalleService] = Depends(get_reserva_detalle_service)):
     """Obtener un detalle de reserva por ID"""
-    detalle = service.get_by_id(id_detalle)
+    detalle = await service.get_by_id(id_detalle)
     if not detalle:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -34,7 +49,7 @@ def get_reserva_detalle(id_detalle: int, service: ReservaDetalleService = Depend
 
 
 @router.post("/", response_model=ReservaDetalleResponse, status_code=status.HTTP_201_CREATED)
-def create_reserva_detalle(detalle_data: ReservaDetalleCreate, service: ReservaDetalleService = Depends(get_reserva_detalle_service)):
+async def create_reserva_detalle(detalle_data: ReservaDetalleCreate, service: AsyncService[ReservaDetalleService] = Depends(get_reserva_detalle_service)):
     """Crear un nuevo detalle de reserva"""
     # Conversión manual de Schema a Clase de Dominio
     detalle = ReservaDetalle(
@@ -44,7 +59,7 @@ def create_reserva_detalle(detalle_data: ReservaDetalleCreate, service: ReservaD
     )
     
     try:
-        created_detalle = service.insert(detalle)
+        created_detalle = await service.insert(detalle)
         return ReservaDetalleResponse(**created_detalle.to_dict())
     except ValueError as e:
         raise HTTPException(
@@ -54,10 +69,10 @@ def create_reserva_detalle(detalle_data: ReservaDetalleCreate, service: ReservaD
 
 
 @router.put("/{id_detalle}", response_model=ReservaDetalleResponse)
-def update_reserva_detalle(id_detalle: int, detalle_data: ReservaDetalleUpdate, service: ReservaDetalleService = Depends(get_reserva_detalle_service)):
+async def update_reserva_detalle(id_detalle: int, detalle_data: ReservaDetalleUpdate, service: AsyncService[ReservaDetalleService] = Depends(get_reserva_detalle_service)):
     """Actualizar un detalle de reserva existente (Maneja parciales correctamente)"""
     # 1. Verificar y obtener datos ACTUALES de la BD
-    detalle_actual = service.get_by_id(id_detalle)
+    detalle_actual = await service.get_by_id(id_detalle)
     if not detalle_actual:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -78,7 +93,7 @@ def update_reserva_detalle(id_detalle: int, detalle_data: ReservaDetalleUpdate,
     )
     
     try:
-        service.update(detalle_a_guardar)
+        await service.update(detalle_a_guardar)
         return ReservaDetalleResponse(**detalle_a_guardar.to_dict())
     except ValueError as e:
         raise HTTPException(
@@ -88,14 +103,14 @@ def update_reserva_detalle(id_detalle: int, detalle_data: ReservaDetalleUpdate,
 
 
 @router.delete("/{id_detalle}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_reserva_detalle(id_detalle: int, service: ReservaDetalleService = Depends(get_reserva_detalle_service)):
+async def delete_reserva_detalle(id_detalle: int, service: AsyncService[ReservaDetalleService] = Depends(get_reserva_detalle_service)):
     """Eliminar un detalle de reserva"""
-    existing = service.get_by_id(id_detalle)
+    existing = await service.get_by_id(id_detalle)
     if not existing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Detalle de reserva con ID {id_detalle} no encontrado"
         )
     
-    service.delete(id_detalle)
+    await service.delete(id_detalle)
     return None
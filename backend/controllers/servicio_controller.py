@@ -1,30 +1,43 @@
-from fastapi import APIRouter, HTTPException, status, Depends
-from typing import List
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Response
+from typing import List, Optional
 from schemas.servicio_schema import ServicioCreate, ServicioUpdate, ServicioResponse
+from services.async_service import AsyncService
 from services.servicio_service import ServicioService
 from classes.servicio import Servicio
-from data.database_connection import DatabaseConnection
+from data.db_executor import DatabaseExecutor, get_db_executor
+from controllers.pagination import LIMIT_DESCRIPTION, MAX_LIMIT, AFTER_DESCRIPTION, set_next_cursor
 
 router = APIRouter(prefix="/servicios", tags=["Servicios"])
 
 
-def get_servicio_service():
-    """Dependency para obtener instancia de ServicioService"""
-    db_conn = DatabaseConnection()
-    return ServicioService(connection=db_conn.get_connection())
+def get_servicio_service(executor: DatabaseExecutor = Depends(get_db_executor)) -> AsyncService[ServicioService]:
+    """Dependency para obtener ServicioService sobre el executor de base de datos"""
+    return AsyncService(ServicioService, executor)
 
 
 @router.get("/", response_model=List[ServicioResponse])
-def list_servicios(service: ServicioService = Depends(get_servicio_service)):
-    """Listar todos los servicios"""
-    servicios = service.list_all()
+async def list_servicios(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_LIMIT, description=LIMIT_DESCRIPTION),
+    after: Optional[str] = Query(None, description=AFTER_DESCRIPTION),
+    service: AsyncService[ServicioService] = Depends(get_servicio_service),
+):
+    """Listar los servicios paginados por id"""
+    try:
+        servicios, next_cursor = await service.list_page(limit, after)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    set_next_cursor(response, next_cursor)
     return [ServicioResponse(**servicio.to_dict()) for servicio in servicios]
 
 
 @router.get("/{id_servicio}", response_model=ServicioResponse)
-def get_servicio(id_servicio: int, service: ServicioService = Depends(get_servicio_service)):
+async def get_servicio(id_servicio: int, service: AsyncService[ServicioService] = Depends(get_servicio_service)):
     """Obtener un servicio por ID"""
-    servicio = service.get_by_id(id_servicio)
+    servicio = await service.get_by_id(id_servicio)
     if not servicio:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -34,7 +47,7 @@ def get_servicio(id_servicio: int, service: ServicioService = Depends(get_servic
 
 
 @router.post("/", response_model=ServicioResponse, status_code=status.HTTP_201_CREATED)
-def create_servicio(servicio_data: ServicioCreate, service: ServicioService = Depends(get_servicio_service)):
+async def create_servicio(servicio_data: ServicioCreate, service: AsyncService[ServicioService] = Depends(get_servicio_service)):
     """Crear un nuevo servicio"""
     # Conversión manual de Schema a Clase de Dominio
     servicio = Servicio(
@@ -43,7 +56,7 @@ def create_servicio(servicio_data: ServicioCreate, service: ServicioService = De
     )
     
     try:
-        created_servicio = service.insert(servicio)
+        created_servicio = await service.insert(servicio)
         return ServicioResponse(**created_servicio.to_dict())
     except ValueError as e:
         raise HTTPException(
@@ -53,10 +66,10 @@ def create_servicio(servicio_data: ServicioCreate, service: ServicioService = De
 
 
 @router.put("/{id_servicio}", response_model=ServicioResponse)
-def update_servicio(id_servicio: int, servicio_data: ServicioUpdate, service: ServicioService = Depends(get_servicio_service)):
+async def update_servicio(id_servicio: int, servicio_data: ServicioUpdate, service: AsyncService[ServicioService] = Depends(get_servicio_service)):
     """Actualizar un servicio existente (Maneja parciales correctamente)"""
     # 1. Verificar y obtener datos ACTUALES de la BD
-    servicio_actual = service.get_by_id(id_servicio)
+    servicio_actual = await service.get_by_id(id_servicio)
     if not servicio_actual:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -75,7 +88,7 @@ def update_servicio(id_servicio: int, servicio_data: ServicioUpdate, service: Se
     )
     
     try:
-        service.update(servicio_a_guardar)
+        await service.update(servicio_a_guardar)
         return ServicioResponse(**servicio_a_guardar.to_dict())
     except ValueError as e:
         raise HTTPException(
@@ -85,14 +98,14 @@ def update_servicio(id_servicio: int, servicio_data: ServicioUpdate, service: Se
 
 
 @router.delete("/{id_servicio}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_servicio(id_servicio: int, service: ServicioService = Depends(get_servicio_service)):
+async def delete_servicio(id_servicio: int, service: AsyncService[ServicioService] = Depends(get_servicio_service)):
     """Eliminar un servicio"""
-    existing = service.get_by_id(id_servicio)
+    existing = await service.get_by_id(id_servicio)
     if not existing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Servicio con ID {id_servicio} no encontrado"
         )
     
-    service.delete(id_servicio)
+    await service.delete(id_servicio)
     return None
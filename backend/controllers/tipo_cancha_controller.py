@@ -1,30 +1,43 @@
-from fastapi import APIRouter, HTTPException, status, Depends
-from typing import List
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Response
+from typing import List, Optional
 from schemas.tipo_cancha_schema import TipoCanchaCreate, TipoCanchaUpdate, TipoCanchaResponse
+from services.async_service import AsyncService
 from services.tipo_cancha_service import TipoCanchaService
 from classes.tipo_cancha import TipoCancha
-from data.database_connection import DatabaseConnection
+from data.db_executor import DatabaseExecutor, get_db_executor
+from controllers.pagination import LIMIT_DESCRIPTION, MAX_LIMIT, AFTER_DESCRIPTION, set_next_cursor
 
 router = APIRouter(prefix="/tipos-cancha", tags=["Tipos de Cancha"])
 
 
-def get_tipo_cancha_service():
-    """Dependency para obtener instancia de TipoCanchaService"""
-    db_conn = DatabaseConnection()
-    return TipoCanchaService(connection=db_conn.get_connection())
+def get_tipo_cancha_service(executor: DatabaseExecutor = Depends(get_db_executor)) -> AsyncService[TipoCanchaService]:
+    """Dependency para obtener TipoCanchaService sobre el executor de base de datos"""
+    return AsyncService(TipoCanchaService, executor)
 
 
 @router.get("/", response_model=List[TipoCanchaResponse])
-def list_tipos_cancha(service: TipoCanchaService = Depends(get_tipo_cancha_service)):
-    """Listar todos los tipos de cancha"""
-    tipos = service.list_all()
+async def list_tipos_cancha(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_LIMIT, description=LIMIT_DESCRIPTION),
+    after: Optional[str] = Query(None, description=AFTER_DESCRIPTION),
+    service: AsyncService[TipoCanchaService] = Depends(get_tipo_cancha_service),
+):
+    """Listar los tipos de cancha paginados por id"""
+    try:
+        tipos, next_cursor = await service.list_page(limit, after)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    set_next_cursor(response, next_cursor)
     return [TipoCanchaResponse(**tipo.to_dict()) for tipo in tipos]
 
 
 @router.get("/{id_tipo}", response_model=TipoCanchaResponse)
-def get_tipo_cancha(id_tipo: int, service: TipoCanchaService = Depends(get_tipo_cancha_service)):
+async def get_tipo_cancha(id_tipo: int, service: AsyncService[TipoCanchaService] = Depends(get_tipo_cancha_service)):
     """Obtener un tipo de cancha por ID"""
-    tipo = service.get_by_id(id_tipo)
+    tipo = await service.get_by_id(id_tipo)
     if not tipo:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -34,7 +47,7 @@ def get_tipo_cancha(id_tipo: int, service: TipoCanchaService = Depends(get_tipo_
 
 
 @router.post("/", response_model=TipoCanchaResponse, status_code=status.HTTP_201_CREATED)
-def create_tipo_cancha(tipo_data: TipoCanchaCreate, service: TipoCanchaService = Depends(get_tipo_cancha_service)):
+async def create_tipo_cancha(tipo_data: TipoCanchaCreate, service: AsyncService[TipoCanchaService] = Depends(get_tipo_cancha_service)):
     """Crear un nuevo tipo de cancha"""
     # Conversión manual de Schema a Clase de Dominio
     tipo = TipoCancha(
@@ -43,7 +56,7 @@ def create_tipo_cancha(tipo_data: TipoCanchaCreate, service: TipoCanchaService =
     )
     
     try:
-        created_tipo = service.insert(tipo)
+        created_tipo = await service.insert(tipo)
         return TipoCanchaResponse(**created_tipo.to_dict())
     except ValueError as e:
         raise HTTPException(
@@ -53,10 +66,10 @@ def create_tipo_cancha(tipo_data: TipoCanchaCreate, service: TipoCanchaService =
 
 
 @router.put("/{id_tipo}", response_model=TipoCanchaResponse)
-def update_tipo_cancha(id_tipo: int, tipo_data: TipoCanchaUpdate, service: TipoCanchaService = Depends(get_tipo_cancha_service)):
+async def update_tipo_cancha(id_tipo: int, tipo_data: TipoCanchaUpdate, service: AsyncService[TipoCanchaService] = Depends(get_tipo_cancha_service)):
     """Actualizar un tipo de cancha existente (Maneja parciales correctamente)"""
     # 1. Verificar y obtener datos ACTUALES de la BD
-    tipo_actual = service.get_by_id(id_tipo)
+    tipo_actual = await service.get_by_id(id_tipo)
     if not tipo_actual:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -75,7 +88,7 @@ def update_tipo_cancha(id_tipo: int, tipo_data: TipoCanchaUpdate, service: TipoC
     )
     
     try:
-        service.update(tipo_a_guardar)
+        await service.update(tipo_a_guardar)
         return TipoCanchaResponse(**tipo_a_guardar.to_dict())
     except ValueError as e:
         raise HTTPException(
@@ -85,14 +98,14 @@ def update_tipo_cancha(id_tipo: int, tipo_data: TipoCanchaUpdate, service: TipoC
 
 
 @router.delete("/{id_tipo}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_tipo_cancha(id_tipo: int, service: TipoCanchaService = Depends(get_tipo_cancha_service)):
+async def delete_tipo_cancha(id_tipo: int, service: AsyncService[TipoCanchaService] = Depends(get_tipo_cancha_service)):
     """Eliminar un tipo de cancha"""
-    existing = service.get_by_id(id_tipo)
+    existing = await service.get_by_id(id_tipo)
     if not existing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Tipo de cancha con ID {id_tipo} no encontrado"
         )
     
-    service.delete(id_tipo)
+    await service.delete(id_tipo)
     return None
@@ -1,30 +1,43 @@
-from fastapi import APIRouter, HTTPException, status, Depends
-from typing import List
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Response
+from typing import List, Optional
 from schemas.torneo_schema import TorneoCreate, TorneoUpdate, TorneoResponse
+from services.async_service import AsyncService
 from services.torneo_service import TorneoService
 from classes.torneo import Torneo
-from data.database_connection import DatabaseConnection
+from data.db_executor import DatabaseExecutor, get_db_executor
+from controllers.pagination import LIMIT_DESCRIPTION, MAX_LIMIT, AFTER_DESCRIPTION, set_next_cursor
 
 router = APIRouter(prefix="/torneos", tags=["Torneos"])
 
 
-def get_torneo_service():
-    """Dependency para obtener instancia de TorneoService"""
-    db_conn = DatabaseConnection()
-    return TorneoService(connection=db_conn.get_connection())
+def get_torneo_service(executor: DatabaseExecutor = Depends(get_db_executor)) -> AsyncService[TorneoService]:
+    """Dependency para obtener TorneoService sobre el executor de base de datos"""
+    return AsyncService(TorneoService, executor)
 
 
 @router.get("/", response_model=List[TorneoResponse])
-def list_torneos(service: TorneoService = Depends(get_torneo_service)):
-    """Listar todos los torneos"""
-    torneos = service.list_all()
+async def list_torneos(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_LIMIT, description=LIMIT_DESCRIPTION),
+    after: Optional[str] = Query(None, description=AFTER_DESCRIPTION),
+    service: AsyncService[TorneoService] = Depends(get_torneo_service),
+):
+    """Listar los torneos paginados por id"""
+    try:
+        torneos, next_cursor = await service.list_page(limit, after)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    set_next_cursor(response, next_cursor)
     return [TorneoResponse(**torneo.to_dict()) for torneo in torneos]
 
 
 @router.get("/{id_torneo}", response_model=TorneoResponse)
-def get_torneo(id_torneo: int, service: TorneoService = Depends(get_torneo_service)):
+async def get_torneo(id_torneo: int, service: AsyncService[TorneoService] = Depends(get_torneo_service)):
     """Obtener un torneo por ID"""
-    torneo = service.get_by_id(id_torneo)
+    torneo = await service.get_by_id(id_torneo)
     if not torneo:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -34,7 +47,7 @@ def get_torneo(id_torneo: int, service: TorneoService = Depends(get_torneo_servi
 
 
 @router.post("/", response_model=TorneoResponse, status_code=status.HTTP_201_CREATED)
-def create_torneo(torneo_data: TorneoCreate, service: TorneoService = Depends(get_torneo_service)):
+async def create_torneo(torneo_data: TorneoCreate, service: AsyncService[TorneoService] = Depends(get_torneo_service)):
     """Crear un nuevo torneo"""
     # Conversión manual de Schema a Clase de Dominio
     torneo = Torneo(
@@ -44,7 +57,7 @@ def create_torneo(torneo_data: TorneoCreate, service: TorneoService = Depends(ge
     )
     
     try:
-        created_torneo = service.insert(torneo)
+        created_torneo = await service.insert(torneo)
         return TorneoResponse(**created_torneo.to_dict())
     except ValueError as e:
         raise HTTPException(
@@ -54,10 +67,10 @@ def create_torneo(torneo_data: TorneoCreate, service: TorneoService = Depends(ge
 
 
 @router.put("/{id_torneo}", response_model=TorneoResponse)
-def update_torneo(id_torneo: int, torneo_data: TorneoUpdate, service: TorneoService = Depends(get_torneo_service)):
+async def update_torneo(id_torneo: int, torneo_data: TorneoUpdate, service: AsyncService[TorneoService] = Depends(get_torneo_service)):
     """Actualizar un torneo existente (Maneja parciales correctamente)"""
     # 1. Verificar y obtener datos ACTUALES de la BD
-    torneo_actual = service.get_by_id(id_torneo)
+    torneo_actual = await service.get_by_id(id_torneo)
     if not torneo_actual:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -78,7 +91,7 @@ def update_torneo(id_torneo: int, torneo_data: TorneoUpdate, service: TorneoServ
     )
     
     try:
-        service.update(torneo_a_guardar)
+        await service.update(torneo_a_guardar)
         return TorneoResponse(**torneo_a_guardar.to_dict())
     except ValueError as e:
         raise HTTPException(
@@ -88,14 +101,14 @@ def update_torneo(id_torneo: int, torneo_data: TorneoUpdate, service: TorneoServ
 
 
 @router.delete("/{id_torneo}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_torneo(id_torneo: int, service: TorneoService = Depends(get_torneo_service)):
+async def delete_torneo(id_torneo: int, service: AsyncService[TorneoService] = Depends(get_torneo_service)):
     """Eliminar un torneo"""
-    existing = service.get_by_id(id_torneo)
+    existing = await service.get_by_id(id_torneo)
     if not existing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Torneo con ID {id_torneo} no encontrado"
         )
     
-    service.delete(id_torneo)
+    await service.delete(id_torneo)
     return None
@@ -1,31 +1,57 @@
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Response
 from typing import List, Optional
 from datetime import date
-from schemas.turno_schema import TurnoCreate, TurnoUpdate, TurnoResponse
+from schemas.turno_schema import TurnoCreate, TurnoUpdate, TurnoResponse, DisponibilidadResponse
+from services.async_service import AsyncService
 from services.turno_service import TurnoService
 from classes.turno import Turno
-from data.database_connection import DatabaseConnection
+from data.db_executor import DatabaseExecutor, get_db_executor
+from services.exceptions import ConflictoError
+from controllers.pagination import LIMIT_DESCRIPTION, MAX_LIMIT, AFTER_DESCRIPTION, set_next_cursor
 
 router = APIRouter(prefix="/turnos", tags=["Turnos"])
 
 
-def get_turno_service():
-    """Dependency para obtener instancia de TurnoService"""
-    db_conn = DatabaseConnection()
-    return TurnoService(connection=db_conn.get_connection())
+def get_turno_service(executor: DatabaseExecutor = Depends(get_db_executor)) -> AsyncService[TurnoService]:
+    """Dependency para obtener TurnoService sobre el executor de base de datos"""
+    return AsyncService(TurnoService, executor)
 
 @router.get("", response_model=List[TurnoResponse])
 @router.get("/", response_model=List[TurnoResponse])
-def list_turnos(service: TurnoService = Depends(get_turno_service)):
-    """Listar todos los turnos"""
-    turnos = service.list_all()
+async def list_turnos(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_LIMIT, description=LIMIT_DESCRIPTION),
+    after: Optional[str] = Query(None, description=AFTER_DESCRIPTION),
+    fecha: Optional[date] = None,
+    id_cancha: Optional[int] = None,
+    estado: Optional[str] = None,
+    service: AsyncService[TurnoService] = Depends(get_turno_service),
+):
+    """Listar los turnos paginados por id (filtros opcionales: fecha, cancha, estado)"""
+    try:
+        turnos, next_cursor = await service.list_page(limit, after, fecha=fecha, id_cancha=id_cancha, estado=estado)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    set_next_cursor(response, next_cursor)
     return [TurnoResponse(**turno.to_dict()) for turno in turnos]
 
 
+@router.get("/disponibilidad", response_model=DisponibilidadResponse)
+async def get_disponibilidad(fecha: Optional[date] = None, service: AsyncService[TurnoService] = Depends(get_turno_service)):
+    """
+    Grilla compacta de disponibilidad (cancha x horario) para una fecha.
+    Si no se especifica fecha, se usa la fecha actual.
+    """
+    return await service.disponibilidad(fecha or date.today())
+
+
 @router.get("/{id_turno}", response_model=TurnoResponse)
-def get_turno(id_turno: int, service: TurnoService = Depends(get_turno_service)):
+async def get_turno(id_turno: int, service: AsyncService[TurnoService] = Depends(get_turno_service)):
     """Obtener un turno por ID"""
-    turno = service.get_by_id(id_turno)
+    turno = await service.get_by_id(id_turno)
     if not turno:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -35,7 +61,7 @@ def get_turno(id_turno: int, service: TurnoService = Depends(get_turno_service))
 
 
 @router.post("/", response_model=TurnoResponse, status_code=status.HTTP_201_CREATED)
-def create_turno(turno_data: TurnoCreate, service: TurnoService = Depends(get_turno_service)):
+async def create_turno(turno_data: TurnoCreate, service: AsyncService[TurnoService] = Depends(get_turno_service)):
     """Crear un nuevo turno"""
     # Conversión manual de Schema a Clase de Dominio
     turno = Turno(
@@ -45,8 +71,13 @@ def create_turno(turno_data: TurnoCreate, service: TurnoService = Depends(get_tu
     )
     
     try:
-        created_turno = service.insert(turno)
+        created_turno = await service.insert(turno)
         return TurnoResponse(**created_turno.to_dict())
+    except ConflictoError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -55,10 +86,10 @@ def create_turno(turno_data: TurnoCreate, service: TurnoService = Depends(get_tu
 
 
 @router.put("/{id_turno}", response_model=TurnoResponse)
-def update_turno(id_turno: int, turno_data: TurnoUpdate, service: TurnoService = Depends(get_turno_service)):
+async def update_turno(id_turno: int, turno_data: TurnoUpdate, service: AsyncService[TurnoService] = Depends(get_turno_service)):
     """Actualizar un turno existente (Maneja parciales correctamente)"""
     # 1. Verificar y obtener datos ACTUALES de la BD
-    turno_actual = service.get_by_id(id_turno)
+    turno_actual = await service.get_by_id(id_turno)
     if not turno_actual:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -79,8 +110,13 @@ def update_turno(id_turno: int, turno_data: TurnoUpdate, service: TurnoService =
     )
     
     try:
-        service.update(turno_a_guardar)
+        await service.update(turno_a_guardar)
         return TurnoResponse(**turno_a_guardar.to_dict())
+    except ConflictoError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -89,28 +125,38 @@ def update_turno(id_turno: int, turno_data: TurnoUpdate, service: TurnoService =
 
 
 @router.delete("/{id_turno}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_turno(id_turno: int, service: TurnoService = Depends(get_turno_service)):
+async def delete_turno(id_turno: int, service: AsyncService[TurnoService] = Depends(get_turno_service)):
     """Eliminar un turno"""
-    existing = service.get_by_id(id_turno)
+    existing = await service.get_by_id(id_turno)
     if not existing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Turno con ID {id_turno} no encontrado"
         )
     
-    service.delete(id_turno)
+    await service.delete(id_turno)
     return None
 
 
 @router.post("/crear-del-dia", status_code=status.HTTP_200_OK)
-def crear_turnos_del_dia(fecha: Optional[date] = None, service: TurnoService = Depends(get_turno_service)):
+async def crear_turnos_del_dia(
+    fecha: Optional[date] = None,
+    dias: int = Query(1, ge=1, le=366, description="Cantidad de días a generar a partir de la fecha"),
+    service: AsyncService[TurnoService] = Depends(get_turno_service),
+):
     """
     Crea todos los turnos para todas las canchas y horarios en una fecha específica.
     Si no se especifica fecha, se usa la fecha actual.
+    Con `dias` > 1 genera el rango completo (p. ej. los próximos 30 días) en una sola transacción.
     """
     try:
-        resultado = service.crear_turnos_del_dia(fecha)
+        resultado = await service.crear_turnos_del_dia(fecha, dias)
         return resultado
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -119,12 +165,12 @@ def crear_turnos_del_dia(fecha: Optional[date] = None, service: TurnoService = D
 
 
 @router.post("/expirar-pasados", status_code=status.HTTP_200_OK)
-def expirar_turnos_pasados(service: TurnoService = Depends(get_turno_service)):
+async def expirar_turnos_pasados(service: AsyncService[TurnoService] = Depends(get_turno_service)):
     """
     Marca como 'no disponible' todos los turnos cuya fecha y hora ya pasaron.
     """
     try:
-        resultado = service.expirar_turnos_pasados()
+        resultado = await service.expirar_turnos_pasados()
         return resultado
     except Exception as e:
         raise HTTPException(
@@ -0,0 +1,245 @@
+"""
+Pool de conexiones SQLite acotado.
+
+Los endpoints usan el executor de data/db_executor.py (threads lectores y
+fila de escritura). El pool respalda solo la exportación en streaming
+(GET /export/{entidad}), que toma una conexión (checkout) mientras envía el
+cuerpo y la devuelve al terminar; su ocupación y esperas se publican en
+GET /metrics y GET /health/pool.
+
+Configuración por variables de entorno:
+    DONBALON_DB_PATH      Ruta a la base de datos (default: backend/data/donbalon.db)
+    DONBALON_POOL_SIZE    Cantidad máxima de conexiones abiertas (default: 8)
+    DONBALON_POOL_TIMEOUT Segundos máximos de espera por una conexión libre (default: 10)
+    DONBALON_DB_PROFILE   Perfil de PRAGMA de las conexiones (ver data/db_profiles.py)
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator, Optional
+
+from data.db_profiles import apply_profile
+from data.metrics import record_transaction
+from data.unit_of_work import discard_after_commit
+
+
+DEFAULT_POOL_SIZE = 8
+DEFAULT_POOL_TIMEOUT = 10.0
+
+
+class PoolTimeoutError(Exception):
+    """Se lanza cuando no se obtiene una conexión libre dentro del timeout."""
+
+
+def default_db_path() -> str:
+    """Ruta por defecto a donbalon.db en la carpeta backend/data."""
+    env_path = os.environ.get("DONBALON_DB_PATH")
+    if env_path:
+        return env_path
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(current_dir, "donbalon.db")
+
+
+class ConnectionPool:
+    """Pool acotado de conexiones sqlite3 con checkout/release y métricas."""
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        size: int = DEFAULT_POOL_SIZE,
+        timeout: float = DEFAULT_POOL_TIMEOUT,
+        profile: Optional[str] = None,
+    ):
+        """
+        Args:
+            db_path: Ruta a la base de datos. Si es None, se usa default_db_path()
+            size: Cantidad máxima de conexiones abiertas simultáneamente
+            timeout: Segundos máximos de espera por una conexión libre
+            profile: Perfil de PRAGMA. Si es None, se usa el de la configuración
+        """
+        if size < 1:
+            raise ValueError("El tamaño del pool debe ser al menos 1.")
+        self.db_path = db_path or default_db_path()
+        self.size = size
+        self.timeout = timeout
+        self.profile = profile
+
+        self._idle: Deque[sqlite3.Connection] = deque()
+        self._cond = threading.Condition()
+        self._created = 0
+        self._in_use = 0
+        self._closed = False
+
+        # Métricas
+        self._checkouts = 0
+        self._waits = 0
+        self._timeouts = 0
+        self._rollbacks_on_release = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Abre una conexión nueva con la configuración estándar del proyecto."""
+        # check_same_thread=False: FastAPI puede resolver la dependencia y el
+        # endpoint en threads distintos, pero cada conexión la usa un solo
+        # request a la vez.
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        apply_profile(conn, self.profile)
+        return conn
+
+    def acquire(self, timeout: Optional[float] = None) -> sqlite3.Connection:
+        """
+        Toma una conexión del pool, esperando si están todas en uso
+
+        Args:
+            timeout: Segundos de espera. Si es None, se usa el timeout del pool
+
+        Returns:
+            Conexión sqlite3 de uso exclusivo hasta llamar a release()
+
+        Raises:
+            PoolTimeoutError: Si no se libera ninguna conexión a tiempo
+        """
+        timeout = self.timeout if timeout is None else timeout
+        start = time.monotonic()
+        waited = False
+
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("El pool de conexiones está cerrado.")
+                if self._idle:
+                    conn = self._idle.pop()
+                    break
+                if self._created < self.size:
+                    # Reservar el lugar antes de conectar (fuera del lock)
+                    self._created += 1
+                    conn = None
+                    break
+
+                remaining = timeout - (time.monotonic() - start)
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolTimeoutError(
+                        f"No hay conexiones libres en el pool (tamaño {self.size}) luego de {timeout:.1f}s."
+                    )
+                waited = True
+                self._cond.wait(remaining)
+
+            self._in_use += 1
+            self._checkouts += 1
+            elapsed = time.monotonic() - start
+            if waited:
+                self._waits += 1
+            self._total_wait += elapsed
+            self._max_wait = max(self._max_wait, elapsed)
+
+        if conn is None:
+            try:
+                conn = self._connect()
+            except Exception:
+                with self._cond:
+                    self._created -= 1
+                    self._in_use -= 1
+                    self._cond.notify()
+                raise
+        return conn
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """
+        Devuelve una conexión al pool
+
+        Si el request dejó una transacción abierta se hace rollback, para que
+        el siguiente request reciba la conexión limpia.
+        """
+        discard = False
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+                discard_after_commit(conn)
+                record_transaction("release", "rollback")
+                with self._cond:
+                    self._rollbacks_on_release += 1
+        except sqlite3.Error:
+            discard = True
+
+        with self._cond:
+            self._in_use -= 1
+            if discard or self._closed:
+                self._created -= 1
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            else:
+                self._idle.append(conn)
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None) -> Iterator[sqlite3.Connection]:
+        """Context manager que hace acquire() al entrar y release() al salir."""
+        conn = self.acquire(timeout)
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def stats(self) -> Dict[str, float]:
+        """Retorna las métricas actuales del pool."""
+        with self._cond:
+            return {
+                "size": self.size,
+                "created": self._created,
+                "idle": len(self._idle),
+                "in_use": self._in_use,
+                "checkouts": self._checkouts,
+                "waits": self._waits,
+                "timeouts": self._timeouts,
+                "rollbacks_on_release": self._rollbacks_on_release,
+                "total_wait_seconds": round(self._total_wait, 6),
+                "max_wait_seconds": round(self._max_wait, 6),
+            }
+
+    def close(self) -> None:
+        """Cierra las conexiones libres; las que están en uso se cierran al devolverse."""
+        with self._cond:
+            self._closed = True
+            while self._idle:
+                conn = self._idle.pop()
+                self._created -= 1
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._cond.notify_all()
+
+
+_pool: Optional[ConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    """Retorna el pool del proceso, creándolo a partir de la configuración si no existe."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(
+                    size=int(os.environ.get("DONBALON_POOL_SIZE", DEFAULT_POOL_SIZE)),
+                    timeout=float(os.environ.get("DONBALON_POOL_TIMEOUT", DEFAULT_POOL_TIMEOUT)),
+                )
+    return _pool
+
+
+def close_pool() -> None:
+    """Cierra el pool del proceso. Usar solo al apagar la app."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
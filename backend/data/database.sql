@@ -123,13 +123,11 @@ CREATE TABLE IF NOT EXISTS Equipo (
 );
 
 -- Índices para mejorar las búsquedas
--- Índices para mejorar las búsquedas
+-- (los índices nuevos se agregan como migraciones en data/migrations, ver data/migrate.py)
 CREATE INDEX IF NOT EXISTS idx_cancha_tipo ON Cancha(id_tipo);
-CREATE INDEX IF NOT EXISTS idx_turno_cancha ON Turno(id_cancha);
 CREATE INDEX IF NOT EXISTS idx_turno_horario ON Turno(id_horario);
 CREATE INDEX IF NOT EXISTS idx_pago_reserva ON Pago(id_reserva);
 CREATE INDEX IF NOT EXISTS idx_pago_metodo ON Pago(id_metodo_pago);
-CREATE INDEX IF NOT EXISTS idx_reserva_cliente ON Reserva(id_cliente);
 CREATE INDEX IF NOT EXISTS idx_reserva_detalle_reserva ON ReservaDetalle(id_reserva);
 CREATE INDEX IF NOT EXISTS idx_reserva_detalle_turno ON ReservaDetalle(id_turno);
 CREATE INDEX IF NOT EXISTS idx_equipo_torneo ON Equipo(id_torneo);
@@ -0,0 +1,225 @@
+"""
+Executor de base de datos para los endpoints async.
+
+Los endpoints `async def` no pueden bloquear el event loop esperando a SQLite,
+así que todo el trabajo con la base corre en threads dedicados y acotados:
+
+    - un thread escritor, con su propia conexión: las escrituras del proceso
+      quedan en fila acá en lugar de competir por el lock de la base, y se
+      confirman por lotes (group commit, ver data/write_queue.py)
+    - N threads lectores, cada uno con su propia conexión en modo
+      query_only (una escritura mandada por error a un lector falla en lugar
+      de saltearse la fila del escritor)
+
+Cada conexión la abre y la usa siempre el mismo thread, así que no hay
+traspaso de conexiones entre threads ni un pool que consultar por request.
+Con WAL (ver data/db_profiles.py) los lectores no se bloquean mientras el
+escritor confirma.
+
+Configuración por variables de entorno:
+    DONBALON_DB_PATH          Ruta a la base de datos (default: backend/data/donbalon.db)
+    DONBALON_DB_READERS       Cantidad de threads lectores (default: 4)
+    DONBALON_WRITE_BATCH      Escrituras máximas por lote (default: 64)
+    DONBALON_WRITE_LINGER_MS  Espera para juntar más escrituras (default: 0)
+    DONBALON_DB_PROFILE       Perfil de PRAGMA de las conexiones (ver data/db_profiles.py)
+"""
+
+import asyncio
+import contextvars
+import functools
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+from data.connection_pool import default_db_path
+from data.db_profiles import apply_profile
+from data.metrics import record_transaction
+from data.write_queue import DEFAULT_LINGER, DEFAULT_MAX_BATCH, WriteQueue
+
+
+DEFAULT_READERS = 4
+
+R = TypeVar("R")
+
+
+class _Lane:
+    """El grupo de threads lectores con sus métricas."""
+
+    def __init__(self, name: str, workers: int, initializer: Callable[[], None]):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"db-{name}", initializer=initializer)
+        self.workers = workers
+        self.pending = 0
+        self.completed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "threads": self.workers,
+            "pending": self.pending,
+            "completed": self.completed,
+            "total_wait_seconds": round(self.total_wait, 6),
+            "max_wait_seconds": round(self.max_wait, 6),
+        }
+
+
+class DatabaseExecutor:
+    """Un thread escritor y N lectores, cada uno con su conexión sqlite3."""
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        readers: int = DEFAULT_READERS,
+        profile: Optional[str] = None,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        linger: float = DEFAULT_LINGER,
+    ):
+        """
+        Args:
+            db_path: Ruta a la base de datos. Si es None, se usa default_db_path()
+            readers: Cantidad de threads lectores
+            profile: Perfil de PRAGMA. Si es None, se usa el de la configuración
+            max_batch: Escrituras máximas por group commit (1 = un commit por escritura)
+            linger: Segundos que el escritor espera para juntar más escrituras
+        """
+        if readers < 1:
+            raise ValueError("Se necesita al menos un thread lector.")
+        self.db_path = db_path or default_db_path()
+        self.profile = profile
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[sqlite3.Connection] = []
+        self._closed = False
+
+        self._readers = _Lane("reader", readers, self._open_reader)
+        self._writer = WriteQueue(functools.partial(self._connect, False), max_batch, linger)
+
+    def _connect(self, query_only: bool) -> sqlite3.Connection:
+        """Abre la conexión de un thread del executor."""
+        # check_same_thread=False solo para poder cerrarla desde close()
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        apply_profile(conn, self.profile)
+        if query_only:
+            conn.execute("PRAGMA query_only = ON")
+        return conn
+
+    def _open_reader(self) -> None:
+        """Inicializador de cada thread lector: abre la conexión que va a usar siempre."""
+        conn = self._connect(True)
+        self._local.conn = conn
+        with self._lock:
+            self._connections.append(conn)
+
+    def _run(self, lane: _Lane, submitted: float, fn: Callable[..., R], args, kwargs) -> R:
+        """Corre `fn(conexión, ...)` en el thread actual del executor."""
+        waited = time.monotonic() - submitted
+        with self._lock:
+            lane.total_wait += waited
+            lane.max_wait = max(lane.max_wait, waited)
+        conn = self._local.conn
+        try:
+            return fn(conn, *args, **kwargs)
+        finally:
+            # Igual que ConnectionPool.release: la próxima tarea recibe la conexión limpia
+            if conn.in_transaction:
+                conn.rollback()
+                record_transaction("release", "rollback")
+
+    async def _submit(self, lane: _Lane, fn: Callable[..., R], args, kwargs) -> R:
+        if self._closed:
+            raise RuntimeError("El executor de base de datos está cerrado.")
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            lane.pending += 1
+        try:
+            # Con el contexto del request (p. ej. el contador de sentencias de data/query_stats.py)
+            context = contextvars.copy_context()
+            return await loop.run_in_executor(
+                lane.executor, context.run, self._run, lane, time.monotonic(), fn, args, kwargs
+            )
+        finally:
+            with self._lock:
+                lane.pending -= 1
+                lane.completed += 1
+
+    async def read(self, fn: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        """
+        Corre una función de solo lectura en un thread lector
+
+        Args:
+            fn: Función que recibe la conexión del thread como primer argumento
+            *args, **kwargs: Resto de los argumentos de `fn`
+
+        Returns:
+            Lo que devuelve `fn`
+        """
+        return await self._submit(self._readers, fn, args, kwargs)
+
+    async def write(self, fn: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        """
+        Corre una función que escribe en el thread escritor
+
+        Las escrituras se ejecutan de a una, en el orden en que llegan, cada
+        una en su SAVEPOINT dentro de la transacción de su lote.
+
+        Args:
+            fn: Función que recibe la conexión del thread como primer argumento.
+                No debe hacer COMMIT ni ROLLBACK (usar unit_of_work)
+            *args, **kwargs: Resto de los argumentos de `fn`
+
+        Returns:
+            Lo que devuelve `fn`, una vez confirmado su lote
+        """
+        if self._closed:
+            raise RuntimeError("El executor de base de datos está cerrado.")
+        return await self._writer.submit(fn, *args, **kwargs)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Retorna las métricas del escritor y de los lectores."""
+        with self._lock:
+            return {"writer": self._writer.stats(), "readers": self._readers.stats()}
+
+    def close(self) -> None:
+        """Espera las tareas en curso y cierra las conexiones de todos los threads."""
+        self._closed = True
+        self._writer.close()
+        self._readers.executor.shutdown(wait=True)
+        with self._lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._connections.clear()
+
+
+_executor: Optional[DatabaseExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_db_executor() -> DatabaseExecutor:
+    """Retorna el executor del proceso, creándolo a partir de la configuración si no existe."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = DatabaseExecutor(
+                    readers=int(os.environ.get("DONBALON_DB_READERS", DEFAULT_READERS)),
+                    max_batch=int(os.environ.get("DONBALON_WRITE_BATCH", DEFAULT_MAX_BATCH)),
+                    linger=float(os.environ.get("DONBALON_WRITE_LINGER_MS", DEFAULT_LINGER * 1000)) / 1000,
+                )
+    return _executor
+
+
+def close_db_executor() -> None:
+    """Cierra el executor del proceso. Usar solo al apagar la app."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.close()
+            _executor = None
@@ -0,0 +1,89 @@
+"""
+Perfiles de PRAGMA de SQLite según el tipo de uso de la conexión.
+
+Todos los perfiles activan WAL para que las lecturas no se bloqueen mientras
+otra conexión confirma una escritura (p. ej. la grilla de turnos mientras se
+registra una reserva).
+
+Perfiles:
+    api        Conexiones del pool de la API: durabilidad razonable y esperas cortas.
+    reporting  Reportes: mucha caché y mmap para recorrer tablas grandes; solo lectura.
+    bulk-load  Carga masiva de datos: sin fsync por commit, esperas largas.
+
+El perfil por defecto se toma de la variable de entorno DONBALON_DB_PROFILE
+(default: "api"). Quien abre la conexión puede pedir un perfil explícito.
+"""
+
+import os
+import sqlite3
+from typing import Dict, Optional, Union
+
+
+DEFAULT_PROFILE = "api"
+
+PROFILES: Dict[str, Dict[str, Union[int, str]]] = {
+    "api": {
+        "busy_timeout": 5000,
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -16000,          # ~16 MB (negativo = KiB)
+        "mmap_size": 128 * 1024 * 1024,
+        "temp_store": "MEMORY",
+    },
+    "reporting": {
+        "busy_timeout": 30000,
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -65536,          # ~64 MB
+        "mmap_size": 512 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        # Al final: journal_mode = WAL necesita escribir en la base
+        "query_only": "ON",
+    },
+    "bulk-load": {
+        "busy_timeout": 60000,
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -131072,         # ~128 MB
+        "mmap_size": 256 * 1024 * 1024,
+        "temp_store": "MEMORY",
+    },
+}
+
+
+def get_profile_name(profile: Optional[str] = None) -> str:
+    """
+    Resuelve el nombre del perfil a aplicar
+
+    Args:
+        profile: Perfil pedido explícitamente. Si es None, se usa DONBALON_DB_PROFILE
+
+    Returns:
+        Nombre de un perfil existente
+
+    Raises:
+        ValueError: Si el perfil no existe
+    """
+    name = profile or os.environ.get("DONBALON_DB_PROFILE", DEFAULT_PROFILE)
+    if name not in PROFILES:
+        raise ValueError(f"Perfil de base de datos desconocido: {name}. Opciones: {', '.join(PROFILES)}")
+    return name
+
+
+def apply_profile(conn: sqlite3.Connection, profile: Optional[str] = None) -> str:
+    """
+    Configura una conexión recién abierta con foreign keys y el perfil de PRAGMA
+
+    Args:
+        conn: Conexión a configurar (sin transacción abierta)
+        profile: Perfil a aplicar. Si es None, se usa el de la configuración
+
+    Returns:
+        Nombre del perfil aplicado
+    """
+    name = get_profile_name(profile)
+    conn.execute("PRAGMA foreign_keys = ON")
+    # busy_timeout va primero: cambiar journal_mode puede tener que esperar un lock
+    for pragma, value in PROFILES[name].items():
+        conn.execute(f"PRAGMA {pragma} = {value}")
+    return name
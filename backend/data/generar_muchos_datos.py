@@ -8,12 +8,17 @@ from pathlib import Path
 from datetime import date, timedelta
 import random
 
+try:
+    from data.db_profiles import apply_profile
+except ImportError:  # Ejecutado como script desde backend/data
+    from db_profiles import apply_profile
 
-def generate(db_path=None, months=12):
+
+def generate(db_path=None, months=12, profile="bulk-load"):
     if db_path is None:
         db_path = Path(__file__).parent / "donbalon.db"
     conn = sqlite3.connect(str(db_path))
-    conn.execute("PRAGMA foreign_keys = ON")
+    apply_profile(conn, profile)
     cur = conn.cursor()
 
     try:
@@ -50,11 +55,13 @@ def generate(db_path=None, months=12):
                 # Randomly skip some days to add variety
                 if random.random() < 0.6:
                     for horario_id in horarios:
-                        # Crear turno
+                        # Crear turno (si ya existe por una corrida anterior, se omite)
                         cur.execute(
-                            "INSERT INTO Turno (id_cancha, id_horario, fecha, estado_turno) VALUES (?, ?, ?, 'DISPONIBLE')",
+                            "INSERT OR IGNORE INTO Turno (id_cancha, id_horario, fecha, estado_turno) VALUES (?, ?, ?, 'DISPONIBLE')",
                             (cancha_id, horario_id, dia.isoformat())
                         )
+                        if cur.rowcount == 0:
+                            continue
                         turno_id = cur.lastrowid
                         created_turnos += 1
 
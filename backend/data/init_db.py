@@ -2,6 +2,11 @@ import sqlite3
 import os
 from pathlib import Path
 
+try:
+    from data.migrate import migrate
+except ImportError:  # Ejecutado como script desde backend/data
+    from migrate import migrate
+
 def init_database(db_path=None):
     """
     Inicializa la base de datos SQLite con el esquema definido en database.sql
@@ -33,8 +38,6 @@ def init_database(db_path=None):
         # Ejecutar el script SQL
         cursor.executescript(sql_script)
         conn.commit()
-        print(f" Base de datos creada exitosamente en: {db_path}")
-        return conn
     except sqlite3.Error as e:
         print(f" Error al crear la base de datos: {e}")
         conn.rollback()
@@ -42,6 +45,11 @@ def init_database(db_path=None):
     finally:
         conn.close()
 
+    # Índices y cambios posteriores al esquema base
+    migrate(db_path)
+    print(f" Base de datos creada exitosamente en: {db_path}")
+    return conn
+
 if __name__ == "__main__":
     # Crear la BD en la carpeta backend/data
     data_dir = Path(__file__).parent
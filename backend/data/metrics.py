@@ -0,0 +1,304 @@
+"""
+Métricas del proceso en el formato de texto de Prometheus (GET /metrics).
+
+    - requests HTTP: cantidad y latencia por método y plantilla de ruta
+      (/turnos/{id_turno}, no /turnos/17), requests en curso
+    - sentencias SQL: latencia por operación y sentencias por request (de
+      data/query_stats.py)
+    - transacciones: COMMIT y ROLLBACK por origen (unit_of_work, lotes de la
+      fila de escritura y escrituras deshechas dentro de un lote, autocommit
+      de los repositorios, conexiones devueltas con una transacción abierta)
+    - reservas: resultado (success, conflict, invalid, error) y latencia del
+      alta, incluida la espera en la fila de escritura
+    - espera por conexión del pool y del executor de base de datos, y el
+      caché de catálogo (los agrega controllers/metrics_controller.py al
+      exportar)
+
+Los histogramas usan los límites de bucket fijos de cada métrica, así que se
+pueden sumar entre procesos. Por ejemplo, una alerta sobre el p99 del alta de
+reservas:
+
+    histogram_quantile(0.99, sum by (le) (rate(donbalon_booking_duration_seconds_bucket[5m]))) > 0.5
+
+DELETE /admin/queries reinicia las métricas de sentencias; Prometheus lo toma
+como un reinicio del contador.
+"""
+
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from data.query_stats import Histogram, query_stats
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Límites (segundos) de los buckets de latencia de requests y reservas
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Plantilla de ruta de los requests que no coinciden con ningún endpoint
+UNMATCHED_ROUTE = "sin_ruta"
+
+Labels = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def family(name: str, kind: str, help: str, samples: Iterable[Tuple[Dict[str, str], float]]) -> List[str]:
+    """
+    Líneas de una familia de métricas simple (counter o gauge)
+
+    Args:
+        name: Nombre de la métrica
+        kind: "counter" o "gauge"
+        help: Descripción
+        samples: Pares (labels, valor)
+
+    Returns:
+        Las líneas HELP, TYPE y una por muestra
+    """
+    lines = [f"# HELP {name} {help}", f"# TYPE {name} {kind}"]
+    for labels, value in samples:
+        lines.append(f"{name}{_format_labels(list(labels), list(labels.values()))} {_format_value(value)}")
+    return lines
+
+
+def histogram_lines(name: str, names: Sequence[str], values: Sequence[str], histogram: Histogram) -> List[str]:
+    """
+    Muestras de un histograma (buckets acumulados, +Inf, _sum y _count)
+
+    Args:
+        name: Nombre de la métrica
+        names: Nombres de los labels
+        values: Valores de los labels
+        histogram: Histograma con cuentas por bucket (no acumuladas)
+
+    Returns:
+        Las líneas de las muestras, sin HELP ni TYPE
+    """
+    lines = []
+    cumulative = 0
+    for bound, count in zip(list(histogram.bounds) + [float("inf")], histogram.counts):
+        cumulative += count
+        labels = _format_labels(list(names) + ["le"], list(values) + [_format_value(float(bound))])
+        lines.append(f"{name}_bucket{labels} {cumulative}")
+    labels = _format_labels(names, values)
+    lines.append(f"{name}_sum{labels} {_format_value(float(histogram.total))}")
+    lines.append(f"{name}_count{labels} {histogram.count}")
+    return lines
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str]):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _check(self, labels: Labels) -> Labels:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} espera los labels {self.labelnames}")
+        return tuple(str(value) for value in labels)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    """Contador que solo crece, por combinación de labels."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        key = self._check(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._check(labels), 0)
+
+    def lines(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return self.header() + [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in values
+        ]
+
+
+class Gauge(Counter):
+    """Valor que sube y baja (p. ej. requests en curso)."""
+
+    kind = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def lines(self) -> List[str]:
+        if not self.labelnames and not self._values:
+            # Sin labels se exporta aunque todavía valga 0
+            return self.header() + [f"{self.name} 0"]
+        return super().lines()
+
+
+class LatencyHistogram(_Metric):
+    """Histograma de buckets fijos por combinación de labels."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, bounds: Sequence[float], labelnames: Sequence[str] = ()):
+        super().__init__(name, help, labelnames)
+        self.bounds = tuple(bounds)
+        self._histograms: Dict[Labels, Histogram] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        key = self._check(labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(self.bounds)
+            histogram.observe(value)
+
+    def get(self, *labels: str) -> Optional[Histogram]:
+        """Copia del histograma de una combinación de labels, o None si no tiene muestras."""
+        with self._lock:
+            histogram = self._histograms.get(self._check(labels))
+            if histogram is None:
+                return None
+            copy = Histogram(self.bounds)
+            copy.merge(histogram)
+            return copy
+
+    def lines(self) -> List[str]:
+        lines = self.header()
+        with self._lock:
+            for key, histogram in sorted(self._histograms.items()):
+                lines.extend(histogram_lines(self.name, self.labelnames, key, histogram))
+        return lines
+
+
+class MetricsRegistry:
+    """Métricas del proceso y colectores que se consultan al exportar."""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Callable[[], List[str]]] = []
+        self._lock = threading.Lock()
+
+    def _add(self, metric):
+        with self._lock:
+            self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._add(Counter(name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._add(Gauge(name, help, labelnames))
+
+    def histogram(self, name: str, help: str, bounds: Sequence[float], labelnames: Sequence[str] = ()) -> LatencyHistogram:
+        return self._add(LatencyHistogram(name, help, bounds, labelnames))
+
+    def register_collector(self, collector: Callable[[], List[str]]) -> None:
+        """
+        Registra una función que arma líneas de métricas al exportar (para
+        valores que ya lleva otro componente, como las estadísticas del pool)
+
+        Args:
+            collector: Función sin argumentos que retorna líneas del formato de texto
+        """
+        with self._lock:
+            self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Todas las métricas en el formato de texto de Prometheus."""
+        with self._lock:
+            metrics = list(self._metrics)
+            collectors = list(self._collectors)
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.lines())
+        for collector in collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+http_requests = metrics.counter(
+    "donbalon_http_requests_total", "Requests HTTP atendidos.", ("method", "route", "status")
+)
+http_request_duration = metrics.histogram(
+    "donbalon_http_request_duration_seconds", "Latencia de los requests HTTP.", REQUEST_BUCKETS, ("method", "route")
+)
+http_requests_in_flight = metrics.gauge(
+    "donbalon_http_requests_in_flight", "Requests HTTP en curso."
+)
+db_transactions = metrics.counter(
+    "donbalon_db_transactions_total", "Transacciones terminadas por origen y resultado.", ("source", "outcome")
+)
+bookings = metrics.counter(
+    "donbalon_bookings_total", "Altas de reserva por resultado.", ("outcome",)
+)
+booking_duration = metrics.histogram(
+    "donbalon_booking_duration_seconds", "Latencia del alta de reservas por resultado.", REQUEST_BUCKETS, ("outcome",)
+)
+
+
+def record_transaction(source: str, outcome: str) -> None:
+    """
+    Cuenta una transacción terminada
+
+    Args:
+        source: Quién la terminó (unit_of_work, write_queue,
+            write_queue_request, autocommit, release)
+        outcome: "commit" o "rollback"
+    """
+    db_transactions.inc(source, outcome)
+
+
+def record_booking(outcome: str, seconds: float) -> None:
+    """
+    Registra el alta de una reserva
+
+    Args:
+        outcome: success, conflict (turno ya reservado), invalid (datos
+            rechazados) o error
+        seconds: Duración del alta, incluida la espera en la fila de escritura
+    """
+    bookings.inc(outcome)
+    booking_duration.observe(seconds, outcome)
+
+
+def _query_stats_collector() -> List[str]:
+    by_operation, per_request = query_stats.histograms()
+    name = "donbalon_db_statement_duration_seconds"
+    lines = [f"# HELP {name} Latencia de las sentencias SQL por operación.", f"# TYPE {name} histogram"]
+    for operation in sorted(by_operation):
+        lines.extend(histogram_lines(name, ("operation",), (operation,), by_operation[operation]))
+    name = "donbalon_db_statements_per_request"
+    lines += [f"# HELP {name} Sentencias SQL por request HTTP.", f"# TYPE {name} histogram"]
+    lines.extend(histogram_lines(name, (), (), per_request))
+    return lines
+
+
+metrics.register_collector(_query_stats_collector)
@@ -0,0 +1,172 @@
+"""Motor de migraciones versionadas del esquema.
+
+`database.sql` define el esquema base y se aplica con CREATE IF NOT EXISTS.
+Los cambios posteriores (índices, tablas nuevas) van como migraciones en
+`data/migrations/NNNN_descripcion.sql` y se aplican en orden, una sola vez,
+registrando la versión en la tabla VersionEsquema. Así una base en uso puede
+recibir índices nuevos sin recrearse.
+
+Uso:
+    python -m data.migrate              # aplica las migraciones pendientes
+    python -m data.migrate --estado     # muestra versión actual y pendientes
+"""
+import argparse
+import re
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+
+MIGRATIONS_DIR = Path(__file__).parent / "migrations"
+VERSION_TABLE = "VersionEsquema"
+
+_FILENAME_RE = re.compile(r"^(\d+)_(\w+)\.sql$")
+
+
+class Migration(NamedTuple):
+    version: int
+    nombre: str
+    path: Path
+
+    def read_sql(self) -> str:
+        return self.path.read_text(encoding="utf-8")
+
+
+def discover_migrations(directory: Path = MIGRATIONS_DIR) -> List[Migration]:
+    """Lista las migraciones del directorio ordenadas por versión."""
+    migrations = []
+    for path in directory.glob("*.sql"):
+        match = _FILENAME_RE.match(path.name)
+        if not match:
+            continue
+        migrations.append(Migration(int(match.group(1)), match.group(2), path))
+    migrations.sort(key=lambda m: m.version)
+
+    versions = [m.version for m in migrations]
+    if len(versions) != len(set(versions)):
+        raise ValueError(f"Hay migraciones con la misma versión en {directory}")
+    return migrations
+
+
+def split_statements(script: str) -> List[str]:
+    """Separa un script SQL en sentencias completas."""
+    statements = []
+    current = ""
+    for line in script.splitlines(keepends=True):
+        current += line
+        if sqlite3.complete_statement(current):
+            statement = current.strip()
+            if statement:
+                statements.append(statement)
+            current = ""
+    leftover = [l for l in current.splitlines() if l.strip() and not l.strip().startswith("--")]
+    if leftover:
+        raise ValueError(f"Sentencia SQL incompleta al final del script: {current.strip()[:80]}")
+    return statements
+
+
+def _ensure_version_table(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        f"""CREATE TABLE IF NOT EXISTS {VERSION_TABLE} (
+            version INTEGER PRIMARY KEY,
+            nombre TEXT NOT NULL,
+            aplicada_en TEXT NOT NULL
+        )"""
+    )
+
+
+def current_version(conn: sqlite3.Connection) -> int:
+    """Versión del esquema aplicada en la base (0 si no tiene migraciones)."""
+    _ensure_version_table(conn)
+    row = conn.execute(f"SELECT MAX(version) FROM {VERSION_TABLE}").fetchone()
+    return row[0] or 0
+
+
+def pending_migrations(conn: sqlite3.Connection, directory: Path = MIGRATIONS_DIR) -> List[Migration]:
+    """Migraciones del directorio que todavía no se aplicaron en la base."""
+    _ensure_version_table(conn)
+    applied = {r[0] for r in conn.execute(f"SELECT version FROM {VERSION_TABLE}")}
+    return [m for m in discover_migrations(directory) if m.version not in applied]
+
+
+def _apply(conn: sqlite3.Connection, migration: Migration) -> bool:
+    """Aplica una migración en su propia transacción. Retorna True si tocó índices."""
+    statements = split_statements(migration.read_sql())
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        for statement in statements:
+            conn.execute(statement)
+        conn.execute(
+            f"INSERT INTO {VERSION_TABLE} (version, nombre, aplicada_en) VALUES (?, ?, ?)",
+            (migration.version, migration.nombre, datetime.now().isoformat(timespec="seconds")),
+        )
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    return any(re.search(r"\bINDEX\b", s, re.IGNORECASE) for s in statements)
+
+
+def migrate(db_path=None, directory: Path = MIGRATIONS_DIR, verbose: bool = True) -> List[Migration]:
+    """
+    Aplica en orden las migraciones pendientes
+
+    Cada migración corre en su propia transacción: si falla se revierte
+    completa y no se aplican las siguientes. Si alguna creó o eliminó
+    índices, al final se ejecuta ANALYZE para actualizar las estadísticas
+    del planificador.
+
+    Args:
+        db_path: Ruta a la base de datos. Si es None, se usa backend/data/donbalon.db
+        directory: Directorio de migraciones
+        verbose: Si es True, informa por consola cada migración aplicada
+
+    Returns:
+        Lista de migraciones aplicadas
+    """
+    if db_path is None:
+        db_path = Path(__file__).parent / "donbalon.db"
+
+    # isolation_level=None: las transacciones se controlan explícitamente
+    conn = sqlite3.connect(str(db_path), isolation_level=None)
+    applied: List[Migration] = []
+    try:
+        conn.execute("PRAGMA foreign_keys = ON")
+        touched_indexes = False
+        for migration in pending_migrations(conn, directory):
+            touched_indexes |= _apply(conn, migration)
+            applied.append(migration)
+            if verbose:
+                print(f" Migración {migration.version:04d} aplicada: {migration.nombre}")
+        if touched_indexes:
+            conn.execute("ANALYZE")
+    finally:
+        conn.close()
+    return applied
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Migraciones del esquema DonBalon")
+    parser.add_argument("--db", default=None, help="Ruta a la base de datos")
+    parser.add_argument("--estado", action="store_true", help="Mostrar versión actual y migraciones pendientes")
+    args = parser.parse_args(argv)
+
+    if args.estado:
+        db_path = args.db or Path(__file__).parent / "donbalon.db"
+        conn = sqlite3.connect(str(db_path))
+        try:
+            print(f"Versión actual: {current_version(conn)}")
+            for m in pending_migrations(conn):
+                print(f"  pendiente: {m.version:04d} {m.nombre}")
+        finally:
+            conn.close()
+        return
+
+    applied = migrate(args.db)
+    if not applied:
+        print("El esquema ya está actualizado.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+-- Índices compuestos y de cobertura para las consultas calientes.
+-- Bases creadas antes de esta migración: si hay turnos duplicados para la
+-- misma cancha/horario/fecha, el índice único falla y la migración se revierte.
+
+-- Turno por cancha/horario/fecha: chequeo de conflictos al reservar y
+-- generación de turnos. Único, así evita además la doble reserva.
+CREATE UNIQUE INDEX IF NOT EXISTS uq_turno_cancha_horario_fecha ON Turno(id_cancha, id_horario, fecha);
+
+-- idx_turno_cancha queda cubierto por el prefijo del índice anterior
+DROP INDEX IF EXISTS idx_turno_cancha;
+
+-- Turno por fecha: grilla de disponibilidad, expiración y filtros por período.
+-- Incluye cancha, horario y estado para resolver esas consultas sin leer la tabla.
+CREATE INDEX IF NOT EXISTS idx_turno_fecha ON Turno(fecha, id_cancha, id_horario, estado_turno);
+
+-- Reserva por fecha y por estado
+CREATE INDEX IF NOT EXISTS idx_reserva_fecha ON Reserva(fecha_reserva);
+CREATE INDEX IF NOT EXISTS idx_reserva_estado ON Reserva(estado_reserva, fecha_reserva);
+
+-- Reservas de un cliente ordenadas por fecha (reemplaza idx_reserva_cliente)
+CREATE INDEX IF NOT EXISTS idx_reserva_cliente_fecha ON Reserva(id_cliente, fecha_reserva);
+DROP INDEX IF EXISTS idx_reserva_cliente;
+
+-- Cliente por mail para /clientes/login
+CREATE INDEX IF NOT EXISTS idx_cliente_mail ON Cliente(mail);
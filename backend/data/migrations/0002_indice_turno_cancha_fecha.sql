@@ -0,0 +1,4 @@
+-- Turnos de una cancha en un período (reporte de reservas por cancha).
+-- uq_turno_cancha_horario_fecha tiene el horario en el medio, así que no
+-- sirve para un rango de fechas de una sola cancha.
+CREATE INDEX IF NOT EXISTS idx_turno_cancha_fecha ON Turno(id_cancha, fecha);
@@ -0,0 +1,162 @@
+-- Tabla resumen de uso por cancha, día y horario, para reportes y tableros.
+--
+--   reservas       ítems de reservas no canceladas
+--   ingresos       suma de precio_total_item de esos ítems
+--   cancelaciones  ítems de reservas canceladas
+--   expirados      turnos no disponibles sin ninguna reserva (vencidos o bloqueados)
+--
+-- Se mantiene con triggers, así la actualizan todas las escrituras (API,
+-- expiración, scripts de carga). Como hay un solo turno por cancha/horario/fecha
+-- (uq_turno_cancha_horario_fecha), cada fila corresponde a un turno y cada
+-- trigger recalcula la fila de los turnos que tocó. Solo se guardan filas con
+-- algún valor distinto de cero.
+--
+-- Reconstrucción completa: python -m data.rollups
+
+CREATE TABLE IF NOT EXISTS UsoCancha (
+    id_cancha INTEGER NOT NULL,
+    fecha DATE NOT NULL,
+    id_horario INTEGER NOT NULL,
+    reservas INTEGER NOT NULL DEFAULT 0,
+    ingresos DECIMAL(10, 2) NOT NULL DEFAULT 0,
+    cancelaciones INTEGER NOT NULL DEFAULT 0,
+    expirados INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (id_cancha, fecha, id_horario)
+) WITHOUT ROWID;
+
+-- Reporte mensual y tableros por período
+CREATE INDEX IF NOT EXISTS idx_uso_cancha_fecha ON UsoCancha(fecha);
+
+-- Carga inicial con los datos existentes
+INSERT INTO UsoCancha (id_cancha, fecha, id_horario, reservas, ingresos, cancelaciones, expirados)
+SELECT t.id_cancha, t.fecha, t.id_horario,
+       SUM(rd.id_detalle IS NOT NULL AND lower(coalesce(r.estado_reserva, '')) <> 'cancelada'),
+       coalesce(SUM(CASE WHEN lower(coalesce(r.estado_reserva, '')) <> 'cancelada' THEN rd.precio_total_item END), 0),
+       SUM(lower(coalesce(r.estado_reserva, '')) = 'cancelada'),
+       COUNT(rd.id_detalle) = 0 AND lower(t.estado_turno) = 'no disponible'
+FROM Turno t
+LEFT JOIN ReservaDetalle rd ON rd.id_turno = t.id_turno
+LEFT JOIN Reserva r ON r.id_reserva = rd.id_reserva
+GROUP BY t.id_turno
+HAVING COUNT(rd.id_detalle) > 0 OR lower(t.estado_turno) = 'no disponible';
+
+-- Turno: alta, cambio de estado (reserva o expiración), cambio de clave y baja
+
+CREATE TRIGGER IF NOT EXISTS trg_uso_turno_insert AFTER INSERT ON Turno
+WHEN lower(NEW.estado_turno) = 'no disponible'
+BEGIN
+    INSERT OR REPLACE INTO UsoCancha (id_cancha, fecha, id_horario, expirados)
+    SELECT NEW.id_cancha, NEW.fecha, NEW.id_horario, 1
+    WHERE NOT EXISTS (SELECT 1 FROM ReservaDetalle WHERE id_turno = NEW.id_turno);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_uso_turno_update AFTER UPDATE OF estado_turno, id_cancha, fecha, id_horario ON Turno
+BEGIN
+    DELETE FROM UsoCancha
+    WHERE id_cancha = OLD.id_cancha AND fecha = OLD.fecha AND id_horario = OLD.id_horario;
+    INSERT INTO UsoCancha (id_cancha, fecha, id_horario, reservas, ingresos, cancelaciones, expirados)
+    SELECT t.id_cancha, t.fecha, t.id_horario,
+           SUM(rd.id_detalle IS NOT NULL AND lower(coalesce(r.estado_reserva, '')) <> 'cancelada'),
+           coalesce(SUM(CASE WHEN lower(coalesce(r.estado_reserva, '')) <> 'cancelada' THEN rd.precio_total_item END), 0),
+           SUM(lower(coalesce(r.estado_reserva, '')) = 'cancelada'),
+           COUNT(rd.id_detalle) = 0 AND lower(t.estado_turno) = 'no disponible'
+    FROM Turno t
+    LEFT JOIN ReservaDetalle rd ON rd.id_turno = t.id_turno
+    LEFT JOIN Reserva r ON r.id_reserva = rd.id_reserva
+    WHERE t.id_turno = NEW.id_turno
+    GROUP BY t.id_turno
+    HAVING COUNT(rd.id_detalle) > 0 OR lower(t.estado_turno) = 'no disponible';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_uso_turno_delete AFTER DELETE ON Turno
+BEGIN
+    DELETE FROM UsoCancha
+    WHERE id_cancha = OLD.id_cancha AND fecha = OLD.fecha AND id_horario = OLD.id_horario;
+END;
+
+-- ReservaDetalle: ítem reservado, modificado o eliminado
+
+CREATE TRIGGER IF NOT EXISTS trg_uso_detalle_insert AFTER INSERT ON ReservaDetalle
+BEGIN
+    DELETE FROM UsoCancha
+    WHERE (id_cancha, fecha, id_horario) IN (
+        SELECT id_cancha, fecha, id_horario FROM Turno WHERE id_turno = NEW.id_turno
+    );
+    INSERT INTO UsoCancha (id_cancha, fecha, id_horario, reservas, ingresos, cancelaciones, expirados)
+    SELECT t.id_cancha, t.fecha, t.id_horario,
+           SUM(rd.id_detalle IS NOT NULL AND lower(coalesce(r.estado_reserva, '')) <> 'cancelada'),
+           coalesce(SUM(CASE WHEN lower(coalesce(r.estado_reserva, '')) <> 'cancelada' THEN rd.precio_total_item END), 0),
+           SUM(lower(coalesce(r.estado_reserva, '')) = 'cancelada'),
+           COUNT(rd.id_detalle) = 0 AND lower(t.estado_turno) = 'no disponible'
+    FROM Turno t
+    LEFT JOIN ReservaDetalle rd ON rd.id_turno = t.id_turno
+    LEFT JOIN Reserva r ON r.id_reserva = rd.id_reserva
+    WHERE t.id_turno = NEW.id_turno
+    GROUP BY t.id_turno
+    HAVING COUNT(rd.id_detalle) > 0 OR lower(t.estado_turno) = 'no disponible';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_uso_detalle_update AFTER UPDATE ON ReservaDetalle
+BEGIN
+    DELETE FROM UsoCancha
+    WHERE (id_cancha, fecha, id_horario) IN (
+        SELECT id_cancha, fecha, id_horario FROM Turno WHERE id_turno IN (OLD.id_turno, NEW.id_turno)
+    );
+    INSERT INTO UsoCancha (id_cancha, fecha, id_horario, reservas, ingresos, cancelaciones, expirados)
+    SELECT t.id_cancha, t.fecha, t.id_horario,
+           SUM(rd.id_detalle IS NOT NULL AND lower(coalesce(r.estado_reserva, '')) <> 'cancelada'),
+           coalesce(SUM(CASE WHEN lower(coalesce(r.estado_reserva, '')) <> 'cancelada' THEN rd.precio_total_item END), 0),
+           SUM(lower(coalesce(r.estado_reserva, '')) = 'cancelada'),
+           COUNT(rd.id_detalle) = 0 AND lower(t.estado_turno) = 'no disponible'
+    FROM Turno t
+    LEFT JOIN ReservaDetalle rd ON rd.id_turno = t.id_turno
+    LEFT JOIN Reserva r ON r.id_reserva = rd.id_reserva
+    WHERE t.id_turno IN (OLD.id_turno, NEW.id_turno)
+    GROUP BY t.id_turno
+    HAVING COUNT(rd.id_detalle) > 0 OR lower(t.estado_turno) = 'no disponible';
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_uso_detalle_delete AFTER DELETE ON ReservaDetalle
+BEGIN
+    DELETE FROM UsoCancha
+    WHERE (id_cancha, fecha, id_horario) IN (
+        SELECT id_cancha, fecha, id_horario FROM Turno WHERE id_turno = OLD.id_turno
+    );
+    INSERT INTO UsoCancha (id_cancha, fecha, id_horario, reservas, ingresos, cancelaciones, expirados)
+    SELECT t.id_cancha, t.fecha, t.id_horario,
+           SUM(rd.id_detalle IS NOT NULL AND lower(coalesce(r.estado_reserva, '')) <> 'cancelada'),
+           coalesce(SUM(CASE WHEN lower(coalesce(r.estado_reserva, '')) <> 'cancelada' THEN rd.precio_total_item END), 0),
+           SUM(lower(coalesce(r.estado_reserva, '')) = 'cancelada'),
+           COUNT(rd.id_detalle) = 0 AND lower(t.estado_turno) = 'no disponible'
+    FROM Turno t
+    LEFT JOIN ReservaDetalle rd ON rd.id_turno = t.id_turno
+    LEFT JOIN Reserva r ON r.id_reserva = rd.id_reserva
+    WHERE t.id_turno = OLD.id_turno
+    GROUP BY t.id_turno
+    HAVING COUNT(rd.id_detalle) > 0 OR lower(t.estado_turno) = 'no disponible';
+END;
+
+-- Reserva: cancelación (o reactivación) de todos sus ítems
+
+CREATE TRIGGER IF NOT EXISTS trg_uso_reserva_estado AFTER UPDATE OF estado_reserva ON Reserva
+WHEN (lower(OLD.estado_reserva) = 'cancelada') <> (lower(NEW.estado_reserva) = 'cancelada')
+BEGIN
+    DELETE FROM UsoCancha
+    WHERE (id_cancha, fecha, id_horario) IN (
+        SELECT t.id_cancha, t.fecha, t.id_horario
+        FROM ReservaDetalle d JOIN Turno t ON t.id_turno = d.id_turno
+        WHERE d.id_reserva = NEW.id_reserva
+    );
+    INSERT INTO UsoCancha (id_cancha, fecha, id_horario, reservas, ingresos, cancelaciones, expirados)
+    SELECT t.id_cancha, t.fecha, t.id_horario,
+           SUM(rd.id_detalle IS NOT NULL AND lower(coalesce(r.estado_reserva, '')) <> 'cancelada'),
+           coalesce(SUM(CASE WHEN lower(coalesce(r.estado_reserva, '')) <> 'cancelada' THEN rd.precio_total_item END), 0),
+           SUM(lower(coalesce(r.estado_reserva, '')) = 'cancelada'),
+           COUNT(rd.id_detalle) = 0 AND lower(t.estado_turno) = 'no disponible'
+    FROM Turno t
+    LEFT JOIN ReservaDetalle rd ON rd.id_turno = t.id_turno
+    LEFT JOIN Reserva r ON r.id_reserva = rd.id_reserva
+    WHERE t.id_turno IN (SELECT id_turno FROM ReservaDetalle WHERE id_reserva = NEW.id_reserva)
+    GROUP BY t.id_turno
+    HAVING COUNT(rd.id_detalle) > 0 OR lower(t.estado_turno) = 'no disponible';
+END;
@@ -0,0 +1,3 @@
+-- Pagos por fecha: exportación por período (/export/pagos) en orden de
+-- fecha sin ordenar en memoria.
+CREATE INDEX IF NOT EXISTS idx_pago_fecha ON Pago(fecha_pago);
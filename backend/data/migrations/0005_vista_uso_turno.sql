@@ -0,0 +1,93 @@
+-- El cálculo del uso de cada turno, en un solo lugar.
+--
+-- Los triggers de 0003 repetían cada uno la misma agregación (qué cuenta como
+-- reserva, ingreso o cancelación), igual que data/rollups.py. Desde esta
+-- versión la regla está solo en la vista v_uso_turno: los triggers piden
+-- recalcular los turnos que tocaron y data/rollups.py reconstruye desde la
+-- vista. Los valores calculados son los mismos, así que UsoCancha no se
+-- recarga.
+
+-- Uso de cada turno calculado desde las tablas base. La usan los triggers y
+-- la reconstrucción de data/rollups.py. Un filtro id_turno = ? se aplica
+-- antes de agrupar (push-down de SQLite): se calcula solo ese turno, por su
+-- clave.
+CREATE VIEW IF NOT EXISTS v_uso_turno AS
+SELECT t.id_turno, t.id_cancha, t.fecha, t.id_horario,
+       SUM(rd.id_detalle IS NOT NULL AND lower(coalesce(r.estado_reserva, '')) <> 'cancelada') AS reservas,
+       coalesce(SUM(CASE WHEN lower(coalesce(r.estado_reserva, '')) <> 'cancelada' THEN rd.precio_total_item END), 0) AS ingresos,
+       SUM(lower(coalesce(r.estado_reserva, '')) = 'cancelada') AS cancelaciones,
+       COUNT(rd.id_detalle) = 0 AND lower(t.estado_turno) = 'no disponible' AS expirados
+FROM Turno t
+LEFT JOIN ReservaDetalle rd ON rd.id_turno = t.id_turno
+LEFT JOIN Reserva r ON r.id_reserva = rd.id_reserva
+GROUP BY t.id_turno
+HAVING COUNT(rd.id_detalle) > 0 OR lower(t.estado_turno) = 'no disponible';
+
+-- Recalcular el uso de un turno:
+--     INSERT INTO v_recalcular_uso_turno (id_turno) VALUES (...)
+-- La vista no tiene filas; su trigger recalcula de a un turno, así cada
+-- recálculo usa el filtro por clave de v_uso_turno (un IN (subconsulta) no se
+-- aplica antes de agrupar y recorrería todos los turnos).
+CREATE VIEW IF NOT EXISTS v_recalcular_uso_turno AS
+SELECT id_turno FROM Turno WHERE 0;
+
+CREATE TRIGGER IF NOT EXISTS trg_recalcular_uso_turno INSTEAD OF INSERT ON v_recalcular_uso_turno
+BEGIN
+    DELETE FROM UsoCancha
+    WHERE (id_cancha, fecha, id_horario) IN (
+        SELECT id_cancha, fecha, id_horario FROM Turno WHERE id_turno = NEW.id_turno
+    );
+    INSERT INTO UsoCancha (id_cancha, fecha, id_horario, reservas, ingresos, cancelaciones, expirados)
+    SELECT id_cancha, fecha, id_horario, reservas, ingresos, cancelaciones, expirados
+    FROM v_uso_turno WHERE id_turno = NEW.id_turno;
+END;
+
+-- Turno: alta, cambio de estado (reserva o expiración) y cambio de clave
+-- (trg_uso_turno_delete no calcula el uso y queda como en 0003)
+
+DROP TRIGGER IF EXISTS trg_uso_turno_insert;
+CREATE TRIGGER trg_uso_turno_insert AFTER INSERT ON Turno
+WHEN lower(NEW.estado_turno) = 'no disponible'
+BEGIN
+    INSERT INTO v_recalcular_uso_turno (id_turno) VALUES (NEW.id_turno);
+END;
+
+DROP TRIGGER IF EXISTS trg_uso_turno_update;
+CREATE TRIGGER trg_uso_turno_update AFTER UPDATE OF estado_turno, id_cancha, fecha, id_horario ON Turno
+BEGIN
+    -- La fila anterior, por si cambió la clave
+    DELETE FROM UsoCancha
+    WHERE id_cancha = OLD.id_cancha AND fecha = OLD.fecha AND id_horario = OLD.id_horario;
+    INSERT INTO v_recalcular_uso_turno (id_turno) VALUES (NEW.id_turno);
+END;
+
+-- ReservaDetalle: ítem reservado, modificado o eliminado
+
+DROP TRIGGER IF EXISTS trg_uso_detalle_insert;
+CREATE TRIGGER trg_uso_detalle_insert AFTER INSERT ON ReservaDetalle
+BEGIN
+    INSERT INTO v_recalcular_uso_turno (id_turno) VALUES (NEW.id_turno);
+END;
+
+DROP TRIGGER IF EXISTS trg_uso_detalle_update;
+CREATE TRIGGER trg_uso_detalle_update AFTER UPDATE ON ReservaDetalle
+BEGIN
+    INSERT INTO v_recalcular_uso_turno (id_turno)
+    SELECT id_turno FROM Turno WHERE id_turno IN (OLD.id_turno, NEW.id_turno);
+END;
+
+DROP TRIGGER IF EXISTS trg_uso_detalle_delete;
+CREATE TRIGGER trg_uso_detalle_delete AFTER DELETE ON ReservaDetalle
+BEGIN
+    INSERT INTO v_recalcular_uso_turno (id_turno) VALUES (OLD.id_turno);
+END;
+
+-- Reserva: cancelación (o reactivación) de todos sus ítems
+
+DROP TRIGGER IF EXISTS trg_uso_reserva_estado;
+CREATE TRIGGER trg_uso_reserva_estado AFTER UPDATE OF estado_reserva ON Reserva
+WHEN (lower(OLD.estado_reserva) = 'cancelada') <> (lower(NEW.estado_reserva) = 'cancelada')
+BEGIN
+    INSERT INTO v_recalcular_uso_turno (id_turno)
+    SELECT DISTINCT id_turno FROM ReservaDetalle WHERE id_reserva = NEW.id_reserva;
+END;
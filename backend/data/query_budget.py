@@ -0,0 +1,223 @@
+"""
+Presupuesto de sentencias y detector de N+1 por request (desarrollo/staging).
+
+Varios flujos hacen una consulta por fila (los reportes,
+expirar_turnos_pasados, el get-then-update de los controllers). Con el
+detector activo, el middleware de main.py revisa al final de cada request las
+sentencias que contó data/query_stats.py y lo marca si:
+
+    - superó el presupuesto de sentencias (DONBALON_QUERY_BUDGET), o
+    - repitió una misma forma de sentencia con parámetros distintos
+      DONBALON_N_PLUS_ONE_MIN veces o más (el patrón N+1)
+
+Los requests marcados se loguean como warning con los lugares del código que
+ejecutaron cada sentencia repetida, se informan en el header X-Query-Warning
+y quedan en GET /admin/n-plus-one.
+
+Para los tests, max_queries() verifica que un endpoint no supere una cantidad
+de sentencias, aunque el detector esté apagado:
+
+    with max_queries(2):
+        client.get("/turnos/1")
+
+Configuración por variables de entorno:
+    DONBALON_QUERY_BUDGET    Sentencias máximas por request (sin definir: detector apagado, como en producción)
+    DONBALON_N_PLUS_ONE_MIN  Repeticiones de una forma para marcarla como N+1 (default: 5)
+"""
+
+import datetime
+import logging
+import os
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+from data.query_stats import RequestQueries
+
+
+logger = logging.getLogger(__name__)
+
+# Header de la respuesta de un request marcado
+QUERY_WARNING_HEADER = "X-Query-Warning"
+
+DEFAULT_N_PLUS_ONE_MIN = 5
+FLAGGED_LOG_SIZE = 100
+
+
+class QueryBudget:
+    """Revisa las sentencias de cada request contra el presupuesto y busca N+1."""
+
+    def __init__(self, budget: Optional[int] = None, min_repeats: Optional[int] = None):
+        """
+        Args:
+            budget: Sentencias máximas por request. Si es None, se usa
+                DONBALON_QUERY_BUDGET; si tampoco está definida, el detector queda apagado
+            min_repeats: Repeticiones de una forma para marcarla como N+1. Si
+                es None, se usa DONBALON_N_PLUS_ONE_MIN
+        """
+        if budget is None and os.environ.get("DONBALON_QUERY_BUDGET"):
+            budget = int(os.environ["DONBALON_QUERY_BUDGET"])
+        if min_repeats is None:
+            min_repeats = int(os.environ.get("DONBALON_N_PLUS_ONE_MIN", DEFAULT_N_PLUS_ONE_MIN))
+        self.budget = budget
+        self.min_repeats = min_repeats
+        self._lock = threading.Lock()
+        self._watchers: List[List[Dict[str, Any]]] = []
+        self._flagged: Deque[Dict[str, Any]] = deque(maxlen=FLAGGED_LOG_SIZE)
+
+    @property
+    def enabled(self) -> bool:
+        """Si el detector marca y loguea requests."""
+        return self.budget is not None
+
+    @property
+    def capturing(self) -> bool:
+        """Si hay que guardar parámetros y lugares del código de cada sentencia."""
+        return self.enabled or bool(self._watchers)
+
+    def repeated(self, statements: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Formas de sentencia ejecutadas min_repeats veces o más con parámetros distintos
+
+        Args:
+            statements: Sentencias del request, como las devuelve statements()
+
+        Returns:
+            Las que forman un N+1, la más repetida primero
+        """
+        return [
+            item for item in statements
+            # La misma sentencia con los mismos parámetros no es un N+1
+            if item["count"] >= self.min_repeats and item["distinct_params"] != 1
+        ]
+
+    def inspect(self, endpoint: str, queries: RequestQueries) -> Optional[Dict[str, Any]]:
+        """
+        Revisa las sentencias de un request terminado
+
+        Args:
+            endpoint: Método y ruta del request (p. ej. "GET /turnos/{id_turno}")
+            queries: Sentencias del request
+
+        Returns:
+            El reporte del request si quedó marcado, o None
+        """
+        report = {
+            "endpoint": endpoint,
+            "queries": queries.count,
+            "seconds": round(queries.seconds, 6),
+            "budget": self.budget,
+            "over_budget": self.budget is not None and queries.count > self.budget,
+            "statements": statements(queries),
+            "at": datetime.datetime.now().isoformat(timespec="seconds"),
+        }
+        report["repeated"] = self.repeated(report["statements"])
+        with self._lock:
+            for watcher in self._watchers:
+                watcher.append(report)
+
+        if not self.enabled or not (report["over_budget"] or report["repeated"]):
+            return None
+        with self._lock:
+            self._flagged.append(report)
+        logger.warning("%s: %s", endpoint, summary(report))
+        for item in report["repeated"]:
+            logger.warning(
+                "  N+1 %s x%d desde:\n    %s", item["sql"], item["count"], "\n    ".join(item["call_sites"]) or "?"
+            )
+        return report
+
+    def flagged(self) -> List[Dict[str, Any]]:
+        """Últimos requests marcados (el más reciente primero)."""
+        with self._lock:
+            return list(reversed(self._flagged))
+
+    def reset(self) -> None:
+        """Descarta los requests marcados."""
+        with self._lock:
+            self._flagged.clear()
+
+    @contextmanager
+    def watch(self) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Junta el reporte de cada request terminado durante el bloque (esté o no
+        activo el detector)
+
+        Yields:
+            La lista donde se agregan los reportes
+        """
+        reports: List[Dict[str, Any]] = []
+        with self._lock:
+            self._watchers.append(reports)
+        try:
+            yield reports
+        finally:
+            with self._lock:
+                self._watchers.remove(reports)
+
+
+def statements(queries: RequestQueries) -> List[Dict[str, Any]]:
+    """
+    Sentencias de un request agrupadas por forma
+
+    Args:
+        queries: Sentencias del request
+
+    Returns:
+        Lista de {sql, count, distinct_params, call_sites}, la más ejecutada
+        primero (distinct_params y call_sites solo si se capturaron)
+    """
+    result = []
+    for shape, count in queries.shapes.items():
+        sites = (queries.call_sites or {}).get(shape, {})
+        result.append({
+            "sql": shape,
+            "count": count,
+            "distinct_params": len(queries.params.get(shape, ())) if queries.params is not None else None,
+            "call_sites": dict(sorted(sites.items(), key=lambda item: item[1], reverse=True)),
+        })
+    result.sort(key=lambda item: item["count"], reverse=True)
+    return result
+
+
+def summary(report: Dict[str, Any]) -> str:
+    """Resumen de una línea de un reporte (para el log y el header X-Query-Warning)."""
+    parts = [f"{report['queries']} sentencias"]
+    if report["over_budget"]:
+        parts.append(f"presupuesto {report['budget']}")
+    if report["repeated"]:
+        worst = report["repeated"][0]
+        parts.append(f"N+1: {len(report['repeated'])} formas repetidas (la peor x{worst['count']})")
+    return ", ".join(parts)
+
+
+query_budget = QueryBudget()
+
+
+@contextmanager
+def max_queries(limit: int) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Helper de tests: falla si algún request del bloque ejecuta más de `limit` sentencias
+
+    Args:
+        limit: Sentencias máximas por request
+
+    Yields:
+        Los reportes de los requests del bloque
+
+    Raises:
+        AssertionError: Si algún request superó el límite, con sus sentencias
+            y los lugares del código que las ejecutaron
+    """
+    with query_budget.watch() as reports:
+        yield reports
+    excedidos = [report for report in reports if report["queries"] > limit]
+    if excedidos:
+        detalle = []
+        for report in excedidos:
+            detalle.append(f"{report['endpoint']}: {report['queries']} sentencias (máximo {limit})")
+            for item in report["statements"]:
+                detalle.append(f"    x{item['count']} {item['sql']}")
+                detalle.extend(f"        {site} (x{count})" for site, count in item["call_sites"].items())
+        raise AssertionError("\n".join(detalle))
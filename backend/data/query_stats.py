@@ -0,0 +1,348 @@
+"""
+Instrumentación de las sentencias SQL de los repositorios.
+
+BaseRepository registra acá cada sentencia que ejecuta (execute, query_one,
+query_all, query_entities, query_entity; ExportRepository.iter_chunks, la
+suya al cerrar el cursor):
+
+    - por forma de la sentencia (SQL normalizado: literales, listas de
+      parámetros y filas de un INSERT multi-fila colapsados), cantidad de
+      ejecuciones, tiempo total y máximo, histograma de latencia y filas
+    - un contador por request (track_request), que se propaga a los threads
+      del executor de base de datos; opcionalmente guarda también los
+      parámetros y el lugar del código de cada sentencia (para el detector
+      de N+1 de data/query_budget.py)
+    - un log de sentencias lentas con su EXPLAIN QUERY PLAN, para detectar
+      recorridos completos (SCAN Turno) apenas aparecen
+
+Se consulta en GET /admin/queries.
+
+Configuración por variables de entorno:
+    DONBALON_SLOW_QUERY_MS  Umbral del log de sentencias lentas (default: 100, 0 = todas)
+"""
+
+import bisect
+import contextvars
+import datetime
+import os
+import re
+import sqlite3
+import sys
+import threading
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Deque, Dict, Iterator, Optional, Sequence, Set, Tuple
+
+
+# Header de la respuesta con la cantidad de sentencias del request
+QUERY_COUNT_HEADER = "X-Query-Count"
+
+DEFAULT_SLOW_QUERY_MS = 100.0
+SLOW_LOG_SIZE = 100
+
+# Límites superiores (segundos) de los buckets de latencia por sentencia
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+# Límites de los buckets de sentencias por request
+PER_REQUEST_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200)
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w.])\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+_PARAM_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_REPEATED_LISTS = re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+")
+
+# Frames del código propio que se muestran como lugar de una sentencia
+CALL_SITE_DEPTH = 3
+_BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Módulos por los que pasan todas las sentencias: no dicen quién la ejecutó
+_PLUMBING = frozenset(
+    os.path.join(_BACKEND_DIR, *parts)
+    for parts in (
+        ("data", "query_stats.py"),
+        ("data", "db_executor.py"),
+        ("data", "write_queue.py"),
+        ("data", "unit_of_work.py"),
+        ("repositories", "base_repository.py"),
+        ("services", "async_service.py"),
+    )
+)
+
+
+@lru_cache(maxsize=4096)
+def normalize_sql(sql: str) -> str:
+    """
+    Forma de una sentencia, para agrupar las que solo difieren en valores
+
+    Args:
+        sql: Sentencia tal como se ejecutó
+
+    Returns:
+        La sentencia con literales reemplazados por ?, listas de parámetros
+        como (...) y los espacios colapsados
+    """
+    shape = _STRING.sub("?", sql)
+    shape = _NUMBER.sub("?", shape)
+    shape = _WHITESPACE.sub(" ", shape).strip().rstrip(";")
+    shape = _PARAM_LIST.sub("(...)", shape)
+    return _REPEATED_LISTS.sub("(...)", shape)
+
+
+def call_site() -> str:
+    """
+    Lugar del código que ejecutó la sentencia en curso
+
+    Returns:
+        Hasta CALL_SITE_DEPTH frames del backend (del más interno al más
+        externo), como "repositories/turno_repository.py:52 get_by_id <- ..."
+    """
+    frames = []
+    frame = sys._getframe(1)
+    while frame is not None and len(frames) < CALL_SITE_DEPTH:
+        filename = frame.f_code.co_filename
+        if filename.startswith(_BACKEND_DIR) and filename not in _PLUMBING:
+            relative = os.path.relpath(filename, _BACKEND_DIR)
+            frames.append(f"{relative}:{frame.f_lineno} {frame.f_code.co_name}")
+        frame = frame.f_back
+    return " <- ".join(frames) or "?"
+
+
+def _params_key(params: Tuple[Any, ...]) -> Any:
+    try:
+        key = tuple(params)
+        hash(key)
+        return key
+    except TypeError:
+        return repr(params)
+
+
+class Histogram:
+    """Histograma de buckets fijos (cuentas no acumuladas; el último es +Inf)."""
+
+    __slots__ = ("bounds", "counts", "count", "total")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def merge(self, other: "Histogram") -> None:
+        """Suma las cuentas de otro histograma con los mismos buckets."""
+        for i, count in enumerate(other.counts):
+            self.counts[i] += count
+        self.count += other.count
+        self.total += other.total
+
+    def to_dict(self) -> Dict[str, int]:
+        labels = [f"le_{bound:g}" for bound in self.bounds] + ["le_inf"]
+        return dict(zip(labels, self.counts))
+
+
+class _Statement:
+    __slots__ = ("histogram", "max", "rows")
+
+    def __init__(self):
+        self.histogram = Histogram(LATENCY_BUCKETS)
+        self.max = 0.0
+        self.rows = 0
+
+
+class RequestQueries:
+    """Sentencias ejecutadas durante un request."""
+
+    __slots__ = ("count", "seconds", "rows", "shapes", "params", "call_sites")
+
+    def __init__(self, capture_sites: bool = False):
+        """
+        Args:
+            capture_sites: Guardar los parámetros distintos y los lugares del
+                código de cada forma (recorre el stack en cada sentencia)
+        """
+        self.count = 0
+        self.seconds = 0.0
+        self.rows = 0
+        # Ejecuciones por forma de sentencia
+        self.shapes: Dict[str, int] = {}
+        self.params: Optional[Dict[str, Set[Any]]] = {} if capture_sites else None
+        self.call_sites: Optional[Dict[str, Dict[str, int]]] = {} if capture_sites else None
+
+    def observe(self, shape: str, params: Tuple[Any, ...], seconds: float, rows: int) -> None:
+        self.count += 1
+        self.seconds += seconds
+        self.rows += max(rows, 0)
+        self.shapes[shape] = self.shapes.get(shape, 0) + 1
+        if self.call_sites is not None:
+            self.params.setdefault(shape, set()).add(_params_key(params))
+            sites = self.call_sites.setdefault(shape, {})
+            site = call_site()
+            sites[site] = sites.get(site, 0) + 1
+
+
+_current_request: contextvars.ContextVar[Optional[RequestQueries]] = contextvars.ContextVar(
+    "donbalon_request_queries", default=None
+)
+
+
+def current_request() -> Optional[RequestQueries]:
+    """Contador del request en curso, o None fuera de un request."""
+    return _current_request.get()
+
+
+class QueryStats:
+    """Registro de sentencias por forma, sentencias por request y log de lentas."""
+
+    def __init__(self, slow_threshold: Optional[float] = None):
+        """
+        Args:
+            slow_threshold: Segundos a partir de los cuales una sentencia va al
+                log de lentas. Si es None, se usa DONBALON_SLOW_QUERY_MS
+        """
+        if slow_threshold is None:
+            slow_threshold = float(os.environ.get("DONBALON_SLOW_QUERY_MS", DEFAULT_SLOW_QUERY_MS)) / 1000
+        self.slow_threshold = slow_threshold
+        self._lock = threading.Lock()
+        self._statements: Dict[str, _Statement] = {}
+        self._per_request = Histogram(PER_REQUEST_BUCKETS)
+        self._slow: Deque[Dict[str, Any]] = deque(maxlen=SLOW_LOG_SIZE)
+
+    def record(
+        self,
+        conn: sqlite3.Connection,
+        sql: str,
+        params: Tuple[Any, ...],
+        seconds: float,
+        rows: int,
+    ) -> None:
+        """
+        Registra una sentencia ejecutada
+
+        Args:
+            conn: Conexión donde se ejecutó (para el EXPLAIN de las lentas)
+            sql: Sentencia
+            params: Parámetros (solo se usan para el EXPLAIN; no se guardan)
+            seconds: Duración
+            rows: Filas devueltas o afectadas
+        """
+        shape = normalize_sql(sql)
+        with self._lock:
+            stmt = self._statements.get(shape)
+            if stmt is None:
+                stmt = self._statements[shape] = _Statement()
+            stmt.histogram.observe(seconds)
+            stmt.max = max(stmt.max, seconds)
+            stmt.rows += max(rows, 0)
+
+        request = _current_request.get()
+        if request is not None:
+            request.observe(shape, params, seconds, rows)
+
+        if seconds >= self.slow_threshold:
+            self._log_slow(conn, sql, shape, params, seconds, rows)
+
+    def _log_slow(self, conn, sql, shape, params, seconds, rows) -> None:
+        try:
+            plan = [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+        except sqlite3.Error as e:
+            plan = [f"(sin plan: {e})"]
+        entry = {
+            "sql": shape,
+            "seconds": round(seconds, 6),
+            "rows": rows,
+            "plan": plan,
+            # Recorridos completos de tabla (sin índice para el filtro)
+            "scans": [detail.split()[1] for detail in plan if detail.startswith("SCAN ")],
+            "at": datetime.datetime.now().isoformat(timespec="seconds"),
+        }
+        with self._lock:
+            self._slow.append(entry)
+
+    @contextmanager
+    def track_request(self, capture_sites: bool = False) -> Iterator[RequestQueries]:
+        """
+        Cuenta las sentencias del bloque (un request) y las suma al histograma
+        de sentencias por request
+
+        Args:
+            capture_sites: Guardar además parámetros y lugares del código (ver RequestQueries)
+
+        Yields:
+            El contador del request
+        """
+        request = RequestQueries(capture_sites)
+        token = _current_request.set(request)
+        try:
+            yield request
+        finally:
+            _current_request.reset(token)
+            with self._lock:
+                self._per_request.observe(request.count)
+
+    def snapshot(self, limit: int = 50) -> Dict[str, Any]:
+        """
+        Estado actual, con las sentencias ordenadas por tiempo total
+
+        Args:
+            limit: Cantidad máxima de sentencias a devolver
+
+        Returns:
+            Diccionario con statements, queries_per_request y slow_queries
+        """
+        with self._lock:
+            statements = sorted(self._statements.items(), key=lambda item: item[1].histogram.total, reverse=True)
+            return {
+                "statements": [
+                    {
+                        "sql": shape,
+                        "count": stmt.histogram.count,
+                        "total_seconds": round(stmt.histogram.total, 6),
+                        "avg_seconds": round(stmt.histogram.total / stmt.histogram.count, 6),
+                        "max_seconds": round(stmt.max, 6),
+                        "rows": stmt.rows,
+                        "histogram": stmt.histogram.to_dict(),
+                    }
+                    for shape, stmt in statements[:limit]
+                ],
+                "queries_per_request": {
+                    "requests": self._per_request.count,
+                    "avg": round(self._per_request.total / self._per_request.count, 2) if self._per_request.count else 0.0,
+                    "histogram": self._per_request.to_dict(),
+                },
+                "slow_query_threshold_seconds": self.slow_threshold,
+                "slow_queries": list(reversed(self._slow)),
+            }
+
+    def histograms(self) -> Tuple[Dict[str, Histogram], Histogram]:
+        """
+        Copias de los histogramas para exportarlos como métricas (ver data/metrics.py)
+
+        Returns:
+            (latencia por operación -SELECT, INSERT, UPDATE...- sumando todas
+            sus formas, sentencias por request)
+        """
+        by_operation: Dict[str, Histogram] = {}
+        with self._lock:
+            for shape, stmt in self._statements.items():
+                operation = shape.split(" ", 1)[0].upper()
+                if operation not in by_operation:
+                    by_operation[operation] = Histogram(LATENCY_BUCKETS)
+                by_operation[operation].merge(stmt.histogram)
+            per_request = Histogram(PER_REQUEST_BUCKETS)
+            per_request.merge(self._per_request)
+        return by_operation, per_request
+
+    def reset(self) -> None:
+        """Descarta todo lo registrado."""
+        with self._lock:
+            self._statements.clear()
+            self._per_request = Histogram(PER_REQUEST_BUCKETS)
+            self._slow.clear()
+
+
+query_stats = QueryStats()
+
@@ -0,0 +1,66 @@
+"""
+Reintentos ante SQLITE_BUSY / SQLITE_LOCKED.
+
+SQLite admite un solo escritor a la vez. Cuando busy_timeout no alcanza (por
+ejemplo en un pico de reservas), la sentencia falla con "database is locked";
+en ese caso la transacción completa se puede reintentar tras una espera corta.
+"""
+
+import random
+import sqlite3
+import time
+from typing import Callable, TypeVar
+
+
+T = TypeVar("T")
+
+DEFAULT_ATTEMPTS = 4
+DEFAULT_BASE_DELAY = 0.05
+DEFAULT_MAX_DELAY = 1.0
+
+
+def is_busy_error(exc: BaseException) -> bool:
+    """Indica si la excepción corresponde a una base de datos ocupada/bloqueada."""
+    if not isinstance(exc, sqlite3.OperationalError):
+        return False
+    name = getattr(exc, "sqlite_errorname", "") or ""
+    if name.startswith(("SQLITE_BUSY", "SQLITE_LOCKED")):
+        return True
+    message = str(exc).lower()
+    return "database is locked" in message or "database table is locked" in message
+
+
+def retry_on_busy(
+    func: Callable[[], T],
+    attempts: int = DEFAULT_ATTEMPTS,
+    base_delay: float = DEFAULT_BASE_DELAY,
+    max_delay: float = DEFAULT_MAX_DELAY,
+) -> T:
+    """
+    Ejecuta `func` reintentando con backoff exponencial (con jitter) si la base está ocupada
+
+    `func` debe ser una transacción completa e idempotente ante el rollback
+    (lee, valida y escribe de nuevo en cada intento).
+
+    Args:
+        func: Función sin argumentos a ejecutar
+        attempts: Cantidad máxima de intentos (incluido el primero)
+        base_delay: Espera inicial en segundos
+        max_delay: Espera máxima entre intentos en segundos
+
+    Returns:
+        El resultado de `func`
+
+    Raises:
+        sqlite3.OperationalError: Si la base sigue ocupada luego del último intento
+    """
+    attempt = 1
+    while True:
+        try:
+            return func()
+        except sqlite3.OperationalError as exc:
+            if attempt >= attempts or not is_busy_error(exc):
+                raise
+            delay = min(max_delay, base_delay * (2 ** (attempt - 1)))
+            time.sleep(delay * random.uniform(0.5, 1.5))
+            attempt += 1
@@ -0,0 +1,77 @@
+"""Reconstrucción de la tabla resumen UsoCancha.
+
+UsoCancha (migración 0003) se mantiene sola con triggers ante cada reserva,
+cancelación o expiración. Este comando la recalcula completa desde Turno,
+ReservaDetalle y Reserva: sirve para cargas hechas con los triggers
+deshabilitados, para restaurar un backup o para verificar que está al día.
+
+Uso:
+    python -m data.rollups                 # reconstruye UsoCancha
+    python -m data.rollups --verificar     # solo informa si hay diferencias
+"""
+import argparse
+import sqlite3
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+
+COLUMNAS = "id_cancha, fecha, id_horario, reservas, ingresos, cancelaciones, expirados"
+
+# Mismo cálculo que los triggers: la vista v_uso_turno de 0005_vista_uso_turno.sql
+SELECT_USO_CANCHA = f"SELECT {COLUMNAS} FROM v_uso_turno"
+
+
+def reconstruir_uso_cancha(conn: sqlite3.Connection) -> int:
+    """
+    Recalcula UsoCancha completa en una sola transacción
+
+    Args:
+        conn: Conexión a la base (sin transacción abierta)
+
+    Returns:
+        Cantidad de filas de la tabla resumen
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.execute("DELETE FROM UsoCancha")
+        cur = conn.execute(f"INSERT INTO UsoCancha ({COLUMNAS}) {SELECT_USO_CANCHA}")
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    return cur.rowcount
+
+
+def diferencias_uso_cancha(conn: sqlite3.Connection) -> List[Tuple]:
+    """Filas que difieren entre UsoCancha y el cálculo desde las tablas base."""
+    return conn.execute(
+        f"""
+        SELECT * FROM (SELECT {COLUMNAS} FROM UsoCancha EXCEPT {SELECT_USO_CANCHA})
+        UNION ALL
+        SELECT * FROM ({SELECT_USO_CANCHA} EXCEPT SELECT {COLUMNAS} FROM UsoCancha)
+        """
+    ).fetchall()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Reconstruir las tablas resumen de DonBalon")
+    parser.add_argument("--db", default=None, help="Ruta a la base de datos")
+    parser.add_argument("--verificar", action="store_true", help="Solo comparar, sin reconstruir")
+    args = parser.parse_args(argv)
+
+    db_path = args.db or Path(__file__).parent / "donbalon.db"
+    # isolation_level=None: la transacción se controla explícitamente
+    conn = sqlite3.connect(str(db_path), isolation_level=None)
+    try:
+        if args.verificar:
+            diferencias = diferencias_uso_cancha(conn)
+            print(f"UsoCancha: {len(diferencias)} filas con diferencias")
+            return
+        filas = reconstruir_uso_cancha(conn)
+        print(f"UsoCancha reconstruida: {filas} filas")
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Unidad de trabajo: una transacción compartida por todos los repositorios de
+una conexión.
+
+    with unit_of_work(conn):
+        reserva_repo.create(...)
+        turno_repo.create_many(...)
+        with unit_of_work(conn):      # anidada: SAVEPOINT
+            pago_repo.create(...)
+    # un solo COMMIT (un solo fsync) al salir del bloque exterior
+
+El bloque exterior abre la transacción (BEGIN IMMEDIATE por defecto, para tomar
+el lock de escritura antes de leer y validar) y hace COMMIT al terminar o
+ROLLBACK si sale con una excepción. Los bloques anidados usan SAVEPOINT: si
+fallan deshacen solo su parte y la excepción sigue hacia afuera.
+
+Los repositorios no guardan estado de la transacción: BaseRepository.execute
+no hace commit cuando la conexión ya tenía una transacción abierta antes de la
+sentencia, así que todos los repositorios que comparten la conexión la respetan.
+
+after_commit() difiere una acción hasta que la transacción abierta se
+confirme; quien hace el COMMIT exterior llama a run_after_commit() y quien
+hace ROLLBACK a discard_after_commit(). Las acciones registradas con
+on_rollback=True (p. ej. invalidar un caché, que pudo haber visto datos sin
+confirmar) se ejecutan también ante el ROLLBACK.
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from data.metrics import record_transaction
+
+SAVEPOINT_NAME = "unit_of_work"
+
+# Acciones pendientes por conexión, con su on_rollback (sqlite3.Connection no admite weakref)
+_after_commit: Dict[int, List[Tuple[Callable[[], None], bool]]] = {}
+_after_commit_lock = threading.Lock()
+
+
+def after_commit(conn: sqlite3.Connection, callback: Callable[[], None], on_rollback: bool = False) -> None:
+    """
+    Ejecuta `callback` cuando se confirme la transacción abierta de `conn`, o
+    enseguida si no hay ninguna
+
+    Args:
+        conn: Conexión de la transacción
+        callback: Acción sin argumentos
+        on_rollback: Ejecutarla también si la transacción se deshace
+    """
+    if not conn.in_transaction:
+        callback()
+        return
+    with _after_commit_lock:
+        _after_commit.setdefault(id(conn), []).append((callback, on_rollback))
+
+
+def run_after_commit(conn: sqlite3.Connection) -> None:
+    """Ejecuta las acciones pendientes de `conn`. Llamar luego del COMMIT."""
+    with _after_commit_lock:
+        callbacks = _after_commit.pop(id(conn), ())
+    for callback, _ in callbacks:
+        callback()
+
+
+def discard_after_commit(conn: sqlite3.Connection) -> None:
+    """
+    Descarta las acciones pendientes de `conn`, salvo las registradas con
+    on_rollback, que se ejecutan. Llamar luego del ROLLBACK.
+    """
+    with _after_commit_lock:
+        callbacks = _after_commit.pop(id(conn), ())
+    for callback, on_rollback in callbacks:
+        if on_rollback:
+            callback()
+
+
+@contextmanager
+def unit_of_work(conn: sqlite3.Connection, immediate: bool = True) -> Iterator[sqlite3.Connection]:
+    """
+    Agrupa las escrituras del bloque en una transacción (o un SAVEPOINT si ya
+    hay una abierta)
+
+    Args:
+        conn: Conexión compartida por los repositorios
+        immediate: Si es True, la transacción exterior empieza con BEGIN IMMEDIATE
+
+    Yields:
+        La misma conexión
+    """
+    if conn.in_transaction:
+        # Anidada: mismo nombre en cada nivel; RELEASE y ROLLBACK TO actúan
+        # sobre el SAVEPOINT más reciente con ese nombre
+        conn.execute(f"SAVEPOINT {SAVEPOINT_NAME}")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute(f"ROLLBACK TO {SAVEPOINT_NAME}")
+            conn.execute(f"RELEASE {SAVEPOINT_NAME}")
+            raise
+        conn.execute(f"RELEASE {SAVEPOINT_NAME}")
+        return
+
+    conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        discard_after_commit(conn)
+        record_transaction("unit_of_work", "rollback")
+        raise
+    conn.commit()
+    record_transaction("unit_of_work", "commit")
+    run_after_commit(conn)
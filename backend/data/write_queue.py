@@ -0,0 +1,272 @@
+"""
+Fila de escritura con group commit.
+
+SQLite admite un solo escritor a la vez. En lugar de que cada request abra su
+transacción, confirme y compita por el lock, todas las escrituras del proceso
+se encolan en un único thread escritor que las agrupa:
+
+    BEGIN IMMEDIATE
+        SAVEPOINT request   -> escritura 1 -> RELEASE
+        SAVEPOINT request   -> escritura 2 falla -> ROLLBACK TO, RELEASE
+        SAVEPOINT request   -> escritura 3 -> RELEASE
+    COMMIT                  (uno solo para todo el lote)
+
+Cada escritura corre en su propio SAVEPOINT: si falla se deshace solo su
+parte y su llamador recibe la excepción, mientras que las demás del lote se
+confirman. Los resultados se entregan recién después del COMMIT. Si falla la
+transacción del lote (el COMMIT, o una escritura que la aborta), las
+escrituras que no habían fallado se reintentan de a una.
+
+El lote se arma con lo que ya está en la fila al terminar el anterior (hasta
+max_batch); opcionalmente se espera `linger` segundos a que lleguen más. Así
+con poca carga cada escritura se confirma sola, y en un pico (el viernes a la
+tarde) el costo del commit y del lock se reparte entre muchas.
+
+Configuración por variables de entorno:
+    DONBALON_WRITE_BATCH      Escrituras máximas por lote (default: 64)
+    DONBALON_WRITE_LINGER_MS  Espera para juntar más escrituras (default: 0)
+"""
+
+import asyncio
+import contextvars
+import queue
+import sqlite3
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, TypeVar
+
+from data.metrics import record_transaction
+from data.unit_of_work import discard_after_commit, run_after_commit
+
+
+DEFAULT_MAX_BATCH = 64
+DEFAULT_LINGER = 0.0
+
+# Latencias que se guardan para calcular percentiles
+LATENCY_WINDOW = 10000
+
+SAVEPOINT_NAME = "write_queue_request"
+
+R = TypeVar("R")
+
+
+def percentile(values: Sequence[float], p: float) -> float:
+    """
+    Percentil por el método del rango más cercano
+
+    Args:
+        values: Muestras (en cualquier orden)
+        p: Percentil entre 0 y 100
+
+    Returns:
+        El valor del percentil, o 0.0 si no hay muestras
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(p / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+class _Write:
+    """Una escritura encolada y el futuro de su llamador."""
+
+    __slots__ = ("fn", "args", "kwargs", "loop", "future", "context", "submitted", "result", "error")
+
+    def __init__(self, fn, args, kwargs, loop, future):
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.loop = loop
+        self.future = future
+        # Contexto del llamador (p. ej. el contador de sentencias del request)
+        self.context = contextvars.copy_context()
+        self.submitted = time.monotonic()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+def _resolve(future: asyncio.Future, result: Any, error: Optional[BaseException]) -> None:
+    if future.cancelled():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+class WriteQueue:
+    """Thread escritor único que confirma las escrituras por lotes."""
+
+    def __init__(
+        self,
+        connect: Callable[[], sqlite3.Connection],
+        max_batch: int = DEFAULT_MAX_BATCH,
+        linger: float = DEFAULT_LINGER,
+    ):
+        """
+        Args:
+            connect: Abre la conexión del escritor (se llama desde su thread)
+            max_batch: Escrituras máximas por lote (1 = un commit por escritura)
+            linger: Segundos a esperar que lleguen más escrituras antes de ejecutar el lote
+        """
+        if max_batch < 1:
+            raise ValueError("El lote debe admitir al menos una escritura.")
+        self.max_batch = max_batch
+        self.linger = linger
+        self._connect = connect
+        self._queue: "queue.Queue[Optional[_Write]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+
+        # Métricas
+        self._pending = 0
+        self._completed = 0
+        self._failed = 0
+        self._batches = 0
+        self._max_batch_seen = 0
+        self._retried = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._started = time.monotonic()
+
+        self._thread = threading.Thread(target=self._loop, name="db-writer", daemon=True)
+        self._thread.start()
+
+    async def submit(self, fn: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        """
+        Encola una escritura y espera a que su lote se confirme
+
+        Args:
+            fn: Función que recibe la conexión del escritor como primer argumento.
+                No debe hacer COMMIT ni ROLLBACK: corre dentro de la transacción del lote
+            *args, **kwargs: Resto de los argumentos de `fn`
+
+        Returns:
+            Lo que devuelve `fn`, una vez confirmado el lote
+        """
+        if self._closed:
+            raise RuntimeError("La fila de escritura está cerrada.")
+        loop = asyncio.get_running_loop()
+        write = _Write(fn, args, kwargs, loop, loop.create_future())
+        with self._lock:
+            self._pending += 1
+        self._queue.put(write)
+        return await write.future
+
+    def _loop(self) -> None:
+        conn = self._connect()
+        try:
+            stopping = False
+            while not stopping:
+                first = self._queue.get()
+                if first is None:
+                    break
+                batch = [first]
+                deadline = time.monotonic() + self.linger
+                while len(batch) < self.max_batch:
+                    try:
+                        remaining = deadline - time.monotonic()
+                        write = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if write is None:
+                        stopping = True
+                        break
+                    batch.append(write)
+                self._run_batch(conn, batch)
+        finally:
+            conn.close()
+
+    def _run_batch(self, conn: sqlite3.Connection, batch: List[_Write]) -> None:
+        started = time.monotonic()
+        with self._lock:
+            for write in batch:
+                waited = started - write.submitted
+                self._total_wait += waited
+                self._max_wait = max(self._max_wait, waited)
+
+        began = False
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            began = True
+            for write in batch:
+                conn.execute(f"SAVEPOINT {SAVEPOINT_NAME}")
+                try:
+                    write.result = write.context.run(write.fn, conn, *write.args, **write.kwargs)
+                except Exception as e:
+                    write.error = e
+                    conn.execute(f"ROLLBACK TO {SAVEPOINT_NAME}")
+                    record_transaction("write_queue_request", "rollback")
+                conn.execute(f"RELEASE {SAVEPOINT_NAME}")
+            conn.commit()
+            record_transaction("write_queue", "commit")
+            run_after_commit(conn)
+        except Exception as e:
+            if conn.in_transaction:
+                conn.rollback()
+                record_transaction("write_queue", "rollback")
+            discard_after_commit(conn)
+            pending = [write for write in batch if write.error is None]
+            if began and len(batch) > 1:
+                # Que una escritura que rompió la transacción del lote no
+                # arrastre al resto: se reintentan de a una
+                with self._lock:
+                    self._retried += len(pending)
+                for write in pending:
+                    write.result = None
+                    self._run_batch(conn, [write])
+                failed = [write for write in batch if write.error is not None and write not in pending]
+                if failed:
+                    self._finish(failed)
+                return
+            for write in pending:
+                write.error = e
+
+        self._finish(batch)
+
+    def _finish(self, batch: List[_Write]) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._batches += 1
+            self._max_batch_seen = max(self._max_batch_seen, len(batch))
+            for write in batch:
+                self._pending -= 1
+                self._completed += 1
+                if write.error is not None:
+                    self._failed += 1
+                self._latencies.append(now - write.submitted)
+        for write in batch:
+            write.loop.call_soon_threadsafe(_resolve, write.future, write.result, write.error)
+
+    def stats(self) -> Dict[str, float]:
+        """Lotes, escrituras, espera en la fila y percentiles de latencia (de las últimas LATENCY_WINDOW)."""
+        with self._lock:
+            latencies = list(self._latencies)
+            elapsed = time.monotonic() - self._started
+            return {
+                "threads": 1,
+                "pending": self._pending,
+                "completed": self._completed,
+                "failed": self._failed,
+                "retried": self._retried,
+                "batches": self._batches,
+                "avg_batch_size": round(self._completed / self._batches, 2) if self._batches else 0.0,
+                "max_batch_size": self._max_batch_seen,
+                "writes_per_second": round(self._completed / elapsed, 2) if elapsed > 0 else 0.0,
+                "total_wait_seconds": round(self._total_wait, 6),
+                "max_wait_seconds": round(self._max_wait, 6),
+                "latency_p50_seconds": round(percentile(latencies, 50), 6),
+                "latency_p99_seconds": round(percentile(latencies, 99), 6),
+            }
+
+    def close(self) -> None:
+        """Confirma lo que ya está en la fila y detiene el thread escritor."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+
@@ -1,5 +1,8 @@
-from fastapi import FastAPI
+import time
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from controllers import (
     cancha_controller,
     reserva_controller,
@@ -15,15 +18,35 @@ from controllers import (
     pago_controller,
     reserva_detalle_controller,
     torneo_controller,
+    export_controller,
+    admin_controller,
+    metrics_controller,
 )
+from controllers.pagination import NEXT_CURSOR_HEADER
+from data.connection_pool import PoolTimeoutError, get_pool, close_pool
+from data.db_executor import get_db_executor, close_db_executor
+from data.metrics import UNMATCHED_ROUTE, http_request_duration, http_requests, http_requests_in_flight
+from data.query_budget import QUERY_WARNING_HEADER, query_budget, summary
+from data.query_stats import QUERY_COUNT_HEADER, query_stats
+from repositories.catalog_cache import catalog_cache
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Abre el executor de base de datos y el pool de conexiones al iniciar y los cierra al apagar la app"""
+    get_db_executor()
+    get_pool()
+    yield
+    close_db_executor()
+    close_pool()
+
 
 # Crear la aplicación FastAPI
 app = FastAPI(
     title="DonBalon API",
     description="API REST para el sistema de gestión de canchas deportivas DonBalon",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Configurar CORS
@@ -32,8 +55,56 @@ app.add_middleware(
     allow_origins=["http://localhost:3000"],  # En producción, especificar los orígenes permitidos
     allow_methods=["*"],
     allow_headers=["*"],
+    # Cursor de paginación de los listados y sentencias SQL del request
+    expose_headers=[NEXT_CURSOR_HEADER, QUERY_COUNT_HEADER, QUERY_WARNING_HEADER],
 )
 
+
+def route_template(request: Request) -> str:
+    """Plantilla de la ruta del request (/turnos/{id_turno}), que el router deja en el scope"""
+    route = request.scope.get("route")
+    return route.path if route is not None else UNMATCHED_ROUTE
+
+
+@app.middleware("http")
+async def contar_sentencias(request: Request, call_next):
+    """
+    Cuenta las sentencias SQL de cada request (ver data/query_stats.py) y las
+    informa en un header; con el detector de N+1 activo (data/query_budget.py)
+    marca los requests que superan el presupuesto o repiten sentencias
+
+    Las respuestas en streaming (GET /export/{entidad}) ejecutan su consulta
+    mientras se envía el cuerpo, después de los headers: no entran en
+    X-Query-Count ni en el presupuesto, solo en las estadísticas por forma de
+    GET /admin/queries.
+    """
+    with query_stats.track_request(capture_sites=query_budget.capturing) as queries:
+        response = await call_next(request)
+    response.headers[QUERY_COUNT_HEADER] = str(queries.count)
+    if queries.call_sites is not None:
+        report = query_budget.inspect(f"{request.method} {route_template(request)}", queries)
+        if report is not None:
+            response.headers[QUERY_WARNING_HEADER] = summary(report)
+    return response
+
+
+@app.middleware("http")
+async def medir_requests(request: Request, call_next):
+    """Cuenta los requests en curso y registra latencia y status por ruta (ver data/metrics.py)"""
+    http_requests_in_flight.inc()
+    inicio = time.perf_counter()
+    status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        http_requests_in_flight.dec()
+        route = route_template(request)
+        http_request_duration.observe(time.perf_counter() - inicio, request.method, route)
+        http_requests.inc(request.method, route, status_code)
+
+
 # Incluir los routers, para agrupar endpoints por funcionalidad
 app.include_router(cancha_controller.router)
 app.include_router(reserva_controller.router)
@@ -49,6 +120,18 @@ app.include_router(metodo_pago_controller.router)
 app.include_router(pago_controller.router)
 app.include_router(reserva_detalle_controller.router)
 app.include_router(torneo_controller.router)
+app.include_router(export_controller.router)
+app.include_router(admin_controller.router)
+app.include_router(metrics_controller.router)
+
+
+@app.exception_handler(PoolTimeoutError)
+def pool_timeout_handler(request: Request, exc: PoolTimeoutError):
+    """Sin conexiones libres: el servidor está saturado, el cliente puede reintentar"""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": str(exc)},
+    )
 
 
 @app.get("/", tags=["Root"])
@@ -66,6 +149,24 @@ def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/health/pool", tags=["Health"])
+def pool_stats():
+    """Métricas del pool de conexiones a la base de datos"""
+    return get_pool().stats()
+
+
+@app.get("/health/db", tags=["Health"])
+def db_executor_stats():
+    """Tareas pendientes, completadas y espera en cola del escritor y los lectores"""
+    return get_db_executor().stats()
+
+
+@app.get("/health/cache", tags=["Health"])
+def cache_stats():
+    """Hits, misses e invalidaciones del caché de catálogo, por tabla"""
+    return catalog_cache.stats()
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -0,0 +1,142 @@
+"""Compara el tiempo de la capa de datos de los reportes contra la versión anterior.
+
+La versión anterior (N+1) pedía cada turno y cada cancha por separado; la
+actual resuelve todo con una consulta. Acá se miden las dos sobre la misma base,
+sin generar el PDF, para aislar el costo de acceso a datos.
+
+Uso (desde backend/, idealmente sobre una base llenada con generar_muchos_datos):
+    python -m reportes.comparar_tiempos --db data/donbalon.db
+    python -m reportes.comparar_tiempos --id_cliente 7 --repeticiones 5
+    python -m reportes.comparar_tiempos --id_cancha 2 --inicio 2025-01-01 --fin 2025-01-31
+"""
+import argparse
+import time
+from datetime import date, datetime, timedelta
+
+from repositories.base_repository import BaseRepository
+from repositories.cancha_repository import CanchaRepository
+from repositories.cliente_repository import ClienteRepository
+from repositories.reporte_repository import ReporteRepository
+from repositories.reserva_detalle_repository import ReservaDetalleRepository
+from repositories.reserva_repository import ReservaRepository
+from repositories.turno_repository import TurnoRepository
+
+# Mismo perfil que utils.REPORT_DB_PROFILE; no se importa utils para poder
+# medir sin tener reportlab instalado
+REPORT_DB_PROFILE = "reporting"
+
+
+def reservas_por_cliente_n_mas_1(db_path, id_cliente):
+    """Capa de datos anterior del reporte por cliente: una consulta por detalle."""
+    cliente = ClienteRepository(db_path, profile=REPORT_DB_PROFILE).get_by_id(id_cliente)
+    reserva_repo = ReservaRepository(db_path, profile=REPORT_DB_PROFILE)
+    detalle_repo = ReservaDetalleRepository(db_path, profile=REPORT_DB_PROFILE)
+    turno_repo = TurnoRepository(db_path, profile=REPORT_DB_PROFILE)
+    cancha_repo = CanchaRepository(db_path, profile=REPORT_DB_PROFILE)
+
+    filas = []
+    for r in reserva_repo.get_by_cliente(cliente.id_cliente) if cliente else []:
+        for d in detalle_repo.get_by_reserva(r.id_reserva):
+            turno = turno_repo.get_by_id(d.id_turno)
+            # Sin caché de catálogo, como antes: una consulta por detalle
+            cancha = cancha_repo.query_one("SELECT nombre FROM Cancha WHERE id_cancha = ?", (turno.id_cancha,)) if turno else None
+            filas.append((r.id_reserva, cancha["nombre"] if cancha else None, str(turno.fecha) if turno else None))
+    return filas
+
+
+def reservas_por_cliente_join(db_path, id_cliente):
+    """Capa de datos actual del reporte por cliente: una sola consulta."""
+    _, reservas = ReporteRepository(db_path, profile=REPORT_DB_PROFILE).get_reservas_por_cliente(id_cliente)
+    return [(item.reserva.id_reserva, d.nombre_cancha, d.fecha) for item in reservas for d in item.detalles]
+
+
+def reservas_por_cancha_n_mas_1(db_path, id_cancha, fecha_inicio, fecha_fin):
+    """Capa de datos anterior del reporte por cancha: toda la historia de la cancha
+    filtrada en Python y tres consultas por turno."""
+    turno_repo = TurnoRepository(db_path, profile=REPORT_DB_PROFILE)
+    detalle_repo = ReservaDetalleRepository(db_path, profile=REPORT_DB_PROFILE)
+    reserva_repo = ReservaRepository(db_path, profile=REPORT_DB_PROFILE)
+    cliente_repo = ClienteRepository(db_path, profile=REPORT_DB_PROFILE)
+
+    inicio = datetime.fromisoformat(fecha_inicio).date()
+    fin = datetime.fromisoformat(fecha_fin).date()
+    turnos = turno_repo.get_by_cancha(id_cancha)
+    turnos_periodo = [t for t in turnos if inicio <= datetime.fromisoformat(str(t.fecha)).date() <= fin]
+
+    filas = []
+    for t in turnos_periodo:
+        for d in detalle_repo.get_by_turno(t.id_turno):
+            reserva = reserva_repo.get_by_id(d.id_reserva)
+            cliente = cliente_repo.get_by_id(reserva.id_cliente) if reserva else None
+            filas.append((d.id_reserva, t.id_turno, cliente.apellido if cliente else None))
+    return filas
+
+
+def reservas_por_cancha_join(db_path, id_cancha, fecha_inicio, fecha_fin):
+    """Capa de datos actual del reporte por cancha: una consulta con el período en SQL."""
+    _, items = ReporteRepository(db_path, profile=REPORT_DB_PROFILE).get_reservas_por_cancha(
+        id_cancha, fecha_inicio, fecha_fin
+    )
+    return [(item.id_reserva, item.id_turno, item.apellido_cliente) for item in items]
+
+
+def medir(func, *args, repeticiones=3):
+    """Ejecuta `func` varias veces y retorna (mejor tiempo en segundos, resultado)."""
+    mejor = None
+    resultado = None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = func(*args)
+        transcurrido = time.perf_counter() - inicio
+        mejor = transcurrido if mejor is None else min(mejor, transcurrido)
+    return mejor, resultado
+
+
+def cliente_con_mas_reservas(db_path):
+    row = BaseRepository(db_path, profile=REPORT_DB_PROFILE).query_one(
+        "SELECT id_cliente FROM Reserva GROUP BY id_cliente ORDER BY COUNT(*) DESC LIMIT 1"
+    )
+    return row["id_cliente"] if row else 1
+
+
+def comparar(nombre, anterior, actual, args, repeticiones):
+    t_anterior, r_anterior = medir(anterior, *args, repeticiones=repeticiones)
+    t_actual, r_actual = medir(actual, *args, repeticiones=repeticiones)
+    if sorted(r_anterior, key=repr) != sorted(r_actual, key=repr):
+        print(f"ADVERTENCIA: {nombre}: las dos versiones devuelven datos distintos")
+    mejora = t_anterior / t_actual if t_actual else float("inf")
+    print(
+        f"{nombre}: {len(r_actual)} filas | anterior {t_anterior * 1000:.1f} ms | "
+        f"actual {t_actual * 1000:.1f} ms | {mejora:.1f}x"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Comparar tiempos de la capa de datos de los reportes")
+    parser.add_argument("--db", default=None, help="Ruta a la base de datos (default: data/donbalon.db)")
+    parser.add_argument("--id_cliente", type=int, default=None, help="Cliente a medir (default: el de más reservas)")
+    parser.add_argument("--id_cancha", type=int, default=1, help="Cancha a medir")
+    parser.add_argument("--inicio", default=(date.today() - timedelta(days=30)).isoformat(), help="Fecha inicio YYYY-MM-DD")
+    parser.add_argument("--fin", default=date.today().isoformat(), help="Fecha fin YYYY-MM-DD")
+    parser.add_argument("--repeticiones", type=int, default=3, help="Repeticiones por versión (se toma la mejor)")
+    args = parser.parse_args(argv)
+
+    id_cliente = args.id_cliente or cliente_con_mas_reservas(args.db)
+    comparar(
+        f"Reservas por cliente (id={id_cliente})",
+        reservas_por_cliente_n_mas_1,
+        reservas_por_cliente_join,
+        (args.db, id_cliente),
+        args.repeticiones,
+    )
+    comparar(
+        f"Reservas por cancha (id={args.id_cancha}, {args.inicio} a {args.fin})",
+        reservas_por_cancha_n_mas_1,
+        reservas_por_cancha_join,
+        (args.db, args.id_cancha, args.inicio, args.fin),
+        args.repeticiones,
+    )
+
+
+if __name__ == "__main__":
+    main()
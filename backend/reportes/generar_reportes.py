@@ -1,15 +1,42 @@
 """Script para generar los reportes solicitados.
 
-Uso:
-    python generar_reportes.py --salida_dir ./salidas --generar all
+Uso (desde backend/):
+    python -m reportes.generar_reportes --salida_dir ./salidas --generar all
+    python -m reportes.generar_reportes --generar all --jobs 4
+    python -m reportes.generar_reportes --generar por_cliente --todos --jobs 8
 
+Con --jobs N cada reporte se genera en un proceso aparte (el armado con
+ReportLab y los gráficos de matplotlib usan CPU), cada uno con su propia
+conexión de solo lectura (perfil "reporting"). Con --todos se genera un PDF
+por cliente y/o por cancha en lugar de uno solo. Si un reporte falla, el resto
+se sigue generando y los errores se informan al final.
 """
 import os
+import sys
+import time
 import argparse
+import importlib
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
+from typing import List, NamedTuple, Optional, Tuple
 
-# Import report generators lazily inside the CLI so modules that require heavy
-# libs (matplotlib) are only imported when needed.
+# Import report generators lazily inside the workers so modules that require
+# heavy libs (matplotlib, reportlab) are only imported when needed.
+
+
+class Tarea(NamedTuple):
+    """Un reporte a generar: función `modulo.funcion` llamada con `args`."""
+    nombre: str
+    modulo: str
+    funcion: str
+    args: Tuple
+
+
+class Resultado(NamedTuple):
+    nombre: str
+    segundos: float
+    error: Optional[str] = None
 
 
 def ensure_dir(d):
@@ -17,7 +44,104 @@ def ensure_dir(d):
         os.makedirs(d)
 
 
-def main():
+def ejecutar_tarea(tarea: Tarea) -> Resultado:
+    """Genera un reporte capturando el error, para que no corte el resto del lote."""
+    inicio = time.perf_counter()
+    try:
+        func = getattr(importlib.import_module(tarea.modulo), tarea.funcion)
+        func(*tarea.args)
+        error = None
+    except Exception:
+        error = traceback.format_exc()
+    return Resultado(tarea.nombre, time.perf_counter() - inicio, error)
+
+
+def ejecutar_tareas(tareas: List[Tarea], jobs: int = 1) -> List[Resultado]:
+    """
+    Ejecuta las tareas en este proceso (jobs=1) o en un pool de `jobs` procesos
+
+    Args:
+        tareas: Reportes a generar
+        jobs: Cantidad de procesos
+
+    Returns:
+        Un resultado por tarea, en el orden en que terminaron
+    """
+    if jobs <= 1 or len(tareas) <= 1:
+        return [ejecutar_tarea(t) for t in tareas]
+
+    resultados = []
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tareas))) as executor:
+        futuros = {executor.submit(ejecutar_tarea, t): t for t in tareas}
+        for futuro in as_completed(futuros):
+            try:
+                resultados.append(futuro.result())
+            except Exception:
+                # El proceso murió (p. ej. sin memoria) antes de devolver el resultado
+                resultados.append(Resultado(futuros[futuro].nombre, 0.0, traceback.format_exc()))
+    return resultados
+
+
+def listar_ids(tabla: str, columna: str) -> List[int]:
+    """Ids de todas las filas de una tabla (para el modo --todos)."""
+    from repositories.base_repository import BaseRepository
+
+    # Perfil "reporting" (ver utils.REPORT_DB_PROFILE), sin importar reportlab
+    repo = BaseRepository(profile="reporting")
+    try:
+        return [row[0] for row in repo.query_all(f"SELECT {columna} FROM {tabla} ORDER BY {columna}")]
+    finally:
+        # Cerrar antes de crear los procesos: no heredar conexiones abiertas
+        repo.close()
+
+
+def planificar_tareas(args, ids_clientes=None, ids_canchas=None) -> List[Tarea]:
+    """Arma la lista de reportes a generar según los argumentos de la línea de comandos."""
+    salida = args.salida_dir
+    tareas = []
+
+    if args.generar in ("all", "por_cliente"):
+        if ids_clientes is None:
+            tareas.append(Tarea(
+                "reservas_por_cliente", "reportes.report_reservas_por_cliente", "generar_reservas_por_cliente",
+                (os.path.join(salida, "reservas_por_cliente.pdf"), args.id_cliente),
+            ))
+        else:
+            for id_cliente in ids_clientes:
+                tareas.append(Tarea(
+                    f"reservas_por_cliente_{id_cliente}", "reportes.report_reservas_por_cliente", "generar_reservas_por_cliente",
+                    (os.path.join(salida, f"reservas_por_cliente_{id_cliente}.pdf"), id_cliente),
+                ))
+
+    if args.generar in ("all", "por_cancha"):
+        if ids_canchas is None:
+            tareas.append(Tarea(
+                "reservas_por_cancha", "reportes.report_reservas_por_cancha_periodo", "generar_reservas_por_cancha",
+                (os.path.join(salida, "reservas_por_cancha.pdf"), args.id_cancha, args.inicio, args.fin),
+            ))
+        else:
+            for id_cancha in ids_canchas:
+                tareas.append(Tarea(
+                    f"reservas_por_cancha_{id_cancha}", "reportes.report_reservas_por_cancha_periodo", "generar_reservas_por_cancha",
+                    (os.path.join(salida, f"reservas_por_cancha_{id_cancha}.pdf"), id_cancha, args.inicio, args.fin),
+                ))
+
+    if args.generar in ("all", "mas_utilizadas"):
+        tareas.append(Tarea(
+            "canchas_mas_utilizadas", "reportes.report_canchas_mas_utilizadas", "generar_canchas_mas_utilizadas",
+            (os.path.join(salida, "canchas_mas_utilizadas.pdf"),),
+        ))
+
+    if args.generar in ("all", "mensual"):
+        tareas.append(Tarea(
+            "utilizacion_mensual", "reportes.report_utilizacion_mensual", "generar_utilizacion_mensual",
+            (os.path.join(salida, "utilizacion_mensual.pdf"),),
+        ))
+
+    return tareas
+
+
+def main(argv=None):
     parser = argparse.ArgumentParser(description="Generar reportes DonBalon")
     parser.add_argument("--salida_dir", default="./reportes_out", help="Directorio de salida para los PDFs")
     parser.add_argument("--generar", default="all", choices=["all", "por_cliente", "por_cancha", "mas_utilizadas", "mensual"], help="Qué reporte generar")
@@ -25,28 +149,35 @@ def main():
     parser.add_argument("--id_cliente", type=int, default=1, help="Id del cliente para reporte por cliente")
     parser.add_argument("--inicio", default=(datetime.now().date().replace(day=1).isoformat()), help="Fecha inicio YYYY-MM-DD")
     parser.add_argument("--fin", default=(datetime.now().date().isoformat()), help="Fecha fin YYYY-MM-DD")
+    parser.add_argument("--todos", action="store_true", help="Un PDF por cada cliente y/o cancha (ignora --id_cliente/--id_cancha)")
+    parser.add_argument("--jobs", type=int, default=1, help="Procesos en paralelo (default: 1, secuencial)")
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error("--jobs debe ser al menos 1")
     salida = args.salida_dir
     ensure_dir(salida)
 
-    if args.generar in ("all", "por_cliente"):
-        from .report_reservas_por_cliente import generar_reservas_por_cliente
-        generar_reservas_por_cliente(os.path.join(salida, "reservas_por_cliente.pdf"), args.id_cliente)
-
-    if args.generar in ("all", "por_cancha"):
-        from .report_reservas_por_cancha_periodo import generar_reservas_por_cancha
-        generar_reservas_por_cancha(os.path.join(salida, "reservas_por_cancha.pdf"), args.id_cancha, args.inicio, args.fin)
-
-    if args.generar in ("all", "mas_utilizadas"):
-        from .report_canchas_mas_utilizadas import generar_canchas_mas_utilizadas
-        generar_canchas_mas_utilizadas(os.path.join(salida, "canchas_mas_utilizadas.pdf"))
+    ids_clientes = ids_canchas = None
+    if args.todos:
+        if args.generar in ("all", "por_cliente"):
+            ids_clientes = listar_ids("Cliente", "id_cliente")
+        if args.generar in ("all", "por_cancha"):
+            ids_canchas = listar_ids("Cancha", "id_cancha")
 
-    if args.generar in ("all", "mensual"):
-        from .report_utilizacion_mensual import generar_utilizacion_mensual
-        generar_utilizacion_mensual(os.path.join(salida, "utilizacion_mensual.pdf"))
+    tareas = planificar_tareas(args, ids_clientes, ids_canchas)
+    inicio = time.perf_counter()
+    resultados = ejecutar_tareas(tareas, args.jobs)
+    errores = [r for r in resultados if r.error]
 
-    print(f"Reportes generados en: {os.path.abspath(salida)}")
+    for r in errores:
+        print(f"Error en {r.nombre}:\n{r.error}", file=sys.stderr)
+    print(
+        f"{len(resultados) - len(errores)} de {len(tareas)} reportes generados en: {os.path.abspath(salida)} "
+        f"({time.perf_counter() - inicio:.1f}s, jobs={args.jobs})"
+    )
+    if errores:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
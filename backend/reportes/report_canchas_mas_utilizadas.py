@@ -1,17 +1,19 @@
 from repositories.base_repository import BaseRepository
-from .utils import build_pdf, make_table
+from .utils import build_pdf, make_table, REPORT_DB_PROFILE
 from reportlab.platypus import Paragraph, Spacer
 from reportlab.lib.styles import getSampleStyleSheet
 
 
 def generar_canchas_mas_utilizadas(output_path: str, top_n: int = 10):
-    repo = BaseRepository()
+    repo = BaseRepository(profile=REPORT_DB_PROFILE)
+    # Lee la tabla resumen UsoCancha (mantenida por triggers) en lugar de
+    # recorrer ReservaDetalle ⨝ Turno. Usos = ítems reservados, incluidos los
+    # de reservas canceladas, como el cálculo original.
     sql = (
-        "SELECT t.id_cancha as id_cancha, c.nombre as nombre, COUNT(rd.id_detalle) as usos "
-        "FROM ReservaDetalle rd "
-        "JOIN Turno t ON rd.id_turno = t.id_turno "
-        "JOIN Cancha c ON t.id_cancha = c.id_cancha "
-        "GROUP BY t.id_cancha ORDER BY usos DESC"
+        "SELECT u.id_cancha as id_cancha, c.nombre as nombre, SUM(u.reservas + u.cancelaciones) as usos "
+        "FROM UsoCancha u "
+        "JOIN Cancha c ON u.id_cancha = c.id_cancha "
+        "GROUP BY u.id_cancha HAVING usos > 0 ORDER BY usos DESC"
     )
     rows = repo.query_all(sql)
 
@@ -1,9 +1,5 @@
-from repositories.turno_repository import TurnoRepository
-from repositories.reserva_detalle_repository import ReservaDetalleRepository
-from repositories.reserva_repository import ReservaRepository
-from repositories.cancha_repository import CanchaRepository
-from repositories.cliente_repository import ClienteRepository
-from .utils import build_pdf, make_table
+from repositories.reporte_repository import ReporteRepository
+from .utils import build_pdf, make_table, REPORT_DB_PROFILE
 from reportlab.platypus import Paragraph, Spacer
 from reportlab.lib.styles import getSampleStyleSheet
 from datetime import datetime
@@ -14,36 +10,28 @@ def generar_reservas_por_cancha(output_path: str, id_cancha: int, fecha_inicio:
 
     fechas en formato YYYY-MM-DD
     """
-    turno_repo = TurnoRepository()
-    detalle_repo = ReservaDetalleRepository()
-    reserva_repo = ReservaRepository()
-    cancha_repo = CanchaRepository()
-    cliente_repo = ClienteRepository()
+    reporte_repo = ReporteRepository(profile=REPORT_DB_PROFILE)
 
+    # Validar y normalizar las fechas; el filtro del período se hace en SQL
     inicio = datetime.fromisoformat(fecha_inicio).date()
     fin = datetime.fromisoformat(fecha_fin).date()
 
-    turnos = turno_repo.get_by_cancha(id_cancha)
-    turnos_periodo = [t for t in turnos if inicio <= datetime.fromisoformat(str(t.fecha)).date() <= fin]
+    nombre_cancha, items = reporte_repo.get_reservas_por_cancha(id_cancha, inicio.isoformat(), fin.isoformat())
+    nombre_cancha = nombre_cancha or f"Cancha {id_cancha}"
 
     elements = []
     styles = getSampleStyleSheet()
-    nombre_cancha = cancha_repo.get_by_id(id_cancha).nombre if cancha_repo.get_by_id(id_cancha) else f"Cancha {id_cancha}"
     elements.append(Paragraph(f"Reservas para {nombre_cancha} desde {fecha_inicio} hasta {fecha_fin}", styles["Heading2"]))
 
     table_data = [["ID Reserva", "Fecha Turno", "ID Turno", "Cliente", "Monto Item"]]
-    for t in turnos_periodo:
-        detalles = detalle_repo.get_by_turno(t.id_turno)
-        for d in detalles:
-            reserva = reserva_repo.get_by_id(d.id_reserva)
-            cliente = cliente_repo.get_by_id(reserva.id_cliente) if reserva else None
-            table_data.append([
-                str(d.id_reserva),
-                str(t.fecha),
-                str(t.id_turno),
-                f"{cliente.nombre} {cliente.apellido}" if cliente else "N/A",
-                str(d.precio_total_item),
-            ])
+    for item in items:
+        table_data.append([
+            str(item.id_reserva),
+            str(item.fecha),
+            str(item.id_turno),
+            f"{item.nombre_cliente} {item.apellido_cliente}" if item.nombre_cliente is not None else "N/A",
+            str(item.precio_total_item),
+        ])
 
     elements.append(make_table(table_data))
     elements.append(Spacer(1, 12))
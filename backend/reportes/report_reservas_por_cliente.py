@@ -1,12 +1,7 @@
-from repositories.cliente_repository import ClienteRepository
-from repositories.reserva_repository import ReservaRepository
-from repositories.reserva_detalle_repository import ReservaDetalleRepository
-from repositories.turno_repository import TurnoRepository
-from repositories.cancha_repository import CanchaRepository
-from .utils import build_pdf, make_table
+from repositories.reporte_repository import ReporteRepository
+from .utils import build_pdf, make_table, REPORT_DB_PROFILE
 from reportlab.platypus import Paragraph, Spacer
 from reportlab.lib.styles import getSampleStyleSheet
-from datetime import datetime
 
 
 def generar_reservas_por_cliente(output_path: str, id_cliente: int):
@@ -16,13 +11,10 @@ def generar_reservas_por_cliente(output_path: str, id_cliente: int):
         output_path: Ruta del PDF de salida.
         id_cliente: Id del cliente cuyas reservas se desean listar.
     """
-    clientes_repo = ClienteRepository()
-    reserva_repo = ReservaRepository()
-    detalle_repo = ReservaDetalleRepository()
-    turno_repo = TurnoRepository()
-    cancha_repo = CanchaRepository()
+    reporte_repo = ReporteRepository(profile=REPORT_DB_PROFILE)
 
-    cliente = clientes_repo.get_by_id(id_cliente)
+    # Cliente, reservas y turnos en una sola consulta
+    cliente, reservas = reporte_repo.get_reservas_por_cliente(id_cliente)
 
     styles = getSampleStyleSheet()
     elements = []
@@ -36,7 +28,6 @@ def generar_reservas_por_cliente(output_path: str, id_cliente: int):
     header = Paragraph(f"Cliente: {cliente.nombre} {cliente.apellido} (id={cliente.id_cliente})", styles["Heading4"])
     elements.append(header)
 
-    reservas = reserva_repo.get_by_cliente(cliente.id_cliente)
     if not reservas:
         elements.append(Paragraph("No tiene reservas.", styles["Normal"]))
         elements.append(Spacer(1, 8))
@@ -44,13 +35,12 @@ def generar_reservas_por_cliente(output_path: str, id_cliente: int):
         return
 
     table_data = [["ID Reserva", "Fecha", "Monto", "Estado", "Detalle (Cancha - Fecha - Horario)"]]
-    for r in reservas:
-        detalles = detalle_repo.get_by_reserva(r.id_reserva)
-        detalle_texts = []
-        for d in detalles:
-            turno = turno_repo.get_by_id(d.id_turno)
-            cancha = cancha_repo.get_by_id(turno.id_cancha) if turno else None
-            detalle_texts.append(f"{cancha.nombre if cancha else 'N/A'} - {turno.fecha if turno else 'N/A'} - turno:{turno.id_horario if turno else 'N/A'}")
+    for item in reservas:
+        r = item.reserva
+        detalle_texts = [
+            f"{d.nombre_cancha or 'N/A'} - {d.fecha or 'N/A'} - turno:{d.id_horario if d.id_horario is not None else 'N/A'}"
+            for d in item.detalles
+        ]
         table_data.append([
             str(r.id_reserva),
             str(r.fecha_reserva),
@@ -1,5 +1,5 @@
 from repositories.base_repository import BaseRepository
-from .utils import save_chart_to_png, build_pdf, make_image_element, make_table
+from .utils import save_chart_to_png, build_pdf, make_image_element, make_table, REPORT_DB_PROFILE
 from reportlab.platypus import Paragraph, Spacer
 from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.lib.pagesizes import A4
@@ -7,12 +7,12 @@ import datetime
 
 
 def generar_utilizacion_mensual(output_path: str):
-    repo = BaseRepository()
+    repo = BaseRepository(profile=REPORT_DB_PROFILE)
+    # Tabla resumen UsoCancha (ver report_canchas_mas_utilizadas)
     sql = (
-        "SELECT strftime('%Y-%m', t.fecha) as mes, COUNT(rd.id_detalle) as usos "
-        "FROM ReservaDetalle rd "
-        "JOIN Turno t ON rd.id_turno = t.id_turno "
-        "GROUP BY mes ORDER BY mes"
+        "SELECT strftime('%Y-%m', fecha) as mes, SUM(reservas + cancelaciones) as usos "
+        "FROM UsoCancha "
+        "GROUP BY mes HAVING usos > 0 ORDER BY mes"
     )
     rows = repo.query_all(sql)
 
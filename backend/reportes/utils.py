@@ -6,6 +6,10 @@ from reportlab.lib import colors
 import os
 
 
+# Perfil de PRAGMA para las conexiones de los reportes (ver data/db_profiles.py)
+REPORT_DB_PROFILE = "reporting"
+
+
 def save_chart_to_png(fig) -> str:
     """Guarda una figura matplotlib en un archivo PNG temporal y devuelve la ruta."""
     fd, path = tempfile.mkstemp(suffix=".png")
@@ -1,5 +1,6 @@
 # Repositories para acceso a datos (DAO pattern)
 from .base_repository import BaseRepository
+from .catalog_cache import CachedCatalogRepository, CatalogCache, catalog_cache
 from .estado_repository import EstadoRepository
 from .tipo_cancha_repository import TipoCanchaRepository
 from .cancha_repository import CanchaRepository
@@ -14,9 +15,13 @@ from .reserva_repository import ReservaRepository
 from .reserva_detalle_repository import ReservaDetalleRepository
 from .torneo_repository import TorneoRepository
 from .equipo_repository import EquipoRepository
+from .reporte_repository import ReporteRepository
 
 __all__ = [
     "BaseRepository",
+    "CachedCatalogRepository",
+    "CatalogCache",
+    "catalog_cache",
     "EstadoRepository",
     "TipoCanchaRepository",
     "CanchaRepository",
@@ -32,4 +37,5 @@ __all__ = [
     "TipoPagoRepository",
     "TorneoRepository",
     "EquipoRepository",
+    "ReporteRepository",
 ]
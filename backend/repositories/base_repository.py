@@ -3,21 +3,187 @@ Base Repository - Clase base para todos los repositorios DAO (Data Access Object
 Proporciona métodos genéricos para operaciones CRUD
 """
 
+import copy
+import datetime
+import gc
 import os
 import sqlite3
-from typing import Any, List, Optional, Tuple
+import time
+from contextlib import contextmanager
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from data.db_executor import get_db_executor
+from data.db_profiles import apply_profile
+from data.metrics import record_transaction
+from data.query_stats import query_stats
+from data.unit_of_work import unit_of_work
+
+# Convierte una fila (tupla o sqlite3.Row, accedida por posición) en una entidad
+RowFactory = Callable[[Sequence[Any]], Any]
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Arma el cursor de paginación con los valores de la clave de la última fila."""
+    return ",".join(str(value) for value in values)
+
+
+def decode_cursor(cursor: str, size: int) -> Tuple[int, ...]:
+    """
+    Interpreta un cursor generado por encode_cursor
+
+    Raises:
+        ValueError: Si el cursor no tiene `size` enteros separados por coma
+    """
+    parts = cursor.split(",")
+    try:
+        if len(parts) != size:
+            raise ValueError
+        return tuple(int(part) for part in parts)
+    except ValueError:
+        raise ValueError(f"Cursor de paginación inválido: {cursor!r}") from None
+
+
+def case_variants(value: str) -> Tuple[str, ...]:
+    """
+    Variantes de mayúsculas de un valor de estado ('Pagada', 'PAGADA', 'pagada', ...)
+
+    Los estados se guardaron con distintas mayúsculas según quién los escribió;
+    filtrar con `columna IN (variantes)` aprovecha los índices, a diferencia de
+    lower(columna) = ?.
+    """
+    return tuple(dict.fromkeys((value, value.lower(), value.upper(), value.capitalize(), value.title())))
+
+
+# Conversores de columnas para ROW_FIELDS. Están memoizados: en una tabla grande
+# las fechas, horarios y montos se repiten mucho, y los resultados (date, time,
+# Decimal) son inmutables, así que se pueden compartir entre filas.
+
+@lru_cache(maxsize=8192)
+def parse_date(value: Any) -> Optional[datetime.date]:
+    """Fecha ISO (YYYY-MM-DD) guardada como texto -> date."""
+    return datetime.date.fromisoformat(value) if isinstance(value, str) else value
+
+
+@lru_cache(maxsize=4096)
+def parse_time(value: Any) -> Optional[datetime.time]:
+    """Hora ISO (HH:MM[:SS]) guardada como texto -> time."""
+    return datetime.time.fromisoformat(value) if isinstance(value, str) else value
+
+
+@lru_cache(maxsize=8192, typed=True)
+def parse_decimal(value: Any) -> Decimal:
+    """Monto guardado como REAL/texto -> Decimal (0.00 si es NULL)."""
+    return Decimal(str(value)) if value is not None else Decimal("0.00")
+
+
+def to_sqlite(value: Any) -> Any:
+    """Valor de una entidad -> valor para SQLite (montos como texto, fechas y horas en ISO)."""
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    return value
+
+
+@contextmanager
+def gc_paused():
+    """
+    Suspende el recolector de ciclos mientras se crean muchos objetos
+
+    Al armar cientos de miles de entidades el recolector se dispara una y otra
+    vez recorriendo objetos que no forman ciclos; pausarlo durante el mapeo
+    evita ese costo. Si ya estaba deshabilitado, se deja como estaba.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def compile_row_factory(entity: type, row_fields: Sequence[Tuple[str, str, Optional[Callable]]],
+                        columns: Sequence[str]) -> RowFactory:
+    """
+    Genera la función que arma una entidad a partir de una fila
+
+    El código se genera una vez por entidad y lista de columnas (como hace
+    namedtuple), con las posiciones ya resueltas: por fila no hay dict(row), ni
+    búsquedas por nombre, ni chequeos de columnas faltantes. Las columnas de
+    row_fields que no vienen en la consulta quedan con el valor por defecto de
+    la entidad.
+
+    Args:
+        entity: Clase a construir
+        row_fields: Tuplas (atributo, columna, conversor o None), en el orden
+            de los parámetros del constructor de `entity`
+        columns: Nombres de las columnas de la consulta, en orden
+
+    Returns:
+        Función fila -> entidad
+    """
+    positions = {name: i for i, name in enumerate(columns)}
+    namespace: Dict[str, Any] = {"_entity": entity}
+    args = []
+    # Argumentos posicionales (la mitad de costo que por nombre) mientras no
+    # falte ninguna columna; después de la primera faltante, por nombre
+    positional = True
+    for attr, column, convert in row_fields:
+        if column not in positions:
+            positional = False
+            continue
+        value = f"row[{positions[column]}]"
+        if convert is not None:
+            namespace[f"_{attr}"] = convert
+            value = f"_{attr}({value})"
+        args.append(value if positional else f"{attr}={value}")
+    source = f"def build_{entity.__name__}(row):\n    return _entity({', '.join(args)})\n"
+    exec(source, namespace)
+    return namespace[f"build_{entity.__name__}"]
 
 
 class BaseRepository:
     """Clase base que proporciona métodos comunes para acceso a datos"""
 
-    def __init__(self, db_path: Optional[str] = None, connection: Optional[sqlite3.Connection] = None):
+    # Columnas de la clave primaria, para la paginación por cursor (keyset)
+    KEY_COLUMNS: Tuple[str, ...] = ()
+
+    # Mapeo fila -> entidad: clase y tuplas (atributo, columna, conversor o None)
+    # en el orden del constructor de la clase
+    ENTITY: Optional[type] = None
+    # Variante compacta de solo lectura de ENTITY (NamedTuple con los mismos
+    # atributos, en el mismo orden), para listados masivos
+    READ_ENTITY: Optional[type] = None
+    ROW_FIELDS: Tuple[Tuple[str, str, Optional[Callable]], ...] = ()
+
+    # Alta masiva (create_many): columnas del INSERT, en el orden de
+    # insert_values(), y atributo de la entidad que recibe el id generado
+    # (None si la clave no es autoincremental)
+    INSERT_COLUMNS: Tuple[str, ...] = ()
+    ID_ATTR: Optional[str] = None
+
+    # Funciones compiladas por (repositorio, entidad, columnas); compartidas entre instancias
+    _row_factories: Dict[Tuple[type, type, Tuple[str, ...]], RowFactory] = {}
+    # Atributos de la entidad para cada una de INSERT_COLUMNS, por repositorio
+    _insert_attrs: Dict[type, Tuple[str, ...]] = {}
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        connection: Optional[sqlite3.Connection] = None,
+        profile: Optional[str] = None,
+    ):
         """
         Inicializa la conexión a la base de datos SQLite
 
         Args:
             db_path: Ruta a la base de datos. Si es None, se busca en la carpeta backend
             connection: Conexión existente (inyección de dependencias). Si se provee, no se cierra al destruir.
+            profile: Perfil de PRAGMA para la conexión propia (ver data/db_profiles.py).
+                Se ignora si se inyecta una conexión, que ya viene configurada.
         """
         self._owned = False
         
@@ -37,8 +203,8 @@ class BaseRepository:
             self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
             # Permitir acceso a las filas como diccionarios
             self.conn.row_factory = sqlite3.Row
-            # Habilitar restricciones de claves foráneas
-            self.conn.execute("PRAGMA foreign_keys = ON")
+            # Habilitar restricciones de claves foráneas y aplicar el perfil (WAL, caché, etc.)
+            apply_profile(self.conn, profile)
             
         self.autocommit = True
 
@@ -46,6 +212,9 @@ class BaseRepository:
         """
         Ejecuta una sentencia SQL (INSERT, UPDATE, DELETE)
 
+        Si la conexión ya tenía una transacción abierta (unit_of_work o una
+        transacción manual), la sentencia se suma a ella y no se hace commit.
+
         Args:
             sql: Sentencia SQL a ejecutar
             params: Parámetros para la sentencia
@@ -53,12 +222,121 @@ class BaseRepository:
         Returns:
             Cursor con el resultado de la ejecución
         """
+        in_transaction = self.conn.in_transaction
         cur = self.conn.cursor()
-        cur.execute(sql, params)
-        if self.autocommit:
+        started = time.perf_counter()
+        try:
+            cur.execute(sql, params)
+        except Exception:
+            # No dejar abierta la transacción implícita de una sentencia suelta
+            # que falló: las siguientes se tomarían como parte de ella
+            if not in_transaction and self.conn.in_transaction:
+                self.conn.rollback()
+                record_transaction("autocommit", "rollback")
+            raise
+        query_stats.record(self.conn, sql, params, time.perf_counter() - started, cur.rowcount)
+        if self.autocommit and not in_transaction:
+            opened = self.conn.in_transaction
             self.conn.commit()
+            if opened:
+                record_transaction("autocommit", "commit")
         return cur
 
+    def unit_of_work(self, immediate: bool = True):
+        """
+        Transacción compartida por todos los repositorios de esta conexión
+        (ver data/unit_of_work.py)
+
+        Args:
+            immediate: Si es True, la transacción exterior empieza con BEGIN IMMEDIATE
+
+        Returns:
+            Context manager: un solo commit al salir, rollback si hay excepción
+        """
+        return unit_of_work(self.conn, immediate)
+
+    def insert_rows(self, columns: Sequence[str], rows: Sequence[Tuple[Any, ...]]) -> List[int]:
+        """
+        Inserta varias filas en la tabla del repositorio (self.TABLE) con
+        INSERT multi-fila (VALUES (...), (...), ...)
+
+        Dentro de una misma sentencia SQLite asigna los rowid en forma
+        consecutiva, así que los ids se reconstruyen a partir de lastrowid.
+
+        Args:
+            columns: Columnas a insertar
+            rows: Filas con los valores en el orden de `columns`
+
+        Returns:
+            Lista de ids asignados, en el mismo orden que `rows`
+        """
+        ids: List[int] = []
+        if not rows:
+            return ids
+
+        # Respetar el límite clásico de 999 parámetros por sentencia
+        chunk_size = max(1, 999 // len(columns))
+        placeholders = "(" + ", ".join("?" for _ in columns) + ")"
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
+            sql = (
+                f"INSERT INTO {self.TABLE} ({', '.join(columns)}) "
+                f"VALUES {', '.join(placeholders for _ in chunk)}"
+            )
+            params = tuple(value for row in chunk for value in row)
+            cur = self.execute(sql, params)
+            first_id = cur.lastrowid - len(chunk) + 1
+            ids.extend(range(first_id, cur.lastrowid + 1))
+        return ids
+
+    def insert_values(self, obj: Any) -> Tuple[Any, ...]:
+        """
+        Valores a insertar de una entidad, en el orden de INSERT_COLUMNS
+
+        Toma el atributo que ROW_FIELDS asocia a cada columna y lo convierte
+        con to_sqlite. Los repositorios que guardan algo distinto del atributo
+        (el nombre del estado de Turno y Reserva) lo redefinen.
+
+        Args:
+            obj: Entidad del repositorio
+
+        Returns:
+            Tupla de valores ya convertidos para SQLite
+        """
+        attrs = self._insert_attrs.get(type(self))
+        if attrs is None:
+            by_column = {column: attr for attr, column, _ in self.ROW_FIELDS}
+            attrs = tuple(by_column[column] for column in self.INSERT_COLUMNS)
+            self._insert_attrs[type(self)] = attrs
+        return tuple(to_sqlite(getattr(obj, attr)) for attr in attrs)
+
+    def create_many(self, objs: Sequence[Any]) -> List[Any]:
+        """
+        Inserta varias entidades en una sola transacción
+
+        Todas las filas entran o ninguna: si una falla (clave duplicada,
+        clave foránea inexistente) se deshace el lote completo. Si ya hay una
+        transacción abierta el lote se suma a ella (savepoint). Los ids se
+        asignan de vuelta en ID_ATTR a partir de los rowid consecutivos de
+        cada INSERT multi-fila (ver insert_rows).
+
+        Args:
+            objs: Entidades a insertar
+
+        Returns:
+            Las mismas entidades, con el id asignado
+        """
+        objs = list(objs)
+        if not objs:
+            return objs
+        rows = [self.insert_values(obj) for obj in objs]
+        with self.unit_of_work():
+            ids = self.insert_rows(self.INSERT_COLUMNS, rows)
+        if self.ID_ATTR is not None:
+            for obj, id_ in zip(objs, ids):
+                setattr(obj, self.ID_ATTR, id_)
+        return objs
+
     def query_one(self, sql: str, params: Tuple[Any, ...] = ()) -> Optional[sqlite3.Row]:
         """
         Ejecuta una sentencia SQL SELECT y retorna una fila
@@ -70,9 +348,12 @@ class BaseRepository:
         Returns:
             Una fila (Row) o None si no hay resultados
         """
+        started = time.perf_counter()
         cur = self.conn.cursor()
         cur.execute(sql, params)
-        return cur.fetchone()
+        row = cur.fetchone()
+        query_stats.record(self.conn, sql, params, time.perf_counter() - started, int(row is not None))
+        return row
 
     def query_all(self, sql: str, params: Tuple[Any, ...] = ()) -> List[sqlite3.Row]:
         """
@@ -85,9 +366,173 @@ class BaseRepository:
         Returns:
             Lista de filas (Row objects)
         """
+        started = time.perf_counter()
         cur = self.conn.cursor()
         cur.execute(sql, params)
-        return cur.fetchall()
+        rows = cur.fetchall()
+        query_stats.record(self.conn, sql, params, time.perf_counter() - started, len(rows))
+        return rows
+
+    def _bound(self, conn: sqlite3.Connection) -> "BaseRepository":
+        """Copia del repositorio que trabaja sobre otra conexión (la de un thread del executor)"""
+        bound = copy.copy(self)
+        bound.conn = conn
+        bound._owned = False
+        return bound
+
+    async def query_one_async(self, sql: str, params: Tuple[Any, ...] = ()) -> Optional[sqlite3.Row]:
+        """
+        Variante async de query_one: corre en un thread lector del executor de
+        base de datos (ver data/db_executor.py), con la conexión de ese thread
+
+        No usa self.conn: no ve lo escrito en una transacción sin confirmar de
+        esta conexión.
+        """
+        return await get_db_executor().read(lambda conn: self._bound(conn).query_one(sql, params))
+
+    async def query_all_async(self, sql: str, params: Tuple[Any, ...] = ()) -> List[sqlite3.Row]:
+        """
+        Variante async de query_all: corre en un thread lector del executor de
+        base de datos, con la conexión de ese thread (ver query_one_async)
+        """
+        return await get_db_executor().read(lambda conn: self._bound(conn).query_all(sql, params))
+
+    async def execute_async(self, sql: str, params: Tuple[Any, ...] = ()) -> sqlite3.Cursor:
+        """
+        Variante async de execute: corre en el thread escritor del executor de
+        base de datos y vuelve cuando se confirma su lote (ver data/write_queue.py)
+
+        Returns:
+            Cursor con el resultado (lastrowid, rowcount)
+        """
+        return await get_db_executor().write(lambda conn: self._bound(conn).execute(sql, params))
+
+    def row_factory(self, columns: Sequence[str], entity: Optional[type] = None) -> RowFactory:
+        """
+        Función fila -> entidad para una consulta con estas columnas (compilada
+        la primera vez y reutilizada después)
+
+        Args:
+            columns: Nombres de las columnas de la consulta, en orden
+            entity: Clase a construir (default: self.ENTITY)
+
+        Returns:
+            Función que recibe la fila y devuelve la entidad
+        """
+        key = (type(self), entity or self.ENTITY, tuple(columns))
+        factory = self._row_factories.get(key)
+        if factory is None:
+            factory = compile_row_factory(key[1], self.ROW_FIELDS, key[2])
+            self._row_factories[key] = factory
+        return factory
+
+    def query_entities(self, sql: str, params: Tuple[Any, ...] = (), entity: Optional[type] = None) -> List[Any]:
+        """
+        Ejecuta una sentencia SELECT y retorna las filas ya convertidas a entidades
+
+        Las filas se leen como tuplas (sin sqlite3.Row ni dict intermedio) y se
+        convierten con la función compilada de row_factory, con el recolector
+        de ciclos pausado.
+
+        Args:
+            sql: Sentencia SQL a ejecutar
+            params: Parámetros para la sentencia
+            entity: Clase a construir (default: self.ENTITY; self.READ_ENTITY
+                para listados de solo lectura)
+
+        Returns:
+            Lista de entidades
+        """
+        started = time.perf_counter()
+        cur = self.conn.cursor()
+        cur.row_factory = None
+        cur.execute(sql, params)
+        build = self.row_factory([column[0] for column in cur.description], entity)
+        with gc_paused():
+            # Recorrer el cursor en lugar de fetchall(): cada tupla cruda se
+            # libera apenas se convierte, sin tener toda la tabla dos veces en memoria
+            items = [build(row) for row in cur]
+        # Incluye la conversión a entidades, que se hace mientras se leen las filas
+        query_stats.record(self.conn, sql, params, time.perf_counter() - started, len(items))
+        return items
+
+    def query_entity(self, sql: str, params: Tuple[Any, ...] = ()) -> Optional[Any]:
+        """
+        Ejecuta una sentencia SELECT y retorna la primera fila como entidad
+
+        Args:
+            sql: Sentencia SQL a ejecutar
+            params: Parámetros para la sentencia
+
+        Returns:
+            La entidad (self.ENTITY) o None si no hay resultados
+        """
+        started = time.perf_counter()
+        cur = self.conn.cursor()
+        cur.row_factory = None
+        cur.execute(sql, params)
+        row = cur.fetchone()
+        query_stats.record(self.conn, sql, params, time.perf_counter() - started, int(row is not None))
+        if row is None:
+            return None
+        return self.row_factory([column[0] for column in cur.description])(row)
+
+    def get_all_lectura(self) -> List[Any]:
+        """
+        Obtiene todas las filas de la tabla en la variante de solo lectura
+        (READ_ENTITY), que ocupa bastante menos memoria que ENTITY
+
+        Returns:
+            Lista de READ_ENTITY (o de ENTITY si el repositorio no define variante)
+        """
+        return self.query_entities(f"SELECT * FROM {self.TABLE}", entity=self.READ_ENTITY)
+
+    def query_page(
+        self,
+        limit: Optional[int],
+        after: Optional[str] = None,
+        conditions: Sequence[str] = (),
+        params: Sequence[Any] = (),
+    ) -> Tuple[List[Any], Optional[str]]:
+        """
+        Obtiene una página de entidades ordenadas por la clave primaria (keyset)
+
+        En lugar de OFFSET, la página siguiente arranca después de la clave de
+        la última fila (`clave > cursor`), así que el costo no crece con el
+        número de página ni con el tamaño de la tabla. Las páginas son para
+        listar: si el repositorio define READ_ENTITY se devuelve esa variante.
+
+        Args:
+            limit: Cantidad máxima de filas (None = todas las que siguen al cursor)
+            after: Cursor devuelto por la página anterior (None = primera página)
+            conditions: Condiciones WHERE adicionales (se combinan con AND)
+            params: Parámetros de las condiciones
+
+        Returns:
+            Tupla (entidades, cursor de la página siguiente o None si no hay más)
+        """
+        key = ", ".join(self.KEY_COLUMNS)
+        where = list(conditions)
+        values = list(params)
+        if after is not None:
+            last = decode_cursor(after, len(self.KEY_COLUMNS))
+            where.append(f"({key}) > ({', '.join('?' for _ in last)})")
+            values.extend(last)
+
+        sql = f"SELECT * FROM {self.TABLE}"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        if limit is None:
+            return self.query_entities(f"{sql} ORDER BY {key}", tuple(values), self.READ_ENTITY), None
+        # Una fila de más para saber si hay página siguiente
+        sql += f" ORDER BY {key} LIMIT ?"
+        items = self.query_entities(sql, tuple(values) + (limit + 1,), self.READ_ENTITY)
+
+        if len(items) <= limit:
+            return items, None
+        items = items[:limit]
+        # Las columnas de la clave tienen el mismo nombre que sus atributos
+        return items, encode_cursor([getattr(items[-1], column) for column in self.KEY_COLUMNS])
 
     def close(self) -> None:
         """Cierra la conexión a la base de datos si es propiedad del repositorio"""
@@ -2,15 +2,24 @@
 CanchaRepository - DAO para la tabla Cancha
 """
 
-from typing import List, Optional
-from classes.cancha import Cancha, from_dict as cancha_from_dict
-from .base_repository import BaseRepository
+from typing import List, Optional, Tuple
+from classes.cancha import Cancha
+from .catalog_cache import CachedCatalogRepository
 
 
-class CanchaRepository(BaseRepository):
-    """Repositorio para manejar operaciones CRUD de la entidad Cancha"""
+class CanchaRepository(CachedCatalogRepository[Cancha]):
+    """Repositorio para manejar operaciones CRUD de la entidad Cancha (con caché de lectura)"""
 
     TABLE = "Cancha"
+    ID_COLUMN = "id_cancha"
+    ENTITY = Cancha
+    ROW_FIELDS = (
+        ("id_cancha", "id_cancha", None),
+        ("id_tipo", "id_tipo", None),
+        ("nombre", "nombre", None),
+    )
+    INSERT_COLUMNS = ("id_tipo", "nombre")
+    ID_ATTR = "id_cancha"
 
     def create(self, cancha: Cancha) -> Cancha:
         """
@@ -23,7 +32,8 @@ class CanchaRepository(BaseRepository):
             El objeto Cancha con el id asignado
         """
         sql = f"INSERT INTO {self.TABLE} (id_tipo, nombre) VALUES (?, ?)"
-        cur = self.execute(sql, (cancha.id_tipo, cancha.nombre))
+        cur = self.execute(sql, self.insert_values(cancha))
+        self.invalidate_cache()
         cancha.id_cancha = cur.lastrowid
         return cancha
 
@@ -37,10 +47,7 @@ class CanchaRepository(BaseRepository):
         Returns:
             Objeto Cancha o None si no existe
         """
-        row = self.query_one(f"SELECT * FROM {self.TABLE} WHERE id_cancha = ?", (id_cancha,))
-        if not row:
-            return None
-        return cancha_from_dict(dict(row))
+        return self.cached_get_by_id(id_cancha)
 
     def get_all(self) -> List[Cancha]:
         """
@@ -49,8 +56,26 @@ class CanchaRepository(BaseRepository):
         Returns:
             Lista de objetos Cancha
         """
-        rows = self.query_all(f"SELECT * FROM {self.TABLE}")
-        return [cancha_from_dict(dict(row)) for row in rows]
+        return self.cached_get_all()
+
+    def get_page(
+        self,
+        limit: Optional[int],
+        after: Optional[str] = None,
+        id_tipo: Optional[int] = None,
+    ) -> Tuple[List[Cancha], Optional[str]]:
+        """
+        Obtiene una página de Cancha ordenada por id, desde el caché
+
+        Args:
+            limit: Cantidad máxima de resultados
+            after: Cursor devuelto por la página anterior (None = primera página)
+            id_tipo: Id del tipo de cancha (opcional)
+
+        Returns:
+            Tupla (lista de Cancha, cursor de la página siguiente o None)
+        """
+        return self.cached_get_page(limit, after, id_tipo=id_tipo)
 
     def get_by_tipo(self, id_tipo: int) -> List[Cancha]:
         """
@@ -62,8 +87,7 @@ class CanchaRepository(BaseRepository):
         Returns:
             Lista de objetos Cancha
         """
-        rows = self.query_all(f"SELECT * FROM {self.TABLE} WHERE id_tipo = ?", (id_tipo,))
-        return [cancha_from_dict(dict(row)) for row in rows]
+        return self.query_entities(f"SELECT * FROM {self.TABLE} WHERE id_tipo = ?", (id_tipo,))
 
     def update(self, cancha: Cancha) -> None:
         """
@@ -74,6 +98,7 @@ class CanchaRepository(BaseRepository):
         """
         sql = f"UPDATE {self.TABLE} SET id_tipo = ?, nombre = ? WHERE id_cancha = ?"
         self.execute(sql, (cancha.id_tipo, cancha.nombre, cancha.id_cancha))
+        self.invalidate_cache()
 
     def delete(self, id_cancha: int) -> None:
         """
@@ -84,6 +109,7 @@ class CanchaRepository(BaseRepository):
         """
         sql = f"DELETE FROM {self.TABLE} WHERE id_cancha = ?"
         self.execute(sql, (id_cancha,))
+        self.invalidate_cache()
 
     def exists(self, id_cancha: int) -> bool:
         """
@@ -95,5 +121,4 @@ class CanchaRepository(BaseRepository):
         Returns:
             True si existe, False en caso contrario
         """
-        row = self.query_one(f"SELECT 1 FROM {self.TABLE} WHERE id_cancha = ?", (id_cancha,))
-        return row is not None
+        return self.cached_get_by_id(id_cancha) is not None
@@ -2,8 +2,8 @@
 CanchaServicioRepository - DAO para la tabla CanchaServicio (tabla de asociación)
 """
 
-from typing import List, Optional
-from classes.cancha_servicio import CanchaServicio, from_dict as cancha_servicio_from_dict
+from typing import List, Optional, Tuple
+from classes.cancha_servicio import CanchaServicio
 from .base_repository import BaseRepository
 
 
@@ -11,6 +11,13 @@ class CanchaServicioRepository(BaseRepository):
     """Repositorio para manejar la asociación entre Canchas y Servicios"""
 
     TABLE = "CanchaServicio"
+    KEY_COLUMNS = ("id_cancha", "id_servicio")
+    ENTITY = CanchaServicio
+    ROW_FIELDS = (
+        ("id_cancha", "id_cancha", None),
+        ("id_servicio", "id_servicio", None),
+    )
+    INSERT_COLUMNS = ("id_cancha", "id_servicio")
 
     def create(self, cancha_servicio: CanchaServicio) -> CanchaServicio:
         """
@@ -23,7 +30,7 @@ class CanchaServicioRepository(BaseRepository):
             El objeto CanchaServicio
         """
         sql = f"INSERT INTO {self.TABLE} (id_cancha, id_servicio) VALUES (?, ?)"
-        self.execute(sql, (cancha_servicio.id_cancha, cancha_servicio.id_servicio))
+        self.execute(sql, self.insert_values(cancha_servicio))
         return cancha_servicio
 
     def get_servicios_by_cancha(self, id_cancha: int) -> List[int]:
@@ -107,13 +114,25 @@ class CanchaServicioRepository(BaseRepository):
         Returns:
             Objeto CanchaServicio o None
         """
-        row = self.query_one(
+        return self.query_entity(
             f"SELECT * FROM {self.TABLE} WHERE id_cancha = ? AND id_servicio = ?",
             (id_cancha, id_servicio),
         )
-        if not row:
-            return None
-        return cancha_servicio_from_dict(dict(row))
+
+    def get_by_cancha(self, id_cancha: int) -> List[CanchaServicio]:
+        """
+        Obtiene las asociaciones de una cancha (por la clave primaria, sin recorrer la tabla)
+
+        Args:
+            id_cancha: Id de la cancha
+
+        Returns:
+            Lista de objetos CanchaServicio ordenada por id_servicio
+        """
+        return self.query_entities(
+            f"SELECT * FROM {self.TABLE} WHERE id_cancha = ? ORDER BY id_servicio",
+            (id_cancha,),
+        )
 
     def get_all(self) -> List[CanchaServicio]:
         """
@@ -122,5 +141,33 @@ class CanchaServicioRepository(BaseRepository):
         Returns:
             Lista de objetos CanchaServicio
         """
-        rows = self.query_all(f"SELECT * FROM {self.TABLE}")
-        return [cancha_servicio_from_dict(dict(row)) for row in rows]
+        return self.query_entities(f"SELECT * FROM {self.TABLE}")
+
+    def get_page(
+        self,
+        limit: Optional[int],
+        after: Optional[str] = None,
+        id_cancha: Optional[int] = None,
+        id_servicio: Optional[int] = None,
+    ) -> Tuple[List[CanchaServicio], Optional[str]]:
+        """
+        Obtiene una página de CanchaServicio ordenada por id_cancha, id_servicio, con filtros opcionales
+
+        Args:
+            limit: Cantidad máxima de resultados
+            after: Cursor devuelto por la página anterior (None = primera página)
+            id_cancha: Id de la cancha (opcional)
+            id_servicio: Id del servicio (opcional)
+
+        Returns:
+            Tupla (lista de CanchaServicio, cursor de la página siguiente o None)
+        """
+        conditions = []
+        params = []
+        if id_cancha is not None:
+            conditions.append("id_cancha = ?")
+            params.append(id_cancha)
+        if id_servicio is not None:
+            conditions.append("id_servicio = ?")
+            params.append(id_servicio)
+        return self.query_page(limit, after, conditions, params)
@@ -0,0 +1,213 @@
+"""
+Caché en proceso para las tablas de catálogo (TipoCancha, Cancha, Horario,
+Servicio, MetodoPago).
+
+Estas tablas cambian pocas veces al año pero se leen en cada reserva y en cada
+carga de la grilla. El caché es de lectura directa (read-through): ante un
+miss se carga la tabla completa (son pocas filas) y a partir de ahí get_by_id y
+get_all se resuelven en memoria. Los create/update/delete del repositorio lo
+invalidan; además cada entrada vence luego de un TTL, para acotar la
+desactualización ante escrituras hechas por fuera de la API (scripts, otros
+procesos).
+
+Configuración:
+    DONBALON_CATALOG_CACHE_TTL  Segundos de vida de cada entrada (default: 300, 0 = sin caché)
+"""
+
+import copy
+import os
+import threading
+import time
+from typing import Any, Dict, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+from data.unit_of_work import after_commit
+
+from .base_repository import BaseRepository, decode_cursor, encode_cursor
+
+
+T = TypeVar("T")
+
+DEFAULT_TTL = 300.0
+
+
+class _Entry:
+    __slots__ = ("items", "by_id", "loaded_at")
+
+    def __init__(self, items: List[Any], by_id: Dict[Any, Any]):
+        self.items = items
+        self.by_id = by_id
+        self.loaded_at = time.monotonic()
+
+
+class CatalogCache:
+    """Almacén de snapshots por (base de datos, tabla) con contadores de hit/miss."""
+
+    def __init__(self, ttl: Optional[float] = None):
+        self.ttl = float(os.environ.get("DONBALON_CATALOG_CACHE_TTL", DEFAULT_TTL)) if ttl is None else ttl
+        self._entries: Dict[Tuple[str, str], _Entry] = {}
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[str, int]] = {}
+        # Se incrementa en cada invalidación: una carga que empezó antes de una
+        # escritura no debe guardar su snapshot (ya desactualizado)
+        self._generations: Dict[Tuple[str, str], int] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def _count(self, table: str, counter: str) -> None:
+        counters = self._counters.setdefault(table, {"hits": 0, "misses": 0, "invalidations": 0})
+        counters[counter] += 1
+
+    def get(self, db_key: str, table: str) -> Tuple[Optional[_Entry], int]:
+        """
+        Retorna el snapshot vigente de la tabla (o None) y la generación actual,
+        que se debe pasar a put() al guardar la carga. Cuenta hit/miss.
+        """
+        key = (db_key, table)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry.loaded_at < self.ttl:
+                self._count(table, "hits")
+            else:
+                entry = None
+                self._count(table, "misses")
+            return entry, self._generations.get(key, 0)
+
+    def put(self, db_key: str, table: str, entry: _Entry, generation: int) -> None:
+        """Guarda un snapshot, salvo que haya habido una invalidación mientras se cargaba."""
+        key = (db_key, table)
+        with self._lock:
+            if self._generations.get(key, 0) == generation:
+                self._entries[key] = entry
+
+    def invalidate(self, db_key: Optional[str] = None, table: Optional[str] = None) -> None:
+        """Invalida una tabla de una base, una tabla en todas las bases, o todo."""
+        with self._lock:
+            if db_key is not None and table is not None:
+                keys = {(db_key, table)}
+            else:
+                keys = {
+                    key for key in set(self._entries) | set(self._generations)
+                    if (db_key is None or key[0] == db_key) and (table is None or key[1] == table)
+                }
+            for key in keys:
+                self._entries.pop(key, None)
+                self._generations[key] = self._generations.get(key, 0) + 1
+            if table is not None:
+                self._count(table, "invalidations")
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Contadores de hits, misses e invalidaciones por tabla."""
+        with self._lock:
+            result = {table: dict(counters) for table, counters in self._counters.items()}
+            for (_, table), entry in self._entries.items():
+                result.setdefault(table, {"hits": 0, "misses": 0, "invalidations": 0})
+                result[table]["size"] = len(entry.items)
+            return result
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._counters.clear()
+
+
+catalog_cache = CatalogCache()
+
+
+class CachedCatalogRepository(BaseRepository, Generic[T]):
+    """
+    Base para repositorios de catálogo con caché de lectura
+
+    Las subclases definen TABLE, ID_COLUMN y el mapeo de filas (ENTITY,
+    ROW_FIELDS); sus get_by_id/get_all delegan en cached_get_by_id/
+    cached_get_all y sus escrituras llaman a invalidate_cache().
+    """
+
+    ID_COLUMN = ""
+
+    cache = catalog_cache
+
+    def _fetch_all(self) -> List[T]:
+        """Lee la tabla completa de la base (sin caché)."""
+        return self.query_entities(f"SELECT * FROM {self.TABLE}")
+
+    @property
+    def db_key(self) -> str:
+        """Identifica la base de datos de la conexión, para no mezclar cachés entre bases."""
+        key = getattr(self, "_db_key", None)
+        if key is None:
+            if self.db_path:
+                key = os.path.realpath(self.db_path)
+            else:
+                row = self.conn.execute("PRAGMA database_list").fetchone()
+                # Las bases en memoria son propias de cada conexión
+                key = os.path.realpath(row[2]) if row and row[2] else f":memory:{id(self.conn)}"
+            self._db_key = key
+        return key
+
+    def _snapshot(self) -> _Entry:
+        entry, generation = self.cache.get(self.db_key, self.TABLE)
+        if entry is None:
+            # Ordenados por id, para paginar sin reordenar en cada pedido
+            items = sorted(self._fetch_all(), key=lambda obj: getattr(obj, self.ID_COLUMN))
+            entry = _Entry(items, {getattr(obj, self.ID_COLUMN): obj for obj in items})
+            # Dentro de una transacción abierta la lectura puede incluir filas
+            # sin confirmar: sirve para esta conexión, pero no se comparte
+            if self.cache.enabled and not self.conn.in_transaction:
+                self.cache.put(self.db_key, self.TABLE, entry, generation)
+        return entry
+
+    def cached_get_all(self) -> List[T]:
+        """Todas las filas de la tabla, desde el caché (copias, se pueden modificar)."""
+        return [copy.copy(obj) for obj in self._snapshot().items]
+
+    def cached_get_by_id(self, id_value: Any) -> Optional[T]:
+        """Una fila por id desde el caché, o None si no existe."""
+        obj = self._snapshot().by_id.get(id_value)
+        return copy.copy(obj) if obj is not None else None
+
+    def cached_get_page(self, limit: Optional[int], after: Optional[str] = None, **filters: Any) -> Tuple[List[T], Optional[str]]:
+        """
+        Una página ordenada por id desde el caché (misma semántica que query_page)
+
+        Args:
+            limit: Cantidad máxima de filas (None = todas)
+            after: Cursor devuelto por la página anterior
+            filters: Igualdades atributo=valor; los valores None se ignoran
+
+        Returns:
+            Tupla (objetos, cursor de la página siguiente o None)
+        """
+        last = decode_cursor(after, 1)[0] if after is not None else None
+        filters = {name: value for name, value in filters.items() if value is not None}
+        page = []
+        for obj in self._snapshot().items:
+            if last is not None and getattr(obj, self.ID_COLUMN) <= last:
+                continue
+            if any(getattr(obj, name) != value for name, value in filters.items()):
+                continue
+            if len(page) == limit:
+                return page, encode_cursor([getattr(page[-1], self.ID_COLUMN)])
+            page.append(copy.copy(obj))
+        return page, None
+
+    def create_many(self, objs: Sequence[T]) -> List[T]:
+        """Alta masiva (ver BaseRepository.create_many) que invalida el snapshot."""
+        try:
+            return super().create_many(objs)
+        finally:
+            self.invalidate_cache()
+
+    def invalidate_cache(self) -> None:
+        """
+        Descarta el snapshot de esta tabla; la próxima lectura la recarga
+
+        Dentro de una transacción se invalida de nuevo al terminarla, tanto si
+        se confirma (una lectura de otra conexión en el medio cargaría los
+        datos anteriores) como si se deshace (no debe sobrevivir nada cargado
+        con las filas sin confirmar).
+        """
+        db_key, table = self.db_key, self.TABLE
+        self.cache.invalidate(db_key, table)
+        if self.conn.in_transaction:
+            after_commit(self.conn, lambda: self.cache.invalidate(db_key, table), on_rollback=True)
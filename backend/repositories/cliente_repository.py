@@ -2,8 +2,8 @@
 ClienteRepository - DAO para la tabla Cliente
 """
 
-from typing import List, Optional
-from classes.cliente import Cliente, from_dict as cliente_from_dict
+from typing import List, Optional, Tuple
+from classes.cliente import Cliente, ClienteLectura
 from .base_repository import BaseRepository
 
 
@@ -11,6 +11,20 @@ class ClienteRepository(BaseRepository):
     """Repositorio para manejar operaciones CRUD de la entidad Cliente"""
 
     TABLE = "Cliente"
+    KEY_COLUMNS = ("id_cliente",)
+    ENTITY = Cliente
+    READ_ENTITY = ClienteLectura
+    ROW_FIELDS = (
+        ("id_cliente", "id_cliente", None),
+        ("nombre", "nombre", None),
+        ("apellido", "apellido", None),
+        ("telefono", "telefono", None),
+        ("mail", "mail", None),
+        ("password", "password", None),
+        ("admin", "admin", bool),
+    )
+    INSERT_COLUMNS = ("nombre", "apellido", "telefono", "mail", "password", "admin")
+    ID_ATTR = "id_cliente"
 
     def create(self, cliente: Cliente) -> Cliente:
         """
@@ -23,7 +37,7 @@ class ClienteRepository(BaseRepository):
             El objeto Cliente con el id asignado
         """
         sql = f"INSERT INTO {self.TABLE} (nombre, apellido, telefono, mail, password, admin) VALUES (?, ?, ?, ?, ?, ?)"
-        cur = self.execute(sql, (cliente.nombre, cliente.apellido, cliente.telefono, cliente.mail, cliente.password, cliente.admin))
+        cur = self.execute(sql, self.insert_values(cliente))
         cliente.id_cliente = cur.lastrowid
         return cliente
 
@@ -37,10 +51,7 @@ class ClienteRepository(BaseRepository):
         Returns:
             Objeto Cliente o None si no existe
         """
-        row = self.query_one(f"SELECT * FROM {self.TABLE} WHERE id_cliente = ?", (id_cliente,))
-        if not row:
-            return None
-        return cliente_from_dict(dict(row))
+        return self.query_entity(f"SELECT * FROM {self.TABLE} WHERE id_cliente = ?", (id_cliente,))
 
     def get_all(self) -> List[Cliente]:
         """
@@ -49,8 +60,31 @@ class ClienteRepository(BaseRepository):
         Returns:
             Lista de objetos Cliente
         """
-        rows = self.query_all(f"SELECT * FROM {self.TABLE}")
-        return [cliente_from_dict(dict(row)) for row in rows]
+        return self.query_entities(f"SELECT * FROM {self.TABLE}")
+
+    def get_page(
+        self,
+        limit: Optional[int],
+        after: Optional[str] = None,
+        mail: Optional[str] = None,
+    ) -> Tuple[List[ClienteLectura], Optional[str]]:
+        """
+        Obtiene una página de Cliente ordenada por id_cliente, con filtros opcionales
+
+        Args:
+            limit: Cantidad máxima de resultados
+            after: Cursor devuelto por la página anterior (None = primera página)
+            mail: Mail exacto del cliente (opcional)
+
+        Returns:
+            Tupla (lista de ClienteLectura, cursor de la página siguiente o None)
+        """
+        conditions = []
+        params = []
+        if mail is not None:
+            conditions.append("mail = ?")
+            params.append(mail)
+        return self.query_page(limit, after, conditions, params)
 
     def get_by_apellido(self, apellido: str) -> List[Cliente]:
         """
@@ -62,8 +96,7 @@ class ClienteRepository(BaseRepository):
         Returns:
             Lista de objetos Cliente
         """
-        rows = self.query_all(f"SELECT * FROM {self.TABLE} WHERE apellido = ?", (apellido,))
-        return [cliente_from_dict(dict(row)) for row in rows]
+        return self.query_entities(f"SELECT * FROM {self.TABLE} WHERE apellido = ?", (apellido,))
 
     def update(self, cliente: Cliente) -> None:
         """
@@ -108,7 +141,4 @@ class ClienteRepository(BaseRepository):
         Returns:
             Objeto Cliente o None si no existe
         """
-        row = self.query_one(f"SELECT * FROM {self.TABLE} WHERE mail = ?", (mail,))
-        if not row:
-            return None
-        return cliente_from_dict(dict(row))
+        return self.query_entity(f"SELECT * FROM {self.TABLE} WHERE mail = ?", (mail,))
@@ -2,8 +2,8 @@
 EquipoRepository - DAO para la tabla Equipo
 """
 
-from typing import List, Optional
-from classes.equipo import Equipo, from_dict as equipo_from_dict
+from typing import List, Optional, Tuple
+from classes.equipo import Equipo
 from .base_repository import BaseRepository
 
 
@@ -11,6 +11,16 @@ class EquipoRepository(BaseRepository):
     """Repositorio para manejar operaciones CRUD de la entidad Equipo"""
 
     TABLE = "Equipo"
+    KEY_COLUMNS = ("id_equipo",)
+    ENTITY = Equipo
+    ROW_FIELDS = (
+        ("id_equipo", "id_equipo", None),
+        ("id_torneo", "id_torneo", None),
+        ("nombre", "nombre", None),
+        ("cant_jugadores", "cant_jugadores", None),
+    )
+    INSERT_COLUMNS = ("id_torneo", "nombre", "cant_jugadores")
+    ID_ATTR = "id_equipo"
 
     def create(self, equipo: Equipo) -> Equipo:
         """
@@ -23,7 +33,7 @@ class EquipoRepository(BaseRepository):
             El objeto Equipo con el id asignado
         """
         sql = f"INSERT INTO {self.TABLE} (id_torneo, nombre, cant_jugadores) VALUES (?, ?, ?)"
-        cur = self.execute(sql, (equipo.id_torneo, equipo.nombre, equipo.cant_jugadores))
+        cur = self.execute(sql, self.insert_values(equipo))
         equipo.id_equipo = cur.lastrowid
         return equipo
 
@@ -37,10 +47,7 @@ class EquipoRepository(BaseRepository):
         Returns:
             Objeto Equipo o None si no existe
         """
-        row = self.query_one(f"SELECT * FROM {self.TABLE} WHERE id_equipo = ?", (id_equipo,))
-        if not row:
-            return None
-        return equipo_from_dict(dict(row))
+        return self.query_entity(f"SELECT * FROM {self.TABLE} WHERE id_equipo = ?", (id_equipo,))
 
     def get_all(self) -> List[Equipo]:
         """
@@ -49,8 +56,31 @@ class EquipoRepository(BaseRepository):
         Returns:
             Lista de objetos Equipo
         """
-        rows = self.query_all(f"SELECT * FROM {self.TABLE}")
-        return [equipo_from_dict(dict(row)) for row in rows]
+        return self.query_entities(f"SELECT * FROM {self.TABLE}")
+
+    def get_page(
+        self,
+        limit: Optional[int],
+        after: Optional[str] = None,
+        id_torneo: Optional[int] = None,
+    ) -> Tuple[List[Equipo], Optional[str]]:
+        """
+        Obtiene una página de Equipo ordenada por id_equipo, con filtros opcionales
+
+        Args:
+            limit: Cantidad máxima de resultados
+            after: Cursor devuelto por la página anterior (None = primera página)
+            id_torneo: Id del torneo (opcional)
+
+        Returns:
+            Tupla (lista de Equipo, cursor de la página siguiente o None)
+        """
+        conditions = []
+        params = []
+        if id_torneo is not None:
+            conditions.append("id_torneo = ?")
+            params.append(id_torneo)
+        return self.query_page(limit, after, conditions, params)
 
     def get_by_torneo(self, id_torneo: int) -> List[Equipo]:
         """
@@ -62,8 +92,7 @@ class EquipoRepository(BaseRepository):
         Returns:
             Lista de objetos Equipo
         """
-        rows = self.query_all(f"SELECT * FROM {self.TABLE} WHERE id_torneo = ?", (id_torneo,))
-        return [equipo_from_dict(dict(row)) for row in rows]
+        return self.query_entities(f"SELECT * FROM {self.TABLE} WHERE id_torneo = ?", (id_torneo,))
 
     def get_by_nombre(self, nombre: str) -> List[Equipo]:
         """
@@ -75,8 +104,7 @@ class EquipoRepository(BaseRepository):
         Returns:
             Lista de objetos Equipo
         """
-        rows = self.query_all(f"SELECT * FROM {self.TABLE} WHERE nombre LIKE ?", (f"%{nombre}%",))
-        return [equipo_from_dict(dict(row)) for row in rows]
+        return self.query_entities(f"SELECT * FROM {self.TABLE} WHERE nombre LIKE ?", (f"%{nombre}%",))
 
     def update(self, equipo: Equipo) -> None:
         """
@@ -2,8 +2,8 @@
 EstadoRepository - DAO para la tabla Estado
 """
 
-from typing import List, Optional
-from classes.estado import Estado, from_dict as estado_from_dict
+from typing import List, Optional, Tuple
+from classes.estado import Estado
 from .base_repository import BaseRepository
 
 
@@ -11,6 +11,15 @@ class EstadoRepository(BaseRepository):
     """Repositorio para manejar operaciones CRUD de la entidad Estado"""
 
     TABLE = "Estado"
+    KEY_COLUMNS = ("id_estado",)
+    ENTITY = Estado
+    ROW_FIELDS = (
+        ("id_estado", "id_estado", None),
+        ("nombre", "nombre", None),
+        ("ambito", "ambito", None),
+    )
+    INSERT_COLUMNS = ("nombre", "ambito")
+    ID_ATTR = "id_estado"
     def create(self, estado: Estado) -> Estado:
         """
         Inserta un nuevo Estado en la base de datos
@@ -22,7 +31,7 @@ class EstadoRepository(BaseRepository):
             El objeto Estado con el id asignado por la base de datos
         """
         sql = f"INSERT INTO {self.TABLE} (nombre, ambito) VALUES (?, ?)"
-        cur = self.execute(sql, (estado.nombre, estado.ambito))
+        cur = self.execute(sql, self.insert_values(estado))
         estado.id_estado = cur.lastrowid
         return estado
 
@@ -36,10 +45,7 @@ class EstadoRepository(BaseRepository):
         Returns:
             Objeto Estado o None si no existe
         """
-        row = self.query_one(f"SELECT * FROM {self.TABLE} WHERE id_estado = ?", (id_estado,))
-        if not row:
-            return None
-        return estado_from_dict(dict(row))
+        return self.query_entity(f"SELECT * FROM {self.TABLE} WHERE id_estado = ?", (id_estado,))
 
     def get_all(self) -> List[Estado]:
         """
@@ -48,8 +54,31 @@ class EstadoRepository(BaseRepository):
         Returns:
             Lista de objetos Estado
         """
-        rows = self.query_all(f"SELECT * FROM {self.TABLE}")
-        return [estado_from_dict(dict(row)) for row in rows]
+        return self.query_entities(f"SELECT * FROM {self.TABLE}")
+
+    def get_page(
+        self,
+        limit: Optional[int],
+        after: Optional[str] = None,
+        ambito: Optional[str] = None,
+    ) -> Tuple[List[Estado], Optional[str]]:
+        """
+        Obtiene una página de Estado ordenada por id_estado, con filtros opcionales
+
+        Args:
+            limit: Cantidad máxima de resultados
+            after: Cursor devuelto por la página anterior (None = primera página)
+            ambito: Ámbito del estado (opcional)
+
+        Returns:
+            Tupla (lista de Estado, cursor de la página siguiente o None)
+        """
+        conditions = []
+        params = []
+        if ambito is not None:
+            conditions.append("ambito = ?")
+            params.append(ambito)
+        return self.query_page(limit, after, conditions, params)
 
     def update(self, estado: Estado) -> None:
         """
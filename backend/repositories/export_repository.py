@@ -0,0 +1,104 @@
+"""
+ExportRepository - Lectura por lotes de tablas grandes para exportar
+"""
+
+import time
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+from data.query_stats import query_stats
+from .base_repository import BaseRepository
+
+
+class Exportable(NamedTuple):
+    """Tabla exportable: columnas, columna de fecha para filtrar y orden"""
+    tabla: str
+    columnas: Tuple[str, ...]
+    columna_fecha: str
+    # Orden que coincide con un índice sobre la fecha, para que SQLite recorra
+    # el índice en lugar de ordenar todo el resultado en memoria
+    orden: str
+
+
+EXPORTABLES: Dict[str, Exportable] = {
+    "reservas": Exportable(
+        "Reserva",
+        ("id_reserva", "id_cliente", "monto_total", "fecha_reserva", "estado_reserva"),
+        "fecha_reserva",
+        "fecha_reserva, id_reserva",
+    ),
+    "turnos": Exportable(
+        "Turno",
+        ("id_turno", "id_cancha", "id_horario", "fecha", "estado_turno"),
+        "fecha",
+        "fecha, id_cancha, id_horario",
+    ),
+    "pagos": Exportable(
+        "Pago",
+        ("id_pago", "id_reserva", "id_metodo_pago", "fecha_pago", "monto"),
+        "fecha_pago",
+        "fecha_pago, id_pago",
+    ),
+}
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+class ExportRepository(BaseRepository):
+    """Repositorio que recorre una tabla con un cursor y fetchmany"""
+
+    def iter_chunks(
+        self,
+        entidad: str,
+        fecha_desde: Optional[str] = None,
+        fecha_hasta: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[List[tuple]]:
+        """
+        Recorre las filas de una entidad exportable en lotes
+
+        Solo hay en memoria un lote a la vez: el cursor se va leyendo con
+        fetchmany a medida que se consume el generador. La sentencia se
+        registra en data/query_stats.py al cerrar el cursor, con el tiempo
+        de execute y fetchmany (no el de quien consume los lotes) y el total
+        de filas.
+
+        Args:
+            entidad: Clave de EXPORTABLES
+            fecha_desde: Fecha mínima inclusive (YYYY-MM-DD), opcional
+            fecha_hasta: Fecha máxima inclusive (YYYY-MM-DD), opcional
+            chunk_size: Filas por lote
+
+        Returns:
+            Generador de listas de tuplas, en el orden de EXPORTABLES[entidad].columnas
+        """
+        exportable = EXPORTABLES[entidad]
+        condiciones = []
+        params: List[str] = []
+        if fecha_desde is not None:
+            condiciones.append(f"{exportable.columna_fecha} >= ?")
+            params.append(fecha_desde)
+        if fecha_hasta is not None:
+            condiciones.append(f"{exportable.columna_fecha} <= ?")
+            params.append(fecha_hasta)
+        where = f" WHERE {' AND '.join(condiciones)}" if condiciones else ""
+
+        sql = f"SELECT {', '.join(exportable.columnas)} FROM {exportable.tabla}{where} ORDER BY {exportable.orden}"
+        params_tuple = tuple(params)
+        cur = self.conn.cursor()
+        # Tuplas simples: más baratas que sqlite3.Row para volcar millones de filas
+        cur.row_factory = None
+        started = time.perf_counter()
+        cur.execute(sql, params_tuple)
+        seconds = time.perf_counter() - started
+        total = 0
+        try:
+            while True:
+                started = time.perf_counter()
+                rows = cur.fetchmany(chunk_size)
+                seconds += time.perf_counter() - started
+                if not rows:
+                    break
+                total += len(rows)
+                yield rows
+        finally:
+            cur.close()
+            query_stats.record(self.conn, sql, params_tuple, seconds, total)
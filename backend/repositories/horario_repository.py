@@ -2,15 +2,25 @@
 HorarioRepository - DAO para la tabla Horario
 """
 
-from typing import List, Optional
-from classes.horario import Horario, from_dict as horario_from_dict
-from .base_repository import BaseRepository
+from typing import List, Optional, Tuple
+from classes.horario import Horario
+from .base_repository import parse_time
+from .catalog_cache import CachedCatalogRepository
 
 
-class HorarioRepository(BaseRepository):
-    """Repositorio para manejar operaciones CRUD de la entidad Horario"""
+class HorarioRepository(CachedCatalogRepository[Horario]):
+    """Repositorio para manejar operaciones CRUD de la entidad Horario (con caché de lectura)"""
 
     TABLE = "Horario"
+    ID_COLUMN = "id_horario"
+    ENTITY = Horario
+    ROW_FIELDS = (
+        ("id_horario", "id_horario", None),
+        ("hora_inicio", "hora_inicio", parse_time),
+        ("hora_fin", "hora_fin", parse_time),
+    )
+    INSERT_COLUMNS = ("hora_inicio", "hora_fin")
+    ID_ATTR = "id_horario"
 
     def create(self, horario: Horario) -> Horario:
         """
@@ -23,11 +33,8 @@ class HorarioRepository(BaseRepository):
             El objeto Horario con el id asignado
         """
         sql = f"INSERT INTO {self.TABLE} (hora_inicio, hora_fin) VALUES (?, ?)"
-        # Convertir time a str para SQLite
-        inicio_str = horario.hora_inicio.isoformat() if horario.hora_inicio else None
-        fin_str = horario.hora_fin.isoformat() if horario.hora_fin else None
-        
-        cur = self.execute(sql, (inicio_str, fin_str))
+        cur = self.execute(sql, self.insert_values(horario))
+        self.invalidate_cache()
         horario.id_horario = cur.lastrowid
         return horario
 
@@ -41,10 +48,7 @@ class HorarioRepository(BaseRepository):
         Returns:
             Objeto Horario o None si no existe
         """
-        row = self.query_one(f"SELECT * FROM {self.TABLE} WHERE id_horario = ?", (id_horario,))
-        if not row:
-            return None
-        return horario_from_dict(dict(row))
+        return self.cached_get_by_id(id_horario)
 
     def get_all(self) -> List[Horario]:
         """
@@ -53,8 +57,20 @@ class HorarioRepository(BaseRepository):
         Returns:
             Lista de objetos Horario
         """
-        rows = self.query_all(f"SELECT * FROM {self.TABLE}")
-        return [horario_from_dict(dict(row)) for row in rows]
+        return self.cached_get_all()
+
+    def get_page(self, limit: Optional[int], after: Optional[str] = None) -> Tuple[List[Horario], Optional[str]]:
+        """
+        Obtiene una página de Horario ordenada por id, desde el caché
+
+        Args:
+            limit: Cantidad máxima de resultados
+            after: Cursor devuelto por la página anterior (None = primera página)
+
+        Returns:
+            Tupla (lista de Horario, cursor de la página siguiente o None)
+        """
+        return self.cached_get_page(limit, after)
 
     def update(self, horario: Horario) -> None:
         """
@@ -69,6 +85,7 @@ class HorarioRepository(BaseRepository):
         fin_str = horario.hora_fin.isoformat() if horario.hora_fin else None
         
         self.execute(sql, (inicio_str, fin_str, horario.id_horario))
+        self.invalidate_cache()
 
     def delete(self, id_horario: int) -> None:
         """
@@ -79,6 +96,7 @@ class HorarioRepository(BaseRepository):
         """
         sql = f"DELETE FROM {self.TABLE} WHERE id_horario = ?"
         self.execute(sql, (id_horario,))
+        self.invalidate_cache()
 
     def exists(self, id_horario: int) -> bool:
         """
@@ -90,5 +108,4 @@ class HorarioRepository(BaseRepository):
         Returns:
             True si existe, False en caso contrario
         """
-        row = self.query_one(f"SELECT 1 FROM {self.TABLE} WHERE id_horario = ?", (id_horario,))
-        return row is not None
+        return self.cached_get_by_id(id_horario) is not None
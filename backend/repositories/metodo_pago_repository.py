@@ -2,15 +2,23 @@
 MetodoPagoRepository - DAO para la tabla MetodoPago
 """
 
-from typing import List, Optional
-from classes.metodo_pago import MetodoPago, from_dict as metodo_pago_from_dict
-from .base_repository import BaseRepository
+from typing import List, Optional, Tuple
+from classes.metodo_pago import MetodoPago
+from .catalog_cache import CachedCatalogRepository
 
 
-class MetodoPagoRepository(BaseRepository):
-    """Repositorio para manejar operaciones CRUD de la entidad MetodoPago"""
+class MetodoPagoRepository(CachedCatalogRepository[MetodoPago]):
+    """Repositorio para manejar operaciones CRUD de la entidad MetodoPago (con caché de lectura)"""
 
     TABLE = "MetodoPago"
+    ID_COLUMN = "id_metodo_pago"
+    ENTITY = MetodoPago
+    ROW_FIELDS = (
+        ("id_metodo_pago", "id_metodo_pago", None),
+        ("descripcion", "descripcion", None),
+    )
+    INSERT_COLUMNS = ("descripcion",)
+    ID_ATTR = "id_metodo_pago"
 
     def create(self, metodo_pago: MetodoPago) -> MetodoPago:
         """
@@ -23,7 +31,8 @@ class MetodoPagoRepository(BaseRepository):
             El objeto MetodoPago con el id asignado
         """
         sql = f"INSERT INTO {self.TABLE} (descripcion) VALUES (?)"
-        cur = self.execute(sql, (metodo_pago.descripcion,))
+        cur = self.execute(sql, self.insert_values(metodo_pago))
+        self.invalidate_cache()
         metodo_pago.id_metodo_pago = cur.lastrowid
         return metodo_pago
 
@@ -37,10 +46,7 @@ class MetodoPagoRepository(BaseRepository):
         Returns:
             Objeto MetodoPago o None si no existe
         """
-        row = self.query_one(f"SELECT * FROM {self.TABLE} WHERE id_metodo_pago = ?", (id_metodo_pago,))
-        if not row:
-            return None
-        return metodo_pago_from_dict(dict(row))
+        return self.cached_get_by_id(id_metodo_pago)
 
     def get_all(self) -> List[MetodoPago]:
         """
@@ -49,8 +55,20 @@ class MetodoPagoRepository(BaseRepository):
         Returns:
             Lista de objetos MetodoPago
         """
-        rows = self.query_all(f"SELECT * FROM {self.TABLE}")
-        return [metodo_pago_from_dict(dict(row)) for row in rows]
+        return self.cached_get_all()
+
+    def get_page(self, limit: Optional[int], after: Optional[str] = None) -> Tuple[List[MetodoPago], Optional[str]]:
+        """
+        Obtiene una página de MetodoPago ordenada por id, desde el caché
+
+        Args:
+            limit: Cantidad máxima de resultados
+            after: Cursor devuelto por la página anterior (None = primera página)
+
+        Returns:
+            Tupla (lista de MetodoPago, cursor de la página siguiente o None)
+        """
+        return self.cached_get_page(limit, after)
 
     def update(self, metodo_pago: MetodoPago) -> None:
         """
@@ -61,6 +79,7 @@ class MetodoPagoRepository(BaseRepository):
         """
         sql = f"UPDATE {self.TABLE} SET descripcion = ? WHERE id_metodo_pago = ?"
         self.execute(sql, (metodo_pago.descripcion, metodo_pago.id_metodo_pago))
+        self.invalidate_cache()
 
     def delete(self, id_metodo_pago: int) -> None:
         """
@@ -71,6 +90,7 @@ class MetodoPagoRepository(BaseRepository):
         """
         sql = f"DELETE FROM {self.TABLE} WHERE id_metodo_pago = ?"
         self.execute(sql, (id_metodo_pago,))
+        self.invalidate_cache()
 
     def exists(self, id_metodo_pago: int) -> bool:
         """
@@ -82,5 +102,4 @@ class MetodoPagoRepository(BaseRepository):
         Returns:
             True si existe, False en caso contrario
         """
-        row = self.query_one(f"SELECT 1 FROM {self.TABLE} WHERE id_metodo_pago = ?", (id_metodo_pago,))
-        return row is not None
+        return self.cached_get_by_id(id_metodo_pago) is not None
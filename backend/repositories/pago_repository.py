@@ -2,16 +2,28 @@
 PagoRepository - DAO para la tabla Pago
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import date
-from classes.pago import Pago, from_dict as pago_from_dict
-from .base_repository import BaseRepository
+from classes.pago import Pago, PagoLectura
+from .base_repository import BaseRepository, parse_date, parse_decimal
 
 
 class PagoRepository(BaseRepository):
     """Repositorio para manejar operaciones CRUD de la entidad Pago"""
 
     TABLE = "Pago"
+    KEY_COLUMNS = ("id_pago",)
+    ENTITY = Pago
+    READ_ENTITY = PagoLectura
+    ROW_FIELDS = (
+        ("id_pago", "id_pago", None),
+        ("id_reserva", "id_reserva", None),
+        ("id_metodo_pago", "id_metodo_pago", None),
+        ("fecha_pago", "fecha_pago", parse_date),
+        ("monto", "monto", parse_decimal),
+    )
+    INSERT_COLUMNS = ("id_reserva", "id_metodo_pago", "fecha_pago", "monto")
+    ID_ATTR = "id_pago"
 
     def create(self, pago: Pago) -> Pago:
         """
@@ -24,7 +36,7 @@ class PagoRepository(BaseRepository):
             El objeto Pago con el id asignado
         """
         sql = f"INSERT INTO {self.TABLE} (id_reserva, id_metodo_pago, fecha_pago, monto) VALUES (?, ?, ?, ?)"
-        cur = self.execute(sql, (pago.id_reserva, pago.id_metodo_pago, pago.fecha_pago, str(pago.monto)))
+        cur = self.execute(sql, self.insert_values(pago))
         pago.id_pago = cur.lastrowid
         return pago
 
@@ -38,10 +50,7 @@ class PagoRepository(BaseRepository):
         Returns:
             Objeto Pago o None si no existe
         """
-        row = self.query_one(f"SELECT * FROM {self.TABLE} WHERE id_pago = ?", (id_pago,))
-        if not row:
-            return None
-        return pago_from_dict(dict(row))
+        return self.query_entity(f"SELECT * FROM {self.TABLE} WHERE id_pago = ?", (id_pago,))
 
     def get_all(self) -> List[Pago]:
         """
@@ -50,8 +59,41 @@ class PagoRepository(BaseRepository):
         Returns:
             Lista de objetos Pago
         """
-        rows = self.query_all(f"SELECT * FROM {self.TABLE}")
-        return [pago_from_dict(dict(row)) for row in rows]
+        return self.query_entities(f"SELECT * FROM {self.TABLE}")
+
+    def get_page(
+        self,
+        limit: Optional[int],
+        after: Optional[str] = None,
+        id_reserva: Optional[int] = None,
+        fecha_desde: Optional[date] = None,
+        fecha_hasta: Optional[date] = None,
+    ) -> Tuple[List[PagoLectura], Optional[str]]:
+        """
+        Obtiene una página de Pago ordenada por id_pago, con filtros opcionales
+
+        Args:
+            limit: Cantidad máxima de resultados
+            after: Cursor devuelto por la página anterior (None = primera página)
+            id_reserva: Id de la reserva (opcional)
+            fecha_desde: Fecha de pago mínima inclusive (opcional)
+            fecha_hasta: Fecha de pago máxima inclusive (opcional)
+
+        Returns:
+            Tupla (lista de PagoLectura, cursor de la página siguiente o None)
+        """
+        conditions = []
+        params = []
+        if id_reserva is not None:
+            conditions.append("id_reserva = ?")
+            params.append(id_reserva)
+        if fecha_desde is not None:
+            conditions.append("fecha_pago >= ?")
+            params.append(fecha_desde.isoformat())
+        if fecha_hasta is not None:
+            conditions.append("fecha_pago <= ?")
+            params.append(fecha_hasta.isoformat())
+        return self.query_page(limit, after, conditions, params)
 
     def get_by_reserva(self, id_reserva: int) -> List[Pago]:
         """
@@ -63,8 +105,7 @@ class PagoRepository(BaseRepository):
         Returns:
             Lista de objetos Pago
         """
-        rows = self.query_all(f"SELECT * FROM {self.TABLE} WHERE id_reserva = ?", (id_reserva,))
-        return [pago_from_dict(dict(row)) for row in rows]
+        return self.query_entities(f"SELECT * FROM {self.TABLE} WHERE id_reserva = ?", (id_reserva,))
 
     def get_by_fecha(self, fecha: date) -> List[Pago]:
         """
@@ -76,8 +117,7 @@ class PagoRepository(BaseRepository):
         Returns:
             Lista de objetos Pago
         """
-        rows = self.query_all(f"SELECT * FROM {self.TABLE} WHERE fecha_pago = ?", (fecha,))
-        return [pago_from_dict(dict(row)) for row in rows]
+        return self.query_entities(f"SELECT * FROM {self.TABLE} WHERE fecha_pago = ?", (fecha,))
 
     def update(self, pago: Pago) -> None:
         """
@@ -0,0 +1,150 @@
+"""
+ReporteRepository - Consultas de solo lectura para los reportes PDF
+
+Cada reporte obtiene sus datos con una única consulta (JOIN) y los agrupa en
+Python en una sola pasada, en lugar de recorrer las entidades pidiendo cada
+turno, cancha o cliente por separado.
+"""
+
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import List, Optional, Tuple
+from classes.cliente import Cliente, from_dict as cliente_from_dict
+from classes.reserva import Reserva, from_dict as reserva_from_dict
+from .base_repository import BaseRepository
+
+
+@dataclass
+class DetalleReporte:
+    """Un turno reservado, con el nombre de la cancha ya resuelto"""
+    id_turno: Optional[int] = None
+    nombre_cancha: Optional[str] = None
+    fecha: Optional[str] = None
+    id_horario: Optional[int] = None
+
+
+@dataclass
+class ReservaReporte:
+    """Una reserva con sus detalles"""
+    reserva: Reserva
+    detalles: List[DetalleReporte] = field(default_factory=list)
+
+
+@dataclass
+class TurnoReservadoReporte:
+    """Un ítem reservado de una cancha, con el cliente de la reserva"""
+    id_reserva: int
+    id_turno: int
+    fecha: str
+    nombre_cliente: Optional[str] = None
+    apellido_cliente: Optional[str] = None
+    precio_total_item: Decimal = Decimal("0.00")
+
+
+class ReporteRepository(BaseRepository):
+    """Repositorio con las consultas agregadas que usan los reportes"""
+
+    def get_reservas_por_cliente(self, id_cliente: int) -> Tuple[Optional[Cliente], List[ReservaReporte]]:
+        """
+        Obtiene un cliente con todas sus reservas y los turnos de cada una
+
+        Una sola consulta: Cliente LEFT JOIN Reserva, ReservaDetalle, Turno y
+        Cancha, ordenada por reserva y detalle, que se agrupa en una
+        pasada.
+
+        Args:
+            id_cliente: Id del cliente
+
+        Returns:
+            Tupla (cliente, reservas). El cliente es None si no existe; las
+            reservas están ordenadas por id
+        """
+        rows = self.query_all(
+            """
+            SELECT c.id_cliente, c.nombre, c.apellido, c.telefono, c.mail,
+                   r.id_reserva, r.monto_total, r.fecha_reserva, r.estado_reserva,
+                   rd.id_detalle, t.id_turno, t.fecha AS fecha_turno, t.id_horario,
+                   ca.nombre AS nombre_cancha
+            FROM Cliente c
+            LEFT JOIN Reserva r ON r.id_cliente = c.id_cliente
+            LEFT JOIN ReservaDetalle rd ON rd.id_reserva = r.id_reserva
+            LEFT JOIN Turno t ON t.id_turno = rd.id_turno
+            LEFT JOIN Cancha ca ON ca.id_cancha = t.id_cancha
+            WHERE c.id_cliente = ?
+            ORDER BY r.id_reserva, rd.id_detalle
+            """,
+            (id_cliente,),
+        )
+        if not rows:
+            return None, []
+
+        cliente = cliente_from_dict(dict(rows[0]))
+        reservas: List[ReservaReporte] = []
+        actual: Optional[ReservaReporte] = None
+        for row in rows:
+            if row["id_reserva"] is None:
+                # Cliente sin reservas (fila única del LEFT JOIN)
+                continue
+            if actual is None or actual.reserva.id_reserva != row["id_reserva"]:
+                actual = ReservaReporte(reserva_from_dict(dict(row)))
+                reservas.append(actual)
+            if row["id_detalle"] is not None:
+                actual.detalles.append(DetalleReporte(
+                    id_turno=row["id_turno"],
+                    nombre_cancha=row["nombre_cancha"],
+                    fecha=row["fecha_turno"],
+                    id_horario=row["id_horario"],
+                ))
+        return cliente, reservas
+
+    def get_reservas_por_cancha(
+        self, id_cancha: int, fecha_inicio: str, fecha_fin: str
+    ) -> Tuple[Optional[str], List[TurnoReservadoReporte]]:
+        """
+        Obtiene los turnos reservados de una cancha en un período
+
+        Una sola consulta que parte de la cancha (para tener su nombre aunque no
+        haya reservas) y filtra el período en SQL; con idx_turno_cancha_fecha
+        solo se leen los turnos del rango, no toda la historia de la cancha.
+
+        Args:
+            id_cancha: Id de la cancha
+            fecha_inicio: Fecha inicial inclusive (YYYY-MM-DD)
+            fecha_fin: Fecha final inclusive (YYYY-MM-DD)
+
+        Returns:
+            Tupla (nombre de la cancha, ítems ordenados por fecha y turno). El
+            nombre es None si la cancha no existe
+        """
+        rows = self.query_all(
+            """
+            SELECT ca.nombre AS nombre_cancha,
+                   rd.id_detalle, rd.id_reserva, rd.precio_total_item,
+                   t.id_turno, t.fecha,
+                   cl.nombre AS nombre_cliente, cl.apellido AS apellido_cliente
+            FROM Cancha ca
+            LEFT JOIN Turno t ON t.id_cancha = ca.id_cancha AND t.fecha BETWEEN ? AND ?
+            LEFT JOIN ReservaDetalle rd ON rd.id_turno = t.id_turno
+            LEFT JOIN Reserva r ON r.id_reserva = rd.id_reserva
+            LEFT JOIN Cliente cl ON cl.id_cliente = r.id_cliente
+            WHERE ca.id_cancha = ?
+            ORDER BY t.fecha, t.id_turno, rd.id_detalle
+            """,
+            (fecha_inicio, fecha_fin, id_cancha),
+        )
+        if not rows:
+            return None, []
+
+        items = [
+            TurnoReservadoReporte(
+                id_reserva=row["id_reserva"],
+                id_turno=row["id_turno"],
+                fecha=row["fecha"],
+                nombre_cliente=row["nombre_cliente"],
+                apellido_cliente=row["apellido_cliente"],
+                precio_total_item=Decimal(str(row["precio_total_item"])),
+            )
+            # Los turnos del período sin reservas vienen con detalle NULL
+            for row in rows if row["id_detalle"] is not None
+        ]
+        return rows[0]["nombre_cancha"], items
@@ -2,15 +2,26 @@
 ReservaDetalleRepository - DAO para la tabla ReservaDetalle
 """
 
-from typing import List, Optional
-from classes.reserva_detalle import ReservaDetalle, from_dict as reserva_detalle_from_dict
-from .base_repository import BaseRepository
+from typing import List, Optional, Tuple
+from classes.reserva_detalle import ReservaDetalle, ReservaDetalleLectura
+from .base_repository import BaseRepository, parse_decimal
 
 
 class ReservaDetalleRepository(BaseRepository):
     """Repositorio para manejar operaciones CRUD de la entidad ReservaDetalle"""
 
     TABLE = "ReservaDetalle"
+    KEY_COLUMNS = ("id_detalle",)
+    ENTITY = ReservaDetalle
+    READ_ENTITY = ReservaDetalleLectura
+    ROW_FIELDS = (
+        ("id_detalle", "id_detalle", None),
+        ("id_reserva", "id_reserva", None),
+        ("id_turno", "id_turno", None),
+        ("precio_total_item", "precio_total_item", parse_decimal),
+    )
+    INSERT_COLUMNS = ("id_reserva", "id_turno", "precio_total_item")
+    ID_ATTR = "id_detalle"
 
     def create(self, reserva_detalle: ReservaDetalle) -> ReservaDetalle:
         """
@@ -23,7 +34,7 @@ class ReservaDetalleRepository(BaseRepository):
             El objeto ReservaDetalle con el id asignado
         """
         sql = f"INSERT INTO {self.TABLE} (id_reserva, id_turno, precio_total_item) VALUES (?, ?, ?)"
-        cur = self.execute(sql, (reserva_detalle.id_reserva, reserva_detalle.id_turno, str(reserva_detalle.precio_total_item)))
+        cur = self.execute(sql, self.insert_values(reserva_detalle))
         reserva_detalle.id_detalle = cur.lastrowid
         return reserva_detalle
 
@@ -37,10 +48,7 @@ class ReservaDetalleRepository(BaseRepository):
         Returns:
             Objeto ReservaDetalle o None si no existe
         """
-        row = self.query_one(f"SELECT * FROM {self.TABLE} WHERE id_detalle = ?", (id_detalle,))
-        if not row:
-            return None
-        return reserva_detalle_from_dict(dict(row))
+        return self.query_entity(f"SELECT * FROM {self.TABLE} WHERE id_detalle = ?", (id_detalle,))
 
     def get_all(self) -> List[ReservaDetalle]:
         """
@@ -49,8 +57,36 @@ class ReservaDetalleRepository(BaseRepository):
         Returns:
             Lista de objetos ReservaDetalle
         """
-        rows = self.query_all(f"SELECT * FROM {self.TABLE}")
-        return [reserva_detalle_from_dict(dict(row)) for row in rows]
+        return self.query_entities(f"SELECT * FROM {self.TABLE}")
+
+    def get_page(
+        self,
+        limit: Optional[int],
+        after: Optional[str] = None,
+        id_reserva: Optional[int] = None,
+        id_turno: Optional[int] = None,
+    ) -> Tuple[List[ReservaDetalleLectura], Optional[str]]:
+        """
+        Obtiene una página de ReservaDetalle ordenada por id_detalle, con filtros opcionales
+
+        Args:
+            limit: Cantidad máxima de resultados
+            after: Cursor devuelto por la página anterior (None = primera página)
+            id_reserva: Id de la reserva (opcional)
+            id_turno: Id del turno (opcional)
+
+        Returns:
+            Tupla (lista de ReservaDetalleLectura, cursor de la página siguiente o None)
+        """
+        conditions = []
+        params = []
+        if id_reserva is not None:
+            conditions.append("id_reserva = ?")
+            params.append(id_reserva)
+        if id_turno is not None:
+            conditions.append("id_turno = ?")
+            params.append(id_turno)
+        return self.query_page(limit, after, conditions, params)
 
     def get_by_reserva(self, id_reserva: int) -> List[ReservaDetalle]:
         """
@@ -62,8 +98,7 @@ class ReservaDetalleRepository(BaseRepository):
         Returns:
             Lista de objetos ReservaDetalle
         """
-        rows = self.query_all(f"SELECT * FROM {self.TABLE} WHERE id_reserva = ?", (id_reserva,))
-        return [reserva_detalle_from_dict(dict(row)) for row in rows]
+        return self.query_entities(f"SELECT * FROM {self.TABLE} WHERE id_reserva = ?", (id_reserva,))
 
     def get_by_turno(self, id_turno: int) -> List[ReservaDetalle]:
         """
@@ -75,8 +110,7 @@ class ReservaDetalleRepository(BaseRepository):
         Returns:
             Lista de objetos ReservaDetalle
         """
-        rows = self.query_all(f"SELECT * FROM {self.TABLE} WHERE id_turno = ?", (id_turno,))
-        return [reserva_detalle_from_dict(dict(row)) for row in rows]
+        return self.query_entities(f"SELECT * FROM {self.TABLE} WHERE id_turno = ?", (id_turno,))
 
     def update(self, reserva_detalle: ReservaDetalle) -> None:
         """
@@ -2,16 +2,40 @@
 ReservaRepository - DAO para la tabla Reserva
 """
 
-from typing import List, Optional
+from typing import Any, List, Optional, Tuple
 from datetime import date
-from classes.reserva import Reserva, from_dict as reserva_from_dict
-from .base_repository import BaseRepository
+from classes.reserva import Reserva, ReservaLectura, estado_reserva_desde_nombre
+from .base_repository import BaseRepository, case_variants, parse_date, parse_decimal
 
 
 class ReservaRepository(BaseRepository):
     """Repositorio para manejar operaciones CRUD de la entidad Reserva"""
 
     TABLE = "Reserva"
+    KEY_COLUMNS = ("id_reserva",)
+    ENTITY = Reserva
+    READ_ENTITY = ReservaLectura
+    ROW_FIELDS = (
+        ("id_reserva", "id_reserva", None),
+        ("id_cliente", "id_cliente", None),
+        ("monto_total", "monto_total", parse_decimal),
+        ("fecha_reserva", "fecha_reserva", parse_date),
+        ("estado", "estado_reserva", estado_reserva_desde_nombre),
+    )
+    INSERT_COLUMNS = ("id_cliente", "monto_total", "fecha_reserva", "estado_reserva")
+    ID_ATTR = "id_reserva"
+
+    def insert_values(self, reserva: Reserva) -> Tuple[Any, ...]:
+        """
+        Valores de INSERT_COLUMNS para un Reserva
+
+        Args:
+            reserva: Objeto Reserva a insertar
+
+        Returns:
+            Tupla de valores para el INSERT
+        """
+        return (reserva.id_cliente, str(reserva.monto_total), reserva.fecha_reserva, reserva.estado_nombre)
 
     def create(self, reserva: Reserva) -> Reserva:
         """
@@ -24,7 +48,7 @@ class ReservaRepository(BaseRepository):
             El objeto Reserva con el id asignado
         """
         sql = f"INSERT INTO {self.TABLE} (id_cliente, monto_total, fecha_reserva, estado_reserva) VALUES (?, ?, ?, ?)"
-        cur = self.execute(sql, (reserva.id_cliente, str(reserva.monto_total), reserva.fecha_reserva, reserva.estado_nombre))
+        cur = self.execute(sql, self.insert_values(reserva))
         reserva.id_reserva = cur.lastrowid
         return reserva
 
@@ -38,10 +62,7 @@ class ReservaRepository(BaseRepository):
         Returns:
             Objeto Reserva o None si no existe
         """
-        row = self.query_one(f"SELECT * FROM {self.TABLE} WHERE id_reserva = ?", (id_reserva,))
-        if not row:
-            return None
-        return reserva_from_dict(dict(row))
+        return self.query_entity(f"SELECT * FROM {self.TABLE} WHERE id_reserva = ?", (id_reserva,))
 
     def get_all(self) -> List[Reserva]:
         """
@@ -50,8 +71,47 @@ class ReservaRepository(BaseRepository):
         Returns:
             Lista de objetos Reserva
         """
-        rows = self.query_all(f"SELECT * FROM {self.TABLE}")
-        return [reserva_from_dict(dict(row)) for row in rows]
+        return self.query_entities(f"SELECT * FROM {self.TABLE}")
+
+    def get_page(
+        self,
+        limit: Optional[int],
+        after: Optional[str] = None,
+        id_cliente: Optional[int] = None,
+        estado: Optional[str] = None,
+        fecha_desde: Optional[date] = None,
+        fecha_hasta: Optional[date] = None,
+    ) -> Tuple[List[ReservaLectura], Optional[str]]:
+        """
+        Obtiene una página de Reserva ordenada por id_reserva, con filtros opcionales
+
+        Args:
+            limit: Cantidad máxima de resultados
+            after: Cursor devuelto por la página anterior (None = primera página)
+            id_cliente: Id del cliente (opcional)
+            estado: Estado de la reserva (opcional, sin distinguir mayúsculas)
+            fecha_desde: Fecha de reserva mínima inclusive (opcional)
+            fecha_hasta: Fecha de reserva máxima inclusive (opcional)
+
+        Returns:
+            Tupla (lista de ReservaLectura, cursor de la página siguiente o None)
+        """
+        conditions = []
+        params = []
+        if id_cliente is not None:
+            conditions.append("id_cliente = ?")
+            params.append(id_cliente)
+        if estado is not None:
+            variantes = case_variants(estado)
+            conditions.append(f"estado_reserva IN ({', '.join('?' for _ in variantes)})")
+            params.extend(variantes)
+        if fecha_desde is not None:
+            conditions.append("fecha_reserva >= ?")
+            params.append(fecha_desde.isoformat())
+        if fecha_hasta is not None:
+            conditions.append("fecha_reserva <= ?")
+            params.append(fecha_hasta.isoformat())
+        return self.query_page(limit, after, conditions, params)
 
     def get_by_cliente(self, id_cliente: int) -> List[Reserva]:
         """
@@ -63,8 +123,7 @@ class ReservaRepository(BaseRepository):
         Returns:
             Lista de objetos Reserva
         """
-        rows = self.query_all(f"SELECT * FROM {self.TABLE} WHERE id_cliente = ?", (id_cliente,))
-        return [reserva_from_dict(dict(row)) for row in rows]
+        return self.query_entities(f"SELECT * FROM {self.TABLE} WHERE id_cliente = ?", (id_cliente,))
 
     def get_by_estado(self, estado_reserva: str) -> List[Reserva]:
         """
@@ -76,8 +135,7 @@ class ReservaRepository(BaseRepository):
         Returns:
             Lista de objetos Reserva
         """
-        rows = self.query_all(f"SELECT * FROM {self.TABLE} WHERE estado_reserva = ?", (estado_reserva,))
-        return [reserva_from_dict(dict(row)) for row in rows]
+        return self.query_entities(f"SELECT * FROM {self.TABLE} WHERE estado_reserva = ?", (estado_reserva,))
 
     def get_by_fecha(self, fecha: date) -> List[Reserva]:
         """
@@ -89,8 +147,7 @@ class ReservaRepository(BaseRepository):
         Returns:
             Lista de objetos Reserva
         """
-        rows = self.query_all(f"SELECT * FROM {self.TABLE} WHERE fecha_reserva = ?", (fecha,))
-        return [reserva_from_dict(dict(row)) for row in rows]
+        return self.query_entities(f"SELECT * FROM {self.TABLE} WHERE fecha_reserva = ?", (fecha,))
 
     def update(self, reserva: Reserva) -> None:
         """
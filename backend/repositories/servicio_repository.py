@@ -2,15 +2,25 @@
 ServicioRepository - DAO para la tabla Servicio
 """
 
-from typing import List, Optional
-from classes.servicio import Servicio, from_dict as servicio_from_dict
-from .base_repository import BaseRepository
+from typing import List, Optional, Tuple
+from classes.servicio import Servicio
+from .base_repository import parse_decimal
+from .catalog_cache import CachedCatalogRepository
 
 
-class ServicioRepository(BaseRepository):
-    """Repositorio para manejar operaciones CRUD de la entidad Servicio"""
+class ServicioRepository(CachedCatalogRepository[Servicio]):
+    """Repositorio para manejar operaciones CRUD de la entidad Servicio (con caché de lectura)"""
 
     TABLE = "Servicio"
+    ID_COLUMN = "id_servicio"
+    ENTITY = Servicio
+    ROW_FIELDS = (
+        ("id_servicio", "id_servicio", None),
+        ("descripcion", "descripcion", None),
+        ("costo_servicio", "costo_servicio", parse_decimal),
+    )
+    INSERT_COLUMNS = ("descripcion", "costo_servicio")
+    ID_ATTR = "id_servicio"
 
     def create(self, servicio: Servicio) -> Servicio:
         """
@@ -23,7 +33,8 @@ class ServicioRepository(BaseRepository):
             El objeto Servicio con el id asignado
         """
         sql = f"INSERT INTO {self.TABLE} (descripcion, costo_servicio) VALUES (?, ?)"
-        cur = self.execute(sql, (servicio.descripcion, str(servicio.costo_servicio)))
+        cur = self.execute(sql, self.insert_values(servicio))
+        self.invalidate_cache()
         servicio.id_servicio = cur.lastrowid
         return servicio
 
@@ -37,10 +48,7 @@ class ServicioRepository(BaseRepository):
         Returns:
             Objeto Servicio o None si no existe
         """
-        row = self.query_one(f"SELECT * FROM {self.TABLE} WHERE id_servicio = ?", (id_servicio,))
-        if not row:
-            return None
-        return servicio_from_dict(dict(row))
+        return self.cached_get_by_id(id_servicio)
 
     def get_all(self) -> List[Servicio]:
         """
@@ -49,8 +57,20 @@ class ServicioRepository(BaseRepository):
         Returns:
             Lista de objetos Servicio
         """
-        rows = self.query_all(f"SELECT * FROM {self.TABLE}")
-        return [servicio_from_dict(dict(row)) for row in rows]
+        return self.cached_get_all()
+
+    def get_page(self, limit: Optional[int], after: Optional[str] = None) -> Tuple[List[Servicio], Optional[str]]:
+        """
+        Obtiene una página de Servicio ordenada por id, desde el caché
+
+        Args:
+            limit: Cantidad máxima de resultados
+            after: Cursor devuelto por la página anterior (None = primera página)
+
+        Returns:
+            Tupla (lista de Servicio, cursor de la página siguiente o None)
+        """
+        return self.cached_get_page(limit, after)
 
     def update(self, servicio: Servicio) -> None:
         """
@@ -61,6 +81,7 @@ class ServicioRepository(BaseRepository):
         """
         sql = f"UPDATE {self.TABLE} SET descripcion = ?, costo_servicio = ? WHERE id_servicio = ?"
         self.execute(sql, (servicio.descripcion, str(servicio.costo_servicio), servicio.id_servicio))
+        self.invalidate_cache()
 
     def delete(self, id_servicio: int) -> None:
         """
@@ -71,6 +92,7 @@ class ServicioRepository(BaseRepository):
         """
         sql = f"DELETE FROM {self.TABLE} WHERE id_servicio = ?"
         self.execute(sql, (id_servicio,))
+        self.invalidate_cache()
 
     def exists(self, id_servicio: int) -> bool:
         """
@@ -82,5 +104,4 @@ class ServicioRepository(BaseRepository):
         Returns:
             True si existe, False en caso contrario
         """
-        row = self.query_one(f"SELECT 1 FROM {self.TABLE} WHERE id_servicio = ?", (id_servicio,))
-        return row is not None
+        return self.cached_get_by_id(id_servicio) is not None
@@ -2,15 +2,25 @@
 TipoCanchaRepository - DAO para la tabla TipoCancha
 """
 
-from typing import List, Optional
-from classes.tipo_cancha import TipoCancha, from_dict as tipo_cancha_from_dict
-from .base_repository import BaseRepository
+from typing import List, Optional, Tuple
+from classes.tipo_cancha import TipoCancha
+from .base_repository import parse_decimal
+from .catalog_cache import CachedCatalogRepository
 
 
-class TipoCanchaRepository(BaseRepository):
-    """Repositorio para manejar operaciones CRUD de la entidad TipoCancha"""
+class TipoCanchaRepository(CachedCatalogRepository[TipoCancha]):
+    """Repositorio para manejar operaciones CRUD de la entidad TipoCancha (con caché de lectura)"""
 
     TABLE = "TipoCancha"
+    ID_COLUMN = "id_tipo"
+    ENTITY = TipoCancha
+    ROW_FIELDS = (
+        ("id_tipo", "id_tipo", None),
+        ("descripcion", "descripcion", None),
+        ("precio_hora", "precio_hora", parse_decimal),
+    )
+    INSERT_COLUMNS = ("descripcion", "precio_hora")
+    ID_ATTR = "id_tipo"
 
     def create(self, tipo_cancha: TipoCancha) -> TipoCancha:
         """
@@ -23,7 +33,8 @@ class TipoCanchaRepository(BaseRepository):
             El objeto TipoCancha con el id asignado
         """
         sql = f"INSERT INTO {self.TABLE} (descripcion, precio_hora) VALUES (?, ?)"
-        cur = self.execute(sql, (tipo_cancha.descripcion, str(tipo_cancha.precio_hora)))
+        cur = self.execute(sql, self.insert_values(tipo_cancha))
+        self.invalidate_cache()
         tipo_cancha.id_tipo = cur.lastrowid
         return tipo_cancha
 
@@ -37,10 +48,7 @@ class TipoCanchaRepository(BaseRepository):
         Returns:
             Objeto TipoCancha o None si no existe
         """
-        row = self.query_one(f"SELECT * FROM {self.TABLE} WHERE id_tipo = ?", (id_tipo,))
-        if not row:
-            return None
-        return tipo_cancha_from_dict(dict(row))
+        return self.cached_get_by_id(id_tipo)
 
     def get_all(self) -> List[TipoCancha]:
         """
@@ -49,8 +57,20 @@ class TipoCanchaRepository(BaseRepository):
         Returns:
             Lista de objetos TipoCancha
         """
-        rows = self.query_all(f"SELECT * FROM {self.TABLE}")
-        return [tipo_cancha_from_dict(dict(row)) for row in rows]
+        return self.cached_get_all()
+
+    def get_page(self, limit: Optional[int], after: Optional[str] = None) -> Tuple[List[TipoCancha], Optional[str]]:
+        """
+        Obtiene una página de TipoCancha ordenada por id, desde el caché
+
+        Args:
+            limit: Cantidad máxima de resultados
+            after: Cursor devuelto por la página anterior (None = primera página)
+
+        Returns:
+            Tupla (lista de TipoCancha, cursor de la página siguiente o None)
+        """
+        return self.cached_get_page(limit, after)
 
     def update(self, tipo_cancha: TipoCancha) -> None:
         """
@@ -61,6 +81,7 @@ class TipoCanchaRepository(BaseRepository):
         """
         sql = f"UPDATE {self.TABLE} SET descripcion = ?, precio_hora = ? WHERE id_tipo = ?"
         self.execute(sql, (tipo_cancha.descripcion, str(tipo_cancha.precio_hora), tipo_cancha.id_tipo))
+        self.invalidate_cache()
 
     def delete(self, id_tipo: int) -> None:
         """
@@ -71,6 +92,7 @@ class TipoCanchaRepository(BaseRepository):
         """
         sql = f"DELETE FROM {self.TABLE} WHERE id_tipo = ?"
         self.execute(sql, (id_tipo,))
+        self.invalidate_cache()
 
     def exists(self, id_tipo: int) -> bool:
         """
@@ -82,5 +104,4 @@ class TipoCanchaRepository(BaseRepository):
         Returns:
             True si existe, False en caso contrario
         """
-        row = self.query_one(f"SELECT 1 FROM {self.TABLE} WHERE id_tipo = ?", (id_tipo,))
-        return row is not None
+        return self.cached_get_by_id(id_tipo) is not None
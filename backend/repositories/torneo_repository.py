@@ -2,16 +2,26 @@
 TorneoRepository - DAO para la tabla Torneo
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import date
-from classes.torneo import Torneo, from_dict as torneo_from_dict
-from .base_repository import BaseRepository
+from classes.torneo import Torneo
+from .base_repository import BaseRepository, parse_date
 
 
 class TorneoRepository(BaseRepository):
     """Repositorio para manejar operaciones CRUD de la entidad Torneo"""
 
     TABLE = "Torneo"
+    KEY_COLUMNS = ("id_torneo",)
+    ENTITY = Torneo
+    ROW_FIELDS = (
+        ("id_torneo", "id_torneo", None),
+        ("nombre", "nombre", None),
+        ("fecha_inicio", "fecha_inicio", parse_date),
+        ("fecha_fin", "fecha_fin", parse_date),
+    )
+    INSERT_COLUMNS = ("nombre", "fecha_inicio", "fecha_fin")
+    ID_ATTR = "id_torneo"
 
     def create(self, torneo: Torneo) -> Torneo:
         """
@@ -24,7 +34,7 @@ class TorneoRepository(BaseRepository):
             El objeto Torneo con el id asignado
         """
         sql = f"INSERT INTO {self.TABLE} (nombre, fecha_inicio, fecha_fin) VALUES (?, ?, ?)"
-        cur = self.execute(sql, (torneo.nombre, torneo.fecha_inicio, torneo.fecha_fin))
+        cur = self.execute(sql, self.insert_values(torneo))
         torneo.id_torneo = cur.lastrowid
         return torneo
 
@@ -38,10 +48,7 @@ class TorneoRepository(BaseRepository):
         Returns:
             Objeto Torneo o None si no existe
         """
-        row = self.query_one(f"SELECT * FROM {self.TABLE} WHERE id_torneo = ?", (id_torneo,))
-        if not row:
-            return None
-        return torneo_from_dict(dict(row))
+        return self.query_entity(f"SELECT * FROM {self.TABLE} WHERE id_torneo = ?", (id_torneo,))
 
     def get_all(self) -> List[Torneo]:
         """
@@ -50,8 +57,20 @@ class TorneoRepository(BaseRepository):
         Returns:
             Lista de objetos Torneo
         """
-        rows = self.query_all(f"SELECT * FROM {self.TABLE}")
-        return [torneo_from_dict(dict(row)) for row in rows]
+        return self.query_entities(f"SELECT * FROM {self.TABLE}")
+
+    def get_page(self, limit: Optional[int], after: Optional[str] = None) -> Tuple[List[Torneo], Optional[str]]:
+        """
+        Obtiene una página de Torneo ordenada por id_torneo
+
+        Args:
+            limit: Cantidad máxima de resultados
+            after: Cursor devuelto por la página anterior (None = primera página)
+
+        Returns:
+            Tupla (lista de Torneo, cursor de la página siguiente o None)
+        """
+        return self.query_page(limit, after)
 
     def get_by_nombre(self, nombre: str) -> List[Torneo]:
         """
@@ -63,8 +82,7 @@ class TorneoRepository(BaseRepository):
         Returns:
             Lista de objetos Torneo
         """
-        rows = self.query_all(f"SELECT * FROM {self.TABLE} WHERE nombre LIKE ?", (f"%{nombre}%",))
-        return [torneo_from_dict(dict(row)) for row in rows]
+        return self.query_entities(f"SELECT * FROM {self.TABLE} WHERE nombre LIKE ?", (f"%{nombre}%",))
 
     def get_by_fecha_inicio(self, fecha_inicio: date) -> List[Torneo]:
         """
@@ -76,8 +94,7 @@ class TorneoRepository(BaseRepository):
         Returns:
             Lista de objetos Torneo
         """
-        rows = self.query_all(f"SELECT * FROM {self.TABLE} WHERE fecha_inicio = ?", (fecha_inicio,))
-        return [torneo_from_dict(dict(row)) for row in rows]
+        return self.query_entities(f"SELECT * FROM {self.TABLE} WHERE fecha_inicio = ?", (fecha_inicio,))
 
     def get_activos(self, fecha_actual: date) -> List[Torneo]:
         """
@@ -89,11 +106,10 @@ class TorneoRepository(BaseRepository):
         Returns:
             Lista de objetos Torneo
         """
-        rows = self.query_all(
+        return self.query_entities(
             f"SELECT * FROM {self.TABLE} WHERE fecha_inicio <= ? AND fecha_fin >= ?",
             (fecha_actual, fecha_actual),
         )
-        return [torneo_from_dict(dict(row)) for row in rows]
 
     def update(self, torneo: Torneo) -> None:
         """
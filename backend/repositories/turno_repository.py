@@ -2,16 +2,41 @@
 TurnoRepository - DAO para la tabla Turno
 """
 
-from typing import List, Optional
+import sqlite3
+from typing import Any, List, Optional, Sequence, Tuple
 from datetime import date
-from classes.turno import Turno, from_dict as turno_from_dict
-from .base_repository import BaseRepository
+from classes.turno import Turno, TurnoLectura, estado_turno_desde_nombre
+from .base_repository import BaseRepository, case_variants, parse_date
 
 
 class TurnoRepository(BaseRepository):
     """Repositorio para manejar operaciones CRUD de la entidad Turno"""
 
     TABLE = "Turno"
+    KEY_COLUMNS = ("id_turno",)
+    ENTITY = Turno
+    READ_ENTITY = TurnoLectura
+    ROW_FIELDS = (
+        ("id_turno", "id_turno", None),
+        ("id_cancha", "id_cancha", None),
+        ("id_horario", "id_horario", None),
+        ("fecha", "fecha", parse_date),
+        ("estado", "estado_turno", estado_turno_desde_nombre),
+    )
+    INSERT_COLUMNS = ("id_cancha", "id_horario", "fecha", "estado_turno")
+    ID_ATTR = "id_turno"
+
+    def insert_values(self, turno: Turno) -> Tuple[Any, ...]:
+        """
+        Valores de INSERT_COLUMNS para un Turno
+
+        Args:
+            turno: Objeto Turno a insertar
+
+        Returns:
+            Tupla de valores para el INSERT
+        """
+        return (turno.id_cancha, turno.id_horario, turno.fecha, turno.estado_nombre)
 
     def create(self, turno: Turno) -> Turno:
         """
@@ -24,7 +49,7 @@ class TurnoRepository(BaseRepository):
             El objeto Turno con el id asignado
         """
         sql = f"INSERT INTO {self.TABLE} (id_cancha, id_horario, fecha, estado_turno) VALUES (?, ?, ?, ?)"
-        cur = self.execute(sql, (turno.id_cancha, turno.id_horario, turno.fecha, turno.estado_nombre))
+        cur = self.execute(sql, self.insert_values(turno))
         turno.id_turno = cur.lastrowid
         return turno
 
@@ -38,10 +63,7 @@ class TurnoRepository(BaseRepository):
         Returns:
             Objeto Turno o None si no existe
         """
-        row = self.query_one(f"SELECT * FROM {self.TABLE} WHERE id_turno = ?", (id_turno,))
-        if not row:
-            return None
-        return turno_from_dict(dict(row))
+        return self.query_entity(f"SELECT * FROM {self.TABLE} WHERE id_turno = ?", (id_turno,))
 
     def get_all(self) -> List[Turno]:
         """
@@ -50,8 +72,42 @@ class TurnoRepository(BaseRepository):
         Returns:
             Lista de objetos Turno
         """
-        rows = self.query_all(f"SELECT * FROM {self.TABLE}")
-        return [turno_from_dict(dict(row)) for row in rows]
+        return self.query_entities(f"SELECT * FROM {self.TABLE}")
+
+    def get_page(
+        self,
+        limit: Optional[int],
+        after: Optional[str] = None,
+        fecha: Optional[date] = None,
+        id_cancha: Optional[int] = None,
+        estado: Optional[str] = None,
+    ) -> Tuple[List[TurnoLectura], Optional[str]]:
+        """
+        Obtiene una página de Turno ordenada por id_turno, con filtros opcionales
+
+        Args:
+            limit: Cantidad máxima de resultados
+            after: Cursor devuelto por la página anterior (None = primera página)
+            fecha: Fecha exacta del turno (opcional)
+            id_cancha: Id de la cancha (opcional)
+            estado: Estado del turno (opcional, sin distinguir mayúsculas)
+
+        Returns:
+            Tupla (lista de TurnoLectura, cursor de la página siguiente o None)
+        """
+        conditions = []
+        params = []
+        if fecha is not None:
+            conditions.append("fecha = ?")
+            params.append(fecha.isoformat())
+        if id_cancha is not None:
+            conditions.append("id_cancha = ?")
+            params.append(id_cancha)
+        if estado is not None:
+            variantes = case_variants(estado)
+            conditions.append(f"estado_turno IN ({', '.join('?' for _ in variantes)})")
+            params.extend(variantes)
+        return self.query_page(limit, after, conditions, params)
 
     def get_by_cancha(self, id_cancha: int) -> List[Turno]:
         """
@@ -63,8 +119,7 @@ class TurnoRepository(BaseRepository):
         Returns:
             Lista de objetos Turno
         """
-        rows = self.query_all(f"SELECT * FROM {self.TABLE} WHERE id_cancha = ?", (id_cancha,))
-        return [turno_from_dict(dict(row)) for row in rows]
+        return self.query_entities(f"SELECT * FROM {self.TABLE} WHERE id_cancha = ?", (id_cancha,))
 
     def get_by_fecha(self, fecha: date) -> List[Turno]:
         """
@@ -76,8 +131,7 @@ class TurnoRepository(BaseRepository):
         Returns:
             Lista de objetos Turno
         """
-        rows = self.query_all(f"SELECT * FROM {self.TABLE} WHERE fecha = ?", (fecha,))
-        return [turno_from_dict(dict(row)) for row in rows]
+        return self.query_entities(f"SELECT * FROM {self.TABLE} WHERE fecha = ?", (fecha,))
 
     def get_by_cancha_y_fecha(self, id_cancha: int, fecha: date) -> List[Turno]:
         """
@@ -90,11 +144,10 @@ class TurnoRepository(BaseRepository):
         Returns:
             Lista de objetos Turno
         """
-        rows = self.query_all(
+        return self.query_entities(
             f"SELECT * FROM {self.TABLE} WHERE id_cancha = ? AND fecha = ?",
             (id_cancha, fecha),
         )
-        return [turno_from_dict(dict(row)) for row in rows]
 
     def update(self, turno: Turno) -> None:
         """
@@ -128,13 +181,139 @@ class TurnoRepository(BaseRepository):
         Returns:
             Objeto Turno o None si no existe
         """
-        row = self.query_one(
+        return self.query_entity(
             f"SELECT * FROM {self.TABLE} WHERE id_cancha = ? AND id_horario = ? AND fecha = ?",
             (id_cancha, id_horario, fecha),
         )
-        if not row:
-            return None
-        return turno_from_dict(dict(row))
+
+    def get_by_slots(self, slots: Sequence[Tuple[int, int, date]]) -> List[Turno]:
+        """
+        Obtiene en una sola consulta los turnos existentes para varias
+        combinaciones de cancha, horario y fecha
+
+        Args:
+            slots: Tuplas (id_cancha, id_horario, fecha)
+
+        Returns:
+            Lista de objetos Turno que ya existen para alguna de las combinaciones
+        """
+        if not slots:
+            return []
+        values = ", ".join("(?, ?, ?)" for _ in slots)
+        params = tuple(v for (id_cancha, id_horario, fecha) in slots for v in (id_cancha, id_horario, fecha.isoformat()))
+        sql = f"""
+            WITH slots(id_cancha, id_horario, fecha) AS (VALUES {values})
+            SELECT t.* FROM {self.TABLE} t
+            JOIN slots s ON t.id_cancha = s.id_cancha AND t.id_horario = s.id_horario AND t.fecha = s.fecha
+        """
+        return self.query_entities(sql, params)
+
+    def reservar_disponibles(self, ids_turno: Sequence[int], estado_disponible: str, estado_reservado: str) -> int:
+        """
+        Pasa a reservados los turnos indicados que sigan disponibles
+
+        Args:
+            ids_turno: Ids de los turnos a reservar
+            estado_disponible: Estado que deben tener para poder reservarse (sin distinguir mayúsculas)
+            estado_reservado: Estado a asignar
+
+        Returns:
+            Cantidad de turnos efectivamente reservados
+        """
+        if not ids_turno:
+            return 0
+        placeholders = ", ".join("?" for _ in ids_turno)
+        sql = (
+            f"UPDATE {self.TABLE} SET estado_turno = ? "
+            f"WHERE id_turno IN ({placeholders}) AND lower(estado_turno) = lower(?)"
+        )
+        cur = self.execute(sql, (estado_reservado, *ids_turno, estado_disponible))
+        return cur.rowcount
+
+    def create_for_range(self, fecha_desde: date, fecha_hasta: date, estado_turno: str) -> int:
+        """
+        Crea en una sola sentencia los turnos de todas las canchas y horarios
+        para cada día del rango, omitiendo los que ya existen
+
+        Args:
+            fecha_desde: Primer día del rango (inclusive)
+            fecha_hasta: Último día del rango (inclusive)
+            estado_turno: Estado con el que se crean los turnos
+
+        Returns:
+            Cantidad de turnos insertados
+        """
+        # El WITH va dentro del INSERT para que sqlite3 informe rowcount
+        sql = f"""
+            INSERT INTO {self.TABLE} (id_cancha, id_horario, fecha, estado_turno)
+            WITH RECURSIVE dias(fecha) AS (
+                SELECT date(?)
+                UNION ALL
+                SELECT date(fecha, '+1 day') FROM dias WHERE fecha < date(?)
+            )
+            SELECT c.id_cancha, h.id_horario, d.fecha, ?
+            FROM dias d
+            CROSS JOIN Cancha c
+            CROSS JOIN Horario h
+            WHERE NOT EXISTS (
+                SELECT 1 FROM {self.TABLE} t
+                WHERE t.id_cancha = c.id_cancha AND t.id_horario = h.id_horario AND t.fecha = d.fecha
+            )
+        """
+        cur = self.execute(sql, (fecha_desde.isoformat(), fecha_hasta.isoformat(), estado_turno))
+        return cur.rowcount
+
+    def expire_past(self, fecha_actual: date, hora_actual: str, estado_disponible: str, estado_expirado: str) -> int:
+        """
+        Marca como expirados, en una sola sentencia, los turnos disponibles cuya
+        fecha ya pasó o que son de hoy y cuyo horario ya terminó
+
+        Args:
+            fecha_actual: Fecha de referencia
+            hora_actual: Hora de referencia en formato HH:MM:SS
+            estado_disponible: Estado de los turnos a considerar (sin distinguir mayúsculas)
+            estado_expirado: Estado a asignar
+
+        Returns:
+            Cantidad de turnos actualizados
+        """
+        fecha = fecha_actual.isoformat()
+        sql = f"""
+            UPDATE {self.TABLE} SET estado_turno = ?
+            WHERE fecha <= ?
+              AND lower(estado_turno) = lower(?)
+              AND EXISTS (
+                  SELECT 1 FROM Horario h
+                  WHERE h.id_horario = {self.TABLE}.id_horario
+                    AND ({self.TABLE}.fecha < ? OR (h.hora_fin IS NOT NULL AND time(h.hora_fin) <= ?))
+              )
+        """
+        cur = self.execute(sql, (estado_expirado, fecha, estado_disponible, fecha, hora_actual))
+        return cur.rowcount
+
+    def get_grilla(self, fecha: date) -> List[sqlite3.Row]:
+        """
+        Obtiene la grilla cancha x horario de una fecha con el turno de cada celda
+
+        Las celdas sin turno creado vienen con id_turno y estado_turno en NULL.
+
+        Args:
+            fecha: Fecha de la grilla
+
+        Returns:
+            Filas (id_cancha, nombre, id_horario, hora_inicio, hora_fin, id_turno, estado_turno)
+            ordenadas por cancha y hora de inicio
+        """
+        sql = f"""
+            SELECT c.id_cancha, c.nombre, h.id_horario, h.hora_inicio, h.hora_fin,
+                   t.id_turno, t.estado_turno
+            FROM Cancha c
+            CROSS JOIN Horario h
+            LEFT JOIN {self.TABLE} t
+                   ON t.id_cancha = c.id_cancha AND t.id_horario = h.id_horario AND t.fecha = ?
+            ORDER BY c.id_cancha, h.hora_inicio, h.id_horario
+        """
+        return self.query_all(sql, (fecha.isoformat(),))
 
     def exists(self, id_turno: int) -> bool:
         """
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from datetime import date
 
 
@@ -26,3 +26,22 @@ class TurnoResponse(TurnoBase):
 
     class Config:
         from_attributes = True
+
+
+class GrillaCancha(BaseModel):
+    id_cancha: int
+    nombre: str
+
+
+class GrillaHorario(BaseModel):
+    id_horario: int
+    hora_inicio: str
+    hora_fin: str
+
+
+class DisponibilidadResponse(BaseModel):
+    fecha: date
+    canchas: List[GrillaCancha] = Field(..., description="Filas de la grilla")
+    horarios: List[GrillaHorario] = Field(..., description="Columnas de la grilla")
+    estados: List[str] = Field(..., description="Un string por cancha con un código por horario: D disponible, N no disponible, - sin turno")
+    turnos: List[List[Optional[int]]] = Field(..., description="id_turno de cada celda (null si no hay turno)")
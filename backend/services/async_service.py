@@ -0,0 +1,59 @@
+"""
+Capa de servicios async para los controllers.
+
+AsyncService envuelve una clase de servicio: cada método se expone como
+corrutina que corre el método completo en un thread del executor de base de
+datos (data/db_executor.py), sobre un servicio construido con la conexión de
+ese thread. Así un request hace un solo salto de thread por llamada al
+servicio y las transacciones del servicio (unit_of_work) quedan enteras en una
+conexión, en lugar de repartir cada sentencia entre threads.
+
+Los métodos de solo lectura van a los threads lectores; el resto al escritor.
+"""
+
+from typing import Any, Callable, Generic, Type, TypeVar
+
+from data.db_executor import DatabaseExecutor
+
+
+S = TypeVar("S")
+
+# Métodos de los servicios que no escriben
+READ_METHODS = frozenset({
+    "get_by_id",
+    "get_by_ids",
+    "get_by_mail",
+    "get_by_cancha",
+    "get_by_torneo",
+    "list_all",
+    "list_page",
+    "disponibilidad",
+})
+
+
+class AsyncService(Generic[S]):
+    """Fachada async de un servicio sync sobre el DatabaseExecutor."""
+
+    def __init__(self, service_cls: Type[S], executor: DatabaseExecutor):
+        """
+        Args:
+            service_cls: Clase del servicio; se construye con connection=<conexión del thread>
+            executor: Executor donde corren las llamadas
+        """
+        self.service_cls = service_cls
+        self.executor = executor
+
+    def _call(self, conn, name: str, args, kwargs) -> Any:
+        service = self.service_cls(connection=conn)
+        return getattr(service, name)(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        if name.startswith("_") or not callable(getattr(self.service_cls, name, None)):
+            raise AttributeError(f"{self.service_cls.__name__} no tiene el método {name}")
+        submit = self.executor.read if name in READ_METHODS else self.executor.write
+
+        async def metodo(*args: Any, **kwargs: Any) -> Any:
+            return await submit(self._call, name, args, kwargs)
+
+        metodo.__name__ = name
+        return metodo
@@ -1,5 +1,5 @@
 import sqlite3
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from classes.cancha import Cancha
 from repositories.cancha_repository import CanchaRepository
 
@@ -20,6 +20,24 @@ class CanchaService:
         self.validate(obj)
         return self.repository.create(obj)
 
+    def insert_many(self, objs: List[Cancha]) -> List[Cancha]:
+        """
+        Valida e inserta un lote de Cancha en una sola transacción
+
+        Si un ítem es inválido no se inserta ninguno; el error indica su
+        posición en el lote.
+        """
+        for i, obj in enumerate(objs):
+            try:
+                self.validate(obj)
+            except ValueError as e:
+                raise ValueError(f"Ítem {i}: {e}") from e
+        try:
+            return self.repository.create_many(objs)
+        except sqlite3.IntegrityError as e:
+            # La única restricción de Cancha es la clave foránea a TipoCancha
+            raise ValueError("Algún id_tipo del lote no existe.") from e
+
     def get_by_id(self, id_cancha: int) -> Optional[Cancha]:
         return self.repository.get_by_id(id_cancha)
 
@@ -32,3 +50,11 @@ class CanchaService:
 
     def list_all(self) -> List[Cancha]:
         return self.repository.get_all()
+
+    def list_page(
+        self,
+        limit: Optional[int],
+        after: Optional[str] = None,
+        id_tipo: Optional[int] = None,
+    ) -> Tuple[List[Cancha], Optional[str]]:
+        return self.repository.get_page(limit, after, id_tipo=id_tipo)
@@ -1,7 +1,8 @@
 import sqlite3
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from classes.cancha_servicio import CanchaServicio
 from repositories.cancha_servicio_repository import CanchaServicioRepository
+from services.exceptions import ConflictoError
 
 
 class CanchaServicioService:
@@ -18,12 +19,43 @@ class CanchaServicioService:
         self.validate(obj)
         return self.repository.create(obj)
 
+    def insert_many(self, objs: List[CanchaServicio]) -> List[CanchaServicio]:
+        """
+        Valida e inserta un lote de CanchaServicio en una sola transacción
+
+        Si un ítem es inválido no se inserta ninguno; el error indica su
+        posición en el lote.
+        """
+        for i, obj in enumerate(objs):
+            try:
+                self.validate(obj)
+            except ValueError as e:
+                raise ValueError(f"Ítem {i}: {e}") from e
+        try:
+            return self.repository.create_many(objs)
+        except sqlite3.IntegrityError as e:
+            if "UNIQUE" in str(e).upper():
+                raise ConflictoError("Alguna relación cancha-servicio del lote ya existe.") from e
+            raise ValueError("Alguna cancha o servicio del lote no existe.") from e
+
     def get_by_ids(self, id_cancha: int, id_servicio: int) -> Optional[CanchaServicio]:
         return self.repository.get_by_ids(id_cancha, id_servicio)
 
     def delete(self, id_cancha: int, id_servicio: int) -> None:
         self.repository.delete(id_cancha, id_servicio)
 
+    def get_by_cancha(self, id_cancha: int) -> List[CanchaServicio]:
+        return self.repository.get_by_cancha(id_cancha)
+
     def list_all(self) -> List[CanchaServicio]:
         return self.repository.get_all()
 
+    def list_page(
+        self,
+        limit: Optional[int],
+        after: Optional[str] = None,
+        id_cancha: Optional[int] = None,
+        id_servicio: Optional[int] = None,
+    ) -> Tuple[List[CanchaServicio], Optional[str]]:
+        return self.repository.get_page(limit, after, id_cancha=id_cancha, id_servicio=id_servicio)
+
@@ -1,6 +1,6 @@
 import sqlite3
-from typing import List, Optional
-from classes.cliente import Cliente
+from typing import List, Optional, Tuple
+from classes.cliente import Cliente, ClienteLectura
 from repositories.cliente_repository import ClienteRepository
 
 
@@ -37,6 +37,9 @@ class ClienteService:
     def get_by_id(self, id_cliente: int) -> Optional[Cliente]:
         return self.repository.get_by_id(id_cliente)
 
+    def get_by_mail(self, mail: str) -> Optional[Cliente]:
+        return self.repository.get_by_mail(mail)
+
     def update(self, obj: Cliente) -> None:
         self.validate(obj)
         self.repository.update(obj)
@@ -46,3 +49,11 @@ class ClienteService:
 
     def list_all(self) -> List[Cliente]:
         return self.repository.get_all()
+
+    def list_page(
+        self,
+        limit: Optional[int],
+        after: Optional[str] = None,
+        mail: Optional[str] = None,
+    ) -> Tuple[List[ClienteLectura], Optional[str]]:
+        return self.repository.get_page(limit, after, mail=mail)
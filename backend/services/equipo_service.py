@@ -1,5 +1,5 @@
 import sqlite3
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from classes.equipo import Equipo
 from repositories.equipo_repository import EquipoRepository
 
@@ -35,5 +35,13 @@ class EquipoService:
     def list_all(self) -> List[Equipo]:
         return self.repository.get_all()
 
+    def list_page(
+        self,
+        limit: Optional[int],
+        after: Optional[str] = None,
+        id_torneo: Optional[int] = None,
+    ) -> Tuple[List[Equipo], Optional[str]]:
+        return self.repository.get_page(limit, after, id_torneo=id_torneo)
+
     def get_by_torneo(self, id_torneo: int) -> List[Equipo]:
         return self.repository.get_by_torneo(id_torneo)
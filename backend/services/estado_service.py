@@ -1,5 +1,5 @@
 import sqlite3
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from classes.estado import Estado
 from repositories.estado_repository import EstadoRepository
 
@@ -34,3 +34,11 @@ class EstadoService:
 
     def list_all(self) -> List[Estado]:
         return self.repository.get_all()
+
+    def list_page(
+        self,
+        limit: Optional[int],
+        after: Optional[str] = None,
+        ambito: Optional[str] = None,
+    ) -> Tuple[List[Estado], Optional[str]]:
+        return self.repository.get_page(limit, after, ambito=ambito)
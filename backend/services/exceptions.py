@@ -0,0 +1,10 @@
+"""Excepciones de la capa de servicios."""
+
+
+class ConflictoError(ValueError):
+    """
+    El recurso ya está tomado (p. ej. un turno reservado por otro cliente).
+
+    Hereda de ValueError para que el código que ya trata los errores de
+    validación lo siga capturando; los controllers lo mapean a 409.
+    """
@@ -0,0 +1,75 @@
+import csv
+import io
+import json
+import sqlite3
+from datetime import date
+from typing import Iterator, Optional
+from repositories.export_repository import EXPORTABLES, DEFAULT_CHUNK_SIZE, ExportRepository
+
+
+FORMATOS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+class ExportService:
+    def __init__(self, db_path: Optional[str] = None, connection: Optional[sqlite3.Connection] = None):
+        self.repository = ExportRepository(db_path, connection)
+
+    @staticmethod
+    def validate(entidad: str, formato: str, desde: Optional[date], hasta: Optional[date]) -> None:
+        """Valida los parámetros antes de empezar a enviar la respuesta."""
+        if entidad not in EXPORTABLES:
+            raise ValueError(f"No se puede exportar '{entidad}'. Opciones: {', '.join(EXPORTABLES)}")
+        if formato not in FORMATOS:
+            raise ValueError(f"Formato desconocido: {formato}. Opciones: {', '.join(FORMATOS)}")
+        if desde and hasta and desde > hasta:
+            raise ValueError("La fecha 'desde' no puede ser posterior a 'hasta'.")
+
+    def exportar(
+        self,
+        entidad: str,
+        formato: str = "ndjson",
+        desde: Optional[date] = None,
+        hasta: Optional[date] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[str]:
+        """
+        Genera el contenido exportado de a un lote de filas por vez
+
+        Args:
+            entidad: Clave de EXPORTABLES (reservas, turnos, pagos)
+            formato: "ndjson" (un objeto JSON por línea) o "csv" (con encabezado)
+            desde: Fecha mínima inclusive, opcional
+            hasta: Fecha máxima inclusive, opcional
+            chunk_size: Filas leídas de la base por lote
+
+        Returns:
+            Generador de bloques de texto, uno por lote
+        """
+        self.validate(entidad, formato, desde, hasta)
+        columnas = EXPORTABLES[entidad].columnas
+        chunks = self.repository.iter_chunks(
+            entidad,
+            desde.isoformat() if desde else None,
+            hasta.isoformat() if hasta else None,
+            chunk_size,
+        )
+
+        if formato == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer, lineterminator="\n")
+            writer.writerow(columnas)
+            for rows in chunks:
+                writer.writerows(rows)
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+            if buffer.tell():
+                # Solo encabezado: no hubo filas
+                yield buffer.getvalue()
+            return
+
+        for rows in chunks:
+            yield "".join(json.dumps(dict(zip(columnas, row)), ensure_ascii=False) + "\n" for row in rows)
@@ -1,5 +1,5 @@
 import sqlite3
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from classes.horario import Horario
 from repositories.horario_repository import HorarioRepository
 
@@ -18,6 +18,20 @@ class HorarioService:
         self.validate(obj)
         return self.repository.create(obj)
 
+    def insert_many(self, objs: List[Horario]) -> List[Horario]:
+        """
+        Valida e inserta un lote de Horario en una sola transacción
+
+        Si un ítem es inválido no se inserta ninguno; el error indica su
+        posición en el lote.
+        """
+        for i, obj in enumerate(objs):
+            try:
+                self.validate(obj)
+            except ValueError as e:
+                raise ValueError(f"Ítem {i}: {e}") from e
+        return self.repository.create_many(objs)
+
     def get_by_id(self, id_horario: int) -> Optional[Horario]:
         return self.repository.get_by_id(id_horario)
 
@@ -30,3 +44,6 @@ class HorarioService:
 
     def list_all(self) -> List[Horario]:
         return self.repository.get_all()
+
+    def list_page(self, limit: Optional[int], after: Optional[str] = None) -> Tuple[List[Horario], Optional[str]]:
+        return self.repository.get_page(limit, after)
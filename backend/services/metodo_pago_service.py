@@ -1,5 +1,5 @@
 import sqlite3
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from classes.metodo_pago import MetodoPago
 from repositories.metodo_pago_repository import MetodoPagoRepository
 
@@ -30,3 +30,6 @@ class MetodoPagoService:
 
     def list_all(self) -> List[MetodoPago]:
         return self.repository.get_all()
+
+    def list_page(self, limit: Optional[int], after: Optional[str] = None) -> Tuple[List[MetodoPago], Optional[str]]:
+        return self.repository.get_page(limit, after)
@@ -1,7 +1,8 @@
 import sqlite3
-from typing import List, Optional
+from datetime import date
+from typing import List, Optional, Tuple
 from decimal import Decimal
-from classes.pago import Pago
+from classes.pago import Pago, PagoLectura
 from repositories.pago_repository import PagoRepository
 
 
@@ -35,3 +36,21 @@ class PagoService:
 
     def list_all(self) -> List[Pago]:
         return self.repository.get_all()
+
+    def list_page(
+        self,
+        limit: Optional[int],
+        after: Optional[str] = None,
+        id_reserva: Optional[int] = None,
+        fecha_desde: Optional[date] = None,
+        fecha_hasta: Optional[date] = None,
+    ) -> Tuple[List[PagoLectura], Optional[str]]:
+        if fecha_desde and fecha_hasta and fecha_desde > fecha_hasta:
+            raise ValueError("La fecha desde no puede ser posterior a la fecha hasta.")
+        return self.repository.get_page(
+            limit,
+            after,
+            id_reserva=id_reserva,
+            fecha_desde=fecha_desde,
+            fecha_hasta=fecha_hasta,
+        )
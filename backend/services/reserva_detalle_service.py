@@ -1,7 +1,7 @@
 import sqlite3
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from decimal import Decimal
-from classes.reserva_detalle import ReservaDetalle
+from classes.reserva_detalle import ReservaDetalle, ReservaDetalleLectura
 from repositories.reserva_detalle_repository import ReservaDetalleRepository
 
 
@@ -33,3 +33,12 @@ class ReservaDetalleService:
 
     def list_all(self) -> List[ReservaDetalle]:
         return self.repository.get_all()
+
+    def list_page(
+        self,
+        limit: Optional[int],
+        after: Optional[str] = None,
+        id_reserva: Optional[int] = None,
+        id_turno: Optional[int] = None,
+    ) -> Tuple[List[ReservaDetalleLectura], Optional[str]]:
+        return self.repository.get_page(limit, after, id_reserva=id_reserva, id_turno=id_turno)
@@ -1,8 +1,8 @@
 import sqlite3
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from decimal import Decimal
 from datetime import date
-from classes.reserva import Reserva
+from classes.reserva import Reserva, ReservaLectura
 from classes.reserva_detalle import ReservaDetalle
 from classes.turno import Turno
 from classes.pago import Pago
@@ -13,11 +13,14 @@ from repositories.pago_repository import PagoRepository
 from repositories.cancha_repository import CanchaRepository
 from repositories.tipo_cancha_repository import TipoCanchaRepository
 from schemas.reserva_transaccion_schema import ReservaTransaccionSchema
-from data.database_connection import DatabaseConnection
+from data.retry import retry_on_busy
+from data.unit_of_work import unit_of_work
+from services.exceptions import ConflictoError
 
 
 from classes.estado_reserva.reserva_pagada import ReservaPagada
 from classes.estado_reserva.reserva_pendiente import ReservaPendiente
+from classes.estado_turno.turno_disponible import TurnoDisponible
 from classes.estado_turno.turno_no_disponible import TurnoNoDisponible
 from repositories.metodo_pago_repository import MetodoPagoRepository
 
@@ -26,10 +29,13 @@ ID_ESTADO_NO_DISPONIBLE = 2
 
 class ReservaService:
     def __init__(self, db_path: Optional[str] = None, connection: Optional[sqlite3.Connection] = None):
-        self.db_conn = DatabaseConnection()
-        self.connection = connection if connection else self.db_conn.get_connection()
-        
-        self.repository = ReservaRepository(connection=self.connection)
+        # La API inyecta la conexión del executor (o del pool); fuera de la API
+        # el primer repositorio abre una propia, como en los demás servicios.
+        # Todos los repositorios comparten esa conexión, para que el alta
+        # transaccional quede en una sola unidad de trabajo.
+        self.repository = ReservaRepository(db_path, connection)
+        self.connection = self.repository.conn
+
         self.detalle_repository = ReservaDetalleRepository(connection=self.connection)
         self.turno_repository = TurnoRepository(connection=self.connection)
         self.pago_repository = PagoRepository(connection=self.connection)
@@ -64,12 +70,47 @@ class ReservaService:
     def list_all(self) -> List[Reserva]:
         return self.repository.get_all()
 
+    def list_page(
+        self,
+        limit: Optional[int],
+        after: Optional[str] = None,
+        id_cliente: Optional[int] = None,
+        estado: Optional[str] = None,
+        fecha_desde: Optional[date] = None,
+        fecha_hasta: Optional[date] = None,
+    ) -> Tuple[List[ReservaLectura], Optional[str]]:
+        if fecha_desde and fecha_hasta and fecha_desde > fecha_hasta:
+            raise ValueError("La fecha desde no puede ser posterior a la fecha hasta.")
+        return self.repository.get_page(
+            limit,
+            after,
+            id_cliente=id_cliente,
+            estado=estado,
+            fecha_desde=fecha_desde,
+            fecha_hasta=fecha_hasta,
+        )
+
     def registrar_reserva_completa(self, data: ReservaTransaccionSchema) -> Reserva:
+        """
+        Crea una reserva completa de forma transaccional, reintentando con
+        backoff acotado si la base está ocupada por otro escritor (SQLITE_BUSY).
+
+        Raises:
+            ConflictoError: Si algún turno ya está reservado
+            ValueError: Si los datos de la reserva no son válidos
+        """
+        return retry_on_busy(lambda: self._registrar_reserva_completa(data))
+
+    def _registrar_reserva_completa(self, data: ReservaTransaccionSchema) -> Reserva:
         """
         Crea una reserva completa de forma transaccional.
         Usa el enfoque Two-Pass:
         1. Valida disponibilidad y calcula precios en memoria.
-        2. Abre transacción y persiste todo.
+        2. Abre transacción (BEGIN IMMEDIATE) y persiste todo.
+
+        La validación va a la base con una sola consulta, la de los turnos
+        existentes, sin importar cuántos items tenga la reserva. Las canchas,
+        sus tipos y precios (y el método de pago) salen del caché de catálogo.
         """
         
         # --- PASADA 1: Validación y Cálculo (Lectura) ---
@@ -87,96 +128,106 @@ class ReservaService:
         else:
             estado_inicial = ReservaPagada()
 
+        slots = [(item.id_cancha, item.id_horario, item.fecha) for item in data.items]
+        if len(set(slots)) != len(slots):
+            raise ValueError("La reserva incluye el mismo turno más de una vez.")
 
-        for item in data.items:
-            # 1. Verificar si ya existe un turno para esa cancha/horario/fecha
-            existing_turno = self.turno_repository.get_by_cancha_horario_fecha(
-                item.id_cancha, item.id_horario, item.fecha
-            )
-            if existing_turno:
-                raise ValueError(f"El turno para la cancha {item.id_cancha} en el horario {item.id_horario} el día {item.fecha} ya está ocupado.")
+        # 1. Turnos ya creados para esas cancha/horario/fecha (una sola consulta).
+        #    Los creados como disponibles (p. ej. por crear-del-dia) se pueden reservar.
+        disponible = TurnoDisponible.nombre.lower()
+        existentes = {
+            (t.id_cancha, t.id_horario, t.fecha): t
+            for t in self.turno_repository.get_by_slots(slots)
+        }
 
-            # 2. Obtener precio de la cancha
+        for item, slot in zip(data.items, slots):
+            existing_turno = existentes.get(slot)
+            if existing_turno and existing_turno.estado_nombre.lower() != disponible:
+                raise ConflictoError(f"El turno para la cancha {item.id_cancha} en el horario {item.id_horario} el día {item.fecha} ya está ocupado.")
+
+            # 2. Cancha y tipo salen del caché de catálogo (sin consultas si está cargado)
             cancha = self.cancha_repository.get_by_id(item.id_cancha)
             if not cancha:
                 raise ValueError(f"La cancha {item.id_cancha} no existe.")
-            
+
             tipo_cancha = self.tipo_cancha_repository.get_by_id(cancha.id_tipo)
             if not tipo_cancha:
                 raise ValueError(f"El tipo de cancha {cancha.id_tipo} no existe.")
-            
+
             precio_item = tipo_cancha.precio_hora
+
             total_reserva += precio_item
             
             items_procesados.append({
                 "item_data": item,
-                "precio": precio_item
+                "precio": precio_item,
+                "turno": existing_turno,
             })
 
         # --- PASADA 2: Persistencia (Escritura Transaccional) ---
         try:
-            # Deshabilitar autocommit en los repositorios para manejar la transacción manualmente
-            self.repository.autocommit = False
-            self.turno_repository.autocommit = False
-            self.detalle_repository.autocommit = False
-            self.pago_repository.autocommit = False
-
-            # Iniciar transacción explícita (aunque sqlite3 lo maneja, aseguramos atomicidad)
-            # Nota: self.connection es la misma para todos los repositorios
-            
-            # 1. Crear Reserva
-            nueva_reserva = Reserva(
-                id_cliente=data.id_cliente,
-                monto_total=total_reserva,
-                fecha_reserva=date.today(),
-                estado=estado_inicial
-            )
-            reserva_creada = self.repository.create(nueva_reserva)
-
-            # 2. Procesar Items (Turnos y Detalles)
-            for procesado in items_procesados:
-                item = procesado["item_data"]
-                precio = procesado["precio"]
-
-                # Crear Turno
-                nuevo_turno = Turno(
-                    id_cancha=item.id_cancha,
-                    id_horario=item.id_horario,
-                    fecha=item.fecha,
-                    estado=TurnoNoDisponible() # Estado inicial: No Disponible
+            # Una sola transacción para todos los repositorios (comparten
+            # self.connection). BEGIN IMMEDIATE toma ya el lock de escritura: si
+            # otro escritor lo tiene, falla acá (SQLITE_BUSY) antes de escribir
+            # nada y retry_on_busy reintenta. Con WAL las lecturas siguen sin
+            # bloquearse. Commit al salir del bloque, rollback si hay excepción.
+            with unit_of_work(self.connection):
+                # 1. Crear Reserva
+                nueva_reserva = Reserva(
+                    id_cliente=data.id_cliente,
+                    monto_total=total_reserva,
+                    fecha_reserva=date.today(),
+                    estado=estado_inicial
                 )
-                turno_creado = self.turno_repository.create(nuevo_turno)
-
-                # Crear Detalle
-                nuevo_detalle = ReservaDetalle(
+                reserva_creada = self.repository.create(nueva_reserva)
+
+                # 2. Turnos: reservar los disponibles existentes y crear el resto
+                turnos_existentes = [p["turno"] for p in items_procesados if p["turno"]]
+                reservados = self.turno_repository.reservar_disponibles(
+                    [t.id_turno for t in turnos_existentes],
+                    TurnoDisponible.nombre,
+                    TurnoNoDisponible.nombre,
+                )
+                if reservados != len(turnos_existentes):
+                    raise ConflictoError("Uno de los turnos seleccionados fue reservado por otro cliente.")
+
+                nuevos_turnos = [
+                    Turno(
+                        id_cancha=p["item_data"].id_cancha,
+                        id_horario=p["item_data"].id_horario,
+                        fecha=p["item_data"].fecha,
+                        estado=TurnoNoDisponible() # Estado inicial: No Disponible
+                    )
+                    for p in items_procesados if not p["turno"]
+                ]
+                self.turno_repository.create_many(nuevos_turnos)
+
+                # 3. Detalles (un INSERT multi-fila), en el orden de los items
+                turnos_nuevos = iter(nuevos_turnos)
+                detalles = []
+                for procesado in items_procesados:
+                    turno = procesado["turno"] or next(turnos_nuevos)
+                    detalles.append(ReservaDetalle(
+                        id_reserva=reserva_creada.id_reserva,
+                        id_turno=turno.id_turno,
+                        precio_total_item=procesado["precio"]
+                    ))
+                self.detalle_repository.create_many(detalles)
+
+                # 4. Registrar Pago
+                nuevo_pago = Pago(
                     id_reserva=reserva_creada.id_reserva,
-                    id_turno=turno_creado.id_turno,
-                    precio_total_item=precio
+                    id_metodo_pago=data.id_metodo_pago,
+                    fecha_pago=date.today(),
+                    monto=total_reserva
+                    # estado_pago eliminado
                 )
-                self.detalle_repository.create(nuevo_detalle)
-
-            # 3. Registrar Pago
-            nuevo_pago = Pago(
-                id_reserva=reserva_creada.id_reserva,
-                id_metodo_pago=data.id_metodo_pago,
-                fecha_pago=date.today(),
-                monto=total_reserva
-                # estado_pago eliminado
-            )
-            self.pago_repository.create(nuevo_pago)
-
-            # Confirmar transacción
-            self.connection.commit()
-            
+                self.pago_repository.create(nuevo_pago)
+
             return reserva_creada
 
-        except Exception as e:
-            self.connection.rollback()
-            raise e
-        
-        finally:
-            # Restaurar el estado "natural" de los repositorios
-            self.repository.autocommit = True
-            self.turno_repository.autocommit = True
-            self.detalle_repository.autocommit = True
-            self.pago_repository.autocommit = True
+        except sqlite3.IntegrityError as e:
+            # El índice único de Turno detectó una reserva concurrente del mismo turno
+            if "UNIQUE" in str(e).upper():
+                raise ConflictoError("Uno de los turnos seleccionados fue reservado por otro cliente.") from e
+            raise
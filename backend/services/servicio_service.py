@@ -1,5 +1,5 @@
 import sqlite3
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from decimal import Decimal
 from classes.servicio import Servicio
 from repositories.servicio_repository import ServicioRepository
@@ -33,3 +33,6 @@ class ServicioService:
 
     def list_all(self) -> List[Servicio]:
         return self.repository.get_all()
+
+    def list_page(self, limit: Optional[int], after: Optional[str] = None) -> Tuple[List[Servicio], Optional[str]]:
+        return self.repository.get_page(limit, after)
@@ -1,5 +1,5 @@
 import sqlite3
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from decimal import Decimal
 from classes.tipo_cancha import TipoCancha
 from repositories.tipo_cancha_repository import TipoCanchaRepository
@@ -33,3 +33,6 @@ class TipoCanchaService:
 
     def list_all(self) -> List[TipoCancha]:
         return self.repository.get_all()
+
+    def list_page(self, limit: Optional[int], after: Optional[str] = None) -> Tuple[List[TipoCancha], Optional[str]]:
+        return self.repository.get_page(limit, after)
@@ -1,5 +1,5 @@
 import sqlite3
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from classes.torneo import Torneo
 from repositories.torneo_repository import TorneoRepository
 
@@ -34,3 +34,6 @@ class TorneoService:
 
     def list_all(self) -> List[Torneo]:
         return self.repository.get_all()
+
+    def list_page(self, limit: Optional[int], after: Optional[str] = None) -> Tuple[List[Torneo], Optional[str]]:
+        return self.repository.get_page(limit, after)
@@ -1,10 +1,18 @@
 import sqlite3
-from typing import List, Optional
-from datetime import date, datetime, time
-from classes.turno import Turno
+from typing import List, Optional, Tuple
+from datetime import date, datetime, timedelta
+from classes.turno import Turno, TurnoLectura
+from classes.estado_turno.turno_disponible import TurnoDisponible
+from classes.estado_turno.turno_no_disponible import TurnoNoDisponible
 from repositories.turno_repository import TurnoRepository
 from repositories.cancha_repository import CanchaRepository
 from repositories.horario_repository import HorarioRepository
+from services.exceptions import ConflictoError
+
+# Códigos de la grilla de disponibilidad
+CODIGO_DISPONIBLE = "D"
+CODIGO_NO_DISPONIBLE = "N"
+CODIGO_SIN_TURNO = "-"
 
 
 class TurnoService:
@@ -23,14 +31,29 @@ class TurnoService:
 
     def insert(self, obj: Turno) -> Turno:
         self.validate(obj)
-        return self.repository.create(obj)
+        try:
+            return self.repository.create(obj)
+        except sqlite3.IntegrityError as e:
+            self._raise_si_duplicado(obj, e)
+            raise
 
     def get_by_id(self, id_turno: int) -> Optional[Turno]:
         return self.repository.get_by_id(id_turno)
 
     def update(self, obj: Turno) -> None:
         self.validate(obj)
-        self.repository.update(obj)
+        try:
+            self.repository.update(obj)
+        except sqlite3.IntegrityError as e:
+            self._raise_si_duplicado(obj, e)
+            raise
+
+    def _raise_si_duplicado(self, obj: Turno, error: sqlite3.IntegrityError) -> None:
+        """Traduce la violación del índice único cancha/horario/fecha a ConflictoError."""
+        if "UNIQUE" in str(error).upper():
+            raise ConflictoError(
+                f"Ya existe un turno para la cancha {obj.id_cancha} en el horario {obj.id_horario} el día {obj.fecha}."
+            ) from error
 
     def delete(self, id_turno: int) -> None:
         self.repository.delete(id_turno)
@@ -38,56 +61,100 @@ class TurnoService:
     def list_all(self) -> List[Turno]:
         return self.repository.get_all()
 
-    def crear_turnos_del_dia(self, fecha: Optional[date] = None) -> dict:
+    def list_page(
+        self,
+        limit: Optional[int],
+        after: Optional[str] = None,
+        fecha: Optional[date] = None,
+        id_cancha: Optional[int] = None,
+        estado: Optional[str] = None,
+    ) -> Tuple[List[TurnoLectura], Optional[str]]:
+        return self.repository.get_page(limit, after, fecha=fecha, id_cancha=id_cancha, estado=estado)
+
+    def crear_turnos_del_dia(self, fecha: Optional[date] = None, dias: int = 1) -> dict:
         """
-        Crea todos los turnos para todas las canchas y horarios en una fecha específica.
+        Crea todos los turnos para todas las canchas y horarios en una fecha específica,
+        o en un rango de `dias` días consecutivos a partir de esa fecha.
         Si no se especifica fecha, se usa la fecha actual.
         
         Args:
             fecha: Fecha para la cual crear los turnos (default: hoy)
+            dias: Cantidad de días a generar a partir de `fecha` (default: 1)
             
         Returns:
             Diccionario con el conteo de turnos creados y omitidos
         """
         if fecha is None:
             fecha = date.today()
-            
-        # Obtener todas las canchas y horarios
-        canchas = self.cancha_repository.get_all()
-        horarios = self.horario_repository.get_all()
-        
-        creados = 0
-        omitidos = 0
-        
-        for cancha in canchas:
-            for horario in horarios:
-                # Verificar si ya existe el turno
-                turno_existente = self.repository.get_by_cancha_horario_fecha(
-                    cancha.id_cancha, 
-                    horario.id_horario, 
-                    fecha
-                )
-                
-                if turno_existente:
-                    omitidos += 1
-                    continue
-                
-                # Crear el turno (por defecto se crea como disponible)
-                nuevo_turno = Turno(
-                    id_cancha=cancha.id_cancha,
-                    id_horario=horario.id_horario,
-                    fecha=fecha
-                )
-                
-                self.repository.create(nuevo_turno)
-                creados += 1
-        
+        if dias < 1:
+            raise ValueError("La cantidad de días debe ser al menos 1.")
+        fecha_hasta = fecha + timedelta(days=dias - 1)
+
+        # Un único INSERT ... SELECT (canchas x horarios x días) que omite los
+        # turnos existentes, dentro de una unidad de trabajo: los conteos se leen
+        # en la misma transacción que la inserción y hay un solo commit
+        with self.repository.unit_of_work():
+            total_canchas = len(self.cancha_repository.get_all())
+            total_horarios = len(self.horario_repository.get_all())
+            creados = self.repository.create_for_range(fecha, fecha_hasta, TurnoDisponible.nombre)
+        omitidos = total_canchas * total_horarios * dias - creados
+
         return {
             "fecha": fecha.isoformat(),
+            "fecha_hasta": fecha_hasta.isoformat(),
+            "dias": dias,
             "turnos_creados": creados,
             "turnos_omitidos": omitidos,
-            "total_canchas": len(canchas),
-            "total_horarios": len(horarios)
+            "total_canchas": total_canchas,
+            "total_horarios": total_horarios
+        }
+
+    def disponibilidad(self, fecha: date) -> dict:
+        """
+        Arma la grilla compacta de disponibilidad (cancha x horario) de una fecha.
+
+        Cada fila de `estados` es un string con un código por horario:
+        'D' disponible, 'N' no disponible, '-' sin turno creado.
+        `turnos` tiene la misma forma con el id_turno de cada celda (o None).
+
+        Args:
+            fecha: Fecha a consultar
+
+        Returns:
+            Diccionario con canchas, horarios, estados y turnos
+        """
+        canchas = []
+        horarios = []
+        estados = []
+        turnos = []
+        disponible = TurnoDisponible.nombre.lower()
+
+        for row in self.repository.get_grilla(fecha):
+            if not canchas or canchas[-1]["id_cancha"] != row["id_cancha"]:
+                canchas.append({"id_cancha": row["id_cancha"], "nombre": row["nombre"]})
+                estados.append([])
+                turnos.append([])
+            if len(canchas) == 1:
+                horarios.append({
+                    "id_horario": row["id_horario"],
+                    "hora_inicio": row["hora_inicio"],
+                    "hora_fin": row["hora_fin"],
+                })
+
+            if row["id_turno"] is None:
+                estados[-1].append(CODIGO_SIN_TURNO)
+            elif (row["estado_turno"] or "").lower() == disponible:
+                estados[-1].append(CODIGO_DISPONIBLE)
+            else:
+                estados[-1].append(CODIGO_NO_DISPONIBLE)
+            turnos[-1].append(row["id_turno"])
+
+        return {
+            "fecha": fecha.isoformat(),
+            "canchas": canchas,
+            "horarios": horarios,
+            "estados": ["".join(fila) for fila in estados],
+            "turnos": turnos,
         }
 
     def expirar_turnos_pasados(self) -> dict:
@@ -98,35 +165,18 @@ class TurnoService:
             Diccionario con el conteo de turnos expirados
         """
         ahora = datetime.now()
-        fecha_actual = ahora.date()
-        hora_actual = ahora.time()
-        
-        # Obtener todos los turnos
-        todos_turnos = self.repository.get_all()
-        expirados = 0
-        
-        for turno in todos_turnos:
-            # Solo procesar turnos que estén disponibles
-            if turno.estado_nombre.lower() != "disponible":
-                continue
-                
-            # Obtener el horario para saber la hora de fin
-            horario = self.horario_repository.get_by_id(turno.id_horario)
-            if not horario:
-                continue
-            
-            # Verificar si el turno ya pasó
-            if turno.fecha < fecha_actual:
-                # Fecha anterior a hoy
-                turno.reservar()  # Cambia el estado a no disponible
-                self.repository.update(turno)
-                expirados += 1
-            elif turno.fecha == fecha_actual and horario.hora_fin and horario.hora_fin <= hora_actual:
-                # Mismo día pero la hora de fin ya pasó
-                turno.reservar()  # Cambia el estado a no disponible
-                self.repository.update(turno)
-                expirados += 1
-        
+
+        # Un único UPDATE unido a Horario: sin cargar la tabla Turno ni
+        # consultar el horario de cada turno. Dentro de una unidad de trabajo
+        # para sumarse a la transacción de quien llame (un solo commit)
+        with self.repository.unit_of_work():
+            expirados = self.repository.expire_past(
+                ahora.date(),
+                ahora.time().replace(microsecond=0).isoformat(),
+                TurnoDisponible.nombre,
+                TurnoNoDisponible.nombre,
+            )
+
         return {
             "turnos_expirados": expirados,
             "fecha_hora_proceso": ahora.isoformat()
@@ -0,0 +1,60 @@
+"""
+Fixtures compartidas por los tests: bases con los datos de ejemplo en la
+carpeta temporal del test, una conexión a ella y el cliente HTTP de la app.
+"""
+
+import os
+import sys
+import sqlite3
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+BACKEND_DIR = os.path.abspath(os.path.join(ROOT, 'backend'))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from fastapi.testclient import TestClient
+
+from data.init_db import init_database
+from data.datos_ejemplo_db import insert_sample_data
+from data.db_executor import close_db_executor
+
+
+@pytest.fixture
+def crear_base(tmp_path):
+    """Función que crea una base con los datos de ejemplo y retorna su ruta (para tests con varias bases)."""
+    def crear(nombre="donbalon.db"):
+        path = str(tmp_path / nombre)
+        init_database(path)
+        insert_sample_data(path)
+        return path
+    return crear
+
+
+@pytest.fixture
+def db_path(crear_base, monkeypatch):
+    """Base con los datos de ejemplo, que es también la de la app (DONBALON_DB_PATH)."""
+    path = crear_base()
+    monkeypatch.setenv("DONBALON_DB_PATH", path)
+    yield path
+    # El executor del proceso queda abierto sobre la base de este test
+    close_db_executor()
+
+
+@pytest.fixture
+def connection(db_path):
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def client(db_path):
+    import main
+    with TestClient(main.app) as client:
+        yield client
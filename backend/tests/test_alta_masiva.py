@@ -0,0 +1,58 @@
+import os
+import sys
+import sqlite3
+import datetime
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+BACKEND_DIR = os.path.abspath(os.path.join(ROOT, 'backend'))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from classes.cancha_servicio import CanchaServicio
+from classes.horario import Horario
+from repositories.cancha_servicio_repository import CanchaServicioRepository
+from repositories.horario_repository import HorarioRepository
+from services.cancha_servicio_service import CanchaServicioService
+from services.exceptions import ConflictoError
+
+
+def contar(db_path, tabla):
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {tabla}").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_create_many_asigna_ids_consecutivos_y_actualiza_cache(db_path):
+    repo = HorarioRepository(db_path)
+    antes = len(repo.get_all())  # carga el caché
+    # Más filas que un INSERT multi-fila (999 parámetros / 2 columnas)
+    horarios = [
+        Horario(hora_inicio=datetime.time(i // 60 % 24, i % 60), hora_fin=datetime.time(23, 59))
+        for i in range(1200)
+    ]
+
+    creados = repo.create_many(horarios)
+
+    ids = [h.id_horario for h in creados]
+    assert ids == list(range(ids[0], ids[0] + 1200))
+    assert repo.get_by_id(ids[-1]).hora_inicio == horarios[-1].hora_inicio
+    assert len(repo.get_all()) == antes + 1200
+
+
+def test_create_many_es_todo_o_nada(db_path):
+    antes = contar(db_path, "CanchaServicio")
+    service = CanchaServicioService(db_path)
+    lote = [CanchaServicio(id_cancha=3, id_servicio=3), CanchaServicio(id_cancha=1, id_servicio=1)]
+
+    with pytest.raises(ConflictoError):
+        service.insert_many(lote)
+
+    assert contar(db_path, "CanchaServicio") == antes
+    assert not CanchaServicioRepository(db_path).exists(3, 3)
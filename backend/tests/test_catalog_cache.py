@@ -0,0 +1,74 @@
+import os
+import sys
+import sqlite3
+from decimal import Decimal
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+BACKEND_DIR = os.path.abspath(os.path.join(ROOT, 'backend'))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from repositories.catalog_cache import CatalogCache
+from repositories.cancha_repository import CanchaRepository
+from repositories.tipo_cancha_repository import TipoCanchaRepository
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = CatalogCache(ttl=60)
+    for repo in (CanchaRepository, TipoCanchaRepository):
+        monkeypatch.setattr(repo, "cache", cache)
+    return cache
+
+
+def test_lecturas_desde_cache(connection, cache):
+    statements = []
+    connection.set_trace_callback(statements.append)
+    repo = CanchaRepository(connection=connection)
+
+    assert len(repo.get_all()) == 3
+    assert repo.get_by_id(2).nombre
+    assert repo.exists(3) and not repo.exists(99)
+    assert len([s for s in statements if s.startswith("SELECT")]) == 1
+    assert cache.stats()["Cancha"] == {"hits": 3, "misses": 1, "invalidations": 0, "size": 3}
+
+    # Las copias devueltas no modifican el caché
+    repo.get_by_id(2).nombre = "otro"
+    assert repo.get_by_id(2).nombre != "otro"
+
+
+def test_escritura_invalida(connection, cache):
+    repo = TipoCanchaRepository(connection=connection)
+
+    tipo = repo.get_by_id(1)
+    tipo.precio_hora = Decimal("750")
+    repo.update(tipo)
+
+    assert repo.get_by_id(1).precio_hora == Decimal("750")
+    assert cache.stats()["TipoCancha"]["invalidations"] == 1
+
+
+def test_bases_distintas_no_comparten_cache(connection, crear_base, cache):
+    otra = sqlite3.connect(crear_base("otra.db"))
+    otra.execute("DELETE FROM Cancha WHERE id_cancha = 3")
+    otra.commit()
+
+    assert len(CanchaRepository(connection=connection).get_all()) == 3
+    assert len(CanchaRepository(connection=otra).get_all()) == 2
+    otra.close()
+
+
+def test_lectura_dentro_de_transaccion_no_se_comparte(connection, cache):
+    repo = CanchaRepository(connection=connection)
+
+    connection.execute("DELETE FROM Cancha WHERE id_cancha = 3")
+    assert connection.in_transaction
+    assert len(repo.get_all()) == 2
+    connection.rollback()
+
+    assert len(repo.get_all()) == 3
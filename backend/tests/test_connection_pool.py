@@ -0,0 +1,73 @@
+import os
+import sys
+import threading
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+BACKEND_DIR = os.path.abspath(os.path.join(ROOT, 'backend'))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from data.connection_pool import ConnectionPool, PoolTimeoutError
+
+
+def make_pool(tmp_path, size=2, timeout=0.2):
+    return ConnectionPool(str(tmp_path / "pool.db"), size=size, timeout=timeout)
+
+
+def test_pool_is_bounded_and_times_out(tmp_path):
+    pool = make_pool(tmp_path, size=2)
+    a = pool.acquire()
+    b = pool.acquire()
+    assert a is not b
+
+    with pytest.raises(PoolTimeoutError):
+        pool.acquire(timeout=0.05)
+
+    pool.release(a)
+    c = pool.acquire()
+    assert c is a
+
+    stats = pool.stats()
+    assert stats["created"] == 2
+    assert stats["in_use"] == 2
+    assert stats["timeouts"] == 1
+    pool.release(b)
+    pool.release(c)
+    pool.close()
+
+
+def test_waiter_gets_released_connection(tmp_path):
+    pool = make_pool(tmp_path, size=1, timeout=2)
+    conn = pool.acquire()
+    got = []
+
+    t = threading.Thread(target=lambda: got.append(pool.acquire()))
+    t.start()
+    pool.release(conn)
+    t.join(2)
+
+    assert got == [conn]
+    assert pool.stats()["waits"] == 1
+    pool.release(conn)
+    pool.close()
+
+
+def test_release_rolls_back_open_transaction(tmp_path):
+    pool = make_pool(tmp_path, size=1)
+    with pool.connection() as conn:
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.commit()
+        conn.execute("INSERT INTO t VALUES (1)")
+        assert conn.in_transaction
+
+    with pool.connection() as conn:
+        assert not conn.in_transaction
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+    assert pool.stats()["rollbacks_on_release"] == 1
+    pool.close()
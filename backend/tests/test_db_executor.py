@@ -0,0 +1,101 @@
+import os
+import sys
+import sqlite3
+import asyncio
+import datetime
+import threading
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+BACKEND_DIR = os.path.abspath(os.path.join(ROOT, 'backend'))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from data.db_executor import DatabaseExecutor
+from classes.horario import Horario
+from repositories.cliente_repository import ClienteRepository
+from services.async_service import AsyncService
+from services.horario_service import HorarioService
+
+
+@pytest.fixture
+def executor(db_path):
+    executor = DatabaseExecutor(db_path, readers=2)
+    yield executor
+    executor.close()
+
+
+def test_lectores_en_paralelo_y_escritor_unico(executor):
+    def thread_actual(conn):
+        return threading.current_thread().name
+
+    async def main():
+        lecturas = await asyncio.gather(*(executor.read(thread_actual) for _ in range(20)))
+        escrituras = await asyncio.gather(*(executor.write(thread_actual) for _ in range(5)))
+        return set(lecturas), set(escrituras)
+
+    lectores, escritores = asyncio.run(main())
+    assert all(name.startswith("db-reader") for name in lectores)
+    assert len(escritores) == 1 and escritores.pop().startswith("db-writer")
+    assert executor.stats()["readers"]["completed"] == 20
+
+
+def test_lector_no_puede_escribir(executor):
+    def borrar(conn):
+        conn.execute("DELETE FROM Horario")
+
+    with pytest.raises(sqlite3.OperationalError):
+        asyncio.run(executor.read(borrar))
+
+
+def test_async_service_y_variantes_async_del_repositorio(executor, db_path):
+    service = AsyncService(HorarioService, executor)
+    repo = ClienteRepository(db_path)
+
+    async def main():
+        creado = await service.insert(Horario(hora_inicio=datetime.time(23, 0), hora_fin=datetime.time(23, 30)))
+        leido = await service.get_by_id(creado.id_horario)
+        cur = await repo.execute_async("UPDATE Cliente SET telefono = ? WHERE id_cliente = 1", ("555",))
+        fila = await repo.query_one_async("SELECT telefono FROM Cliente WHERE id_cliente = 1")
+        return creado, leido, cur.rowcount, fila["telefono"]
+
+    creado, leido, filas, telefono = asyncio.run(main())
+    assert leido.id_horario == creado.id_horario
+    assert (filas, telefono) == (1, "555")
+
+
+def test_group_commit_aisla_el_error_de_cada_escritura(db_path):
+    # linger: que las cinco escrituras entren en el mismo lote
+    executor = DatabaseExecutor(db_path, readers=1, max_batch=10, linger=0.05)
+
+    def insertar(conn, descripcion):
+        conn.execute("INSERT INTO MetodoPago (descripcion) VALUES (?)", (descripcion,))
+        if descripcion == "falla":
+            raise ValueError("rechazada")
+        return descripcion
+
+    async def main():
+        return await asyncio.gather(
+            *(executor.write(insertar, d) for d in ("a", "b", "falla", "c", "d")),
+            return_exceptions=True,
+        )
+
+    try:
+        resultados = asyncio.run(main())
+        stats = executor.stats()["writer"]
+    finally:
+        executor.close()
+
+    assert resultados[:2] + resultados[3:] == ["a", "b", "c", "d"]
+    assert isinstance(resultados[2], ValueError)
+    assert (stats["batches"], stats["max_batch_size"], stats["failed"]) == (1, 5, 1)
+    conn = sqlite3.connect(db_path)
+    try:
+        guardadas = {row[0] for row in conn.execute("SELECT descripcion FROM MetodoPago")}
+    finally:
+        conn.close()
+    assert {"a", "b", "c", "d"} <= guardadas and "falla" not in guardadas
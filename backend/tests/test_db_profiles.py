@@ -0,0 +1,35 @@
+import os
+import sys
+import sqlite3
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+BACKEND_DIR = os.path.abspath(os.path.join(ROOT, 'backend'))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from data.db_profiles import PROFILES, apply_profile, get_profile_name
+
+
+@pytest.mark.parametrize("profile", sorted(PROFILES))
+def test_apply_profile_enables_wal(tmp_path, profile):
+    conn = sqlite3.connect(str(tmp_path / "perfil.db"))
+    assert apply_profile(conn, profile) == profile
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+    assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == PROFILES[profile]["busy_timeout"]
+    conn.close()
+
+
+def test_profile_from_environment(monkeypatch):
+    monkeypatch.setenv("DONBALON_DB_PROFILE", "reporting")
+    assert get_profile_name() == "reporting"
+    assert get_profile_name("bulk-load") == "bulk-load"
+
+    monkeypatch.setenv("DONBALON_DB_PROFILE", "inexistente")
+    with pytest.raises(ValueError):
+        get_profile_name()
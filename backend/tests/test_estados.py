@@ -0,0 +1,50 @@
+import os
+import sys
+import logging
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+BACKEND_DIR = os.path.abspath(os.path.join(ROOT, 'backend'))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from classes.turno import Turno
+from classes.reserva import Reserva
+from classes.estado_turno.turno_disponible import TurnoDisponible
+from classes.estado_turno.turno_no_disponible import TurnoNoDisponible
+from classes.estado_reserva.reserva_pagada import ReservaPagada
+from classes.estado_reserva.reserva_pendiente import ReservaPendiente
+from classes.estado_reserva.reserva_cancelada import ReservaCancelada
+
+
+def test_estados_unicos_con_nombre_precalculado():
+    assert TurnoDisponible() is TurnoDisponible()
+    assert TurnoDisponible() is not TurnoNoDisponible()
+    assert ReservaPagada() is ReservaPagada()
+    assert TurnoNoDisponible.nombre == "No Disponible"
+    assert str(TurnoDisponible()) == "Disponible"
+    assert ReservaPendiente.nombre == "Pendiente"
+    assert Turno().estado_nombre == "Disponible"
+    assert Reserva().estado_nombre == "Pendiente"
+
+
+def test_transiciones_usan_logger_y_no_stdout(capsys, caplog):
+    turnos = [Turno(id_turno=i) for i in range(3)]
+    with caplog.at_level(logging.DEBUG, logger="classes"):
+        for turno in turnos:
+            turno.reservar()
+        turnos[0].reservar()
+
+        reserva = Reserva(id_reserva=7)
+        reserva.pagar()
+        reserva.anular()
+
+    assert all(t.estado is TurnoNoDisponible() for t in turnos)
+    assert reserva.estado is ReservaCancelada()
+    assert capsys.readouterr().out == ""
+
+    advertencias = [r for r in caplog.records if r.levelno == logging.WARNING]
+    assert [r.getMessage() for r in advertencias] == ["[Turno 0] El turno ya está No Disponible."]
+    assert any(r.getMessage().startswith("[7] Cancelando reserva pagada") for r in caplog.records)
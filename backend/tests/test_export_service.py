@@ -0,0 +1,52 @@
+import os
+import sys
+import csv
+import json
+import datetime
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+BACKEND_DIR = os.path.abspath(os.path.join(ROOT, 'backend'))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from data.query_stats import query_stats
+from services.export_service import ExportService
+from services.turno_service import TurnoService
+
+
+def test_ndjson_por_lotes_con_filtro(connection):
+    TurnoService(connection=connection).crear_turnos_del_dia(datetime.date(2030, 1, 1), dias=2)
+    service = ExportService(connection=connection)
+
+    with query_stats.track_request() as queries:
+        bloques = list(service.exportar("turnos", desde=datetime.date(2030, 1, 2), chunk_size=10))
+    assert len(bloques) == 3  # 27 turnos en lotes de 10
+    # El cursor de fetchmany queda registrado como una sentencia con todas sus filas
+    assert (queries.count, queries.rows) == (1, 27)
+
+    turnos = [json.loads(linea) for bloque in bloques for linea in bloque.splitlines()]
+    assert len(turnos) == 27
+    assert {t["fecha"] for t in turnos} == {"2030-01-02"}
+    assert set(turnos[0]) == {"id_turno", "id_cancha", "id_horario", "fecha", "estado_turno"}
+
+
+def test_csv_y_validaciones(connection):
+    service = ExportService(connection=connection)
+
+    filas = list(csv.reader("".join(service.exportar("reservas", "csv")).splitlines()))
+    assert filas[0] == ["id_reserva", "id_cliente", "monto_total", "fecha_reserva", "estado_reserva"]
+    assert [f[0] for f in filas[1:]] == ["1", "2"]
+
+    # Sin filas: solo el encabezado
+    vacio = "".join(service.exportar("pagos", "csv", desde=datetime.date(2099, 1, 1)))
+    assert vacio == "id_pago,id_reserva,id_metodo_pago,fecha_pago,monto\n"
+
+    with pytest.raises(ValueError):
+        list(service.exportar("clientes"))
+    with pytest.raises(ValueError):
+        list(service.exportar("reservas", "ndjson", datetime.date(2025, 2, 1), datetime.date(2025, 1, 1)))
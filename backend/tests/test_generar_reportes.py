@@ -0,0 +1,60 @@
+import os
+import sys
+import sqlite3
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+BACKEND_DIR = os.path.abspath(os.path.join(ROOT, 'backend'))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+import pytest
+
+from data.db_profiles import apply_profile
+from reportes.generar_reportes import Tarea, ejecutar_tareas, planificar_tareas
+
+
+class Args:
+    salida_dir = "salida"
+    generar = "all"
+    id_cliente = 1
+    id_cancha = 1
+    inicio = "2025-01-01"
+    fin = "2025-01-31"
+
+
+def test_planificar_tareas_por_lote():
+    individuales = planificar_tareas(Args())
+    assert [t.nombre for t in individuales] == [
+        "reservas_por_cliente", "reservas_por_cancha", "canchas_mas_utilizadas", "utilizacion_mensual",
+    ]
+
+    lote = planificar_tareas(Args(), ids_clientes=[1, 2, 3], ids_canchas=[7])
+    nombres = [t.nombre for t in lote]
+    assert nombres[:4] == ["reservas_por_cliente_1", "reservas_por_cliente_2", "reservas_por_cliente_3", "reservas_por_cancha_7"]
+    assert lote[3].args == (os.path.join("salida", "reservas_por_cancha_7.pdf"), 7, "2025-01-01", "2025-01-31")
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_errores_por_reporte(tmp_path, jobs):
+    tareas = [
+        Tarea("ok", "os", "makedirs", (str(tmp_path / "ok"),)),
+        Tarea("falla", "reportes.no_existe", "generar", ()),
+    ]
+    resultados = {r.nombre: r for r in ejecutar_tareas(tareas, jobs)}
+
+    assert resultados["ok"].error is None
+    assert (tmp_path / "ok").is_dir()
+    assert "ModuleNotFoundError" in resultados["falla"].error
+
+
+def test_perfil_reporting_es_solo_lectura(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / "ro.db"))
+    conn.execute("CREATE TABLE t (x INTEGER)")
+    conn.commit()
+    apply_profile(conn, "reporting")
+    with pytest.raises(sqlite3.OperationalError, match="readonly"):
+        conn.execute("INSERT INTO t VALUES (1)")
+    conn.close()
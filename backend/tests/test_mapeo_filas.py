@@ -0,0 +1,69 @@
+import os
+import sys
+import sqlite3
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+BACKEND_DIR = os.path.abspath(os.path.join(ROOT, 'backend'))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from classes.reserva import from_dict as reserva_from_dict
+from classes.turno import Turno, TurnoLectura, from_dict as turno_from_dict
+from repositories.reserva_repository import ReservaRepository
+from repositories.turno_repository import TurnoRepository
+
+
+def test_mapeo_compilado_igual_a_from_dict(connection):
+    turno_repo = TurnoRepository(connection=connection)
+    reserva_repo = ReservaRepository(connection=connection)
+
+    turnos = turno_repo.get_all()
+    esperados = [turno_from_dict(dict(row)) for row in connection.execute("SELECT * FROM Turno")]
+    assert [t.to_dict() for t in turnos] == [t.to_dict() for t in esperados]
+
+    reservas = reserva_repo.get_all()
+    esperadas = [reserva_from_dict(dict(row)) for row in connection.execute("SELECT * FROM Reserva")]
+    assert [r.to_dict() for r in reservas] == [r.to_dict() for r in esperadas]
+
+    # Los turnos con el mismo estado comparten el objeto State
+    estados = {}
+    for t in turnos:
+        estados.setdefault(t.estado_nombre, set()).add(id(t.estado))
+    assert len(turnos) > len(estados)
+    assert all(len(ids) == 1 for ids in estados.values())
+
+    # La conexión sigue devolviendo sqlite3.Row para el resto del código
+    assert isinstance(connection.execute("SELECT 1 AS uno").fetchone(), sqlite3.Row)
+
+
+def test_columnas_faltantes_quedan_con_el_valor_por_defecto(connection):
+    repo = TurnoRepository(connection=connection)
+    turno = repo.query_entity("SELECT id_turno, fecha FROM Turno WHERE id_turno = 1")
+    assert isinstance(turno, Turno)
+    assert turno.id_turno == 1
+    assert turno.fecha.isoformat() == "2025-11-20"
+    assert turno.id_cancha is None
+    assert turno.estado_nombre == "Disponible"
+
+    assert repo.query_entity("SELECT * FROM Turno WHERE id_turno = -1") is None
+
+
+def test_variante_de_lectura_compacta(connection):
+    repo = TurnoRepository(connection=connection)
+    turnos = repo.get_all()
+    lecturas = repo.get_all_lectura()
+
+    assert all(isinstance(t, TurnoLectura) for t in lecturas)
+    assert not hasattr(lecturas[0], "__dict__")
+    assert [t.to_dict() for t in lecturas] == [t.to_dict() for t in turnos]
+    # Ida y vuelta por el contrato to_dict/from_dict, y a la entidad modificable
+    assert [turno_from_dict(t.to_dict()) for t in lecturas] == turnos
+    assert [t.to_entity() for t in lecturas] == turnos
+
+    # Las páginas de los listados usan la variante de solo lectura
+    pagina, _ = repo.get_page(2)
+    assert [t.id_turno for t in pagina] == [t.id_turno for t in lecturas[:2]]
+    assert all(isinstance(t, TurnoLectura) for t in pagina)
@@ -0,0 +1,75 @@
+import os
+import re
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+BACKEND_DIR = os.path.abspath(os.path.join(ROOT, 'backend'))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+SAMPLE = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{((?:[a-zA-Z_]\w*="(?:[^"\\]|\\.)*",?)*)\})? (\S+)$')
+LABEL = re.compile(r'([a-zA-Z_]\w*)="((?:[^"\\]|\\.)*)"')
+
+
+def scrape(client):
+    """Lee /metrics como un scraper: {(nombre, labels): valor}, validando cada línea"""
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    tipos, muestras = {}, {}
+    for line in response.text.splitlines():
+        if line.startswith("# TYPE "):
+            _, _, nombre, tipo = line.split(" ")
+            tipos[nombre] = tipo
+            continue
+        if line.startswith("#"):
+            continue
+        match = SAMPLE.match(line)
+        assert match, line
+        nombre, labels, valor = match.groups()
+        familia = re.sub(r"_(bucket|sum|count)$", "", nombre) if nombre not in tipos else nombre
+        assert familia in tipos, line
+        muestras[(nombre, frozenset(LABEL.findall(labels or "")))] = float(valor)
+    return muestras
+
+
+def p99(muestras, nombre, **labels):
+    """histogram_quantile(0.99, ...) sin interpolar: el límite del bucket donde cae el p99"""
+    buckets = sorted(
+        (float(dict(key)["le"]), valor)
+        for (metrica, key), valor in muestras.items()
+        if metrica == f"{nombre}_bucket" and set(labels.items()) <= key
+    )
+    total = buckets[-1][1]
+    return next(le for le, acumulado in buckets if acumulado >= 0.99 * total)
+
+
+def test_metricas_de_reservas_y_requests(client):
+    antes = scrape(client)
+    reserva = {"id_cliente": 1, "id_metodo_pago": 1, "items": [{"id_cancha": 1, "id_horario": 3, "fecha": "2030-01-01"}]}
+    assert client.post("/reservas/", json=reserva).status_code == 201
+    assert client.post("/reservas/", json=reserva).status_code == 409
+    assert client.get("/turnos/1").status_code == 200
+    despues = scrape(client)
+
+    def delta(nombre, **labels):
+        key = (nombre, frozenset(labels.items()))
+        return despues.get(key, 0) - antes.get(key, 0)
+
+    assert delta("donbalon_bookings_total", outcome="success") == 1
+    assert delta("donbalon_bookings_total", outcome="conflict") == 1
+    assert delta("donbalon_booking_duration_seconds_count", outcome="success") == 1
+    assert delta("donbalon_db_transactions_total", source="write_queue", outcome="commit") >= 1
+    assert delta("donbalon_db_transactions_total", source="write_queue_request", outcome="rollback") == 1
+    # Por plantilla de ruta, no por id
+    assert delta("donbalon_http_requests_total", method="GET", route="/turnos/{id_turno}", status="200") == 1
+    assert delta("donbalon_http_request_duration_seconds_count", method="POST", route="/reservas/") == 2
+
+    # Los buckets son acumulados y el último (+Inf) coincide con _count
+    buckets = [v for (n, k), v in despues.items() if n == "donbalon_booking_duration_seconds_bucket" and ("outcome", "success") in k]
+    assert max(buckets) == despues[("donbalon_booking_duration_seconds_count", frozenset({("outcome", "success")}))]
+    assert p99(despues, "donbalon_booking_duration_seconds", outcome="success") <= 10.0
+    assert ("donbalon_db_statement_duration_seconds_count", frozenset({("operation", "SELECT")})) in despues
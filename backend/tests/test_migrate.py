@@ -0,0 +1,88 @@
+import os
+import sys
+import shutil
+import sqlite3
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+BACKEND_DIR = os.path.abspath(os.path.join(ROOT, 'backend'))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from data import init_db
+from data.init_db import init_database
+from data.datos_ejemplo_db import insert_sample_data
+from data.migrate import current_version, discover_migrations, migrate, pending_migrations
+from data.rollups import diferencias_uso_cancha, reconstruir_uso_cancha
+
+
+def indices(conn):
+    return {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+
+
+def test_init_aplica_todas_las_migraciones(tmp_path):
+    db_path = str(tmp_path / "donbalon.db")
+    init_database(db_path)
+
+    conn = sqlite3.connect(db_path)
+    assert current_version(conn) == discover_migrations()[-1].version
+    assert pending_migrations(conn) == []
+    assert {"uq_turno_cancha_horario_fecha", "idx_turno_fecha", "idx_cliente_mail"} <= indices(conn)
+    # Se corrió ANALYZE luego de crear los índices
+    assert conn.execute("SELECT name FROM sqlite_master WHERE name = 'sqlite_stat1'").fetchone()
+    conn.close()
+
+    # Volver a migrar no hace nada
+    assert migrate(db_path, verbose=False) == []
+
+
+def test_migracion_fallida_se_revierte(tmp_path):
+    db_path = str(tmp_path / "donbalon.db")
+    directorio = tmp_path / "migraciones"
+    directorio.mkdir()
+    (directorio / "0001_tabla.sql").write_text("CREATE TABLE A (x INTEGER);\n")
+    (directorio / "0002_rota.sql").write_text(
+        "CREATE INDEX idx_a ON A(x);\n-- falla a mitad de camino\nINSERT INTO NoExiste VALUES (1);\n"
+    )
+
+    with pytest.raises(sqlite3.OperationalError):
+        migrate(db_path, directory=directorio, verbose=False)
+
+    conn = sqlite3.connect(db_path)
+    assert current_version(conn) == 1
+    assert "idx_a" not in indices(conn)
+    assert [m.version for m in pending_migrations(conn, directorio)] == [2]
+    conn.close()
+
+
+def test_actualiza_una_base_con_la_version_anterior_de_uso_cancha(tmp_path, monkeypatch):
+    # Base creada cuando la última migración era la 0004 (triggers de 0003 con
+    # la agregación repetida)
+    anteriores = tmp_path / "migraciones"
+    anteriores.mkdir()
+    for m in discover_migrations():
+        if m.version <= 4:
+            shutil.copy(m.path, anteriores / m.path.name)
+    monkeypatch.setattr(init_db, "migrate", lambda path: migrate(path, directory=anteriores, verbose=False))
+    db_path = str(tmp_path / "donbalon.db")
+    init_database(db_path)
+    insert_sample_data(db_path)
+
+    assert [m.version for m in migrate(db_path, verbose=False)] == [5]
+
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    vistas = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'view'")}
+    assert {"v_uso_turno", "v_recalcular_uso_turno"} <= vistas
+    trigger = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'trg_uso_reserva_estado'").fetchone()[0]
+    assert "v_recalcular_uso_turno" in trigger
+
+    # Los triggers nuevos mantienen la tabla igual que la reconstrucción
+    conn.execute("UPDATE Reserva SET estado_reserva = 'Cancelada' WHERE id_reserva = 1")
+    conn.execute("DELETE FROM ReservaDetalle WHERE id_reserva = 2")
+    assert diferencias_uso_cancha(conn) == []
+    assert reconstruir_uso_cancha(conn) == conn.execute("SELECT COUNT(*) FROM UsoCancha").fetchone()[0]
+    conn.close()
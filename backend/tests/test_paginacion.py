@@ -0,0 +1,67 @@
+import os
+import sys
+import datetime
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+BACKEND_DIR = os.path.abspath(os.path.join(ROOT, 'backend'))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from repositories.cancha_repository import CanchaRepository
+from repositories.cancha_servicio_repository import CanchaServicioRepository
+from repositories.turno_repository import TurnoRepository
+from services.turno_service import TurnoService
+
+
+def recorrer(get_page, limit, **filtros):
+    """Recorre todas las páginas siguiendo el cursor."""
+    items, after, paginas = [], None, 0
+    while True:
+        page, after = get_page(limit, after, **filtros)
+        items.extend(page)
+        paginas += 1
+        if after is None:
+            return items, paginas
+
+
+def test_turnos_por_cursor_con_filtros(connection):
+    TurnoService(connection=connection).crear_turnos_del_dia(datetime.date(2030, 1, 1), dias=2)
+    repo = TurnoRepository(connection=connection)
+
+    turnos, paginas = recorrer(repo.get_page, 10)
+    ids = [t.id_turno for t in turnos]
+    assert ids == sorted(ids) and len(ids) == len(set(ids)) == 3 + 54
+    assert paginas == 6
+
+    del_dia, _ = recorrer(repo.get_page, 4, fecha=datetime.date(2030, 1, 2), id_cancha=3)
+    assert {(t.fecha, t.id_cancha) for t in del_dia} == {(datetime.date(2030, 1, 2), 3)}
+    assert len(del_dia) == 9
+
+    # El estado se filtra sin distinguir mayúsculas ("NO DISPONIBLE" en los datos de ejemplo)
+    no_disponibles, _ = repo.get_page(100, estado="no disponible")
+    assert [t.id_turno for t in no_disponibles] == [3]
+
+    # Sin limit: todas las filas, sin cursor (los clientes que no paginan no pierden filas)
+    todos, after = repo.get_page(None)
+    assert [t.id_turno for t in todos] == ids and after is None
+    canchas, after = CanchaRepository(connection=connection).get_page(None)
+    assert len(canchas) == 3 and after is None
+
+    with pytest.raises(ValueError):
+        repo.get_page(10, after="x")
+
+
+def test_clave_compuesta_y_catalogo(connection):
+    relaciones, _ = recorrer(CanchaServicioRepository(connection=connection).get_page, 1)
+    claves = [(r.id_cancha, r.id_servicio) for r in relaciones]
+    assert claves == sorted(claves) and len(claves) == len(set(claves))
+
+    canchas, after = CanchaRepository(connection=connection).get_page(1, id_tipo=1)
+    assert [c.id_cancha for c in canchas] == [1] and after == "1"
+    canchas, after = CanchaRepository(connection=connection).get_page(1, after, id_tipo=1)
+    assert [c.id_cancha for c in canchas] == [2] and after is None
@@ -0,0 +1,55 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+BACKEND_DIR = os.path.abspath(os.path.join(ROOT, 'backend'))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from data.query_budget import QueryBudget, max_queries
+from data.query_stats import query_stats
+from repositories.cliente_repository import ClienteRepository
+
+
+def test_detecta_n_mas_uno_con_su_lugar_en_el_codigo(db_path):
+    budget = QueryBudget(budget=3, min_repeats=5)
+    repo = ClienteRepository(db_path)
+    with query_stats.track_request(capture_sites=True) as queries:
+        for id_cliente in range(1, 7):
+            repo.get_by_id(id_cliente)
+    repo.close()
+
+    report = budget.inspect("GET /prueba", queries)
+    assert report["over_budget"]
+    [n_mas_uno] = report["repeated"]
+    assert n_mas_uno["count"] == 6 and n_mas_uno["distinct_params"] == 6
+    [lugar] = n_mas_uno["call_sites"]
+    assert lugar.startswith("repositories/cliente_repository.py")
+    assert "tests/test_query_budget.py" in lugar
+    assert budget.flagged() == [report]
+
+
+def test_misma_sentencia_mismos_parametros_no_es_n_mas_uno(db_path):
+    budget = QueryBudget(budget=100, min_repeats=2)
+    repo = ClienteRepository(db_path)
+    with query_stats.track_request(capture_sites=True) as queries:
+        for _ in range(3):
+            repo.get_by_id(1)
+    repo.close()
+
+    assert budget.inspect("GET /prueba", queries) is None
+    assert budget.flagged() == []
+
+
+def test_max_queries_por_endpoint(client):
+    with max_queries(1):
+        assert client.get("/turnos/1").status_code == 200
+
+    with pytest.raises(AssertionError, match=r"POST /turnos/crear-del-dia: 3 sentencias"):
+        with max_queries(2):
+            client.post("/turnos/crear-del-dia")
@@ -0,0 +1,73 @@
+import os
+import sys
+import asyncio
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+BACKEND_DIR = os.path.abspath(os.path.join(ROOT, 'backend'))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from data.db_executor import DatabaseExecutor
+from data.query_stats import QueryStats, normalize_sql, query_stats
+from repositories.turno_repository import TurnoRepository
+from services.async_service import AsyncService
+from services.turno_service import TurnoService
+
+
+def test_normalize_sql_agrupa_por_forma():
+    assert normalize_sql("SELECT * FROM Turno WHERE id_turno = 5") == "SELECT * FROM Turno WHERE id_turno = ?"
+    assert normalize_sql("SELECT *\n  FROM Cliente WHERE mail = 'a@b.com'") == "SELECT * FROM Cliente WHERE mail = ?"
+    assert (
+        normalize_sql("SELECT * FROM Turno WHERE id_turno IN (?, ?, ?)")
+        == normalize_sql("SELECT * FROM Turno WHERE id_turno IN (?)")
+    )
+    assert (
+        normalize_sql("INSERT INTO Pago (a, b) VALUES (?, ?), (?, ?), (?, ?)")
+        == "INSERT INTO Pago (a, b) VALUES (...)"
+    )
+
+
+def test_sentencia_lenta_registra_plan_y_recorridos(db_path, monkeypatch):
+    stats = QueryStats(slow_threshold=0)
+    monkeypatch.setattr("repositories.base_repository.query_stats", stats)
+
+    repo = TurnoRepository(db_path)
+    repo.query_all("SELECT * FROM Turno WHERE estado_turno = ?", ("Disponible",))
+    repo.query_one("SELECT * FROM Turno WHERE id_turno = ?", (1,))
+    repo.close()
+
+    snapshot = stats.snapshot()
+    assert {s["sql"] for s in snapshot["statements"]} == {
+        "SELECT * FROM Turno WHERE estado_turno = ?",
+        "SELECT * FROM Turno WHERE id_turno = ?",
+    }
+    lentas = {q["sql"]: q for q in snapshot["slow_queries"]}
+    assert lentas["SELECT * FROM Turno WHERE estado_turno = ?"]["scans"] == ["Turno"]
+    assert lentas["SELECT * FROM Turno WHERE id_turno = ?"]["scans"] == []
+    assert all(q["plan"] for q in lentas.values())
+
+
+def test_contador_por_request_sigue_al_executor(db_path, monkeypatch):
+    stats = QueryStats()
+    monkeypatch.setattr("repositories.base_repository.query_stats", stats)
+    executor = DatabaseExecutor(db_path, readers=1)
+    service = AsyncService(TurnoService, executor)
+
+    async def request():
+        with stats.track_request() as queries:
+            await service.list_all()
+            await service.get_by_id(1)
+        return queries
+
+    try:
+        queries = asyncio.run(request())
+    finally:
+        executor.close()
+
+    assert queries.count == 2
+    assert queries.rows > 1
+    assert stats.snapshot()["queries_per_request"]["requests"] == 1
+    assert query_stats is not stats
@@ -0,0 +1,59 @@
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+BACKEND_DIR = os.path.abspath(os.path.join(ROOT, 'backend'))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from repositories.reporte_repository import ReporteRepository
+
+
+def test_reservas_por_cliente_una_consulta(connection):
+    statements = []
+    connection.set_trace_callback(statements.append)
+
+    cliente, reservas = ReporteRepository(connection=connection).get_reservas_por_cliente(2)
+
+    assert len(statements) == 1
+    assert (cliente.nombre, cliente.apellido) == ("Maria", "Garcia")
+    assert [item.reserva.id_reserva for item in reservas] == [2]
+    assert reservas[0].reserva.estado_nombre == "Pagada"
+    detalle = reservas[0].detalles[0]
+    assert (detalle.id_turno, detalle.fecha, detalle.id_horario) == (2, "2025-11-20", 2)
+    assert detalle.nombre_cancha
+
+
+def test_reservas_por_cliente_sin_reservas_o_inexistente(connection):
+    repo = ReporteRepository(connection=connection)
+
+    cliente, reservas = repo.get_reservas_por_cliente(3)
+    assert cliente.id_cliente == 3 and reservas == []
+
+    assert repo.get_reservas_por_cliente(99) == (None, [])
+
+
+def test_reservas_por_cancha_filtra_periodo_en_sql(connection):
+    statements = []
+    connection.set_trace_callback(statements.append)
+    repo = ReporteRepository(connection=connection)
+
+    nombre, items = repo.get_reservas_por_cancha(1, "2025-11-01", "2025-11-30")
+    assert len(statements) == 1
+    assert nombre
+    assert [(i.id_reserva, i.id_turno, i.apellido_cliente) for i in items] == [(1, 1, "Perez"), (2, 2, "Garcia")]
+
+    # Fuera del período: la cancha existe pero no hay ítems
+    assert repo.get_reservas_por_cancha(1, "2025-12-01", "2025-12-31") == (nombre, [])
+    assert repo.get_reservas_por_cancha(99, "2025-11-01", "2025-11-30") == (None, [])
+
+
+def test_reservas_por_cancha_usa_indice(connection):
+    plan = connection.execute(
+        "EXPLAIN QUERY PLAN SELECT id_turno FROM Turno WHERE id_cancha = ? AND fecha BETWEEN ? AND ?",
+        (1, "2025-11-01", "2025-11-30"),
+    ).fetchall()
+    assert any("idx_turno_cancha_fecha" in row["detail"] for row in plan)
@@ -0,0 +1,151 @@
+import os
+import sys
+import sqlite3
+import datetime
+import threading
+from decimal import Decimal
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+BACKEND_DIR = os.path.abspath(os.path.join(ROOT, 'backend'))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from data.retry import retry_on_busy
+from schemas.reserva_transaccion_schema import ReservaTransaccionSchema
+from services.reserva_service import ReservaService
+from services.turno_service import TurnoService
+from services.exceptions import ConflictoError
+from classes.turno import Turno
+
+FECHA = datetime.date(2030, 1, 1)
+
+
+def connect(db_path):
+    conn = sqlite3.connect(db_path, check_same_thread=False, timeout=5)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute("PRAGMA journal_mode = WAL")
+    return conn
+
+
+@pytest.fixture
+def connection(db_path):
+    conn = connect(db_path)
+    yield conn
+    conn.close()
+
+
+def reserva(items, id_metodo_pago=1):
+    return ReservaTransaccionSchema(
+        id_cliente=2,
+        id_metodo_pago=id_metodo_pago,
+        items=[{"id_cancha": c, "id_horario": h, "fecha": f} for c, h, f in items],
+    )
+
+
+def test_reserva_multiples_items(connection):
+    service = ReservaService(connection=connection)
+    # La cancha 1 ya tiene su turno del horario 1 creado como disponible
+    TurnoService(connection=connection).crear_turnos_del_dia(FECHA)
+
+    items = [(1, 1, FECHA), (3, 1, FECHA), (1, 2, FECHA + datetime.timedelta(days=1))]
+    creada = service.registrar_reserva_completa(reserva(items))
+
+    # Canchas 1 y 2 son de Futbol (500), la 3 de Basquet (400)
+    assert creada.monto_total == Decimal("1400")
+    detalles = service.detalle_repository.get_by_reserva(creada.id_reserva)
+    turnos = [service.turno_repository.get_by_id(d.id_turno) for d in detalles]
+    assert [(t.id_cancha, t.id_horario, t.fecha) for t in turnos] == items
+    assert all(t.estado_nombre == "No Disponible" for t in turnos)
+    # El turno disponible existente se reutiliza en vez de duplicarse
+    assert len(service.turno_repository.get_by_cancha_y_fecha(1, FECHA)) == 9
+
+
+def test_reserva_validacion_por_lotes(connection):
+    service = ReservaService(connection=connection)
+    statements = []
+    connection.set_trace_callback(statements.append)
+
+    def selects():
+        return [s for s in statements if s.lstrip().upper().startswith(("SELECT", "WITH"))]
+
+    items = [(1 + i % 3, 1 + i % 9, FECHA + datetime.timedelta(days=i)) for i in range(10)]
+    service.registrar_reserva_completa(reserva(items))
+    # Turnos existentes + carga del catálogo (MetodoPago, Cancha, TipoCancha)
+    assert len(selects()) == 4
+
+    # Con el catálogo en caché solo se consultan los turnos existentes
+    statements.clear()
+    items = [(c, h, f + datetime.timedelta(days=30)) for c, h, f in items]
+    service.registrar_reserva_completa(reserva(items))
+    assert len(selects()) == 1
+
+
+def test_reserva_rechaza_ocupados_e_inexistentes(connection):
+    service = ReservaService(connection=connection)
+    service.registrar_reserva_completa(reserva([(1, 3, FECHA)]))
+
+    with pytest.raises(ConflictoError, match="ya está ocupado"):
+        service.registrar_reserva_completa(reserva([(2, 3, FECHA), (1, 3, FECHA)]))
+    with pytest.raises(ValueError, match="no existe"):
+        service.registrar_reserva_completa(reserva([(99, 3, FECHA)]))
+    with pytest.raises(ValueError, match="más de una vez"):
+        service.registrar_reserva_completa(reserva([(2, 3, FECHA), (2, 3, FECHA)]))
+
+    # Nada de lo rechazado quedó persistido
+    assert service.turno_repository.get_by_cancha_horario_fecha(2, 3, FECHA) is None
+
+
+def test_reservas_concurrentes_mismo_turno(db_path):
+    resultados = []
+    barrera = threading.Barrier(4)
+
+    def reservar():
+        conn = connect(db_path)
+        try:
+            barrera.wait()
+            ReservaService(connection=conn).registrar_reserva_completa(reserva([(2, 5, FECHA)]))
+            resultados.append("ok")
+        except ConflictoError:
+            resultados.append("conflicto")
+        finally:
+            conn.close()
+
+    hilos = [threading.Thread(target=reservar) for _ in range(4)]
+    for h in hilos:
+        h.start()
+    for h in hilos:
+        h.join()
+
+    assert sorted(resultados) == ["conflicto"] * 3 + ["ok"]
+
+
+def test_turno_duplicado_es_conflicto(connection):
+    service = TurnoService(connection=connection)
+    service.insert(Turno(id_cancha=3, id_horario=1, fecha=FECHA))
+    with pytest.raises(ConflictoError):
+        service.insert(Turno(id_cancha=3, id_horario=1, fecha=FECHA))
+
+
+def test_retry_on_busy():
+    intentos = []
+
+    def ocupada():
+        intentos.append(1)
+        if len(intentos) < 3:
+            raise sqlite3.OperationalError("database is locked")
+        return "listo"
+
+    assert retry_on_busy(ocupada, base_delay=0) == "listo"
+    assert len(intentos) == 3
+
+    def siempre_ocupada():
+        raise sqlite3.OperationalError("database is locked")
+
+    with pytest.raises(sqlite3.OperationalError):
+        retry_on_busy(siempre_ocupada, attempts=2, base_delay=0)
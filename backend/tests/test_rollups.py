@@ -0,0 +1,69 @@
+import os
+import sys
+import datetime
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+BACKEND_DIR = os.path.abspath(os.path.join(ROOT, 'backend'))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from data.rollups import diferencias_uso_cancha, reconstruir_uso_cancha
+from schemas.reserva_transaccion_schema import ReservaTransaccionSchema
+from services.reserva_service import ReservaService
+from services.turno_service import TurnoService
+
+FECHA = datetime.date(2030, 1, 1)
+
+
+def uso(conn, id_cancha, fecha, id_horario):
+    row = conn.execute(
+        "SELECT reservas, ingresos, cancelaciones, expirados FROM UsoCancha "
+        "WHERE id_cancha = ? AND fecha = ? AND id_horario = ?",
+        (id_cancha, str(fecha), id_horario),
+    ).fetchone()
+    return tuple(row) if row else None
+
+
+def test_reserva_cancelacion_y_expiracion(connection):
+    # Carga inicial de la migración con los datos de ejemplo
+    assert diferencias_uso_cancha(connection) == []
+
+    reserva = ReservaService(connection=connection).registrar_reserva_completa(ReservaTransaccionSchema(
+        id_cliente=2,
+        id_metodo_pago=1,
+        items=[{"id_cancha": 1, "id_horario": 1, "fecha": FECHA}, {"id_cancha": 3, "id_horario": 1, "fecha": FECHA}],
+    ))
+    assert uso(connection, 1, FECHA, 1) == (1, 500, 0, 0)
+    assert uso(connection, 3, FECHA, 1) == (1, 400, 0, 0)
+
+    connection.execute("UPDATE Reserva SET estado_reserva = 'Cancelada' WHERE id_reserva = ?", (reserva.id_reserva,))
+    connection.commit()
+    assert uso(connection, 1, FECHA, 1) == (0, 0, 1, 0)
+
+    # Turnos de un día pasado: al expirar quedan no disponibles sin reserva
+    pasado = datetime.date(2020, 1, 1)
+    turnos = TurnoService(connection=connection)
+    turnos.crear_turnos_del_dia(pasado)
+    assert uso(connection, 2, pasado, 3) is None
+    assert turnos.expirar_turnos_pasados()["turnos_expirados"] >= 27
+    assert uso(connection, 2, pasado, 3) == (0, 0, 0, 1)
+
+    connection.execute("DELETE FROM ReservaDetalle WHERE id_reserva = ?", (reserva.id_reserva,))
+    connection.commit()
+    # Sin ítems, los turnos reservados quedan como no disponibles sin uso
+    assert uso(connection, 1, FECHA, 1) == (0, 0, 0, 1)
+
+    assert diferencias_uso_cancha(connection) == []
+
+
+def test_reconstruir(connection):
+    connection.execute("DELETE FROM UsoCancha")
+    connection.commit()
+    assert diferencias_uso_cancha(connection)
+
+    connection.isolation_level = None
+    assert reconstruir_uso_cancha(connection) == 3
+    assert diferencias_uso_cancha(connection) == []
@@ -0,0 +1,76 @@
+import os
+import sys
+import datetime
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+BACKEND_DIR = os.path.abspath(os.path.join(ROOT, 'backend'))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from services.turno_service import TurnoService
+
+
+@pytest.fixture
+def service(db_path):
+    svc = TurnoService(db_path)
+    yield svc
+    svc.repository.close()
+
+
+def test_crear_turnos_rango(service):
+    desde = datetime.date(2030, 1, 1)
+    resultado = service.crear_turnos_del_dia(desde, dias=30)
+
+    # 3 canchas x 9 horarios x 30 días
+    assert resultado["turnos_creados"] == 3 * 9 * 30
+    assert resultado["turnos_omitidos"] == 0
+    assert resultado["fecha_hasta"] == "2030-01-30"
+    assert len(service.repository.get_by_fecha(datetime.date(2030, 1, 30))) == 27
+
+    # Repetir solapando el rango omite los existentes
+    resultado = service.crear_turnos_del_dia(datetime.date(2030, 1, 30), dias=2)
+    assert resultado["turnos_creados"] == 27
+    assert resultado["turnos_omitidos"] == 27
+
+
+def test_crear_turnos_respeta_existentes(service):
+    # Los datos de ejemplo ya tienen 3 turnos el 2025-11-20
+    resultado = service.crear_turnos_del_dia(datetime.date(2025, 11, 20))
+    assert resultado["turnos_creados"] == 24
+    assert resultado["turnos_omitidos"] == 3
+    nuevos = [t for t in service.repository.get_by_fecha(datetime.date(2025, 11, 20)) if t.id_turno > 3]
+    assert len(nuevos) == 24
+    assert all(t.estado_nombre == "Disponible" for t in nuevos)
+
+
+def test_expirar_turnos_pasados(service):
+    service.crear_turnos_del_dia(datetime.date(2030, 1, 1), dias=2)
+
+    # 2030-01-02 a las 17:30: vence todo el día anterior y los horarios 15-16, 16-17 de hoy
+    expirados = service.repository.expire_past(datetime.date(2030, 1, 2), "17:30:00", "Disponible", "No Disponible")
+    assert expirados == 27 + 3 * 2 + 2  # + los 2 turnos disponibles de ejemplo (2025-11-20)
+
+    hoy = service.repository.get_by_fecha(datetime.date(2030, 1, 2))
+    vencidos = [t for t in hoy if t.estado_nombre == "No Disponible"]
+    assert sorted({t.id_horario for t in vencidos}) == [1, 2]
+
+    # Los ya expirados no se vuelven a contar
+    assert service.repository.expire_past(datetime.date(2030, 1, 2), "17:30:00", "Disponible", "No Disponible") == 0
+    # Hoy (antes de 2030) no hay nada más para expirar
+    assert service.expirar_turnos_pasados()["turnos_expirados"] == 0
+
+
+def test_disponibilidad_grilla(service):
+    grilla = service.disponibilidad(datetime.date(2025, 11, 20))
+
+    assert [c["id_cancha"] for c in grilla["canchas"]] == [1, 2, 3]
+    assert len(grilla["horarios"]) == 9
+    # Ejemplo: cancha 1 tiene horarios 1 y 2 disponibles, cancha 2 el horario 1 ocupado
+    assert grilla["estados"] == ["DD-------", "N--------", "---------"]
+    assert grilla["turnos"][0][:3] == [1, 2, None]
+    assert grilla["turnos"][1][0] == 3
@@ -0,0 +1,139 @@
+import os
+import sys
+import sqlite3
+import datetime
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+BACKEND_DIR = os.path.abspath(os.path.join(ROOT, 'backend'))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from data.unit_of_work import after_commit, unit_of_work
+from decimal import Decimal
+
+from classes.cliente import Cliente
+from classes.servicio import Servicio
+from classes.turno import Turno
+from repositories.catalog_cache import CatalogCache
+from repositories.cliente_repository import ClienteRepository
+from repositories.servicio_repository import ServicioRepository
+from repositories.turno_repository import TurnoRepository
+
+
+def contar(db_path, tabla):
+    # Otra conexión: solo ve lo que ya se confirmó
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {tabla}").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def nuevo_turno(dia):
+    return Turno(id_cancha=1, id_horario=1, fecha=datetime.date(2030, 1, dia))
+
+
+def test_un_solo_commit_para_todos_los_repositorios(db_path):
+    conn = sqlite3.connect(db_path)
+    commits = []
+    conn.set_trace_callback(lambda sql: commits.append(sql) if sql.upper().startswith("COMMIT") else None)
+    turnos = TurnoRepository(connection=conn)
+    clientes = ClienteRepository(connection=conn)
+    turnos_antes = contar(db_path, "Turno")
+    try:
+        with unit_of_work(conn):
+            for dia in range(1, 6):
+                turnos.create(nuevo_turno(dia))
+            clientes.create(Cliente(nombre="Ana", apellido="Diaz", mail="ana@example.com"))
+            # Nada visible todavía para otras conexiones
+            assert contar(db_path, "Turno") == turnos_antes
+        assert len(commits) == 1
+        assert contar(db_path, "Turno") == turnos_antes + 5
+
+        # Fuera de la unidad de trabajo cada escritura sigue confirmándose sola
+        turnos.create(nuevo_turno(6))
+        assert len(commits) == 2
+    finally:
+        conn.close()
+
+
+def test_rollback_y_savepoints_anidados(db_path):
+    conn = sqlite3.connect(db_path)
+    turnos = TurnoRepository(connection=conn)
+    antes = contar(db_path, "Turno")
+    try:
+        with pytest.raises(RuntimeError):
+            with turnos.unit_of_work():
+                turnos.create(nuevo_turno(1))
+                raise RuntimeError("falla")
+        assert contar(db_path, "Turno") == antes
+        assert not conn.in_transaction
+
+        with turnos.unit_of_work():
+            turnos.create(nuevo_turno(2))
+            # El SAVEPOINT que falla deshace solo su parte
+            with pytest.raises(sqlite3.IntegrityError):
+                with turnos.unit_of_work():
+                    turnos.create(nuevo_turno(3))
+                    turnos.create(nuevo_turno(3))
+            with turnos.unit_of_work():
+                turnos.create(nuevo_turno(4))
+        fechas = {str(t.fecha) for t in turnos.get_by_cancha(1)}
+        assert {"2030-01-02", "2030-01-04"} <= fechas
+        assert "2030-01-03" not in fechas
+        assert contar(db_path, "Turno") == antes + 2
+    finally:
+        conn.close()
+
+
+def test_sentencia_suelta_fallida_no_deja_la_transaccion_abierta(db_path):
+    conn = sqlite3.connect(db_path)
+    turnos = TurnoRepository(connection=conn)
+    try:
+        turnos.create(nuevo_turno(1))
+        with pytest.raises(sqlite3.IntegrityError):
+            turnos.create(nuevo_turno(1))
+        assert not conn.in_transaction
+        turnos.create(nuevo_turno(2))
+        assert not conn.in_transaction
+    finally:
+        conn.close()
+
+
+def test_after_commit_espera_al_commit_exterior(db_path):
+    repo = ClienteRepository(db_path)
+    llamadas = []
+
+    with unit_of_work(repo.conn):
+        with unit_of_work(repo.conn):
+            after_commit(repo.conn, lambda: llamadas.append("confirmada"))
+        assert llamadas == []
+    assert llamadas == ["confirmada"]
+
+    with pytest.raises(RuntimeError):
+        with unit_of_work(repo.conn):
+            after_commit(repo.conn, lambda: llamadas.append("deshecha"))
+            after_commit(repo.conn, lambda: llamadas.append("siempre"), on_rollback=True)
+            raise RuntimeError("falla")
+    assert llamadas == ["confirmada", "siempre"]
+
+
+def test_rollback_invalida_el_cache_de_catalogo(db_path, monkeypatch):
+    monkeypatch.setattr(ServicioRepository, "cache", CatalogCache(ttl=60))
+    repo = ServicioRepository(db_path)
+    cantidad = len(repo.get_all())
+
+    with pytest.raises(RuntimeError):
+        with unit_of_work(repo.conn):
+            repo.create(Servicio(None, "Fantasma", Decimal("10")))
+            assert len(repo.get_all()) == cantidad + 1
+            raise RuntimeError("falla")
+
+    assert [s.descripcion for s in repo.get_all()].count("Fantasma") == 0
+    assert len(repo.get_all()) == contar(db_path, "Servicio") == cantidad
+    repo.close()
@@ -9,6 +9,28 @@ function isoDate(d) {
   return d.toISOString().slice(0, 10);
 }
 
+// Códigos de estado de /turnos/disponibilidad
+const ESTADOS_GRILLA = { D: "Disponible", N: "No Disponible" };
+
+// Convierte la grilla compacta (cancha x horario) en la lista de turnos del día
+function grillaATurnos(grilla) {
+  const lista = [];
+  grilla.canchas.forEach((c, i) => {
+    grilla.horarios.forEach((h, j) => {
+      const idTurno = grilla.turnos[i][j];
+      if (idTurno === null) return;
+      lista.push({
+        id_turno: idTurno,
+        id_cancha: c.id_cancha,
+        id_horario: h.id_horario,
+        fecha: grilla.fecha,
+        estado_turno: ESTADOS_GRILLA[grilla.estados[i][j]],
+      });
+    });
+  });
+  return lista;
+}
+
 export default function Schedule() {
   const [canchas, setCanchas] = useState([]);
   const [horarios, setHorarios] = useState([]);
@@ -52,18 +74,6 @@ export default function Schedule() {
     // Esperar a que la inicialización termine antes de cargar datos
     if (isInitializing) return;
 
-    fetch(`${API_BASE}/canchas`)
-      .then((r) => r.json())
-      .then(setCanchas)
-      .catch(() => setCanchas([]));
-    fetch(`${API_BASE}/horarios`)
-      .then((r) => r.json())
-      .then(setHorarios)
-      .catch(() => setHorarios([]));
-    fetch(`${API_BASE}/turnos`)
-      .then((r) => r.json())
-      .then(setTurnos)
-      .catch(() => setTurnos([]));
     fetch(`${API_BASE}/canchas-servicios`)
       .then((r) => r.json())
       .then(setCanchaServicios)
@@ -74,6 +84,24 @@ export default function Schedule() {
       .catch(() => setServicios([]));
   }, [isInitializing]);
 
+  useEffect(() => {
+    if (isInitializing) return;
+
+    // Canchas, horarios y turnos de la fecha elegida en una sola respuesta
+    fetch(`${API_BASE}/turnos/disponibilidad?fecha=${date}`)
+      .then((r) => r.json())
+      .then((grilla) => {
+        setCanchas(grilla.canchas);
+        setHorarios(grilla.horarios);
+        setTurnos(grillaATurnos(grilla));
+      })
+      .catch(() => {
+        setCanchas([]);
+        setHorarios([]);
+        setTurnos([]);
+      });
+  }, [isInitializing, date]);
+
   // Map horarios to sorted time slots (use hora_inicio)
   const timeSlots = useMemo(() => {
     if (!horarios || horarios.length === 0) {